@@ -0,0 +1,98 @@
+"""Benchmark listing labware calibrations.
+
+Saves calibrations for a number of labware into a temporary config
+directory, then times `get_all_calibrations`, which reads the labware offset
+store once and then answers from memory. For comparison, the same
+calibrations are also listed the way `get_all_calibrations` used to, by
+reading index.json and then one `{calibration_id}.json` file per labware.
+
+Usage:
+    python benchmarks/bench_labware_calibrations.py --labware 200
+"""
+import argparse
+import os
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from opentrons import config
+from opentrons.calibration_storage import (
+    file_operators as io,
+    get,
+    labware_offset_store,
+)
+from opentrons.util.helpers import utc_now
+
+
+def _write_legacy_files(offset_dir: Path, count: int) -> None:
+    index: Dict[str, Any] = {}
+    for i in range(count):
+        calibration_id = f"{i:064x}"
+        index[calibration_id] = {
+            "uri": f"custom_beta/labware_{i}/1",
+            "slot": calibration_id,
+            "module": {},
+        }
+        io.save_to_file(
+            offset_dir / f"{calibration_id}.json",
+            {"default": {"offset": [i, i, i], "lastModified": utc_now()}},
+        )
+    io.save_to_file(offset_dir / "index.json", {"version": 1, "data": index})
+
+
+def _list_from_legacy_files(offset_dir: Path) -> List[Dict[str, Any]]:
+    calibrations = []
+    index = io.read_cal_file(str(offset_dir / "index.json"))
+    for calibration_id in index["data"]:
+        calibrations.append(
+            io.read_cal_file(str(offset_dir / f"{calibration_id}.json"))
+        )
+    return calibrations
+
+
+def _time(func: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labware", type=int, default=200)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.environ["OT_API_CONFIG_DIR"] = config_dir
+        config.reload()
+        offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+
+        legacy_dir = Path(config_dir) / "legacy"
+        legacy_dir.mkdir()
+        _write_legacy_files(legacy_dir, args.labware)
+        _write_legacy_files(offset_dir, args.labware)
+
+        migrate = _time(labware_offset_store.get_all, number=1, repeat=1)
+        assert len(get.get_all_calibrations()) == args.labware
+
+        store = _time(get.get_all_calibrations, args.number, args.repeat)
+        legacy = _time(
+            lambda: _list_from_legacy_files(legacy_dir), args.number, args.repeat
+        )
+
+        def _list_cold() -> object:
+            labware_offset_store.invalidate()
+            return get.get_all_calibrations()
+
+        cold_store = _time(_list_cold, args.number, args.repeat)
+
+    print(f"{args.labware} labware calibrations")
+    print(f"  {'one-time migration':<28} {migrate * 1e3:8.2f} ms")
+    print(f"  {'store, cached':<28} {store * 1e3:8.2f} ms/list")
+    print(f"  {'store, cold':<28} {cold_store * 1e3:8.2f} ms/list")
+    print(f"  {'index + file per labware':<28} {legacy * 1e3:8.2f} ms/list")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark loading the labware definitions for a full deck.
+
+Loads the definitions for a 12-slot deck of common labware the way
+`ProtocolContext.load_labware` does, by load name with no namespace, through
+`get_labware_definition` and its `LabwareDefinitionRegistry`. For comparison,
+the same definitions are also loaded the way `get_labware_definition` used to,
+by opening and parsing each file and falling back from the opentrons namespace
+to custom_beta through exceptions. Also compares `verify_definition`, which
+reuses one compiled schema validator and remembers definitions that have
+already passed, with validating against a freshly loaded labware schema.
+
+Usage:
+    python benchmarks/bench_labware_definitions.py --decks 20
+"""
+import argparse
+import json
+import timeit
+from typing import Callable, List
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+from opentrons.protocols.api_support.constants import (
+    CUSTOM_NAMESPACE,
+    OPENTRONS_NAMESPACE,
+    STANDARD_DEFS_PATH,
+    USER_DEFS_PATH,
+)
+from opentrons.protocols.labware import get_labware_definition, verify_definition
+
+_DECK = [
+    "opentrons_96_tiprack_20ul",
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_filtertiprack_200ul",
+    "opentrons_96_tiprack_1000ul",
+    "corning_96_wellplate_360ul_flat",
+    "nest_96_wellplate_100ul_pcr_full_skirt",
+    "nest_96_wellplate_2ml_deep",
+    "corning_384_wellplate_112ul_flat",
+    "nest_12_reservoir_15ml",
+    "nest_1_reservoir_195ml",
+    "opentrons_24_tuberack_eppendorf_1.5ml_safelock_snapcap",
+    "opentrons_1_trash_1100ml_fixed",
+]
+
+
+def _load_from_files(load_name: str) -> LabwareDefinition:
+    for namespace in [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE]:
+        if namespace == OPENTRONS_NAMESPACE:
+            path = get_shared_data_root() / STANDARD_DEFS_PATH / load_name / "1.json"
+        else:
+            path = USER_DEFS_PATH / namespace / load_name / "1.json"
+        try:
+            with open(path, "rb") as f:
+                definition: LabwareDefinition = json.loads(f.read().decode("utf-8"))
+                return definition
+        except FileNotFoundError:
+            pass
+    raise FileNotFoundError(load_name)
+
+
+def _verify_with_fresh_schema(definition: LabwareDefinition) -> LabwareDefinition:
+    schema = json.loads(load_shared_data("labware/schemas/2.json").decode("utf-8"))
+    jsonschema.validate(definition, schema)
+    return definition
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    definitions: List[LabwareDefinition] = [
+        get_labware_definition(load_name) for load_name in _DECK
+    ]
+    assert definitions == [_load_from_files(load_name) for load_name in _DECK]
+
+    registry = _time(
+        lambda: [get_labware_definition(n) for _ in range(args.decks) for n in _DECK],
+        args.repeat,
+    )
+    files = _time(
+        lambda: [_load_from_files(n) for _ in range(args.decks) for n in _DECK],
+        args.repeat,
+    )
+    verify_definition_time = _time(
+        lambda: [verify_definition(d) for d in definitions], args.repeat
+    )
+    verify_fresh = _time(
+        lambda: [_verify_with_fresh_schema(d) for d in definitions], args.repeat
+    )
+
+    print(f"{len(_DECK)}-slot deck, loaded {args.decks} times")
+    print(f"  {'registry load':<28} {registry * 1e3 / args.decks:8.2f} ms/deck")
+    print(f"  {'open + parse each file':<28} {files * 1e3 / args.decks:8.2f} ms/deck")
+    print(f"  {'verify_definition':<28} {verify_definition_time * 1e3:8.2f} ms/deck")
+    print(f"  {'validate, fresh schema':<28} {verify_fresh * 1e3:8.2f} ms/deck")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark labware offset lookup in ProtocolEngine labware state.
+
+Adds many labware offsets to a `LabwareStore`, then looks up the applicable
+offset for many labware loads, the way `loadLabware` does. For comparison,
+the same lookups are also run through the linear scan that
+`LabwareView.find_applicable_labware_offset` used before offsets were indexed.
+
+Usage:
+    python benchmarks/bench_labware_offsets.py --offsets 500 --loads 1000
+"""
+import argparse
+import timeit
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from opentrons_shared_data.deck import load as load_deck
+
+from opentrons.types import DeckSlotName
+from opentrons.protocol_engine.actions import AddLabwareOffsetAction
+from opentrons.protocol_engine.state.labware import LabwareStore, LabwareView
+from opentrons.protocol_engine.types import (
+    LabwareOffset,
+    LabwareOffsetCreate,
+    LabwareOffsetLocation,
+    LabwareOffsetVector,
+    ModuleModel,
+)
+
+_SLOTS = [DeckSlotName.from_primitive(n) for n in range(1, 12)]
+_MODULES = [None, ModuleModel.TEMPERATURE_MODULE_V2, ModuleModel.MAGNETIC_MODULE_V2]
+
+
+def _build_offset_requests(count: int) -> List[LabwareOffsetCreate]:
+    return [
+        LabwareOffsetCreate(
+            definitionUri=f"opentrons/labware_{i % 40}/1",
+            location=LabwareOffsetLocation(
+                slotName=_SLOTS[i % len(_SLOTS)],
+                moduleModel=_MODULES[i % len(_MODULES)],
+            ),
+            vector=LabwareOffsetVector(x=i, y=i, z=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _build_loads(count: int) -> List[Tuple[str, LabwareOffsetLocation]]:
+    return [
+        (
+            f"opentrons/labware_{(i * 7) % 50}/1",
+            LabwareOffsetLocation(
+                slotName=_SLOTS[(i * 3) % len(_SLOTS)],
+                moduleModel=_MODULES[i % len(_MODULES)],
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _linear_scan(
+    view: LabwareView,
+    definition_uri: str,
+    location: LabwareOffsetLocation,
+) -> Optional[LabwareOffset]:
+    for candidate in reversed(view.get_labware_offsets()):
+        if candidate.definitionUri == definition_uri and candidate.location == location:
+            return candidate
+    return None
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--offsets", type=int, default=500)
+    parser.add_argument("--loads", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    store = LabwareStore(
+        deck_definition=load_deck("ot2_standard", 2),
+        deck_fixed_labware=[],
+    )
+    for i, request in enumerate(_build_offset_requests(args.offsets)):
+        store.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=f"offset-{i}",
+                created_at=datetime.now(),
+                request=request,
+            )
+        )
+
+    view = LabwareView(store.state)
+    loads = _build_loads(args.loads)
+
+    for uri, location in loads:
+        assert view.find_applicable_labware_offset(uri, location) == _linear_scan(
+            view, uri, location
+        )
+
+    indexed = min(
+        timeit.repeat(
+            lambda: [view.find_applicable_labware_offset(u, l) for u, l in loads],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    linear = min(
+        timeit.repeat(
+            lambda: [_linear_scan(view, u, l) for u, l in loads],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+
+    print(f"{args.loads} labware loads against {args.offsets} offsets")
+    print(f"  indexed lookup: {indexed * 1e6 / args.loads:10.2f} us/load")
+    print(f"  linear scan:    {linear * 1e6 / args.loads:10.2f} us/load")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark module serial I/O on threads against I/O on the event loop.
+
+Connects the drivers of five emulated modules (a thermocycler, two
+temperature modules, and two magnetic modules) to the module emulators, once
+with the usual `AsyncSerial` transport, which blocks a thread of its own per
+port, and once with `EventLoopSerial`, which registers each port with the
+event loop. The drivers then poll their modules concurrently, like the
+hardware controller's pollers do, and the number of threads the connections
+added and the latency of each poll are reported. Both transports must read
+the same device info. The Python module emulators don't include a
+heater-shaker, so a second magnetic module stands in for it.
+
+Usage:
+    python benchmarks/bench_module_serial.py --polls 500
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from opentrons.drivers.mag_deck import MagDeckDriver
+from opentrons.drivers.temp_deck import TempDeckDriver
+from opentrons.drivers.thermocycler import ThermocyclerDriver
+from opentrons.hardware_control.emulation.module_server import ModuleStatusClient
+from opentrons.hardware_control.emulation.module_server.helpers import wait_emulators
+from opentrons.hardware_control.emulation.scripts import run_app
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.types import ModuleType
+
+_MODULES = [
+    ModuleType.Thermocycler,
+    ModuleType.Temperature,
+    ModuleType.Temperature,
+    ModuleType.Magnetic,
+    ModuleType.Magnetic,
+]
+
+
+def _start_emulators(settings: Settings) -> None:
+    modules = [m.value for m in _MODULES]
+    thread = threading.Thread(
+        target=lambda: asyncio.run(run_app.run(settings, modules=modules)),
+        daemon=True,
+    )
+    thread.start()
+
+    async def _wait_ready() -> None:
+        client = await ModuleStatusClient.connect(
+            host="localhost", port=settings.module_server.port, interval_seconds=1
+        )
+        await wait_emulators(client=client, modules=_MODULES, timeout=5)
+        client.close()
+
+    asyncio.run(_wait_ready())
+
+
+async def _connect(settings: Settings, module: ModuleType) -> Any:
+    def _url(port: int) -> str:
+        return f"socket://127.0.0.1:{port}"
+
+    for _ in range(50):
+        try:
+            # Emulators are only available once the previous run's drivers
+            # have disconnected from them.
+            if module == ModuleType.Thermocycler:
+                return await ThermocyclerDriver.create(
+                    port=_url(settings.thermocycler_proxy.driver_port),
+                    loop=asyncio.get_running_loop(),
+                )
+            if module == ModuleType.Temperature:
+                return await TempDeckDriver.create(
+                    port=_url(settings.temperature_proxy.driver_port)
+                )
+            return await MagDeckDriver.create(
+                port=_url(settings.magdeck_proxy.driver_port)
+            )
+        except Exception:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"Unable to connect to the {module.value} emulator")
+
+
+def _poll(driver: Any) -> Callable[[], Awaitable[Any]]:
+    if isinstance(driver, ThermocyclerDriver):
+        return driver.get_plate_temperature
+    if isinstance(driver, TempDeckDriver):
+        return driver.get_temperature
+    return driver.get_mag_position  # type: ignore[no-any-return]
+
+
+async def _run(
+    settings: Settings, event_loop_io: bool, polls: int
+) -> Tuple[int, List[float], float, List[Dict[str, str]]]:
+    # Module drivers don't take a transport argument, so select it the way a
+    # robot would.
+    os.environ["OT_EVENT_LOOP_SERIAL"] = str(event_loop_io).lower()
+
+    threads_before = set(threading.enumerate())
+    drivers = []
+    for module in _MODULES:
+        drivers.append(await _connect(settings, module))
+    added_threads = len(set(threading.enumerate()) - threads_before)
+    device_info = [await d.get_device_info() for d in drivers]
+
+    latencies: List[float] = []
+
+    async def _timed(poll: Callable[[], Awaitable[Any]]) -> None:
+        start = time.perf_counter()
+        await poll()
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        await asyncio.gather(*(_timed(_poll(d)) for d in drivers))
+    elapsed = time.perf_counter() - start
+
+    for d in drivers:
+        await d.disconnect()
+    return added_threads, latencies, elapsed, device_info
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+    # The emulators complain about every closed connection.
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+    logging.getLogger("opentrons.hardware_control.emulation").setLevel(logging.CRITICAL)
+
+    settings = Settings()
+    _start_emulators(settings)
+
+    async def _both() -> None:
+        results = {}
+        for event_loop_io in (False, True):
+            results[event_loop_io] = await _run(settings, event_loop_io, args.polls)
+        assert results[False][3] == results[True][3]
+
+        print(f"{len(_MODULES)} modules, {args.polls} concurrent polls of each")
+        print(
+            f"  {'transport':<16} {'threads':>8} {'mean':>10} {'p99':>10} "
+            f"{'polls/s':>10}"
+        )
+        for event_loop_io, (threads, latencies, elapsed, _) in results.items():
+            name = "EventLoopSerial" if event_loop_io else "AsyncSerial"
+            p99 = sorted(latencies)[int(len(latencies) * 0.99)]
+            print(
+                f"  {name:<16} {threads:>8} "
+                f"{statistics.mean(latencies) * 1e3:>7.2f} ms "
+                f"{p99 * 1e3:>7.2f} ms "
+                f"{len(latencies) / elapsed:>10.0f}"
+            )
+
+    asyncio.run(_both())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark position conversions and position reads in hardware_control.API.
+
+Converts a machine position to deck coordinates with a user deck
+calibration, once the previous way, which inverted the attitude matrix for
+each mount on every conversion, and once with the inverse cached by the
+calibration provider; both must give the same position. Then runs moves
+like the protocol engine's move-to-well on a simulating hardware API, which
+asks for the gantry position before each move, and reports how many of
+those requests were answered from the cached position rather than by the
+motion controller.
+
+Usage:
+    python benchmarks/bench_position_cache.py --conversions 20000 --moves 200
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from opentrons.calibration_storage.types import (
+    CalibrationStatus,
+    DeckCalibration,
+    SourceType,
+)
+from opentrons.hardware_control import API
+from opentrons.hardware_control.motion_utilities import deck_from_machine
+from opentrons.hardware_control.robot_calibration import (
+    RobotCalibration,
+    build_deck_transform,
+)
+from opentrons.hardware_control.types import Axis
+from opentrons.types import Mount, Point
+
+_DECK_CALIBRATION = DeckCalibration(
+    attitude=[[1.0047, -0.0046, 0.0], [0.0011, 1.0038, 0.0], [0.0, 0.0, 1.0]],
+    source=SourceType.user,
+    status=CalibrationStatus(),
+)
+_MACHINE_POSITION = {"X": 120.0, "Y": 80.0, "Z": 30.0, "A": 150.0, "B": 5, "C": 7}
+
+
+def _conversions_per_second(conversions: int) -> None:
+    attitude = _DECK_CALIBRATION.attitude
+    transform = build_deck_transform(_DECK_CALIBRATION)
+    origin = Point(0, 0, 0)
+    assert deck_from_machine(
+        _MACHINE_POSITION, attitude, origin, Axis
+    ) == deck_from_machine(
+        _MACHINE_POSITION, attitude, origin, Axis, inverse_attitude=transform.inverse
+    )
+
+    start = time.perf_counter()
+    for _ in range(conversions):
+        deck_from_machine(_MACHINE_POSITION, attitude, origin, Axis)
+    previous = conversions / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(conversions):
+        deck_from_machine(
+            _MACHINE_POSITION,
+            transform.attitude,
+            origin,
+            Axis,
+            inverse_attitude=transform.inverse,
+        )
+    cached = conversions / (time.perf_counter() - start)
+
+    print(f"{conversions} machine to deck conversions")
+    print(f"  {'inverted every time':<24} {previous:>10.0f} conversions/s")
+    print(f"  {'cached inverse':<24} {cached:>10.0f} conversions/s")
+
+
+async def _moves(moves: int) -> None:
+    api = await API.build_hardware_simulator()
+    await api.update_deck_calibration(
+        RobotCalibration(deck_calibration=_DECK_CALIBRATION)
+    )
+    await api.home()
+    # Start counting with the protocol.
+    await api.reset()
+
+    start = time.perf_counter()
+    for i in range(moves):
+        origin = await api.gantry_position(Mount.RIGHT)
+        target = Point(100 + i % 10, 100 + i % 10, 50)
+        await api.move_to(Mount.RIGHT, origin._replace(z=100))
+        await api.move_to(Mount.RIGHT, target._replace(z=100))
+        await api.move_to(Mount.RIGHT, target)
+    elapsed = time.perf_counter() - start
+    counts = api.position_read_counts
+
+    print(f"{moves} moves to a well, each through 3 waypoints")
+    print(f"  {'moves/s':<24} {moves / elapsed:>10.0f}")
+    print(f"  {'controller reads':<24} {counts.controller:>10}")
+    print(f"  {'cached reads':<24} {counts.cached:>10}")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversions", type=int, default=20000)
+    parser.add_argument("--moves", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+
+    _conversions_per_second(args.conversions)
+    asyncio.run(_moves(args.moves))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark simulating the g-code-testing protocol corpus.
+
+Simulates every protocol in the g-code-testing corpus with
+`opentrons.simulate.simulate`, once the usual way, which moves the hardware
+simulator for every pipette action, and once with `analysis_only=True`,
+which only tracks pipette state and plans moves. Both run logs must match.
+Protocols that fail to simulate either way are reported and skipped.
+
+Usage:
+    python benchmarks/bench_simulate.py --repeat 3
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Any, List, Mapping, Optional
+
+from opentrons import simulate
+
+_CORPUS = (
+    Path(__file__).resolve().parents[2]
+    / "g-code-testing"
+    / "g_code_test_data"
+    / "protocol"
+    / "protocols"
+)
+
+
+def _text(runlog: List[Mapping[str, Any]]) -> List[str]:
+    return [entry["payload"]["text"] for entry in runlog]
+
+
+def _simulate(path: Path, analysis_only: bool) -> List[str]:
+    with path.open() as protocol_file:
+        runlog, _ = simulate.simulate(
+            protocol_file, path.name, analysis_only=analysis_only
+        )
+    return _text(runlog)
+
+
+def _time(path: Path, analysis_only: bool, repeat: int) -> Optional[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            _simulate(path, analysis_only)
+        except Exception as error:
+            print(f"{path.name}: skipped, {type(error).__name__}: {error}")
+            return None
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=_CORPUS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+
+    paths = sorted(p for p in args.corpus.glob("*/*.py") if p.name != "__init__.py")
+    results = []
+    for path in paths:
+        full = _time(path, False, args.repeat)
+        if full is None:
+            continue
+        analysis = _time(path, True, args.repeat)
+        if analysis is None:
+            continue
+        assert _simulate(path, False) == _simulate(path, True), path.name
+        results.append((path.name, full, analysis))
+
+    print(f"{len(results)} protocols, best of {args.repeat}")
+    print(f"  {'protocol':<48} {'full':>10} {'analysis':>10}")
+    for name, full, analysis in results:
+        print(f"  {name:<48} {full * 1e3:8.0f} ms {analysis * 1e3:8.0f} ms")
+    total_full = sum(r[1] for r in results)
+    total_analysis = sum(r[2] for r in results)
+    print(f"  {'total':<48} {total_full * 1e3:8.0f} ms {total_analysis * 1e3:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
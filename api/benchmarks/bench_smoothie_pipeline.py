@@ -0,0 +1,118 @@
+"""Benchmark pipelined Smoothie setup commands against the Smoothie emulator.
+
+Runs the same sequence of moves through a `SmoothieDriver` connected to the
+Smoothie emulator, once the usual way, where every max speed change and
+every plunger current drop is a command of its own, and once with
+``pipelined=True``, where they ride along on the line of the next command.
+Each move is wrapped in `restore_axis_max_speed`, like
+`hardware_control.Controller.move` does. Both runs must end up in the same
+position. The number of serial round trips is reported along with round
+trips per second and the time taken per move. Pipelining sends fewer,
+longer lines, so round trips per second drops a little while the time per
+move, which is what a protocol waits on, drops much further.
+
+Usage:
+    python benchmarks/bench_smoothie_pipeline.py --moves 200
+"""
+import argparse
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from opentrons.config.robot_configs import build_config_ot2
+from opentrons.drivers.smoothie_drivers import SmoothieDriver
+from opentrons.hardware_control.emulation.scripts import run_smoothie
+from opentrons.hardware_control.emulation.settings import Settings
+
+_MAX_SPEEDS = {"X": 600, "Y": 400, "Z": 125, "A": 125, "B": 40, "C": 40}
+
+
+def _start_emulator(settings: Settings) -> None:
+    thread = threading.Thread(
+        target=lambda: asyncio.run(run_smoothie.run(settings)), daemon=True
+    )
+    thread.start()
+
+
+async def _connect(settings: Settings, pipelined: bool) -> SmoothieDriver:
+    for _ in range(50):
+        try:
+            return await SmoothieDriver.build(
+                port=f"socket://127.0.0.1:{settings.smoothie.port}",
+                config=build_config_ot2({}),
+                pipelined=pipelined,
+            )
+        except Exception:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Unable to connect to the Smoothie emulator")
+
+
+async def _run(
+    settings: Settings, pipelined: bool, moves: int
+) -> Tuple[float, int, Dict[str, float]]:
+    driver = await _connect(settings, pipelined)
+    await driver.home()
+
+    connection = driver._connection
+    assert connection is not None
+    send_command = connection.send_command
+    round_trips = 0
+
+    async def _counted(*args: Any, **kwargs: Any) -> str:
+        nonlocal round_trips
+        round_trips += 1
+        return await send_command(*args, **kwargs)
+
+    connection.send_command = _counted  # type: ignore[assignment]
+
+    start = time.perf_counter()
+    for i in range(moves):
+        offset = float(i % 10)
+        for target in ({"X": 100 + offset, "Y": 100 + offset}, {"B": 5 + offset}):
+            async with driver.restore_axis_max_speed(_MAX_SPEEDS):
+                await driver.move(target)
+    elapsed = time.perf_counter() - start
+
+    await driver.update_position()
+    position = dict(driver.position)
+    await driver.disconnect()
+    return elapsed, round_trips, position
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+    # The emulator complains about every closed connection.
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+
+    settings = Settings()
+    _start_emulator(settings)
+
+    async def _both() -> None:
+        total_moves = args.moves * 2
+        results = {}
+        for pipelined in (False, True):
+            results[pipelined] = await _run(settings, pipelined, args.moves)
+        assert results[False][2] == results[True][2]
+
+        print(f"{total_moves} moves, each wrapped in restore_axis_max_speed")
+        print(f"  {'mode':<12} {'round trips':>12} {'trips/s':>12} {'per move':>12}")
+        for pipelined, (elapsed, round_trips, _) in results.items():
+            name = "pipelined" if pipelined else "default"
+            print(
+                f"  {name:<12} {round_trips:>12} "
+                f"{round_trips / elapsed:>12.0f} "
+                f"{elapsed / total_moves * 1e3:>9.2f} ms"
+            )
+
+    asyncio.run(_both())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark state change wakeups while a long protocol runs.
+
+Runs a simulated protocol of many commands through a `StateStore`, with a
+client that adds each command and waits for it to complete, the way
+`ProtocolEngine.add_and_execute_command` does. Alongside it, an idle
+subscriber waits on labware state, which the commands never change.
+Commands that finish with a result still notify every topic, since a
+result may change any part of state.
+
+The run is done twice: once with every waiter re-checking its condition on
+every state change (how `StateStore.wait_for` worked before topics), and once
+with per-command completion futures and topic-filtered subscriptions.
+
+Usage:
+    python benchmarks/bench_state_wakeups.py --commands 5000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from opentrons_shared_data.deck import load as load_deck
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import QueueCommandAction, UpdateCommandAction
+from opentrons.protocol_engine.state import StateStore, StateTopic
+
+_CREATED_AT = datetime(year=2021, month=1, day=1)
+
+
+def _make_pause(command_id: str, status: commands.CommandStatus) -> commands.Pause:
+    return commands.Pause(
+        id=command_id,
+        key=command_id,
+        status=status,
+        createdAt=_CREATED_AT,
+        params=commands.PauseParams(),
+        result=(
+            commands.PauseResult()
+            if status == commands.CommandStatus.SUCCEEDED
+            else None
+        ),
+    )
+
+
+async def _run_protocol(command_count: int, use_topics: bool) -> float:
+    store = StateStore(
+        deck_definition=load_deck("ot2_standard", 2),
+        deck_fixed_labware=[],
+        is_door_blocking=False,
+    )
+
+    idle_subscriber = asyncio.get_running_loop().create_task(
+        store.wait_for(
+            lambda: len(store.labware.get_labware_offsets()) > 0,
+            topic=StateTopic.LABWARE if use_topics else None,
+        )
+    )
+
+    async def _execute(command_id: str) -> None:
+        for status in (
+            commands.CommandStatus.RUNNING,
+            commands.CommandStatus.SUCCEEDED,
+        ):
+            await asyncio.sleep(0)
+            store.handle_action(
+                UpdateCommandAction(command=_make_pause(command_id, status))
+            )
+
+    start = time.perf_counter()
+
+    for i in range(command_count):
+        command_id = f"command-{i}"
+        store.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                command_key=command_id,
+                created_at=_CREATED_AT,
+                request=commands.PauseCreate(params=commands.PauseParams()),
+            )
+        )
+        execution = asyncio.get_running_loop().create_task(_execute(command_id))
+
+        if use_topics:
+            await store.wait_for_command_completion(command_id)
+        else:
+            await store.wait_for(store.commands.get_is_complete, command_id=command_id)
+
+        await execution
+
+    elapsed = time.perf_counter() - start
+    idle_subscriber.cancel()
+
+    mode = "topics + futures" if use_topics else "wake on every change"
+    print(
+        f"  {mode:<22} {elapsed * 1e3:10.2f} ms"
+        f" {store.get_spurious_wakeup_count():10d} spurious wakeups"
+    )
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{args.commands} command protocol")
+
+    async def _run() -> None:
+        await _run_protocol(args.commands, use_topics=False)
+        await _run_protocol(args.commands, use_topics=True)
+
+    asyncio.get_event_loop().run_until_complete(_run())
+
+
+if __name__ == "__main__":
+    main()
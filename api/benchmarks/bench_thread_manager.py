@@ -0,0 +1,124 @@
+"""Benchmark calls into the hardware API through ThreadManager.
+
+Calls `gantry_position` on a simulating hardware API: directly, from the
+API's own event loop; through a `ThreadManager` from another thread, both
+with the previous `CallBridger`, which looked up and wrapped the method on
+every access and returned results through a `concurrent.futures.Future`,
+and with the current one; and in batches with
+`ThreadManager.call_batch`, which makes a single trip to the managed thread
+per batch. Every way must return the same position.
+
+Usage:
+    python benchmarks/bench_thread_manager.py --calls 5000 --batch 10
+"""
+import argparse
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Mapping, Sequence
+
+from opentrons.hardware_control import API, ThreadManager
+from opentrons.types import Mount
+
+
+class _PreviousCallBridger:
+    """CallBridger as it was before its methods were cached."""
+
+    def __init__(self, wrapped_obj: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self.wrapped_obj = wrapped_obj
+        self._loop = loop
+
+    def __getattribute__(self, attr_name: str) -> Any:
+        managed_obj = object.__getattribute__(self, "wrapped_obj")
+        loop = object.__getattribute__(self, "_loop")
+        try:
+            attr = getattr(managed_obj, attr_name)
+        except AttributeError:
+            return object.__getattribute__(self, attr_name)
+
+        if asyncio.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            async def wrapper(*args: Sequence[Any], **kwargs: Mapping[str, Any]) -> Any:
+                fut = asyncio.run_coroutine_threadsafe(attr(*args, **kwargs), loop)
+                return await asyncio.wrap_future(fut)
+
+            return wrapper
+        return attr
+
+
+async def _calls_per_second(
+    call: Callable[[], Any], calls: int, per_call: int = 1
+) -> float:
+    start = time.perf_counter()
+    for _ in range(calls // per_call):
+        await call()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.getLogger("opentrons").setLevel(logging.ERROR)
+
+    async def _direct() -> float:
+        api = await API.build_hardware_simulator()
+        await api.home()
+        expected = await api.gantry_position(Mount.LEFT)
+        result = await _calls_per_second(
+            lambda: api.gantry_position(Mount.LEFT), args.calls
+        )
+        assert await api.gantry_position(Mount.LEFT) == expected
+        return result
+
+    direct = asyncio.run(_direct())
+
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    thread_manager.sync.home()
+    expected = thread_manager.sync.gantry_position(Mount.LEFT)
+    assert thread_manager._loop is not None
+    previous = _PreviousCallBridger(thread_manager.managed_obj, thread_manager._loop)
+
+    def _gantry_position(hw: Any) -> Awaitable[Any]:
+        return hw.gantry_position(Mount.LEFT)  # type: ignore[no-any-return]
+
+    async def _bridged() -> List[float]:
+        assert await previous.gantry_position(Mount.LEFT) == expected
+        assert await thread_manager.gantry_position(Mount.LEFT) == expected
+        batch = [_gantry_position] * args.batch
+        assert await thread_manager.call_batch(*batch) == [expected] * args.batch
+
+        return [
+            await _calls_per_second(
+                lambda: previous.gantry_position(Mount.LEFT), args.calls
+            ),
+            await _calls_per_second(
+                lambda: thread_manager.gantry_position(Mount.LEFT), args.calls
+            ),
+            await _calls_per_second(
+                lambda: thread_manager.call_batch(*batch), args.calls, args.batch
+            ),
+        ]
+
+    try:
+        previous_bridge, cached_bridge, batched = asyncio.run(_bridged())
+    finally:
+        thread_manager.clean_up()
+
+    print(f"{args.calls} calls of gantry_position")
+    for name, rate in (
+        ("direct", direct),
+        ("ThreadManager, previous bridge", previous_bridge),
+        ("ThreadManager, cached bridge", cached_bridge),
+        (f"ThreadManager.call_batch of {args.batch}", batched),
+    ):
+        print(f"  {name:<36} {rate:>10.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark cycling through every tip in a set of tip racks.
+
+Picks up every tip from a list of tip racks the way
+`InstrumentContext.pick_up_tip` does, by asking each rack in turn for its
+next tip, starting from its first well, and then using the tips, until all
+of the racks are empty. Runs the cycle with `TipTracker`, which keeps each
+column's tips as a bitmask, and, for comparison, with the well-by-well
+search that `TipTracker` used to do.
+
+Usage:
+    python benchmarks/bench_tip_tracker.py --racks 10
+"""
+import argparse
+import timeit
+from itertools import dropwhile, takewhile
+from typing import List, Optional, Sequence, Type, Union
+
+from opentrons.protocols.api_support.tip_tracker import TipTracker
+from opentrons.protocols.api_support.well_grid import WellGrid
+from opentrons.protocols.context.well import WellImplementation
+
+
+class _WellSearchTipTracker:
+    """The column-filtering search that `TipTracker` used to do."""
+
+    def __init__(self, columns: Sequence[Sequence[WellImplementation]]) -> None:
+        self._columns = columns
+
+    def next_tip(
+        self, num_tips: int = 1, starting_tip: Optional[WellImplementation] = None
+    ) -> Optional[WellImplementation]:
+        columns = self._columns
+        if starting_tip:
+            drop_undefined_columns = list(
+                dropwhile(lambda x: starting_tip not in x, columns)
+            )
+            drop_undefined_columns[0] = list(
+                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
+            )
+            columns = drop_undefined_columns
+
+        drop_leading_empties = [
+            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
+        ]
+        drop_at_first_gap = [
+            list(takewhile(lambda x: x.has_tip(), column))
+            for column in drop_leading_empties
+        ]
+        long_enough = [c for c in drop_at_first_gap if len(c) >= num_tips]
+        return long_enough[0][0] if long_enough else None
+
+    def use_tips(self, start_well: WellImplementation, num_channels: int = 1) -> None:
+        target_column = [col for col in self._columns if start_well in col][0]
+        well_idx = target_column.index(start_well)
+        num_tips = min(len(target_column) - well_idx, num_channels)
+        for well in target_column[well_idx : well_idx + num_tips]:
+            well.set_has_tip(False)
+
+
+Tracker = Union[TipTracker, _WellSearchTipTracker]
+
+
+def _make_rack(rows: int, columns: int, tracker_type: Type[Tracker]) -> Tracker:
+    wells = [
+        WellImplementation(
+            well_geometry=None,  # type: ignore[arg-type]
+            display_name=f"{chr(65 + row)}{column}",
+            has_tip=True,
+            name=f"{chr(65 + row)}{column}",
+        )
+        for column in range(1, columns + 1)
+        for row in range(rows)
+    ]
+    return tracker_type(WellGrid(wells).get_columns())
+
+
+def _cycle(racks: List[Tracker], num_channels: int) -> int:
+    pick_ups = 0
+    for rack in racks:
+        first_well = rack._columns[0][0]
+        while True:
+            well = rack.next_tip(num_channels, first_well)
+            if well is None:
+                break
+            rack.use_tips(well, num_channels)
+            pick_ups += 1
+    return pick_ups
+
+
+def _time_cycle(
+    tracker_type: Type[Tracker],
+    racks: int,
+    rows: int,
+    columns: int,
+    num_channels: int,
+    repeat: int,
+) -> float:
+    def _setup() -> List[Tracker]:
+        return [_make_rack(rows, columns, tracker_type) for _ in range(racks)]
+
+    times = []
+    for _ in range(repeat):
+        tip_racks = _setup()
+        times.append(timeit.timeit(lambda: _cycle(tip_racks, num_channels), number=1))
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--racks", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tracker_types: List[Type[Tracker]] = [TipTracker, _WellSearchTipTracker]
+
+    for label, rows, columns in [("96-tip", 8, 12), ("384-tip", 16, 24)]:
+        for num_channels in [1, 8]:
+            expected = args.racks * rows * columns // num_channels
+            for tracker_type in tracker_types:
+                racks = [
+                    _make_rack(rows, columns, tracker_type) for _ in range(args.racks)
+                ]
+                assert _cycle(racks, num_channels) == expected
+
+            bitmask, well_search = (
+                _time_cycle(t, args.racks, rows, columns, num_channels, args.repeat)
+                for t in tracker_types
+            )
+            print(
+                f"{args.racks} {label} racks, {num_channels}-channel, "
+                f"{expected} pick-ups"
+            )
+            print(f"  {'bitmask TipTracker':<24} {bitmask * 1e3:10.2f} ms")
+            print(f"  {'well-by-well search':<24} {well_search * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,15 @@ class CalibrationDict(TypedDict):
     tipLength: TipLengthDict
 
 
+class LabwareOffsetEntry(CalibrationIndexDict, total=False):
+    """
+    A labware calibration in the labware offset store: its
+    index information and, once it's been calibrated, its offset.
+    """
+
+    default: OffsetDict
+
+
 class PipetteCalibrationData(TypedDict):
     offset: PipetteOffset
     tiprack: str
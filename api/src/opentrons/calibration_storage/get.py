@@ -7,24 +7,31 @@ import itertools
 import logging
 import json
 import typing
+from pathlib import Path
 from typing_extensions import Literal
 
 from opentrons import config
 from opentrons.types import Point, Mount
 
-from . import types as local_types, file_operators as io, helpers, migration, modify
+from . import (
+    types as local_types,
+    file_operators as io,
+    helpers,
+    labware_offset_store,
+    modify,
+)
 
 if typing.TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
     from opentrons_shared_data.pipette.dev_types import LabwareUri
-    from .dev_types import CalibrationIndexDict, CalibrationDict
+    from .dev_types import CalibrationIndexDict, LabwareOffsetEntry
 
 
 log = logging.getLogger(__name__)
 
 
 def _format_calibration_type(
-    data: "CalibrationDict",
+    data: "LabwareOffsetEntry",
 ) -> local_types.LabwareCalibrationTypes:
     offset = local_types.OffsetData(
         value=data["default"]["offset"], last_modified=data["default"]["lastModified"]
@@ -53,42 +60,24 @@ def get_all_calibrations() -> typing.List[local_types.CalibrationInformation]:
     in a succinct way.
 
     :return: A list of dictionary objects representing all of the
-    labware calibration files found on the robot.
+    labware calibrations found on the robot.
     """
     all_calibrations: typing.List[local_types.CalibrationInformation] = []
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
-    if not index_path.exists():
-        return all_calibrations
-
-    migration.check_index_version(index_path)
-    index_file = io.read_cal_file(str(index_path))
-    calibration_index = index_file.get("data", {})
-    for key, data in calibration_index.items():
-        cal_path = offset_path / f"{key}.json"
-        if cal_path.exists():
-            try:
-                cal_blob = io.read_cal_file(str(cal_path))
-            except json.JSONDecodeError:
-                log.error(
-                    f"Skipping corrupt calibration file (bad JSON): {str(cal_path)}"
-                )
-                continue
-            calibration = _format_calibration_type(cal_blob)  # type: ignore
-            try:
-                all_calibrations.append(
-                    local_types.CalibrationInformation(
-                        calibration=calibration,
-                        parent=_format_parent(data),
-                        labware_id=key,
-                        uri=data["uri"],
-                    )
-                )
-            except (KeyError, ValueError):
-                log.exception(
-                    f"Skipping corrupt calibration file (bad data) {str(cal_path)}"
+    for key, data in labware_offset_store.get_all().items():
+        if "default" not in data:
+            continue
+        try:
+            all_calibrations.append(
+                local_types.CalibrationInformation(
+                    calibration=_format_calibration_type(data),
+                    parent=_format_parent(data),
+                    labware_id=key,
+                    uri=data["uri"],
                 )
-                continue
+            )
+        except (KeyError, ValueError):
+            log.exception(f"Skipping corrupt labware calibration (bad data): {key}")
+            continue
     return all_calibrations
 
 
@@ -126,17 +115,15 @@ def get_labware_calibration(
     """
     Find the delta of a given labware, if it exists.
 
-    :param lookup_path: short path to the labware calibration
+    :param lookup_path: short path to the labware calibration, named
+    after its calibration ID
     :return: A point which represents the delta from well A1 origin of
     a labware
     """
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
     offset = Point(0, 0, 0)
-    labware_path = offset_path / lookup_path
-    if labware_path.exists():
+    calibration_data = labware_offset_store.get(Path(lookup_path).stem)
+    if calibration_data is not None and "default" in calibration_data:
         modify.add_existing_labware_to_index_file(definition, parent, slot)
-        migration.check_index_version(offset_path / "index.json")
-        calibration_data = io.read_cal_file(str(labware_path))
         offset_array = calibration_data["default"]["offset"]
         offset = Point(x=offset_array[0], y=offset_array[1], z=offset_array[2])
     return offset
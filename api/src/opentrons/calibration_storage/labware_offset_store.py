@@ -0,0 +1,157 @@
+""" opentrons.calibration_storage.labware_offset_store: a single-file
+store of labware calibrations.
+
+Every labware calibration, along with the index information that used to
+live in a separate index.json, is kept in one file in the labware
+calibration directory, keyed by calibration ID (the labware hash plus its
+parent). The parsed store is cached in memory, and the cache is dropped
+whenever the store is written or its file is replaced by another process.
+
+Older robots kept one ``{calibration_id}.json`` file per labware next to
+an index.json. Those are migrated into the store the first time it's read;
+see :py:func:`.migration.migrate_labware_offsets_to_store`.
+
+A store that can't be parsed is moved aside to ``labware_offsets.corrupt.json``
+rather than written over, so the calibrations in it can still be recovered.
+
+These methods should only be imported inside the calibration_storage
+module.
+"""
+import json
+import logging
+import os
+import threading
+import typing
+from pathlib import Path
+
+from opentrons import config
+
+from . import file_operators as io, migration
+
+if typing.TYPE_CHECKING:
+    from .dev_types import LabwareOffsetEntry
+
+
+log = logging.getLogger(__name__)
+
+STORE_FILE_NAME = "labware_offsets.json"
+CORRUPT_STORE_FILE_NAME = "labware_offsets.corrupt.json"
+STORE_VERSION = 1
+
+LabwareOffsets = typing.Dict[str, "LabwareOffsetEntry"]
+
+# The (inode, mtime, size) of the store file when it was last read.
+_FileStamp = typing.Tuple[int, int, int]
+
+_lock = threading.RLock()
+_cached: typing.Optional[typing.Tuple[Path, _FileStamp, LabwareOffsets]] = None
+
+
+def get_all() -> typing.Mapping[str, "LabwareOffsetEntry"]:
+    """
+    Get every stored labware calibration, keyed by calibration ID.
+
+    The returned mapping is shared with the cache and must not be modified;
+    use :py:func:`put` and :py:func:`remove` to change the store.
+    """
+    with _lock:
+        return _load()
+
+
+def get(calibration_id: str) -> typing.Optional["LabwareOffsetEntry"]:
+    """
+    Get a single stored labware calibration, or None if there isn't one.
+
+    The returned entry is shared with the cache and must not be modified.
+    """
+    return get_all().get(calibration_id)
+
+
+def put(calibration_id: str, entry: "LabwareOffsetEntry") -> None:
+    """
+    Add or replace a labware calibration.
+
+    :param calibration_id: labware hash plus parent
+    :param entry: the index information and, if calibrated, the offset
+    """
+    with _lock:
+        offsets = dict(_load())
+        offsets[calibration_id] = entry
+        _save(offsets)
+
+
+def remove(calibration_id: str) -> None:
+    """
+    Remove a labware calibration.
+
+    :param calibration_id: labware hash plus parent
+    :raises KeyError: If there is no calibration with this ID.
+    """
+    with _lock:
+        offsets = dict(_load())
+        del offsets[calibration_id]
+        _save(offsets)
+
+
+def invalidate() -> None:
+    """Drop the in-memory copy of the store, so the next read reloads it."""
+    global _cached
+    with _lock:
+        _cached = None
+
+
+def _get_store_path() -> Path:
+    offset_dir = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
+    return offset_dir / STORE_FILE_NAME
+
+
+def _get_file_stamp(path: Path) -> typing.Optional[_FileStamp]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _load() -> LabwareOffsets:
+    global _cached
+    path = _get_store_path()
+    stamp = _get_file_stamp(path)
+
+    if stamp is None:
+        _cached = None
+        return migration.migrate_labware_offsets_to_store(path.parent, _save)
+
+    if _cached is not None and _cached[0] == path and _cached[1] == stamp:
+        return _cached[2]
+
+    try:
+        blob = io.read_cal_file(path)
+    except json.JSONDecodeError:
+        corrupt_path = path.with_name(CORRUPT_STORE_FILE_NAME)
+        log.error(
+            f"Moving corrupt labware calibration store {str(path)} "
+            f"to {str(corrupt_path)}"
+        )
+        os.replace(path, corrupt_path)
+        _cached = None
+        return migration.migrate_labware_offsets_to_store(path.parent, _save)
+
+    offsets = typing.cast(LabwareOffsets, blob.get("data", {}))
+    _cached = (path, stamp, offsets)
+    return offsets
+
+
+def _save(offsets: LabwareOffsets) -> None:
+    global _cached
+    path = _get_store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file and move it into place, so that a crash
+    # mid-write can't leave a half-written store behind.
+    temp_path = path.with_name(f"{STORE_FILE_NAME}.tmp")
+    io.save_to_file(temp_path, {"version": STORE_VERSION, "data": offsets})
+    os.replace(temp_path, path)
+
+    stamp = _get_file_stamp(path)
+    _cached = (path, stamp, offsets) if stamp is not None else None
@@ -1,6 +1,16 @@
+import json
+import logging
 import typing
+from pathlib import Path
+
 from . import file_operators as io, types as local_types
 
+if typing.TYPE_CHECKING:
+    from .dev_types import LabwareOffsetEntry
+
+
+log = logging.getLogger(__name__)
+
 
 MAX_VERSION = 1
 
@@ -52,3 +62,45 @@ def migrate_index_0_to_1(index_path: local_types.StrPath) -> None:
         }
     migrated_file = {"version": 1, "data": updated_entries}
     io.save_to_file(index_path, migrated_file)
+
+
+def migrate_labware_offsets_to_store(
+    offset_dir: Path,
+    save_store: typing.Callable[[typing.Dict[str, "LabwareOffsetEntry"]], None],
+) -> typing.Dict[str, "LabwareOffsetEntry"]:
+    """
+    Previously, each labware calibration was saved in its own
+    ``{calibration_id}.json`` file, and looked up through an index.json
+    file in the same directory. Now, they're all saved in a single
+    labware offset store.
+
+    This function reads the index and every calibration file it references
+    and saves the combined entries with ``save_store``. Corrupt calibration
+    files are migrated as index entries without an offset. The legacy files
+    are left in place, so that software from before the store can still
+    read the calibrations as they were when they were migrated.
+
+    :param offset_dir: the labware calibration directory
+    :param save_store: a function to save the migrated store
+    :return: The migrated entries, or an empty dict if there was no index.
+    """
+    index_path = offset_dir / "index.json"
+    if not index_path.exists():
+        return {}
+
+    check_index_version(index_path)
+    index = io.read_cal_file(str(index_path)).get("data", {})
+    entries: typing.Dict[str, "LabwareOffsetEntry"] = {}
+
+    for calibration_id, index_data in index.items():
+        entry = typing.cast("LabwareOffsetEntry", dict(index_data))
+        cal_path = offset_dir / f"{calibration_id}.json"
+        if cal_path.exists():
+            try:
+                entry["default"] = io.read_cal_file(str(cal_path))["default"]
+            except (json.JSONDecodeError, KeyError):
+                log.error(f"Not migrating corrupt calibration file: {str(cal_path)}")
+        entries[calibration_id] = entry
+
+    save_store(entries)
+    return entries
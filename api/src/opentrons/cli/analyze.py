@@ -1,11 +1,16 @@
 """Opentrons analyze CLI."""
+from __future__ import annotations
+
 import click
+import sys
+import time
 
 from anyio import run, Path as AsyncPath
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Union
 from typing_extensions import Literal
 
 from opentrons.protocols.api_support.types import APIVersion
@@ -15,8 +20,9 @@ from opentrons.protocol_reader import (
     ProtocolType,
     JsonProtocolConfig,
     ProtocolFilesInvalidError,
+    ProtocolSource,
 )
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons.protocol_runner import ProtocolRunResult, create_simulating_runner
 from opentrons.protocol_engine import Command, ErrorOccurrence
 
 
@@ -29,16 +35,49 @@ from opentrons.protocol_engine import Command, ErrorOccurrence
 )
 @click.option(
     "--json-output",
-    help="Return analysis results as machine-readable JSON.",
+    help=(
+        "Return analysis results as machine-readable JSON."
+        " In batch mode, write newline-delimited JSON here instead of to stdout."
+    ),
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help=(
+        "Treat each file or directory as a separate protocol,"
+        " and analyze them in parallel."
+        " Results are streamed as newline-delimited JSON, one line per protocol,"
+        " in the order that they finish."
+    ),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="In batch mode, how many protocols to analyze at once."
+    " Defaults to the number of CPUs.",
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[AsyncPath],
+    batch: bool,
+    workers: Optional[int],
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
     """
-    run(_analyze, files, json_output)
+    if batch:
+        if json_output:
+            with open(json_output, "w", encoding="utf-8") as output:
+                _analyze_batch(files, output, workers)
+        else:
+            _analyze_batch(files, sys.stdout, workers)
+    else:
+        run(_analyze, files, json_output)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -71,21 +110,7 @@ async def _analyze(
     analysis = await runner.run(protocol_source)
 
     if json_output:
-        results = AnalyzeResults(
-            createdAt=datetime.now(tz=timezone.utc),
-            files=[
-                ProtocolFile(name=f.path.name, role=f.role)
-                for f in protocol_source.files
-            ],
-            config=(
-                JsonConfig(schemaVersion=protocol_source.config.schema_version)
-                if isinstance(protocol_source.config, JsonProtocolConfig)
-                else PythonConfig(apiVersion=protocol_source.config.api_version)
-            ),
-            metadata=protocol_source.metadata,
-            commands=analysis.commands,
-            errors=analysis.state_summary.errors,
-        )
+        results = _build_results(protocol_source, analysis)
 
         await json_output.write_text(
             results.json(exclude_none=True),
@@ -98,6 +123,77 @@ async def _analyze(
         )
 
 
+def _analyze_batch(
+    files_and_dirs: Sequence[Path],
+    output: TextIO,
+    workers: Optional[int],
+) -> None:
+    # Each worker process pays the cost of importing and setting up
+    # the simulator once, and then reuses it for every protocol it analyzes.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_analyze_batch_entry, entry) for entry in files_and_dirs
+        ]
+
+        for future in as_completed(futures):
+            output.write(future.result() + "\n")
+            output.flush()
+
+
+def _analyze_batch_entry(entry: Path) -> str:
+    """Analyze one protocol of a batch. Runs inside a worker process.
+
+    Returns:
+        The protocol's `BatchAnalyzeResult`, serialized as a single line of JSON.
+    """
+    start_time = time.perf_counter()
+    results: Optional[AnalyzeResults] = None
+    error: Optional[str] = None
+
+    try:
+        results = run(_analyze_entry, entry)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return BatchAnalyzeResult(
+        path=str(entry),
+        wallTime=time.perf_counter() - start_time,
+        results=results,
+        error=error,
+    ).json(exclude_none=True)
+
+
+async def _analyze_entry(entry: Path) -> AnalyzeResults:
+    protocol_source = await ProtocolReader().read_saved(
+        files=_get_input_files([entry]),
+        directory=None,
+    )
+    runner = await create_simulating_runner()
+    analysis = await runner.run(protocol_source)
+
+    return _build_results(protocol_source, analysis)
+
+
+def _build_results(
+    protocol_source: ProtocolSource,
+    analysis: ProtocolRunResult,
+) -> AnalyzeResults:
+    return AnalyzeResults(
+        createdAt=datetime.now(tz=timezone.utc),
+        files=[
+            ProtocolFile(name=f.path.name, role=f.role) for f in protocol_source.files
+        ],
+        config=(
+            JsonConfig(schemaVersion=protocol_source.config.schema_version)
+            if isinstance(protocol_source.config, JsonProtocolConfig)
+            else PythonConfig(apiVersion=protocol_source.config.api_version)
+        ),
+        metadata=protocol_source.metadata,
+        commands=analysis.commands,
+        errors=analysis.state_summary.errors,
+    )
+
+
 class ProtocolFile(BaseModel):
     """A file in a protocol analysis."""
 
@@ -128,3 +224,12 @@ class AnalyzeResults(BaseModel):
     metadata: Dict[str, Any]
     commands: List[Command]
     errors: List[ErrorOccurrence]
+
+
+class BatchAnalyzeResult(BaseModel):
+    """Results of analyzing one protocol in batch mode."""
+
+    path: str
+    wallTime: float
+    results: Optional[AnalyzeResults]
+    error: Optional[str]
@@ -6,10 +6,12 @@ from opentrons.drivers.asyncio.communication.errors import (
     ErrorResponse,
 )
 from .async_serial import AsyncSerial
+from .event_loop_serial import EventLoopSerial
 
 __all__ = [
     "SerialConnection",
     "AsyncSerial",
+    "EventLoopSerial",
     "SerialException",
     "NoResponse",
     "AlarmResponse",
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from concurrent.futures.thread import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, AsyncGenerator
+
+from serial import (  # type: ignore[import]
+    Serial,
+    SerialException,
+    SerialTimeoutException,
+    serial_for_url,
+)
+
+from .async_serial import AsyncSerial, TimeoutProperties
+
+READ_CHUNK_SIZE = 4096
+
+# Opening a port may block (connecting a socket, for instance), so it's done
+# on a thread, but one thread is enough for every port.
+_open_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="serial-open")
+
+
+class EventLoopSerial(AsyncSerial):
+    """AsyncSerial that does its I/O on the event loop.
+
+    Rather than blocking a dedicated thread in pyserial's read_until, the
+    port's file descriptor is put in non-blocking mode and registered with
+    the event loop. Data is buffered as it arrives and read_until only scans
+    the newly received bytes for the match, so no thread is needed per port.
+
+    The timeouts are those of pyserial: read_until returns whatever was read
+    if the match doesn't arrive in time, and write raises
+    SerialTimeoutException.
+    """
+
+    @classmethod
+    async def create(
+        cls,
+        port: str,
+        baud_rate: int,
+        timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        reset_buffer_before_write: bool = False,
+    ) -> EventLoopSerial:
+        """
+        Create an EventLoopSerial instance.
+
+        Args:
+            port: url or port name
+            baud_rate: the baud rate
+            timeout: optional timeout in seconds
+            write_timeout: optional write timeout in seconds
+            loop: optional event loop. if None get_running_loop will be used
+            reset_buffer_before_write: reset the serial input buffer before
+             writing to it
+        """
+        loop = loop or asyncio.get_running_loop()
+        serial = await loop.run_in_executor(
+            _open_executor,
+            partial(
+                serial_for_url,
+                url=port,
+                baudrate=baud_rate,
+                timeout=timeout,
+                write_timeout=write_timeout,
+            ),
+        )
+        return cls(
+            serial=serial,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+
+    def __init__(
+        self,
+        serial: Serial,
+        loop: asyncio.AbstractEventLoop,
+        reset_buffer_before_write: bool,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            serial: connected Serial object
+            loop: event loop
+            reset_buffer_before_write: reset the serial input buffer before
+             writing to it
+        """
+        super().__init__(
+            serial=serial,
+            executor=_open_executor,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+        self._timeout: Optional[float] = serial.timeout
+        self._write_timeout: Optional[float] = serial.write_timeout
+        self._buffer = bytearray()
+        # Where read_until has already looked for its match in the buffer.
+        self._scanned = 0
+        self._data_received = asyncio.Event()
+        self._fd: Optional[int] = None
+        self._error: Optional[Exception] = None
+        if serial.is_open:
+            self._start_reading()
+
+    def _start_reading(self) -> None:
+        fd = _fileno(self._serial)
+        os.set_blocking(fd, False)
+        self._loop.add_reader(fd, self._on_readable)
+        self._fd = fd
+        self._error = None
+
+    def _stop_reading(self) -> None:
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        self._clear_buffer()
+
+    def _clear_buffer(self) -> None:
+        self._buffer.clear()
+        self._scanned = 0
+
+    def _on_readable(self) -> None:
+        assert self._fd is not None
+        try:
+            data = os.read(self._fd, READ_CHUNK_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            data = b""
+            self._error = SerialException(f"read failed: {e}")
+        if not data:
+            # The device went away.
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+            self._error = self._error or SerialException(
+                "device reports readiness to read but returned no data"
+            )
+        self._buffer += data
+        self._data_received.set()
+
+    async def read_until(self, match: bytes) -> bytes:
+        """
+        Read data until match.
+
+        Args:
+            match: a sequence of bytes to match
+
+        Returns:
+            read data, which doesn't end with match if the timeout elapsed.
+        """
+        deadline = None if self._timeout is None else self._loop.time() + self._timeout
+        while True:
+            index = self._buffer.find(match, self._scanned)
+            if index >= 0:
+                end = index + len(match)
+                data = bytes(self._buffer[:end])
+                del self._buffer[:end]
+                self._scanned = 0
+                return data
+            # The match may start in bytes that have already arrived.
+            self._scanned = max(0, len(self._buffer) - len(match) + 1)
+
+            if self._error is not None:
+                raise self._error
+            if self._fd is None:
+                raise SerialException("Attempting to use a port that is not open")
+
+            self._data_received.clear()
+            try:
+                if deadline is None:
+                    await self._data_received.wait()
+                else:
+                    await asyncio.wait_for(
+                        self._data_received.wait(),
+                        timeout=max(0.0, deadline - self._loop.time()),
+                    )
+            except asyncio.TimeoutError:
+                data = bytes(self._buffer)
+                self._clear_buffer()
+                return data
+
+    async def write(self, data: bytes) -> None:
+        """
+        Write data
+
+        Args:
+            data: data to write.
+
+        Returns:
+            None
+        """
+        if self._fd is None:
+            raise SerialException("Attempting to use a port that is not open")
+        if self._reset_buffer_before_write:
+            self._clear_buffer()
+            self._serial.reset_input_buffer()
+
+        deadline = (
+            None
+            if self._write_timeout is None
+            else self._loop.time() + self._write_timeout
+        )
+        remaining = memoryview(data)
+        while remaining:
+            try:
+                remaining = remaining[os.write(self._fd, remaining) :]
+            except (BlockingIOError, InterruptedError):
+                await self._wait_writable(
+                    None if deadline is None else deadline - self._loop.time()
+                )
+
+    async def _wait_writable(self, timeout: Optional[float]) -> None:
+        assert self._fd is not None
+        fd = self._fd
+        writable: asyncio.Future[None] = self._loop.create_future()
+
+        def _on_writable() -> None:
+            if not writable.done():
+                writable.set_result(None)
+
+        self._loop.add_writer(fd, _on_writable)
+        try:
+            await asyncio.wait_for(
+                writable, timeout=None if timeout is None else max(0.0, timeout)
+            )
+        except asyncio.TimeoutError:
+            raise SerialTimeoutException("Write timeout")
+        finally:
+            self._loop.remove_writer(fd)
+
+    async def open(self) -> None:
+        """
+        Open the connection.
+
+        Returns: None
+        """
+        await self._loop.run_in_executor(self._executor, self._serial.open)
+        self._start_reading()
+
+    async def close(self) -> None:
+        """
+        Close the connection
+
+        Returns: None
+        """
+        self._stop_reading()
+        self._serial.close()
+
+    @contextlib.asynccontextmanager
+    async def timeout_override(
+        self, timeout_property: TimeoutProperties, timeout: Optional[float]
+    ) -> AsyncGenerator[None, None]:
+        """Context manager that will temporarily override the default timeout."""
+        attribute = f"_{timeout_property}"
+        default_timeout = getattr(self, attribute)
+        try:
+            if timeout is not None:
+                setattr(self, attribute, timeout)
+            yield
+        finally:
+            setattr(self, attribute, default_timeout)
+
+
+def _fileno(serial: Serial) -> int:
+    """Get the file descriptor of an open pyserial port or socket:// url."""
+    try:
+        return int(serial.fileno())
+    except AttributeError:
+        # pyserial's socket:// handler doesn't expose its socket's descriptor.
+        return int(serial._socket.fileno())
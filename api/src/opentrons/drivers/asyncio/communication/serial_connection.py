@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+from os import environ
+from typing import Optional, Type
 
 from opentrons.drivers.command_builder import CommandBuilder
 
 from .errors import NoResponse, AlarmResponse, ErrorResponse
 from .async_serial import AsyncSerial
+from .event_loop_serial import EventLoopSerial
 
 log = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ class SerialConnection:
         error_keyword: Optional[str] = None,
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
+        event_loop_io: Optional[bool] = None,
     ) -> SerialConnection:
         """
         Create a connection.
@@ -46,10 +49,19 @@ class SerialConnection:
                            (default: alarm)
             reset_buffer_before_write: whether to reset the read buffer before
               every write
+            event_loop_io: whether to do serial I/O on the event loop with an
+              EventLoopSerial, rather than on a thread of the connection's own
+              with an AsyncSerial. If None, this is enabled by setting the
+              OT_EVENT_LOOP_SERIAL environment variable to "true".
 
         Returns: SerialConnection
         """
-        serial = await AsyncSerial.create(
+        if event_loop_io is None:
+            event_loop_io = environ.get("OT_EVENT_LOOP_SERIAL", "").lower() == "true"
+        serial_cls: Type[AsyncSerial] = (
+            EventLoopSerial if event_loop_io else AsyncSerial
+        )
+        serial = await serial_cls.create(
             port=port,
             baud_rate=baud_rate,
             timeout=timeout,
@@ -53,6 +53,9 @@ SMOOTHIE_COMMAND_TERMINATOR = "\r\n\r\n"
 
 SMOOTHIE_ACK = "ok\r\nok\r\n"
 
+SMOOTHIE_MAX_PIPELINED_LINE_LENGTH = 128
+"""Longest line to build when pipelining setup commands into another command"""
+
 PLUNGER_BACKLASH_MM = 0.3
 
 LOW_CURRENT_Z_SPEED = 30
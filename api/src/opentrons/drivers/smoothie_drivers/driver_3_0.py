@@ -27,6 +27,7 @@ from opentrons.drivers.smoothie_drivers.constants import (
     Y_BOUND_OVERRIDE,
     SMOOTHIE_COMMAND_TERMINATOR,
     SMOOTHIE_ACK,
+    SMOOTHIE_MAX_PIPELINED_LINE_LENGTH,
     PLUNGER_BACKLASH_MM,
     CURRENT_CHANGE_DELAY,
     PIPETTE_READ_DELAY,
@@ -92,6 +93,7 @@ class SmoothieDriver:
         port: str,
         config: RobotConfig,
         gpio_chardev: Optional[GPIODriverLike] = None,
+        pipelined: Optional[bool] = None,
     ) -> SmoothieDriver:
         """
         Build a smoothie driver
@@ -100,6 +102,7 @@ class SmoothieDriver:
             port: The port
             config: Robot configuration
             gpio_chardev: Optional GPIO driver
+            pipelined: Whether to pipeline setup commands. See `SmoothieDriver`.
 
         Returns:
             A SmoothieDriver instance.
@@ -114,7 +117,12 @@ class SmoothieDriver:
         )
         gpio_chardev = gpio_chardev or SimulatingGPIOCharDev("simulated")
 
-        instance = cls(config=config, connection=connection, gpio_chardev=gpio_chardev)
+        instance = cls(
+            config=config,
+            connection=connection,
+            gpio_chardev=gpio_chardev,
+            pipelined=pipelined,
+        )
         await instance._setup()
         return instance
 
@@ -123,6 +131,7 @@ class SmoothieDriver:
         config: RobotConfig,
         gpio_chardev: GPIODriverLike,
         connection: Optional[SerialConnection] = None,
+        pipelined: Optional[bool] = None,
     ):
         """
         Constructor
@@ -131,6 +140,13 @@ class SmoothieDriver:
             config: The robot configuration
             gpio_chardev: GPIO device.
             connection: The serial connection.
+            pipelined: Whether to pipeline setup commands. Speed, max speed
+                and acceleration changes are then held back and sent on the
+                same line as the next command, instead of each taking two
+                round trips of its own, and plunger moves drop back to
+                dwelling current on the same line as the move. If None,
+                pipelining is enabled by setting the OT_SMOOTHIE_PIPELINED
+                environment variable to "true".
         """
         self.run_flag = asyncio.Event()
         self.run_flag.set()
@@ -144,6 +160,12 @@ class SmoothieDriver:
         self._connection = connection
         self._config = config
 
+        if pipelined is None:
+            pipelined = environ.get("OT_SMOOTHIE_PIPELINED", "").lower() == "true"
+        self._pipelined = pipelined
+        # Setup commands held back to be sent with the next command
+        self._pending_setup = _command_builder()
+
         self._gpio_chardev = gpio_chardev
 
         # Current settings:
@@ -396,6 +418,7 @@ class SmoothieDriver:
             await self._connection.close()
         self._connection = None
         self.simulating = True
+        self._take_pending_setup()
 
     async def is_connected(self) -> bool:
         if not self._connection:
@@ -551,7 +574,7 @@ class SmoothieDriver:
             self._combined_speed = float(value)
         command = self._build_speed_command(float(value))
         log.debug(f"set_speed: {command}")
-        await self._send_command(command)
+        await self._send_setup_command(command)
 
     def push_speed(self) -> None:
         self._saved_axes_speed = float(self._combined_speed)
@@ -589,7 +612,7 @@ class SmoothieDriver:
             command = command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_axis_max_speed: {command}")
-        await self._send_command(command)
+        await self._send_setup_command(command)
 
     def push_axis_max_speed(self) -> None:
         self._saved_max_speed_settings = self._max_speed_settings.copy()
@@ -616,7 +639,7 @@ class SmoothieDriver:
             command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_acceleration: {command}")
-        await self._send_command(command)
+        await self._send_setup_command(command)
 
     def push_acceleration(self) -> None:
         self._saved_acceleration = self._acceleration.copy()
@@ -816,8 +839,33 @@ class SmoothieDriver:
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
-    async def _send_command(
+    async def _send_setup_command(self, command: CommandBuilder) -> None:
+        """
+        Send a command that only changes settings for the commands after it.
+
+        When pipelining, the command is held back and sent on the same line
+        as the next command, so that it needs no round trips of its own.
+        """
+        if self._pipelined:
+            self._pending_setup.add_builder(builder=command)
+        else:
+            await self._send_command(command)
+
+    def _take_pending_setup(self) -> CommandBuilder:
+        pending = self._pending_setup
+        self._pending_setup = _command_builder()
+        return pending
+
+    def _restore_pending_setup(self, pending: CommandBuilder) -> None:
+        """Put back setup commands that may not have reached the smoothie,
+        ahead of any held back since, so they go out with the next command.
+        """
+        if pending:
+            self._pending_setup = (
+                _command_builder().add_builder(pending).add_builder(self._pending_setup)
+            )
+
+    async def _send_command(  # noqa: C901
         self,
         command: CommandBuilder,
         timeout: float = DEFAULT_EXECUTE_TIMEOUT,
@@ -861,31 +909,56 @@ class SmoothieDriver:
             be infinite. This is almost certainly not what you want.
         """
         if self.simulating:
+            self._take_pending_setup()
             return ""
+        pending_setup = _command_builder()
         try:
+            pending_setup = self._take_pending_setup()
+            if pending_setup:
+                combined = _command_builder().add_builder(pending_setup)
+                combined.add_builder(command)
+                if len(combined.build()) <= SMOOTHIE_MAX_PIPELINED_LINE_LENGTH:
+                    command = combined
+                else:
+                    await self._send_command_unsynchronized(
+                        pending_setup, ack_timeout, timeout, wait=False
+                    )
+                    pending_setup = _command_builder()
             return await self._send_command_unsynchronized(
                 command, ack_timeout, timeout
             )
         except SmoothieError as se:
-            # XXX: This is a reentrancy error because another command could
-            # swoop in here. We're already resetting though and errors (should
-            # be) rare so it's probably fine, but the actual solution to this
-            # is locking at a higher level like in APIv2.
-            await self._reset_from_error()
-            error_axis = se.ret_code.strip()[-1]
-            if not suppress_error_msg:
-                log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
-            if (
-                GCODE.MOVE in command or GCODE.PROBE in command
-            ) and not suppress_home_after_error:
-                if error_axis not in "XYZABC":
-                    error_axis = AXES
-                log.info("Homing after alarm/error")
-                await self.home(error_axis)
+            try:
+                # XXX: This is a reentrancy error because another command could
+                # swoop in here. We're already resetting though and errors
+                # (should be) rare so it's probably fine, but the actual
+                # solution to this is locking at a higher level like in APIv2.
+                await self._reset_from_error()
+                error_axis = se.ret_code.strip()[-1]
+                if not suppress_error_msg:
+                    log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
+                if (
+                    GCODE.MOVE in command or GCODE.PROBE in command
+                ) and not suppress_home_after_error:
+                    if error_axis not in "XYZABC":
+                        error_axis = AXES
+                    log.info("Homing after alarm/error")
+                    await self.home(error_axis)
+            finally:
+                # The settings held back were already cached as sent, so
+                # make sure they still reach the smoothie.
+                self._restore_pending_setup(pending_setup)
             raise SmoothieError(se.ret_code, str(command))
+        except BaseException:
+            self._restore_pending_setup(pending_setup)
+            raise
 
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        wait: bool = True,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
@@ -893,6 +966,8 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
+            if not wait:
+                return command_result
             wait_command = CommandBuilder(
                 terminator=SMOOTHIE_COMMAND_TERMINATOR
             ).add_gcode(gcode=GCODE.WAIT)
@@ -1387,16 +1462,30 @@ class SmoothieDriver:
                 if split_postfix:
                     await self._send_command(split_postfix)
 
+        plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+        dwelled_with_move = False
+        move_ack_timeout = DEFAULT_ACK_TIMEOUT
         try:
             log.debug(f"move: {command}")
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            if self._pipelined and plunger_axis_moved:
+                # dwell pipette motors on the same line as the move, once
+                # it has finished, rather than with a command of their own
+                self.dwell_axes(plunger_axis_moved)
+                command.add_gcode(gcode=GCODE.WAIT).add_builder(
+                    builder=self._generate_current_command()
+                )
+                # the smoothie only acks the line once the move is done
+                move_ack_timeout = DEFAULT_EXECUTE_TIMEOUT
+            await self._send_command(
+                command, timeout=DEFAULT_EXECUTE_TIMEOUT, ack_timeout=move_ack_timeout
+            )
+            dwelled_with_move = self._pipelined
         finally:
             # dwell pipette motors because they get hot
-            plunger_axis_moved = "".join(set("BC") & set(target.keys()))
-            if plunger_axis_moved:
+            if plunger_axis_moved and not dwelled_with_move:
                 self.dwell_axes(plunger_axis_moved)
                 await self._set_saved_current()
             self._axes_moved_at.mark_moved(moving_axes)
@@ -40,6 +40,7 @@ from .types import (
     HardwareAction,
     MotionChecks,
     PauseType,
+    PositionReadCounts,
 )
 from . import modules
 from .robot_calibration import (
@@ -109,6 +110,11 @@ class API(
         self._callbacks: Set[HardwareEventHandler] = set()
         # {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'A': 0.0, 'B': 0.0, 'C': 0.0}
         self._current_position: Dict[Axis, float] = {}
+        # The same position in machine coordinates, as last sent to or read
+        # from the backend.
+        # {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'A': 0.0, 'B': 0.0, 'C': 0.0}
+        self._machine_position: Dict[str, float] = {}
+        self._position_read_counts = PositionReadCounts()
 
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
@@ -149,6 +155,18 @@ class API(
     def _reset_last_mount(self) -> None:
         self._last_moved_mount = None
 
+    def _set_position_from_machine(self, machine_pos: Dict[str, float]) -> None:
+        """Cache a position in machine coordinates and in deck coordinates."""
+        transform = self._get_deck_transform()
+        self._machine_position = dict(machine_pos)
+        self._current_position = deck_from_machine(
+            machine_pos,
+            transform.attitude,
+            top_types.Point(0, 0, 0),
+            Axis,
+            inverse_attitude=transform.inverse,
+        )
+
     @classmethod  # noqa: C901
     async def build_hardware_controller(
         cls,
@@ -486,6 +504,8 @@ class API(
 
     async def reset(self) -> None:
         """Reset the stored state of the system."""
+        self._log.info(f"Position reads since last reset: {self._position_read_counts}")
+        self._position_read_counts = PositionReadCounts()
         self._pause_manager.reset()
         await self._execution_manager.reset()
         await InstrumentHandlerProvider.reset(self)
@@ -558,12 +578,7 @@ class API(
         async with self._motion_lock:
             if smoothie_gantry:
                 smoothie_pos.update(await self._backend.home(smoothie_gantry))
-                self._current_position = deck_from_machine(
-                    smoothie_pos,
-                    self._robot_calibration.deck_calibration.attitude,
-                    top_types.Point(0, 0, 0),
-                    Axis,
-                )
+                self._set_position_from_machine(smoothie_pos)
             for plunger in plungers:
                 await self._do_plunger_home(axis=plunger, acquire_lock=False)
 
@@ -595,12 +610,10 @@ class API(
             raise MustHomeError("Current position is unknown; please home motors.")
         async with self._motion_lock:
             if refresh:
-                self._current_position = deck_from_machine(
-                    await self._backend.update_position(),
-                    self._robot_calibration.deck_calibration.attitude,
-                    top_types.Point(0, 0, 0),
-                    Axis,
-                )
+                self._position_read_counts.controller += 1
+                self._set_position_from_machine(await self._backend.update_position())
+            else:
+                self._position_read_counts.cached += 1
             if mount == top_types.Mount.RIGHT:
                 offset = top_types.Point(0, 0, 0)
             else:
@@ -737,7 +750,7 @@ class API(
         """
         machine_pos = machine_from_deck(
             target_position,
-            self._robot_calibration.deck_calibration.attitude,
+            self._get_deck_transform().attitude,
             top_types.Point(0, 0, 0),
         )
 
@@ -764,9 +777,11 @@ class API(
             except Exception:
                 self._log.exception("Move failed")
                 self._current_position.clear()
+                self._machine_position.clear()
                 raise
             else:
                 self._current_position.update(target_position)
+                self._machine_position.update(machine_pos)
 
     def get_engaged_axes(self) -> Dict[Axis, bool]:
         """Which axes are engaged and holding."""
@@ -793,12 +808,7 @@ class API(
 
         async with self._motion_lock:
             smoothie_pos = await self._fast_home(smoothie_ax, margin)
-            self._current_position = deck_from_machine(
-                smoothie_pos,
-                self._robot_calibration.deck_calibration.attitude,
-                top_types.Point(0, 0, 0),
-                Axis,
-            )
+            self._set_position_from_machine(smoothie_pos)
 
     # Gantry/frame (i.e. not pipette) config API
     @property
@@ -845,7 +855,25 @@ class API(
         self._config = replace(self._config, **kwargs)
 
     async def update_deck_calibration(self, new_transform: RobotCalibration) -> None:
-        pass
+        """Use a new robot calibration.
+
+        The cached position is converted to deck coordinates with the new
+        calibration from its machine coordinates, which the calibration
+        doesn't change, so the position stays known without reading it back
+        from the motion controller.
+        """
+        async with self._motion_lock:
+            self.set_robot_calibration(new_transform)
+            if self._current_position:
+                self._set_position_from_machine(self._machine_position)
+
+    @property
+    def position_read_counts(self) -> PositionReadCounts:
+        """How requests for the current position have been answered since the
+        last :py:meth:`reset`, which :py:meth:`stop` runs at the end of each
+        protocol.
+        """
+        return replace(self._position_read_counts)
 
     # Pipette action API
     async def prepare_for_aspirate(
@@ -1027,12 +1055,7 @@ class API(
                     [ax.name.upper() for ax in move.home_axes],
                     move.home_after_safety_margin,
                 )
-                self._current_position = deck_from_machine(
-                    smoothie_pos,
-                    self._robot_calibration.deck_calibration.attitude,
-                    top_types.Point(0, 0, 0),
-                    Axis,
-                )
+                self._set_position_from_machine(smoothie_pos)
 
         for shake in spec.shake_moves:
             await self.move_rel(mount, shake[0], speed=shake[1])
@@ -10,7 +10,13 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    IDLE_INTERVAL_MULTIPLIER,
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStatistics,
+)
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     TemperatureStatus,
@@ -94,7 +100,9 @@ class HeaterShaker(mod_abc.AbstractModule):
         self._poller = Poller(
             reader=PollerReader(driver=self._driver),
             interval_seconds=poll_time_s,
+            idle_interval_seconds=poll_time_s * IDLE_INTERVAL_MULTIPLIER,
             listener=self._listener,
+            name=f"{self.name()} {port}",
         )
         # TODO (spp, 2022-02-23): refine this to include user-facing error message.
         self._error_status: Optional[str] = None
@@ -239,6 +247,10 @@ class HeaterShaker(mod_abc.AbstractModule):
     def is_simulated(self) -> bool:
         return isinstance(self._driver, SimulatingDriver)
 
+    @property
+    def poll_statistics(self) -> PollStatistics:
+        return self._poller.statistics
+
     async def set_temperature(self, celsius: float) -> None:
         """
         Set temperature in degree Celsius
@@ -449,6 +461,21 @@ class PollerReader(Reader[PollResult]):
             labware_latch=await self._driver.get_labware_latch_status(),
         )
 
+    def is_idle(self, result: PollResult) -> bool:
+        """The heater/shaker is idle unless its temperature, speed, or labware
+        latch is changing."""
+        return (
+            HeaterShaker._get_temperature_status(result.temperature)
+            in (TemperatureStatus.IDLE, TemperatureStatus.HOLDING)
+            and HeaterShaker._get_speed_status(result.rpm)
+            in (SpeedStatus.IDLE, SpeedStatus.HOLDING)
+            and result.labware_latch
+            not in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
 
 class HeaterShakerListener(WaitableListener[PollResult]):
     """Tempdeck state listener."""
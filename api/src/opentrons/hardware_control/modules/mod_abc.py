@@ -5,6 +5,7 @@ import re
 from pkg_resources import parse_version
 from typing import Mapping, Optional, cast, TypeVar
 from opentrons.config import IS_ROBOT, ROBOT_FIRMWARE_DIR
+from opentrons.hardware_control.poller import PollStatistics
 from opentrons.hardware_control.util import use_or_initialize_loop
 from opentrons.drivers.rpi_drivers.types import USBPort
 from ..execution_manager import ExecutionManager
@@ -133,6 +134,11 @@ class AbstractModule(abc.ABC):
         """True if >this is a simulated module."""
         pass
 
+    @property
+    def poll_statistics(self) -> Optional[PollStatistics]:
+        """Statistics of the polls of the module's status, if it's polled."""
+        return None
+
     @property
     def port(self) -> str:
         """The virtual port where the module is connected."""
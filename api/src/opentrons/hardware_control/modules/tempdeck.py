@@ -3,7 +3,13 @@ import logging
 from typing import Mapping, Optional
 
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    IDLE_INTERVAL_MULTIPLIER,
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStatistics,
+)
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -96,7 +102,9 @@ class TempDeck(mod_abc.AbstractModule):
         self._poller = Poller(
             reader=PollerReader(driver=self._driver),
             interval_seconds=polling_frequency,
+            idle_interval_seconds=polling_frequency * IDLE_INTERVAL_MULTIPLIER,
             listener=self._listener,
+            name=f"{self.name()} {port}",
         )
 
     async def cleanup(self) -> None:
@@ -207,6 +215,10 @@ class TempDeck(mod_abc.AbstractModule):
     def is_simulated(self) -> bool:
         return isinstance(self._driver, SimulatingDriver)
 
+    @property
+    def poll_statistics(self) -> PollStatistics:
+        return self._poller.statistics
+
     async def prep_for_update(self) -> str:
         model = self._device_info and self._device_info.get("model")
         if model in ("temp_deck_v1", "temp_deck_v1.1", "temp_deck_v2"):
@@ -283,6 +295,13 @@ class PollerReader(Reader[Temperature]):
         """Poll the tempdeck."""
         return await self._driver.get_temperature()
 
+    def is_idle(self, result: Temperature) -> bool:
+        """The tempdeck is idle unless it's heating or cooling."""
+        return TempDeck._get_status(result) in (
+            TemperatureStatus.IDLE,
+            TemperatureStatus.HOLDING,
+        )
+
 
 class TempdeckListener(WaitableListener[Temperature]):
     """Tempdeck state listener."""
@@ -7,7 +7,13 @@ from opentrons.drivers.types import ThermocyclerLidStatus, Temperature, PlateTem
 from opentrons.hardware_control.modules.lid_temp_status import LidTemperatureStatus
 from opentrons.hardware_control.modules.plate_temp_status import PlateTemperatureStatus
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    IDLE_INTERVAL_MULTIPLIER,
+    Reader,
+    WaitableListener,
+    Poller,
+    PollStatistics,
+)
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -115,8 +121,10 @@ class Thermocycler(mod_abc.AbstractModule):
         )
         self._poller = Poller(
             interval_seconds=polling_interval_sec,
+            idle_interval_seconds=polling_interval_sec * IDLE_INTERVAL_MULTIPLIER,
             listener=self._listener,
             reader=PollerReader(driver=self._driver),
+            name=f"{self.name()} {port}",
         )
         self._hold_time_fuzzy_seconds = polling_interval_sec * 5
 
@@ -488,6 +496,10 @@ class Thermocycler(mod_abc.AbstractModule):
     def is_simulated(self) -> bool:
         return isinstance(self._driver, SimulatingDriver)
 
+    @property
+    def poll_statistics(self) -> PollStatistics:
+        return self._poller.statistics
+
     async def prep_for_update(self) -> str:
         await self._driver.enter_programming_mode()
 
@@ -591,6 +603,19 @@ class PollerReader(Reader[PolledData]):
             plate_temperature=plate_temperature,
         )
 
+    def is_idle(self, result: PolledData) -> bool:
+        """The thermocycler is idle when it isn't controlling temperatures or
+        moving its lid.
+
+        A held plate temperature isn't considered idle, since deciding that
+        the plate is holding takes several polls in a row.
+        """
+        return (
+            result.lid_status != ThermocyclerLidStatus.IN_BETWEEN
+            and result.lid_temperature.target is None
+            and result.plate_temperature.target is None
+        )
+
 
 class ThermocyclerListener(WaitableListener[PolledData]):
     """Thermocycler state listener."""
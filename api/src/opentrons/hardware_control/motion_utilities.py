@@ -1,6 +1,6 @@
 """Utilities for calculating motion correctly."""
 
-from typing import Callable, Dict, Union, overload, Type
+from typing import Callable, Dict, Optional, Union, overload, Type
 from collections import OrderedDict
 from opentrons.types import Mount, Point
 from opentrons.calibration_storage.types import AttitudeMatrix
@@ -265,8 +265,13 @@ def target_position_from_plunger(  # type: ignore[no-untyped-def]
 
 
 def deck_point_from_machine_point(
-    machine_point: Point, attitude: AttitudeMatrix, offset: Point
+    machine_point: Point,
+    attitude: AttitudeMatrix,
+    offset: Point,
+    inverse_attitude: Optional[AttitudeMatrix] = None,
 ) -> Point:
+    if inverse_attitude is not None:
+        return Point(*linal.apply_transform(inverse_attitude, machine_point - offset))
     return Point(
         *linal.apply_reverse(
             attitude,
@@ -337,6 +342,7 @@ def deck_from_machine(
     attitude: AttitudeMatrix,
     offset: Point,
     axis_enum: Type[Axis],
+    inverse_attitude: Optional[AttitudeMatrix] = None,
 ) -> Dict[Axis, float]:
     ...
 
@@ -347,6 +353,7 @@ def deck_from_machine(
     attitude: AttitudeMatrix,
     offset: Point,
     axis_enum: Type[OT3Axis],
+    inverse_attitude: Optional[AttitudeMatrix] = None,
 ) -> Dict[OT3Axis, float]:
     ...
 
@@ -356,8 +363,13 @@ def deck_from_machine(  # type: ignore[no-untyped-def]
     attitude,
     offset,
     axis_enum,
+    inverse_attitude=None,
 ):
-    """Build a deck-abs position store from the machine's position"""
+    """Build a deck-abs position store from the machine's position
+
+    If the inverse of ``attitude`` is already known, passing it as
+    ``inverse_attitude`` saves inverting ``attitude`` for each mount.
+    """
     with_enum = {_axis_enum(k): v for k, v in machine_pos.items()}
     plunger_axes = {k: v for k, v in with_enum.items() if k not in k.gantry_axes()}
     right = Point(
@@ -371,8 +383,10 @@ def deck_from_machine(  # type: ignore[no-untyped-def]
         with_enum[axis_enum.by_mount(Mount.LEFT)],
     )
 
-    right_deck = deck_point_from_machine_point(right, attitude, offset)
-    left_deck = deck_point_from_machine_point(left, attitude, offset)
+    right_deck = deck_point_from_machine_point(
+        right, attitude, offset, inverse_attitude
+    )
+    left_deck = deck_point_from_machine_point(left, attitude, offset, inverse_attitude)
     deck_pos = {
         axis_enum.X: right_deck[0],
         axis_enum.Y: right_deck[1],
@@ -1,12 +1,23 @@
 import asyncio
 from abc import abstractmethod, ABC
 from collections import deque
-from typing import TypeVar, Generic, Deque, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, TypeVar, Generic, Deque, List, Optional
+from weakref import WeakKeyDictionary
 import logging
 
 DataT = TypeVar("DataT")
 log = logging.getLogger(__name__)
 
+IDLE_INTERVAL_MULTIPLIER = 5.0
+"""How much less often modules are polled while they're idle."""
+
+# Pollers due within this fraction of their interval are polled together.
+_COALESCE_FRACTION = 0.1
+
+# How often, in seconds, the scheduler logs the statistics of its pollers.
+_STATISTICS_LOG_INTERVAL = 300.0
+
 
 class Reader(ABC, Generic[DataT]):
     """Interface of poller target."""
@@ -20,6 +31,18 @@ class Reader(ABC, Generic[DataT]):
         """
         ...
 
+    def is_idle(self, result: DataT) -> bool:
+        """
+        Whether a poll result shows that the target is idle, meaning it can be
+        polled less often.
+
+        Args:
+            result: The latest poll result.
+
+        Returns: Whether the target is idle. By default, never.
+        """
+        return False
+
 
 class Listener(ABC, Generic[DataT]):
     """Interface of poller listener"""
@@ -65,6 +88,7 @@ class WaitableListener(Listener[DataT]):
         """Constructor."""
         self._loop = loop or asyncio.get_running_loop()
         self._futures: Deque["asyncio.Future[DataT]"] = deque()
+        self._wait_callback: Optional[Callable[[], None]] = None
 
     async def wait_next_poll(self) -> DataT:
         """
@@ -74,8 +98,19 @@ class WaitableListener(Listener[DataT]):
         """
         f: "asyncio.Future[DataT]" = self._loop.create_future()
         self._futures.append(f)
+        if self._wait_callback:
+            self._wait_callback()
         return await f
 
+    @property
+    def has_waiters(self) -> bool:
+        """Whether anything is waiting for the next poll."""
+        return any(not f.done() for f in self._futures)
+
+    def set_wait_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """Set a function to call whenever something starts waiting for a poll."""
+        self._wait_callback = callback
+
     def on_poll(self, result: DataT) -> None:
         """Handle a new poll"""
         self._notify(result)
@@ -103,14 +138,132 @@ class WaitableListener(Listener[DataT]):
                 f.set_exception(exc)
 
 
+@dataclass
+class PollStatistics:
+    """Statistics of a poller's polls."""
+
+    name: str
+    #: The time between polls the poller is currently using.
+    interval: float
+    polls: int
+    errors: int
+    #: Latencies of the polls, in seconds.
+    last_latency: Optional[float]
+    mean_latency: Optional[float]
+    max_latency: Optional[float]
+    #: The fraction of the time since the poller started that it has spent
+    #: polling, and so using its device's serial connection.
+    utilization: float
+
+
+class PollScheduler:
+    """Schedules the polls of every poller on an event loop.
+
+    One task runs all of the pollers, waking up when the next poller is due and
+    starting the polls of every poller that is due at about that time together.
+    A slow poll doesn't hold up the others.
+    """
+
+    _schedulers: "WeakKeyDictionary[asyncio.AbstractEventLoop, PollScheduler]" = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def get(cls) -> "PollScheduler":
+        """Get the scheduler of the running event loop."""
+        loop = asyncio.get_running_loop()
+        scheduler = cls._schedulers.get(loop)
+        if scheduler is None:
+            scheduler = cls._schedulers[loop] = cls(loop=loop)
+        return scheduler
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Constructor.
+
+        Args:
+            loop: The event loop to poll on.
+        """
+        self._loop = loop
+        self._pollers: List["Poller[Any]"] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._statistics_logged_at = loop.time()
+
+    @property
+    def pollers(self) -> List["Poller[Any]"]:
+        """The pollers being scheduled."""
+        return list(self._pollers)
+
+    def statistics(self) -> Dict[str, PollStatistics]:
+        """Get the statistics of every poller, by name."""
+        return {p.name: p.statistics for p in self._pollers}
+
+    def add(self, poller: "Poller[Any]") -> None:
+        """Start scheduling a poller."""
+        self._pollers.append(poller)
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+        self.wake()
+
+    def wake(self) -> None:
+        """Have the scheduler check its pollers again."""
+        self._wakeup.set()
+
+    def _log_statistics(self, now: float) -> None:
+        """Log the statistics of every poller, if it's been a while."""
+        if now - self._statistics_logged_at < _STATISTICS_LOG_INTERVAL:
+            return
+        self._statistics_logged_at = now
+        for stats in self.statistics().values():
+            log.debug(f"Poller statistics: {stats}")
+
+    async def _run(self) -> None:
+        """Scheduler task entrypoint."""
+        while self._pollers:
+            now = self._loop.time()
+            next_wakeup: Optional[float] = None
+            self._log_statistics(now)
+            for poller in list(self._pollers):
+                if poller.polling:
+                    continue
+                if poller.stopping and poller.polled:
+                    self._pollers.remove(poller)
+                    poller.terminate()
+                    continue
+                if poller.next_poll - now <= _COALESCE_FRACTION * poller.interval:
+                    poller.start_poll()
+                    continue
+                if next_wakeup is None or poller.next_poll < next_wakeup:
+                    next_wakeup = poller.next_poll
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    None if next_wakeup is None else next_wakeup - now,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
 class Poller(Generic[DataT]):
-    """Asyncio poller."""
+    """Asyncio poller.
+
+    The poller polls every `interval_seconds` while its reader reports that its
+    target is busy or while its listener has something waiting for a poll, and
+    every `idle_interval_seconds` otherwise. Polls are run by the
+    `PollScheduler` of the event loop.
+    """
 
     def __init__(
         self,
         interval_seconds: float,
         reader: Reader[DataT],
         listener: Listener[DataT],
+        idle_interval_seconds: Optional[float] = None,
+        name: Optional[str] = None,
+        scheduler: Optional[PollScheduler] = None,
     ) -> None:
         """
         Constructor.
@@ -119,37 +272,141 @@ class Poller(Generic[DataT]):
             interval_seconds: time in between polls.
             reader: The data reader.
             listener: event listener.
+            idle_interval_seconds: time in between polls while the reader
+                reports that its target is idle. Defaults to interval_seconds.
+            name: The poller's name in statistics.
+            scheduler: The scheduler to run on. Defaults to the running event
+                loop's scheduler.
         """
-        self._shutdown_event = asyncio.Event()
+        self._scheduler = scheduler or PollScheduler.get()
+        self._loop = asyncio.get_running_loop()
         self._interval = interval_seconds
+        self._idle_interval = max(
+            interval_seconds, idle_interval_seconds or interval_seconds
+        )
         self._listener = listener
         self._reader = reader
-        self._task = asyncio.create_task(self._poller())
+        self._name = name or f"poller-{id(self)}"
+        self._idle = False
+        self._stopping = False
+        self._polled = False
+        self._poll_task: Optional["asyncio.Task[None]"] = None
+        self._terminated = asyncio.Event()
+
+        self._started_at = self._loop.time()
+        self._next_poll = self._started_at
+        self._last_poll_end = self._started_at
+        self._polls = 0
+        self._errors = 0
+        self._last_latency: Optional[float] = None
+        self._max_latency: Optional[float] = None
+        self._total_latency = 0.0
+
+        if isinstance(listener, WaitableListener):
+            listener.set_wait_callback(self._on_wait)
+        self._scheduler.add(self)
+
+    @property
+    def name(self) -> str:
+        """The poller's name."""
+        return self._name
+
+    @property
+    def interval(self) -> float:
+        """The time in between polls at the moment."""
+        if self._idle and not self._has_waiters():
+            return self._idle_interval
+        return self._interval
+
+    @property
+    def next_poll(self) -> float:
+        """The event loop time the next poll is due."""
+        return self._next_poll
+
+    @property
+    def polling(self) -> bool:
+        """Whether a poll is in progress."""
+        return self._poll_task is not None
+
+    @property
+    def polled(self) -> bool:
+        """Whether a poll has been completed."""
+        return self._polled
+
+    @property
+    def stopping(self) -> bool:
+        """Whether the poller has been signalled to stop."""
+        return self._stopping
+
+    @property
+    def statistics(self) -> PollStatistics:
+        """Statistics of the poller's polls."""
+        elapsed = self._loop.time() - self._started_at
+        return PollStatistics(
+            name=self._name,
+            interval=self.interval,
+            polls=self._polls,
+            errors=self._errors,
+            last_latency=self._last_latency,
+            mean_latency=self._total_latency / self._polls if self._polls else None,
+            max_latency=self._max_latency,
+            utilization=self._total_latency / elapsed if elapsed > 0 else 0.0,
+        )
 
     def stop(self) -> None:
         """Signal poller to stop."""
-        self._shutdown_event.set()
+        self._stopping = True
+        self._scheduler.wake()
 
     async def stop_and_wait(self) -> None:
         """Stop poller and wait for it to terminate."""
         self.stop()
-        await self._task
-
-    async def _poller(self) -> None:
-        """Poll task entrypoint."""
-        while True:
-            try:
-                poll = await self._reader.read()
-                self._listener.on_poll(poll)
-            except Exception as e:
-                log.exception("Polling exception")
-                self._listener.on_error(e)
+        await self._terminated.wait()
 
-            try:
-                await asyncio.wait_for(self._shutdown_event.wait(), self._interval)
-            except asyncio.TimeoutError:
-                pass
-            else:
-                break
+    def start_poll(self) -> None:
+        """Start a poll. Called by the scheduler."""
+        self._poll_task = self._loop.create_task(self._poll())
 
+    def terminate(self) -> None:
+        """Finish up. Called by the scheduler once the poller has stopped."""
+        if isinstance(self._listener, WaitableListener):
+            self._listener.set_wait_callback(None)
         self._listener.on_terminated()
+        self._terminated.set()
+
+    def _has_waiters(self) -> bool:
+        return (
+            isinstance(self._listener, WaitableListener) and self._listener.has_waiters
+        )
+
+    def _on_wait(self) -> None:
+        """Poll soon if something starts waiting while polling slowly."""
+        next_poll = self._last_poll_end + self._interval
+        if next_poll < self._next_poll:
+            self._next_poll = next_poll
+            self._scheduler.wake()
+
+    async def _poll(self) -> None:
+        """Poll task entrypoint."""
+        start = self._loop.time()
+        try:
+            poll = await self._reader.read()
+            self._idle = self._reader.is_idle(poll)
+            self._listener.on_poll(poll)
+        except Exception as e:
+            log.exception("Polling exception")
+            self._errors += 1
+            self._idle = False
+            self._listener.on_error(e)
+        finally:
+            end = self._loop.time()
+            latency = end - start
+            self._polls += 1
+            self._last_latency = latency
+            self._max_latency = max(latency, self._max_latency or 0.0)
+            self._total_latency += latency
+            self._last_poll_end = end
+            self._next_poll = end + self.interval
+            self._polled = True
+            self._poll_task = None
+            self._scheduler.wake()
@@ -27,6 +27,24 @@ class RobotCalibration:
     deck_calibration: types.DeckCalibration
 
 
+@dataclass(frozen=True)
+class DeckTransform:
+    """A deck calibration's attitude matrix along with its inverse, so that
+    converting machine positions to deck positions needn't invert it."""
+
+    attitude: types.AttitudeMatrix
+    inverse: types.AttitudeMatrix
+
+
+def build_deck_transform(deck_calibration: types.DeckCalibration) -> DeckTransform:
+    return DeckTransform(
+        attitude=deck_calibration.attitude,
+        inverse=np.linalg.inv(  # type: ignore[no-untyped-call]
+            deck_calibration.attitude
+        ).tolist(),
+    )
+
+
 @dataclass
 class OT3Transforms(RobotCalibration):
     carriage_offset: Point
@@ -207,6 +225,7 @@ def load() -> RobotCalibration:
 class RobotCalibrationProvider:
     def __init__(self) -> None:
         self._robot_calibration = load()
+        self._deck_transform: Optional[DeckTransform] = None
 
     @lru_cache(1)
     def _validate(self) -> DeckTransformState:
@@ -220,12 +239,23 @@ class RobotCalibrationProvider:
 
     def reset_robot_calibration(self) -> None:
         self._validate.cache_clear()
+        self._deck_transform = None
         self._robot_calibration = load()
 
     def set_robot_calibration(self, robot_calibration: RobotCalibration) -> None:
         self._validate.cache_clear()
+        self._deck_transform = None
         self._robot_calibration = robot_calibration
 
+    def _get_deck_transform(self) -> DeckTransform:
+        """The transform of the current deck calibration, built on first use
+        after the calibration changes."""
+        if self._deck_transform is None:
+            self._deck_transform = build_deck_transform(
+                self._robot_calibration.deck_calibration
+            )
+        return self._deck_transform
+
     def validate_calibration(self) -> DeckTransformState:
         """
         The lru cache decorator is currently not supported by the
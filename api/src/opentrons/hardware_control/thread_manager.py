@@ -3,12 +3,16 @@ import threading
 import logging
 import asyncio
 import functools
+import inspect
 import weakref
+from types import FunctionType
 from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     Generic,
+    List,
     Optional,
     TypeVar,
     cast,
@@ -38,12 +42,66 @@ async def call_coroutine_threadsafe(
     *args: Sequence[Any],
     **kwargs: Mapping[str, Any],
 ) -> WrappedReturn:
-    fut = cast(
-        "asyncio.Future[WrappedReturn]",
-        asyncio.run_coroutine_threadsafe(coro(*args, **kwargs), loop),
-    )
-    wrapped = asyncio.wrap_future(fut)
-    return await wrapped
+    """Run a coroutine function in another thread's loop and await its result.
+
+    This does what awaiting ``asyncio.wrap_future`` of
+    ``asyncio.run_coroutine_threadsafe`` does, including cancelling the
+    coroutine if the caller is cancelled, but hands the result straight from
+    one loop to the other rather than through a ``concurrent.futures.Future``.
+    """
+    caller_loop = asyncio.get_running_loop()
+    result: "asyncio.Future[WrappedReturn]" = caller_loop.create_future()
+    to_run: Awaitable[WrappedReturn] = coro(*args, **kwargs)
+    task: Optional["asyncio.Task[WrappedReturn]"] = None
+
+    def _on_done(done: "asyncio.Task[WrappedReturn]") -> None:
+        if not caller_loop.is_closed():
+            caller_loop.call_soon_threadsafe(_copy_task_state, done, result)
+
+    def _start() -> None:
+        nonlocal task
+        task = loop.create_task(to_run)
+        task.add_done_callback(_on_done)
+
+    def _cancel() -> None:
+        # Scheduled after _start, so the task has always been created.
+        if task is not None and not task.done():
+            task.cancel()
+
+    loop.call_soon_threadsafe(_start)
+    try:
+        return await result
+    except asyncio.CancelledError:
+        loop.call_soon_threadsafe(_cancel)
+        raise
+
+
+def _bridge_coroutine_function(
+    loop: asyncio.AbstractEventLoop, attr: WrappedCoro
+) -> WrappedCoro:
+    """Wrap an async function to run in the managed thread."""
+
+    @functools.wraps(attr)
+    async def wrapper(*args: Sequence[Any], **kwargs: Mapping[str, Any]) -> Any:
+        if asyncio.get_running_loop() is loop:
+            # Already in the managed thread, so there's no need to hop.
+            return await attr(*args, **kwargs)
+        return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
+
+    return cast(WrappedCoro, wrapper)
+
+
+def _copy_task_state(
+    task: "asyncio.Task[WrappedReturn]", result: "asyncio.Future[WrappedReturn]"
+) -> None:
+    if result.done():
+        return
+    if task.cancelled():
+        result.cancel()
+    elif task.exception() is not None:
+        result.set_exception(cast(BaseException, task.exception()))
+    else:
+        result.set_result(task.result())
 
 
 WrappedObj = TypeVar("WrappedObj", bound=AsyncioConfigurable, covariant=True)
@@ -55,8 +113,19 @@ class CallBridger(Generic[WrappedObj]):
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # Methods of the managed object's class, bridged if they're async, are
+        # cached by name, so they're only looked up and wrapped once. Anything
+        # set on the instance itself (a mock, for instance) still wins.
+        self._dispatch_cache: Dict[str, Callable[..., Any]] = {}
+        self._instance_dict: Mapping[str, Any] = getattr(wrapped_obj, "__dict__", {})
 
     def __getattribute__(self, attr_name: str) -> Any:
+        cached = object.__getattribute__(self, "_dispatch_cache").get(attr_name)
+        if cached is not None and attr_name not in object.__getattribute__(
+            self, "_instance_dict"
+        ):
+            return cached
+
         # Almost every attribute retrieved from us will be for people actually
         # looking for an attribute of the managed object, so check there first.
         managed_obj = object.__getattribute__(self, "wrapped_obj")
@@ -67,16 +136,18 @@ class CallBridger(Generic[WrappedObj]):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
+        is_method = attr_name not in object.__getattribute__(
+            self, "_instance_dict"
+        ) and isinstance(
+            inspect.getattr_static(type(managed_obj), attr_name, None), FunctionType
+        )
+
         if asyncio.iscoroutinefunction(attr):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
-
-            @functools.wraps(attr)
-            async def wrapper(
-                *args: Sequence[Any], **kwargs: Mapping[str, Any]
-            ) -> WrappedReturn:
-                return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
-
+            wrapper = _bridge_coroutine_function(loop, attr)
+            if is_method:
+                object.__getattribute__(self, "_dispatch_cache")[attr_name] = wrapper
             return wrapper
 
         elif asyncio.iscoroutine(attr):
@@ -85,8 +156,31 @@ class CallBridger(Generic[WrappedObj]):
             wrapped = asyncio.wrap_future(fut)
             return wrapped
 
+        if is_method:
+            object.__getattribute__(self, "_dispatch_cache")[attr_name] = attr
         return attr
 
+    async def call_batch(
+        self, *calls: Callable[[WrappedObj], Awaitable[Any]]
+    ) -> List[Any]:
+        """Make several calls to the managed object in a single trip to its thread.
+
+        Each call is a function that takes the managed object and returns an
+        awaitable, like ``lambda hw: hw.gantry_position(Mount.LEFT)``. The calls
+        are awaited one after the other in the managed thread.
+
+        :returns: The results of the calls, in order.
+        """
+        managed_obj = object.__getattribute__(self, "wrapped_obj")
+        loop = object.__getattribute__(self, "_loop")
+
+        async def run_calls() -> List[Any]:
+            return [await call(managed_obj) for call in calls]
+
+        if asyncio.get_running_loop() is loop:
+            return await run_calls()
+        return await call_coroutine_threadsafe(loop, cast(Any, run_calls))
+
 
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
@@ -258,6 +258,16 @@ class CurrentConfig:
         return self.hold_current, self.run_current
 
 
+@dataclass
+class PositionReadCounts:
+    """How requests for the current position were answered."""
+
+    #: Requests that read the position back from the motion controller.
+    controller: int = 0
+    #: Requests answered from the position cached after the last motion.
+    cached: int = 0
+
+
 class DoorState(enum.Enum):
     OPEN = False
     CLOSED = True
@@ -16,6 +16,7 @@ from .state import (
     CurrentCommand,
     EngineConfigs,
     StateSummary,
+    StateTopic,
 )
 from .plugins import AbstractPlugin
 
@@ -59,6 +60,7 @@ __all__ = [
     # state interfaces and models
     "State",
     "StateView",
+    "StateTopic",
     "CommandSlice",
     "CurrentCommand",
     # public value interfaces and models
@@ -16,6 +16,7 @@ from .actions import (
     QueueCommandAction,
     UpdateCommandAction,
     FailCommandAction,
+    SetExpectedCommandsAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddModuleAction,
@@ -38,6 +39,7 @@ __all__ = [
     "QueueCommandAction",
     "UpdateCommandAction",
     "FailCommandAction",
+    "SetExpectedCommandsAction",
     "AddLabwareOffsetAction",
     "AddLabwareDefinitionAction",
     "AddModuleAction",
@@ -6,7 +6,7 @@ reactions in objects that subscribe to the pipeline, like the StateStore.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control.types import HardwareEvent
@@ -114,6 +114,18 @@ class FailCommandAction:
     error: ProtocolEngineError
 
 
+@dataclass(frozen=True)
+class SetExpectedCommandsAction:
+    """Set the commands a protocol is expected to add to the run, in order.
+
+    These are usually the commands from an earlier analysis of the protocol.
+    They're only used to estimate the run's remaining duration before
+    the protocol has actually added them.
+    """
+
+    commands: Sequence[Command]
+
+
 @dataclass(frozen=True)
 class AddLabwareOffsetAction:
     """Add a labware offset, to apply to subsequent `LoadLabwareCommand`s."""
@@ -149,6 +161,7 @@ Action = Union[
     QueueCommandAction,
     UpdateCommandAction,
     FailCommandAction,
+    SetExpectedCommandsAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddModuleAction,
@@ -1,6 +1,6 @@
 """Run control command side-effect logic."""
 
-from ..state import StateStore
+from ..state import StateStore, StateTopic
 from ..actions import ActionDispatcher, PauseAction, PauseSource
 
 
@@ -23,5 +23,6 @@ class RunControlHandler:
         if not self._state_store.get_configs().ignore_pause:
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
             await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+                condition=self._state_store.commands.get_is_running,
+                topic=StateTopic.COMMANDS,
             )
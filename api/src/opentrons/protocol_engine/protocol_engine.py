@@ -1,5 +1,5 @@
 """ProtocolEngine class definition."""
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control import HardwareControlAPI
@@ -17,7 +17,7 @@ from .execution import (
     HardwareEventForwarder,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateStore, StateView, StateTopic
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -28,6 +28,7 @@ from .actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    SetExpectedCommandsAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddModuleAction,
@@ -141,9 +142,26 @@ class ProtocolEngine:
 
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed."""
+        await self._state_store.wait_for_command_completion(command_id)
+
+    async def wait_for_state_change(
+        self,
+        state_version: int,
+        topic: Optional[StateTopic] = None,
+    ) -> None:
+        """Wait until the engine's state has changed since a given state version.
+
+        Arguments:
+            state_version: A value previously returned by
+                `state_view.get_state_version()`.
+            topic: Only check for changes when this part of state changes.
+                If omitted, check on every change.
+        """
         await self._state_store.wait_for(
-            self._state_store.commands.get_is_complete,
-            command_id=command_id,
+            _is_state_newer,
+            self._state_store,
+            state_version,
+            topic=topic,
         )
 
     async def add_and_execute_command(self, request: CommandCreate) -> Command:
@@ -182,7 +200,8 @@ class ProtocolEngine:
         This will happen if all commands are executed or if one command fails.
         """
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_complete
+            condition=self._state_store.commands.get_all_complete,
+            topic=StateTopic.COMMANDS,
         )
 
     async def finish(
@@ -237,6 +256,17 @@ class ProtocolEngine:
             self._action_dispatcher.dispatch(HardwareStoppedAction())
             await self._plugin_starter.stop()
 
+    def set_expected_commands(self, commands: Sequence[Command]) -> None:
+        """Set the commands the protocol is expected to add, like from an analysis.
+
+        Protocols that add their commands as they run, like Python protocols,
+        can use this to get an estimate of the whole run's duration up front.
+        Only use this before the protocol has added any commands.
+
+        To retrieve duration estimates, see `.state_view.durations`.
+        """
+        self._action_dispatcher.dispatch(SetExpectedCommandsAction(commands=commands))
+
     def add_labware_offset(self, request: LabwareOffsetCreate) -> LabwareOffset:
         """Add a new labware offset and return it.
 
@@ -282,3 +312,7 @@ class ProtocolEngine:
 
         for a in actions:
             self._action_dispatcher.dispatch(a)
+
+
+def _is_state_newer(state_view: StateView, state_version: int) -> bool:
+    return state_view.get_state_version() > state_version
@@ -1,6 +1,7 @@
 """Protocol engine state module."""
 
 from .state import State, StateStore, StateView
+from .change_notifier import StateTopic
 from .state_summary import StateSummary
 from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
 from .labware import LabwareState, LabwareView
@@ -17,6 +18,7 @@ from .module_substates import (
     ThermocyclerModuleSubState,
     ModuleSubStateType,
 )
+from .durations import DurationState, DurationView
 from .geometry import GeometryView, TipGeometry
 from .motion import MotionView, PipetteLocationData
 from .configs import EngineConfigs
@@ -28,6 +30,7 @@ __all__ = [
     "StateStore",
     "StateView",
     "StateSummary",
+    "StateTopic",
     # command state and values
     "CommandState",
     "CommandView",
@@ -54,6 +57,9 @@ __all__ = [
     "ThermocyclerModuleId",
     "ThermocyclerModuleSubState",
     "ModuleSubStateType",
+    # run duration estimates
+    "DurationState",
+    "DurationView",
     # computed geometry state
     "GeometryView",
     "TipGeometry",
@@ -1,19 +1,51 @@
 """Simple state change notification interface."""
 import asyncio
+from enum import Enum
+from typing import Dict, Iterable, Optional
+
+
+class StateTopic(str, Enum):
+    """A part of engine state that a subscriber may be interested in.
+
+    Each topic corresponds to one of the StateStore's substores.
+    """
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
 
 
 class ChangeNotifier:
     """An interface tto emit or subscribe to state change notifications."""
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
+        """Initialize the ChangeNotifier with internal Events."""
         self._event = asyncio.Event()
+        self._topic_events: Dict[StateTopic, asyncio.Event] = {
+            topic: asyncio.Event() for topic in StateTopic
+        }
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
+    def notify(self, topics: Optional[Iterable[StateTopic]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            topics: The parts of state that changed. Subscribers waiting
+                on any other topic will not be woken up. If omitted,
+                all subscribers are notified.
+        """
         self._event.set()
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        for topic in topics if topics is not None else StateTopic:
+            self._topic_events[topic].set()
+
+    async def wait(self, topic: Optional[StateTopic] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            topic: Only wake up for changes to this part of state.
+                If omitted, wake up for any change.
+        """
+        event = self._event if topic is None else self._topic_events[topic]
+        event.clear()
+        await event.wait()
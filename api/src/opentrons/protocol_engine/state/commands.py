@@ -4,7 +4,7 @@ from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from opentrons.ordered_set import OrderedSet
 
@@ -193,7 +193,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     index=index,
                     command=command,
                 )
-            else:
+            elif prev_entry.command is not command:
                 self._state.commands_by_id[command.id] = CommandEntry(
                     index=prev_entry.index,
                     command=command,
@@ -217,34 +217,24 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 detail=str(action.error),
             )
 
-            prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
-                command=prev_entry.command.copy(
-                    update={
-                        "error": error_occurrence,
-                        "completedAt": action.failed_at,
-                        "status": CommandStatus.FAILED,
-                    }
-                ),
+            # Failing a command also fails every queued command. They all get
+            # the same update, applied in one pass; every other entry is
+            # left as it is.
+            queued_update = {
+                "completedAt": action.failed_at,
+                "status": CommandStatus.FAILED,
+            }
+            commands_by_id = self._state.commands_by_id
+            failed_entries = {
+                command_id: _update_entry(commands_by_id[command_id], queued_update)
+                for command_id in self._state.queued_command_ids
+                if command_id != action.command_id
+            }
+            failed_entries[action.command_id] = _update_entry(
+                commands_by_id[action.command_id],
+                {**queued_update, "error": error_occurrence},
             )
-
-            other_command_ids_to_fail = [
-                *[i for i in self._state.queued_command_ids],
-            ]
-
-            for command_id in other_command_ids_to_fail:
-                prev_entry = self._state.commands_by_id[command_id]
-
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
-                        update={
-                            "completedAt": action.failed_at,
-                            "status": CommandStatus.FAILED,
-                        }
-                    ),
-                )
+            commands_by_id.update(failed_entries)
 
             if self._state.running_command_id == action.command_id:
                 self._state.running_command_id = None
@@ -311,6 +301,10 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     self._state.is_door_blocking = False
 
 
+def _update_entry(entry: CommandEntry, update: Dict[str, Any]) -> CommandEntry:
+    return CommandEntry(index=entry.index, command=entry.command.copy(update=update))
+
+
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
 
@@ -0,0 +1,483 @@
+"""Run duration estimate state and store.
+
+Every command is estimated once, in run order, as soon as the engine
+first sees it: when it's queued, or, for commands that are added to the
+engine already running (like commands from a Python protocol), when it
+starts. The estimates share their hardware-derived timings with the legacy
+`opentrons.protocols.duration.DurationEstimator`, but keep running totals
+instead of a list of increments, and track the temperature of every
+module separately.
+
+A Python protocol only adds each command as it runs it, so on its own the
+engine can't know how much of the run is left. If the engine is told which
+commands to expect, usually from an analysis of the protocol, those are
+estimated up front and count toward the remaining duration until the
+protocol actually adds them.
+"""
+from __future__ import annotations
+
+import re
+from logging import getLogger
+from dataclasses import dataclass
+from collections import deque
+from typing import Deque, Dict, Match, Optional, Pattern, Tuple, Union, cast
+
+from typing_extensions import Final
+
+from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
+from opentrons_shared_data.pipette import name_config
+from opentrons_shared_data.pipette.dev_types import PipetteName
+from opentrons.commands import types as legacy_command_types
+from opentrons.protocols.duration.timing import (
+    BLOW_OUT_TIME,
+    DROP_TIP_TIME,
+    PICK_UP_TIP_TIME,
+    SAME_SLOT_TRAVEL_TIME,
+    START_MODULE_TEMPERATURE,
+    THERMOCYCLER_DEACTIVATE_LID_TIME,
+    THERMOCYCLER_LID_MOVE_TIME,
+    THERMOCYCLER_SET_LID_TEMP_TIME,
+    TOUCH_TIP_TIME,
+    get_deck_travel_time,
+    get_temperature_module_ramp_time,
+    get_thermocycler_ramp_time,
+    get_z_travel_time,
+)
+from opentrons.types import DeckSlotName
+
+from ..commands import (
+    Command,
+    CommandCreate,
+    CommandStatus,
+    AspirateParams,
+    CustomParams,
+    DispenseParams,
+    DropTipParams,
+    LoadLabwareParams,
+    LoadLabwareResult,
+    LoadModuleParams,
+    LoadModuleResult,
+    LoadPipetteParams,
+    LoadPipetteResult,
+    MoveToWellParams,
+    PickUpTipParams,
+    temperature_module,
+    thermocycler,
+)
+from ..types import DeckSlotLocation
+from ..actions import (
+    Action,
+    FailCommandAction,
+    FinishAction,
+    QueueCommandAction,
+    SetExpectedCommandsAction,
+    StopAction,
+    UpdateCommandAction,
+)
+from .abstract_store import HasState, HandlesActions
+
+log = getLogger(__name__)
+
+# Gantry speed, in mm/s, of a pipette with default settings.
+GANTRY_SPEED: Final = 400.0
+
+STARTING_SLOT: Final = DeckSlotName.FIXED_TRASH
+
+_LEGACY_LIQUID_HANDLING_RE: Final = re.compile(
+    r"^(?:Aspirating|Dispensing) (?P<volume>[\d.]+) uL .* at (?P<flow>[\d.]+) uL/sec"
+)
+_LEGACY_DELAY_RE: Final = re.compile(
+    r"^Delaying for (?P<minutes>\d+) minutes and (?P<seconds>[\d.]+) seconds"
+)
+
+_LEGACY_FIXED_TIMES: Final[Dict[str, float]] = {
+    legacy_command_types.BLOW_OUT: BLOW_OUT_TIME,
+    legacy_command_types.TOUCH_TIP: TOUCH_TIP_TIME,
+    legacy_command_types.THERMOCYCLER_OPEN: THERMOCYCLER_LID_MOVE_TIME,
+    legacy_command_types.THERMOCYCLER_CLOSE: THERMOCYCLER_LID_MOVE_TIME,
+    legacy_command_types.THERMOCYCLER_SET_LID_TEMP: THERMOCYCLER_SET_LID_TEMP_TIME,
+    legacy_command_types.THERMOCYCLER_DEACTIVATE_LID: THERMOCYCLER_DEACTIVATE_LID_TIME,
+}
+
+
+@dataclass(frozen=True)
+class _LabwarePlacement:
+    slot_name: DeckSlotName
+    is_on_module: bool
+
+
+@dataclass
+class DurationState:
+    """Estimated durations of a run's commands, in seconds."""
+
+    # Every command that has been estimated.
+    estimates_by_command_id: Dict[str, float]
+
+    # Estimates of the commands that are queued or running.
+    pending_estimates_by_command_id: Dict[str, float]
+
+    # Sum of every estimate of a command that has run or is yet to run.
+    total_duration: float
+
+    # Sum of the estimates in pending_estimates_by_command_id.
+    remaining_duration: float
+
+    # Estimates of the expected commands that haven't been added yet, in order.
+    # See SetExpectedCommandsAction.
+    expected_estimates: Deque[float]
+
+    # Sum of the estimates in expected_estimates.
+    expected_duration: float
+
+    # What the estimator needs to know about the run so far,
+    # as of the most recently estimated command.
+    slot_positions: Dict[DeckSlotName, Tuple[float, float]]
+    labware_placements: Dict[str, _LabwarePlacement]
+    module_slots: Dict[str, DeckSlotName]
+    module_temperatures: Dict[str, float]
+    module_target_temperatures: Dict[str, float]
+    pipette_flow_rates: Dict[str, Tuple[float, float]]
+    last_slot: DeckSlotName
+
+
+class DurationStore(HasState[DurationState], HandlesActions):
+    """Run duration estimate state container."""
+
+    _state: DurationState
+
+    def __init__(self, deck_definition: DeckDefinitionV2) -> None:
+        """Initialize a DurationStore and its state."""
+        self._deck_definition = deck_definition
+        slot_positions = {
+            DeckSlotName.from_primitive(slot_def["id"]): (
+                slot_def["position"][0],
+                slot_def["position"][1],
+            )
+            for slot_def in deck_definition["locations"]["orderedSlots"]
+        }
+
+        self._state = DurationState(
+            estimates_by_command_id={},
+            pending_estimates_by_command_id={},
+            total_duration=0.0,
+            remaining_duration=0.0,
+            expected_estimates=deque(),
+            expected_duration=0.0,
+            slot_positions=slot_positions,
+            labware_placements={},
+            module_slots={},
+            module_temperatures={},
+            module_target_temperatures={},
+            pipette_flow_rates={},
+            last_slot=STARTING_SLOT,
+        )
+
+    def handle_action(self, action: Action) -> None:
+        """Modify state in reaction to an action."""
+        if isinstance(action, QueueCommandAction):
+            self._estimate(action.command_id, action.request)
+
+        elif isinstance(action, UpdateCommandAction):
+            command = action.command
+
+            if command.id not in self._state.estimates_by_command_id:
+                self._estimate(command.id, command)
+
+            self._handle_command_result(command)
+
+            if command.status == CommandStatus.SUCCEEDED:
+                self._complete(command.id)
+
+        elif isinstance(action, FailCommandAction):
+            # failing a command also fails every queued command after it
+            self._complete(action.command_id)
+            self._drop_pending()
+
+        elif isinstance(action, (StopAction, FinishAction)):
+            self._drop_pending()
+
+        elif isinstance(action, SetExpectedCommandsAction):
+            self._set_expected(action)
+
+    def _set_expected(self, action: SetExpectedCommandsAction) -> None:
+        # The expected commands are estimated by a store of their own,
+        # so they don't affect what this one knows about the run so far.
+        estimator = DurationStore(deck_definition=self._deck_definition)
+        estimates: Deque[float] = deque()
+
+        for command in action.commands:
+            estimates.append(estimator._get_duration(command))
+            estimator._handle_command_result(command)
+
+        self._state.expected_estimates = estimates
+        self._state.expected_duration = sum(estimates)
+
+    def _estimate(
+        self,
+        command_id: str,
+        command: Union[Command, CommandCreate],
+    ) -> None:
+        duration = self._get_duration(command)
+
+        # This command takes the place of the next expected one.
+        if self._state.expected_estimates:
+            expected = self._state.expected_estimates.popleft()
+            self._state.expected_duration -= expected
+
+        self._state.estimates_by_command_id[command_id] = duration
+        self._state.pending_estimates_by_command_id[command_id] = duration
+        self._state.total_duration += duration
+        self._state.remaining_duration += duration
+
+    def _complete(self, command_id: str) -> None:
+        duration = self._state.pending_estimates_by_command_id.pop(command_id, None)
+
+        if duration is not None:
+            self._state.remaining_duration -= duration
+
+    def _drop_pending(self) -> None:
+        self._state.total_duration -= self._state.remaining_duration
+        self._state.remaining_duration = 0.0
+        self._state.pending_estimates_by_command_id.clear()
+        self._state.expected_estimates.clear()
+        self._state.expected_duration = 0.0
+
+    def _handle_command_result(self, command: Command) -> None:
+        # Loads may leave their IDs to the engine, so record them again
+        # from their results, which always have them.
+        if isinstance(command.result, LoadLabwareResult):
+            self._load_labware(command.result.labwareId, command.params)
+        elif isinstance(command.result, LoadModuleResult):
+            self._load_module(command.result.moduleId, command.params)
+        elif isinstance(command.result, LoadPipetteResult):
+            self._load_pipette(command.result.pipetteId, command.params)
+
+    def _get_duration(  # noqa: C901
+        self, command: Union[Command, CommandCreate]
+    ) -> float:
+        params = command.params
+
+        if isinstance(params, LoadLabwareParams):
+            if params.labwareId is not None:
+                self._load_labware(params.labwareId, params)
+            return 0.0
+
+        if isinstance(params, LoadModuleParams):
+            if params.moduleId is not None:
+                self._load_module(params.moduleId, params)
+            return 0.0
+
+        if isinstance(params, LoadPipetteParams):
+            if params.pipetteId is not None:
+                self._load_pipette(params.pipetteId, params)
+            return 0.0
+
+        if isinstance(params, PickUpTipParams):
+            return self._move_to_labware(params.labwareId) + PICK_UP_TIP_TIME
+
+        if isinstance(params, DropTipParams):
+            return self._move_to_labware(params.labwareId) + DROP_TIP_TIME
+
+        if isinstance(params, MoveToWellParams):
+            return self._move_to_labware(params.labwareId)
+
+        if isinstance(params, (AspirateParams, DispenseParams)):
+            aspirate_rate, dispense_rate = self._state.pipette_flow_rates.get(
+                params.pipetteId, (0.0, 0.0)
+            )
+            flow_rate = (
+                aspirate_rate if isinstance(params, AspirateParams) else dispense_rate
+            )
+            placement = self._state.labware_placements.get(params.labwareId)
+            is_on_module = placement is not None and placement.is_on_module
+
+            duration = self._move_to_labware(params.labwareId)
+            duration += get_z_travel_time(is_on_module, GANTRY_SPEED)
+            if flow_rate > 0:
+                duration += params.volume / flow_rate
+            return duration
+
+        if isinstance(
+            params,
+            (
+                temperature_module.SetTargetTemperatureParams,
+                thermocycler.SetTargetBlockTemperatureParams,
+            ),
+        ):
+            self._state.module_target_temperatures[params.moduleId] = params.celsius
+            return 0.0
+
+        if isinstance(params, temperature_module.WaitForTemperatureParams):
+            target = self._state.module_target_temperatures.get(params.moduleId)
+            if target is None:
+                return 0.0
+            return get_temperature_module_ramp_time(
+                self._set_module_temperature(params.moduleId, target), target
+            )
+
+        if isinstance(params, thermocycler.SetAndWaitForBlockTemperatureParams):
+            self._state.module_target_temperatures[params.moduleId] = params.celsius
+            return get_thermocycler_ramp_time(
+                self._set_module_temperature(params.moduleId, params.celsius),
+                params.celsius,
+            )
+
+        if isinstance(
+            params,
+            (
+                temperature_module.DeactivateTemperatureParams,
+                thermocycler.DeactivateBlockParams,
+            ),
+        ):
+            self._state.module_target_temperatures.pop(params.moduleId, None)
+            return 0.0
+
+        if isinstance(params, CustomParams):
+            return _get_legacy_duration(params)
+
+        return 0.0
+
+    def _load_labware(self, labware_id: str, params: LoadLabwareParams) -> None:
+        location = params.location
+
+        if isinstance(location, DeckSlotLocation):
+            self._state.labware_placements[labware_id] = _LabwarePlacement(
+                slot_name=location.slotName,
+                is_on_module=False,
+            )
+        else:
+            module_slot = self._state.module_slots.get(location.moduleId)
+            if module_slot is not None:
+                self._state.labware_placements[labware_id] = _LabwarePlacement(
+                    slot_name=module_slot,
+                    is_on_module=True,
+                )
+
+    def _load_module(self, module_id: str, params: LoadModuleParams) -> None:
+        self._state.module_slots[module_id] = params.location.slotName
+        self._state.module_temperatures.setdefault(module_id, START_MODULE_TEMPERATURE)
+
+    def _load_pipette(self, pipette_id: str, params: LoadPipetteParams) -> None:
+        specs = name_config().get(cast(PipetteName, params.pipetteName))
+        if specs is not None:
+            self._state.pipette_flow_rates[pipette_id] = (
+                specs["defaultAspirateFlowRate"]["value"],
+                specs["defaultDispenseFlowRate"]["value"],
+            )
+
+    def _set_module_temperature(self, module_id: str, celsius: float) -> float:
+        """Set a module's current temperature, returning its previous temperature."""
+        previous = self._state.module_temperatures.get(
+            module_id, START_MODULE_TEMPERATURE
+        )
+        self._state.module_temperatures[module_id] = celsius
+        return previous
+
+    def _move_to_labware(self, labware_id: str) -> float:
+        """Get the time to travel to a labware's slot, and record the move."""
+        placement = self._state.labware_placements.get(labware_id)
+
+        if placement is None:
+            return SAME_SLOT_TRAVEL_TIME
+
+        previous_slot = self._state.last_slot
+        self._state.last_slot = placement.slot_name
+        start = self._state.slot_positions.get(previous_slot)
+        end = self._state.slot_positions.get(placement.slot_name)
+
+        if start is None or end is None:
+            return SAME_SLOT_TRAVEL_TIME
+
+        return get_deck_travel_time(start, end, GANTRY_SPEED)
+
+
+class DurationView(HasState[DurationState]):
+    """Read-only view of run duration estimates."""
+
+    _state: DurationState
+
+    def __init__(self, state: DurationState) -> None:
+        """Initialize the view with its backing state value."""
+        self._state = state
+
+    def get_estimate(self, command_id: str) -> Optional[float]:
+        """Get a command's estimated duration, if it has been estimated."""
+        return self._state.estimates_by_command_id.get(command_id)
+
+    def get_total(self) -> float:
+        """Get the estimated duration of the whole run.
+
+        This includes the commands that have run, the commands that are
+        queued or running, and any expected commands that haven't been added
+        yet. Commands that are dropped because the run stopped or failed
+        are removed from the total.
+        """
+        return self._state.total_duration + self._state.expected_duration
+
+    def get_remaining(self) -> float:
+        """Get the estimated duration of the commands that are yet to finish.
+
+        This includes the commands that are queued or running, and any
+        expected commands that haven't been added yet.
+        """
+        return self._state.remaining_duration + self._state.expected_duration
+
+
+def _get_legacy_duration(params: CustomParams) -> float:
+    """Estimate a command from a Python protocol.
+
+    Most Python protocol commands are only recorded by the engine as custom
+    commands with a legacy type and a human-readable description. Liquid
+    handling and delays also carry the details needed to estimate them;
+    commands recorded without those, like in older analyses, are estimated
+    from their description instead.
+    """
+    command_type = getattr(params, "legacyCommandType", None)
+
+    if not isinstance(command_type, str):
+        return 0.0
+
+    if command_type in (legacy_command_types.ASPIRATE, legacy_command_types.DISPENSE):
+        volume = getattr(params, "volume", None)
+        flow_rate = getattr(params, "flowRate", None)
+
+        if volume is None or flow_rate is None:
+            match = _match_legacy_text(params, _LEGACY_LIQUID_HANDLING_RE)
+            if match is None:
+                return 0.0
+            volume = float(match.group("volume"))
+            flow_rate = float(match.group("flow"))
+
+        duration = get_z_travel_time(False, GANTRY_SPEED)
+        if flow_rate > 0:
+            duration += volume / flow_rate
+        return duration
+
+    if command_type == legacy_command_types.DELAY:
+        seconds = getattr(params, "delaySeconds", None)
+
+        if seconds is None:
+            match = _match_legacy_text(params, _LEGACY_DELAY_RE)
+            if match is None:
+                return 0.0
+            seconds = int(match.group("minutes")) * 60 + float(match.group("seconds"))
+
+        return float(seconds)
+
+    return _LEGACY_FIXED_TIMES.get(command_type, 0.0)
+
+
+def _match_legacy_text(
+    params: CustomParams, pattern: Pattern[str]
+) -> Optional[Match[str]]:
+    command_text = getattr(params, "legacyCommandText", None)
+    match = pattern.match(command_text) if isinstance(command_text, str) else None
+
+    if match is None:
+        log.warning(
+            f"Unable to estimate the duration of legacy command"
+            f" {getattr(params, 'legacyCommandType', None)!r}"
+            f" from its text {command_text!r}."
+        )
+
+    return match
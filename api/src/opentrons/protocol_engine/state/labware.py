@@ -4,7 +4,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2, SlotDefV2
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -25,6 +25,7 @@ from ..types import (
     LabwareOffsetLocation,
     LabwareLocation,
     LoadedLabware,
+    ModuleModel,
 )
 from ..actions import (
     Action,
@@ -37,6 +38,16 @@ from .abstract_store import HasState, HandlesActions
 
 _TRASH_LOCATION = DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH)
 
+LabwareOffsetIndexKey = Tuple[str, DeckSlotName, Optional[ModuleModel]]
+
+
+def get_labware_offset_index_key(
+    definition_uri: str,
+    location: LabwareOffsetLocation,
+) -> LabwareOffsetIndexKey:
+    """Get the key used to look up labware offsets by definition URI and location."""
+    return (definition_uri, location.slotName, location.moduleModel)
+
 
 @dataclass
 class LabwareState:
@@ -51,6 +62,10 @@ class LabwareState:
     # We rely on Python 3.7+ preservation of dict insertion order.
     labware_offsets_by_id: Dict[str, LabwareOffset]
 
+    # The ID of the most recently added offset for each definition URI and location.
+    # Every ID here must point to an existing element of labware_offsets_by_id.
+    latest_labware_offset_ids: Dict[LabwareOffsetIndexKey, str]
+
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV2
 
@@ -92,6 +107,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         self._state = LabwareState(
             definitions_by_uri=definitions_by_uri,
             labware_offsets_by_id={},
+            latest_labware_offset_ids={},
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
         )
@@ -153,6 +169,12 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         assert labware_offset.id not in self._state.labware_offsets_by_id
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
+        self._state.latest_labware_offset_ids[
+            get_labware_offset_index_key(
+                definition_uri=labware_offset.definitionUri,
+                location=labware_offset.location,
+            )
+        ] = labware_offset.id
 
 
 class LabwareView(HasState[LabwareState]):
@@ -392,10 +414,14 @@ class LabwareView(HasState[LabwareState]):
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-        return None
+        offset_id = self._state.latest_labware_offset_ids.get(
+            get_labware_offset_index_key(
+                definition_uri=definition_uri,
+                location=location,
+            )
+        )
+        return (
+            self._state.labware_offsets_by_id[offset_id]
+            if offset_id is not None
+            else None
+        )
@@ -1,20 +1,47 @@
 """Protocol engine state management."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..actions import (
+    Action,
+    ActionHandler,
+    AddLabwareDefinitionAction,
+    AddLabwareOffsetAction,
+    AddModuleAction,
+    FailCommandAction,
+    FinishAction,
+    HardwareEventAction,
+    HardwareStoppedAction,
+    PauseAction,
+    PlayAction,
+    QueueCommandAction,
+    StopAction,
+    UpdateCommandAction,
+)
 from .abstract_store import HasState, HandlesActions
-from .change_notifier import ChangeNotifier
+from .change_notifier import ChangeNotifier, StateTopic
 from .commands import CommandState, CommandStore, CommandView
 from .labware import LabwareState, LabwareStore, LabwareView
 from .pipettes import PipetteState, PipetteStore, PipetteView
 from .modules import ModuleState, ModuleStore, ModuleView
+from .durations import DurationState, DurationStore, DurationView
 from .geometry import GeometryView
 from .motion import MotionView
 from .configs import EngineConfigs
@@ -22,6 +49,42 @@ from .state_summary import StateSummary
 
 ReturnT = TypeVar("ReturnT")
 
+_ALL_TOPICS: FrozenSet[StateTopic] = frozenset(StateTopic)
+_COMMANDS_TOPIC: FrozenSet[StateTopic] = frozenset([StateTopic.COMMANDS])
+_LABWARE_TOPIC: FrozenSet[StateTopic] = frozenset([StateTopic.LABWARE])
+_MODULES_TOPIC: FrozenSet[StateTopic] = frozenset([StateTopic.MODULES])
+
+
+def _get_changed_topics(action: Action) -> FrozenSet[StateTopic]:
+    """Get the parts of state that may be modified by an action."""
+    if isinstance(
+        action,
+        (
+            QueueCommandAction,
+            FailCommandAction,
+            PlayAction,
+            PauseAction,
+            StopAction,
+            FinishAction,
+            HardwareStoppedAction,
+            HardwareEventAction,
+        ),
+    ):
+        return _COMMANDS_TOPIC
+
+    # Only a command's result can change labware, pipette, or module state
+    if isinstance(action, UpdateCommandAction) and action.command.result is None:
+        return _COMMANDS_TOPIC
+
+    if isinstance(action, (AddLabwareOffsetAction, AddLabwareDefinitionAction)):
+        return _LABWARE_TOPIC
+
+    if isinstance(action, AddModuleAction):
+        return _MODULES_TOPIC
+
+    # Command results (and anything unrecognized) may touch any substore
+    return _ALL_TOPICS
+
 
 @dataclass(frozen=True)
 class State:
@@ -31,6 +94,7 @@ class State:
     labware: LabwareState
     pipettes: PipetteState
     modules: ModuleState
+    durations: DurationState
 
 
 class StateView(HasState[State]):
@@ -41,9 +105,12 @@ class StateView(HasState[State]):
     _labware: LabwareView
     _pipettes: PipetteView
     _modules: ModuleView
+    _durations: DurationView
     _geometry: GeometryView
     _motion: MotionView
     _configs: EngineConfigs
+    _state_version: int
+    _summary_cache: Optional[Tuple[int, StateSummary]]
 
     @property
     def commands(self) -> CommandView:
@@ -65,6 +132,11 @@ class StateView(HasState[State]):
         """Get state view selectors for hardware module state."""
         return self._modules
 
+    @property
+    def durations(self) -> DurationView:
+        """Get state view selectors for run duration estimates."""
+        return self._durations
+
     @property
     def geometry(self) -> GeometryView:
         """Get state view selectors for derived geometry state."""
@@ -80,16 +152,36 @@ class StateView(HasState[State]):
         """Get Protocol Engine configurations."""
         return self._configs
 
+    def get_state_version(self) -> int:
+        """Get a counter that increases every time the state changes.
+
+        Consumers that derive expensive data from state may cache it
+        against this version, and reuse it until the version changes.
+        """
+        return self._state_version
+
     def get_summary(self) -> StateSummary:
-        """Get protocol run data."""
-        return StateSummary.construct(
+        """Get protocol run data.
+
+        The summary is built at most once per state version.
+        """
+        if self._summary_cache is not None:
+            cached_version, cached_summary = self._summary_cache
+            if cached_version == self._state_version:
+                return cached_summary
+
+        summary = StateSummary.construct(
             status=self.commands.get_status(),
             errors=self._commands.get_all_errors(),
             pipettes=self._pipettes.get_all(),
             labware=self._labware.get_all(),
             labwareOffsets=self._labware.get_labware_offsets(),
             modules=self.modules.get_all(),
+            estimatedDuration=self._durations.get_total(),
+            estimatedRemainingDuration=self._durations.get_remaining(),
         )
+        self._summary_cache = (self._state_version, summary)
+        return summary
 
 
 class StateStore(StateView, ActionHandler):
@@ -126,15 +218,21 @@ class StateStore(StateView, ActionHandler):
             deck_definition=deck_definition,
         )
         self._module_store = ModuleStore()
+        self._duration_store = DurationStore(deck_definition=deck_definition)
 
         self._substores: List[HandlesActions] = [
             self._command_store,
             self._pipette_store,
             self._labware_store,
             self._module_store,
+            self._duration_store,
         ]
         self._configs = configs
         self._change_notifier = change_notifier or ChangeNotifier()
+        self._state_version = 0
+        self._summary_cache = None
+        self._spurious_wakeup_count = 0
+        self._command_completion_futures: Dict[str, "asyncio.Future[None]"] = {}
         self._initialize_state()
 
     def handle_action(self, action: Action) -> None:
@@ -147,12 +245,47 @@ class StateStore(StateView, ActionHandler):
         for substore in self._substores:
             substore.handle_action(action)
 
-        self._update_state_views()
+        self._update_state_views(topics=_get_changed_topics(action))
+        self._resolve_command_completions(action)
+
+    def get_spurious_wakeup_count(self) -> int:
+        """Get how many times a `wait_for` waiter woke up for nothing.
+
+        A wakeup is spurious if the waiter's condition was still false
+        after the state change notification that woke it up.
+        """
+        return self._spurious_wakeup_count
+
+    async def wait_for_command_completion(self, command_id: str) -> None:
+        """Wait for a command to be completed.
+
+        Unlike `wait_for`, the waiter is only woken up once,
+        when the action that completes the command is handled.
+        See `CommandView.get_is_complete` for what counts as "completed."
+
+        Arguments:
+            command_id: Command to wait for.
+
+        Raises:
+            CommandDoesNotExistError: The command is not in state.
+        """
+        if self._commands.get_is_complete(command_id):
+            return
+
+        future = self._command_completion_futures.get(command_id)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._command_completion_futures[command_id] = future
+
+        # shield the shared future so one cancelled waiter doesn't cancel the rest
+        await asyncio.shield(future)
 
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        topic: Optional[StateTopic] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
@@ -191,6 +324,9 @@ class StateStore(StateView, ActionHandler):
             condition: A function that returns a truthy value when the `await`
                 should resolve.
             *args: Positional arguments to pass to `condition`.
+            topic: The part of state that `condition` depends on. If given,
+                `condition` will only be re-checked when that part of state
+                changes. If omitted, it will be re-checked on every change.
             **kwargs: Named arguments to pass to `condition`.
 
         Returns:
@@ -203,9 +339,12 @@ class StateStore(StateView, ActionHandler):
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(topic=topic)
             is_done = predicate()
 
+            if not is_done:
+                self._spurious_wakeup_count += 1
+
         return is_done
 
     def _get_next_state(self) -> State:
@@ -215,6 +354,7 @@ class StateStore(StateView, ActionHandler):
             labware=self._labware_store.state,
             pipettes=self._pipette_store.state,
             modules=self._module_store.state,
+            durations=self._duration_store.state,
         )
 
     def _initialize_state(self) -> None:
@@ -229,6 +369,7 @@ class StateStore(StateView, ActionHandler):
         self._modules = ModuleView(
             state.modules, virtualize_modules=self._configs.use_virtual_modules
         )
+        self._durations = DurationView(state.durations)
 
         # Derived states
         self._geometry = GeometryView(
@@ -242,12 +383,35 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
+    def _update_state_views(self, topics: FrozenSet[StateTopic]) -> None:
         """Update state view interfaces to use latest underlying values."""
         next_state = self._get_next_state()
         self._state = next_state
+        self._state_version += 1
         self._commands._state = next_state.commands
         self._labware._state = next_state.labware
         self._pipettes._state = next_state.pipettes
         self._modules._state = next_state.modules
-        self._change_notifier.notify()
+        self._durations._state = next_state.durations
+        self._change_notifier.notify(topics=topics)
+
+    def _resolve_command_completions(self, action: Action) -> None:
+        """Resolve the completion futures of any commands completed by an action."""
+        if len(self._command_completion_futures) == 0:
+            return
+
+        if isinstance(action, UpdateCommandAction):
+            command_ids = [action.command.id]
+        elif isinstance(action, FailCommandAction):
+            # failing a command also fails every queued command after it
+            command_ids = list(self._command_completion_futures)
+        else:
+            return
+
+        for command_id in command_ids:
+            future = self._command_completion_futures.get(command_id)
+
+            if future is not None and self._commands.get_is_complete(command_id):
+                del self._command_completion_futures[command_id]
+                if not future.done():
+                    future.set_result(None)
@@ -1,6 +1,6 @@
 """Public protocol run data models."""
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 from ..errors import ErrorOccurrence
 from ..types import (
@@ -21,3 +21,19 @@ class StateSummary(BaseModel):
     pipettes: List[LoadedPipette]
     modules: List[LoadedModule]
     labwareOffsets: List[LabwareOffset]
+    estimatedDuration: Optional[float] = Field(
+        None,
+        description=(
+            "Estimated duration of the run, in seconds, including the commands"
+            " that have run, the commands that are still queued or running,"
+            " and any expected commands that haven't been added yet."
+        ),
+    )
+    estimatedRemainingDuration: Optional[float] = Field(
+        None,
+        description=(
+            "Estimated duration, in seconds, of the commands that are still"
+            " queued or running, and of any expected commands that haven't"
+            " been added yet."
+        ),
+    )
@@ -2,6 +2,7 @@
 
 from .protocol_reader import ProtocolReader, ProtocolFilesInvalidError
 from .input_file import AbstractInputFile
+from .compiled_protocol_cache import CompiledProtocol, CompiledProtocolCache
 from .protocol_source import (
     ProtocolSource,
     ProtocolSourceFile,
@@ -14,6 +15,7 @@ from .protocol_source import (
 __all__ = [
     # main interface
     "ProtocolReader",
+    "CompiledProtocolCache",
     # input values
     "AbstractInputFile",
     # errors
@@ -25,4 +27,5 @@ __all__ = [
     "ProtocolType",
     "JsonProtocolConfig",
     "PythonProtocolConfig",
+    "CompiledProtocol",
 ]
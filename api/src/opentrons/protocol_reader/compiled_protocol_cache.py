@@ -0,0 +1,231 @@
+"""Compiled protocol caching."""
+import hashlib
+import importlib.util
+import json
+import logging
+import marshal
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import opentrons
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocols.parse import compile_python
+from opentrons.protocols.types import ApiDeprecationError, MalformedProtocolError
+
+from .protocol_source import (
+    JsonProtocolConfig,
+    Metadata,
+    ProtocolConfig,
+    ProtocolSource,
+    ProtocolType,
+    PythonProtocolConfig,
+)
+
+
+log = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = ".compiled_protocol"
+"""The name of the cache file kept in a saved protocol's directory."""
+
+# Bump this if the layout of the cache file changes.
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CompiledProtocol:
+    """The results of reading a protocol, saved alongside its files.
+
+    Attributes:
+        key: A hash of the protocol's files and of everything else that
+            went into reading them. See `CompiledProtocolCache.compute_key`.
+        main_file_name: The name of the protocol's main file.
+        labware_file_names: The names of the protocol's labware files.
+        metadata: The protocol's metadata.
+        config: The protocol's execution configuration.
+        labware_definitions: The protocol's labware definitions,
+            as plain dictionaries.
+        code: The compiled main file of a Python protocol that passed
+            Protocol API v2 validation, or ``None``.
+    """
+
+    key: str
+    main_file_name: str
+    labware_file_names: List[str]
+    metadata: Metadata
+    config: ProtocolConfig
+    labware_definitions: List[Dict[str, Any]]
+    code: Optional[CodeType]
+
+
+class CompiledProtocolCache:
+    """Save and load compiled protocols in saved protocol directories.
+
+    A cache file is only ever used if its key matches the protocol's files,
+    so a stale or unreadable cache file is ignored rather than trusted.
+    """
+
+    @staticmethod
+    def compute_key(files: Sequence[Tuple[str, bytes]]) -> str:
+        """Compute the cache key of a set of protocol files.
+
+        Arguments:
+            files: The name and contents of each of the protocol's files.
+        """
+        key = hashlib.sha256()
+
+        def _update(*parts: object) -> None:
+            for part in parts:
+                data = part if isinstance(part, bytes) else str(part).encode()
+                # Length-prefix every part so that adjacent parts can't run together.
+                key.update(len(data).to_bytes(8, "big"))
+                key.update(data)
+
+        # Compiled code is specific to a Python version, and reading a
+        # protocol may change between `opentrons` versions.
+        _update(_FORMAT_VERSION, importlib.util.MAGIC_NUMBER, opentrons.__version__)
+
+        for name, contents in sorted(files, key=lambda f: f[0]):
+            _update(name, contents)
+
+        return key.hexdigest()
+
+    @staticmethod
+    def build(
+        key: str,
+        main_file_name: str,
+        main_file_contents: bytes,
+        labware_file_names: List[str],
+        metadata: Metadata,
+        config: ProtocolConfig,
+        labware_definitions: Sequence[LabwareDefinition],
+    ) -> CompiledProtocol:
+        """Compile a protocol's main file, if it's Python, and collect the results.
+
+        A Python main file that fails Protocol API v2 validation is not
+        compiled, so that it gets the usual errors when it's run.
+        """
+        code = None
+
+        if isinstance(config, PythonProtocolConfig):
+            try:
+                code, _, _ = compile_python(
+                    main_file_contents.decode("utf-8"), main_file_name
+                )
+            except (
+                ApiDeprecationError,
+                MalformedProtocolError,
+                SyntaxError,
+                ValueError,
+            ):
+                pass
+
+        return CompiledProtocol(
+            key=key,
+            main_file_name=main_file_name,
+            labware_file_names=labware_file_names,
+            metadata=metadata,
+            config=config,
+            labware_definitions=[
+                json.loads(lw.json(exclude_none=True)) for lw in labware_definitions
+            ],
+            code=code,
+        )
+
+    @staticmethod
+    def load(directory: Path, key: str) -> Optional[CompiledProtocol]:
+        """Load the compiled protocol saved in a directory, if it matches the key."""
+        try:
+            payload = marshal.loads((directory / CACHE_FILE_NAME).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            log.warning(f"Ignoring unreadable compiled protocol in {directory}: {e}")
+            return None
+
+        if (
+            not isinstance(payload, tuple)
+            or len(payload) != 8
+            or payload[0] != _FORMAT_VERSION
+            or payload[1] != key
+        ):
+            return None
+
+        _, _, main_file_name, labware_file_names, metadata, config, lw, code = payload
+
+        return CompiledProtocol(
+            key=key,
+            main_file_name=main_file_name,
+            labware_file_names=list(labware_file_names),
+            metadata=metadata,
+            config=_config_from_tuple(config),
+            labware_definitions=list(lw),
+            code=code,
+        )
+
+    @staticmethod
+    def load_for_source(source: ProtocolSource) -> Optional[CompiledProtocol]:
+        """Load the compiled protocol saved alongside a protocol source, if any."""
+        if source.directory is None:
+            return None
+
+        try:
+            key = CompiledProtocolCache.compute_key(
+                [(f.path.name, f.path.read_bytes()) for f in source.files]
+            )
+        except OSError:
+            return None
+
+        return CompiledProtocolCache.load(source.directory, key)
+
+    @staticmethod
+    def save(directory: Path, compiled: CompiledProtocol) -> None:
+        """Save a compiled protocol into a protocol's directory.
+
+        Failing to save is logged, not raised, since the cache is only an
+        optimization.
+        """
+        try:
+            data = marshal.dumps(
+                (
+                    _FORMAT_VERSION,
+                    compiled.key,
+                    compiled.main_file_name,
+                    compiled.labware_file_names,
+                    compiled.metadata,
+                    _config_to_tuple(compiled.config),
+                    compiled.labware_definitions,
+                    compiled.code,
+                )
+            )
+            # A partially written file fails to load or to match its key,
+            # so it's ignored like any other stale cache file.
+            (directory / CACHE_FILE_NAME).write_bytes(data)
+        except (OSError, ValueError) as e:
+            log.warning(f"Unable to save compiled protocol in {directory}: {e}")
+
+    @staticmethod
+    def clear(directory: Path) -> None:
+        """Delete the compiled protocol saved in a directory, if any."""
+        try:
+            (directory / CACHE_FILE_NAME).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _config_to_tuple(config: ProtocolConfig) -> Tuple[Any, ...]:
+    if isinstance(config, PythonProtocolConfig):
+        return (
+            config.protocol_type.value,
+            config.api_version.major,
+            config.api_version.minor,
+        )
+    return (config.protocol_type.value, config.schema_version)
+
+
+def _config_from_tuple(config: Tuple[Any, ...]) -> ProtocolConfig:
+    if config[0] == ProtocolType.PYTHON.value:
+        return PythonProtocolConfig(api_version=APIVersion(config[1], config[2]))
+    return JsonProtocolConfig(schema_version=config[1])
@@ -2,11 +2,20 @@
 from pathlib import Path
 from typing import List, Optional, Sequence
 
+from anyio import to_thread
+
+from opentrons.protocols.models import LabwareDefinition
+
 from .input_file import AbstractInputFile
-from .file_reader_writer import FileReaderWriter, FileReadError
+from .file_reader_writer import BufferedFile, FileReaderWriter, FileReadError
 from .role_analyzer import RoleAnalyzer, RoleAnalysisFile, RoleAnalysisError
-from .config_analyzer import ConfigAnalyzer, ConfigAnalysisError
-from .protocol_source import ProtocolSource, ProtocolSourceFile
+from .config_analyzer import ConfigAnalyzer, ConfigAnalysis, ConfigAnalysisError
+from .protocol_source import ProtocolSource, ProtocolSourceFile, ProtocolFileRole
+from .compiled_protocol_cache import (
+    CACHE_FILE_NAME,
+    CompiledProtocol,
+    CompiledProtocolCache,
+)
 
 
 class ProtocolFilesInvalidError(ValueError):
@@ -21,6 +30,7 @@ class ProtocolReader:
         file_reader_writer: Optional[FileReaderWriter] = None,
         role_analyzer: Optional[RoleAnalyzer] = None,
         config_analyzer: Optional[ConfigAnalyzer] = None,
+        compiled_protocol_cache: Optional[CompiledProtocolCache] = None,
     ) -> None:
         """Initialize the reader with its dependencies.
 
@@ -29,10 +39,15 @@ class ProtocolReader:
             file_reader_writer: Input file reader/writer. Default impl. used if None.
             role_analyzer: File role analyzer. Default impl. used if None.
             config_analyzer: Protocol config analyzer. Default impl. used if None.
+            compiled_protocol_cache: Compiled protocol cache. Default impl.
+                used if None.
         """
         self._file_reader_writer = file_reader_writer or FileReaderWriter()
         self._role_analyzer = role_analyzer or RoleAnalyzer()
         self._config_analyzer = config_analyzer or ConfigAnalyzer()
+        self._compiled_protocol_cache = (
+            compiled_protocol_cache or CompiledProtocolCache()
+        )
 
     async def read_and_save(
         self, files: Sequence[AbstractInputFile], directory: Path
@@ -70,6 +85,14 @@ class ProtocolReader:
             ProtocolSourceFile(path=directory / f.name, role=f.role) for f in all_files
         ]
 
+        await self._save_compiled(
+            directory=directory,
+            key_files=all_files,
+            all_files=all_files,
+            config_analysis=config_analysis,
+            labware_definitions=role_analysis.labware_definitions,
+        )
+
         return ProtocolSource(
             directory=directory,
             main_file=main_file,
@@ -86,9 +109,13 @@ class ProtocolReader:
     ) -> ProtocolSource:
         """Compute a `ProtocolSource` from protocol source files on the filesystem.
 
+        If `directory` holds a compiled protocol saved from these same files,
+        the source is built from it without parsing the files again.
+
         Arguments:
             files: The files comprising the protocol.
-            directory: Passed through to `ProtocolSource.directory`. Otherwise unused.
+            directory: Passed through to `ProtocolSource.directory`, and searched
+                for a compiled protocol.
 
         Returns:
             A validated ProtocolSource.
@@ -97,6 +124,13 @@ class ProtocolReader:
             ProtocolFilesInvalidError: Input file list given to the reader
                 could not be validated as a protocol.
         """
+        files = [f for f in files if f.name != CACHE_FILE_NAME]
+
+        if directory is not None:
+            compiled = await to_thread.run_sync(self._load_compiled, directory, files)
+            if compiled is not None:
+                return _source_from_compiled(compiled, files, directory)
+
         try:
             buffered_files = await self._file_reader_writer.read(files)
             role_analysis = self._role_analyzer.analyze(buffered_files)
@@ -110,6 +144,15 @@ class ProtocolReader:
             *role_analysis.labware_files,
         ]
 
+        if directory is not None:
+            await self._save_compiled(
+                directory=directory,
+                key_files=buffered_files,
+                all_files=all_files,
+                config_analysis=config_analysis,
+                labware_definitions=role_analysis.labware_definitions,
+            )
+
         # TODO(mc, 2022-04-01): these asserts are a bit awkward,
         # consider restructuring so they're not needed
         assert isinstance(role_analysis.main_file.path, Path)
@@ -129,3 +172,64 @@ class ProtocolReader:
             metadata=config_analysis.metadata,
             labware_definitions=role_analysis.labware_definitions,
         )
+
+    def _load_compiled(
+        self, directory: Path, files: Sequence[Path]
+    ) -> Optional[CompiledProtocol]:
+        try:
+            key = self._compiled_protocol_cache.compute_key(
+                [(f.name, f.read_bytes()) for f in files]
+            )
+        except OSError:
+            return None
+        return self._compiled_protocol_cache.load(directory, key)
+
+    async def _save_compiled(
+        self,
+        directory: Path,
+        key_files: Sequence[BufferedFile],
+        all_files: Sequence[RoleAnalysisFile],
+        config_analysis: ConfigAnalysis,
+        labware_definitions: Sequence[LabwareDefinition],
+    ) -> None:
+        def _compile_and_save() -> None:
+            compiled = self._compiled_protocol_cache.build(
+                key=self._compiled_protocol_cache.compute_key(
+                    [(f.name, f.contents) for f in key_files]
+                ),
+                main_file_name=all_files[0].name,
+                main_file_contents=all_files[0].contents,
+                labware_file_names=[f.name for f in all_files[1:]],
+                metadata=config_analysis.metadata,
+                config=config_analysis.config,
+                labware_definitions=labware_definitions,
+            )
+            self._compiled_protocol_cache.save(directory, compiled)
+
+        await to_thread.run_sync(_compile_and_save)
+
+
+def _source_from_compiled(
+    compiled: CompiledProtocol, files: Sequence[Path], directory: Path
+) -> ProtocolSource:
+    paths_by_name = {f.name: f for f in files}
+    main_file = paths_by_name[compiled.main_file_name]
+
+    return ProtocolSource(
+        directory=directory,
+        main_file=main_file,
+        files=[
+            ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN),
+            *(
+                ProtocolSourceFile(
+                    path=paths_by_name[name], role=ProtocolFileRole.LABWARE
+                )
+                for name in compiled.labware_file_names
+            ),
+        ],
+        config=compiled.config,
+        metadata=compiled.metadata,
+        labware_definitions=[
+            LabwareDefinition.parse_obj(lw) for lw in compiled.labware_definitions
+        ],
+    )
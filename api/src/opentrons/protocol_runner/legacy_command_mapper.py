@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from opentrons.types import MountType, DeckSlotName, Location
 from opentrons.commands import types as legacy_command_types
@@ -36,6 +36,12 @@ class LegacyCommandParams(pe_commands.CustomParams):
     legacyCommandType: str
     legacyCommandText: str
 
+    # Details of some legacy commands, so their durations can be estimated
+    # without parsing legacyCommandText.
+    volume: Optional[float] = None
+    flowRate: Optional[float] = None
+    delaySeconds: Optional[float] = None
+
 
 class LegacyContextCommandError(ProtocolEngineError):
     """An error returned when a PAPIv2 ProtocolContext command fails."""
@@ -268,6 +274,7 @@ class LegacyCommandMapper:
                 params=LegacyCommandParams.construct(
                     legacyCommandType=command["name"],
                     legacyCommandText=command["payload"]["text"],
+                    **_get_legacy_command_details(command),
                 ),
             )
 
@@ -398,3 +405,30 @@ class LegacyCommandMapper:
         self._module_id_by_slot[module_load_info.deck_slot] = module_id
         self._module_definition_by_model[loaded_model] = loaded_definition
         return load_module_command
+
+
+def _get_legacy_command_details(
+    command: legacy_command_types.CommandMessage,
+) -> Dict[str, Any]:
+    """Get the structured params of a legacy command that has any."""
+    payload: Dict[str, Any] = command["payload"]  # type: ignore[assignment]
+
+    if command["name"] in (
+        legacy_command_types.ASPIRATE,
+        legacy_command_types.DISPENSE,
+    ):
+        pipette: LegacyPipetteContext = payload["instrument"]
+        default_flow_rate = (
+            pipette.flow_rate.aspirate
+            if command["name"] == legacy_command_types.ASPIRATE
+            else pipette.flow_rate.dispense
+        )
+        return {
+            "volume": float(payload["volume"]),
+            "flowRate": payload["rate"] * default_flow_rate,
+        }
+
+    if command["name"] == legacy_command_types.DELAY:
+        return {"delaySeconds": payload["minutes"] * 60 + payload["seconds"]}
+
+    return {}
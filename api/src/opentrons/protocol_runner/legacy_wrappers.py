@@ -45,7 +45,11 @@ from opentrons.protocols.types import (
     PythonProtocol as LegacyPythonProtocol,
 )
 
-from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_reader import (
+    CompiledProtocolCache,
+    ProtocolSource,
+    PythonProtocolConfig,
+)
 from .legacy_labware_offset_provider import LegacyLabwareOffsetProvider
 
 
@@ -68,9 +72,38 @@ class LegacyFileReader:
 
     @staticmethod
     def read(protocol_source: ProtocolSource) -> LegacyProtocol:
-        """Read a PAPIv2 protocol into a datastructure."""
+        """Read a PAPIv2 protocol into a datastructure.
+
+        Python protocols with a saved compiled protocol skip parsing
+        and compiling, and reuse the saved labware definitions.
+        """
         protocol_file_path = protocol_source.main_file
         protocol_contents = protocol_file_path.read_text()
+        compiled = CompiledProtocolCache.load_for_source(protocol_source)
+
+        if (
+            compiled is not None
+            and compiled.code is not None
+            and isinstance(compiled.config, PythonProtocolConfig)
+        ):
+            return LegacyPythonProtocol(
+                text=protocol_contents,
+                filename=compiled.code.co_filename,
+                contents=compiled.code,
+                metadata=compiled.metadata,
+                api_level=compiled.config.api_version,
+                bundled_labware=None,
+                bundled_data=None,
+                bundled_python=None,
+                extra_labware={
+                    uri_from_details(
+                        namespace=lw["namespace"],
+                        load_name=lw["parameters"]["loadName"],
+                        version=lw["version"],
+                    ): cast(LegacyLabwareDefinition, lw)
+                    for lw in compiled.labware_definitions
+                },
+            )
 
         return parse(
             protocol_file=protocol_contents,
@@ -3,7 +3,7 @@ import importlib.util
 from types import ModuleType
 
 from opentrons.protocol_api_experimental import ProtocolContext
-from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_reader import CompiledProtocolCache, ProtocolSource
 
 
 class PythonProtocol:
@@ -27,6 +27,14 @@ class PythonFileReader:
     @staticmethod
     def read(protocol_source: ProtocolSource) -> PythonProtocol:
         """Read a Python protocol as a `import`ed Python module."""
+        compiled = CompiledProtocolCache.load_for_source(protocol_source)
+
+        if compiled is not None and compiled.code is not None:
+            module = ModuleType("protocol")
+            module.__file__ = str(protocol_source.main_file)
+            exec(compiled.code, module.__dict__)
+            return PythonProtocol(protocol_module=module)
+
         # TODO(mc, 2021-06-30): better module name logic
         spec = importlib.util.spec_from_file_location(
             name="protocol",
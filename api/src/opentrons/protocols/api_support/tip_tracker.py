@@ -1,5 +1,5 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons.protocols.context.well import WellImplementation
 
@@ -9,8 +9,41 @@ WellColumns = Sequence[Wells]
 
 
 class TipTracker:
+    """Track which wells of a tip rack have tips.
+
+    Each column's tips are kept as a bitmask, with bit ``n`` set if the
+    ``n``th well in the column has a tip, so finding a run of tips in a
+    column, or using or returning several of them, takes a few integer
+    operations instead of a pass over the column's wells. The tracker also
+    remembers the first column that has any tips, and the first that has
+    any empty wells, so that searches skip used-up columns without looking
+    at them.
+
+    The wells remain the source of truth for whether they have a tip. The
+    tracker listens to every well in its columns, so its bitmasks stay
+    current however a well's tip state is set, which means a well must
+    only belong to one tracker.
+    """
+
     def __init__(self, columns: WellColumns):
         self._columns = columns
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._masks: List[int] = []
+        self._full_masks: List[int] = []
+
+        for col_idx, column in enumerate(columns):
+            mask = 0
+            for row_idx, well in enumerate(column):
+                self._positions.setdefault(well.get_name(), (col_idx, row_idx))
+                if well.has_tip():
+                    mask |= 1 << row_idx
+                well.set_tip_listener(partial(self._on_tip_set, col_idx, row_idx))
+            self._masks.append(mask)
+            self._full_masks.append((1 << len(column)) - 1)
+
+        # Every column before these has no tips, or no empty wells, respectively.
+        self._first_column_with_tips = 0
+        self._first_column_with_space = 0
 
     def next_tip(
         self, num_tips: int = 1, starting_tip: Optional[WellImplementation] = None
@@ -29,36 +62,25 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
-        if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns)
-            )
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
-            )
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
+        first_column = self._advance_first_column_with_tips()
 
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[WellImplementation] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+        if starting_tip:
+            col_idx, row_idx = self._get_position(starting_tip)
+            # Only tips at or after the starting tip in its column count,
+            # and only if it's this rack's own well, not just one of the same name
+            if self._columns[col_idx][row_idx] is starting_tip:
+                mask = self._masks[col_idx] & ~((1 << row_idx) - 1)
+                run_start, run_length = _first_run(mask)
+                if run_length >= num_tips:
+                    return self._columns[col_idx][run_start]
+            first_column = max(first_column, col_idx + 1)
+
+        for col_idx in range(first_column, len(self._masks)):
+            run_start, run_length = _first_run(self._masks[col_idx])
+            if run_length >= num_tips:
+                return self._columns[col_idx][run_start]
+
+        return None
 
     def use_tips(
         self,
@@ -87,16 +109,16 @@ class TipTracker:
         :param fail_if_full: for backwards compatibility
         """
         # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
+        col_idx, well_idx = self._get_position(start_well)
+        target_column = self._columns[col_idx]
 
-        well_idx = target_column.index(start_well)
         # Number of tips to pick up is the lesser of (1) the number of tips
         # from the starting well to the end of the column, and (2) the number
         # of channels of the pipette (so a 4-channel pipette would pick up a
         # max of 4 tips, and picking up from the 2nd-to-bottom well in a
         # column would get a maximum of 2 tips)
         num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx : well_idx + num_tips]
+        target_mask = ((1 << num_tips) - 1) << well_idx
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -107,11 +129,11 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(
-                well.has_tip() for well in target_wells
+            assert (
+                self._masks[col_idx] & target_mask == target_mask
             ), "{} is out of tips".format(str(self))
 
-        for well in target_wells:
+        for well in target_column[well_idx : well_idx + num_tips]:
             well.set_has_tip(False)
 
     def previous_tip(self, num_tips: int = 1) -> Optional[WellImplementation]:
@@ -126,21 +148,15 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        first_column = self._advance_first_column_with_space()
+
+        for col_idx in range(first_column, len(self._masks)):
+            empty_mask = self._masks[col_idx] ^ self._full_masks[col_idx]
+            run_start, run_length = _first_run(empty_mask)
+            if run_length >= num_tips:
+                return self._columns[col_idx][run_start]
+
+        return None
 
     def return_tips(self, start_well: WellImplementation, num_channels: int = 1):
         """
@@ -164,12 +180,57 @@ class TipTracker:
         :type num_channels: int
         """
         # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
+        col_idx, well_idx = self._get_position(start_well)
+        target_column = self._columns[col_idx]
         end_idx = min(well_idx + num_channels, len(target_column))
-        drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f"Well {repr(well)} has a tip")
-        for well in drop_targets:
+        target_mask = ((1 << (end_idx - well_idx)) - 1) << well_idx
+        occupied = self._masks[col_idx] & target_mask
+        if occupied:
+            well = target_column[_first_run(occupied)[0]]
+            raise AssertionError(f"Well {repr(well)} has a tip")
+        for well in target_column[well_idx:end_idx]:
             well.set_has_tip(True)
+
+    def _get_position(self, well: WellImplementation) -> Tuple[int, int]:
+        """Get the column and row index of the well with the same name as `well`."""
+        try:
+            return self._positions[well.get_name()]
+        except KeyError:
+            raise ValueError(f"{repr(well)} is not in this tip rack") from None
+
+    def _on_tip_set(self, col_idx: int, row_idx: int, has_tip: bool) -> None:
+        if has_tip:
+            self._masks[col_idx] |= 1 << row_idx
+            self._first_column_with_tips = min(self._first_column_with_tips, col_idx)
+        else:
+            self._masks[col_idx] &= ~(1 << row_idx)
+            self._first_column_with_space = min(self._first_column_with_space, col_idx)
+
+    def _advance_first_column_with_tips(self) -> int:
+        col_idx = self._first_column_with_tips
+        while col_idx < len(self._masks) and not self._masks[col_idx]:
+            col_idx += 1
+        self._first_column_with_tips = col_idx
+        return col_idx
+
+    def _advance_first_column_with_space(self) -> int:
+        col_idx = self._first_column_with_space
+        while (
+            col_idx < len(self._masks)
+            and self._masks[col_idx] == self._full_masks[col_idx]
+        ):
+            col_idx += 1
+        self._first_column_with_space = col_idx
+        return col_idx
+
+
+def _first_run(mask: int) -> Tuple[int, int]:
+    """Get the start and length of the lowest run of set bits in `mask`.
+
+    Returns ``(0, 0)`` if no bits are set.
+    """
+    if not mask:
+        return 0, 0
+    start = (mask & -mask).bit_length() - 1
+    shifted = mask >> start
+    return start, (~shifted & (shifted + 1)).bit_length() - 1
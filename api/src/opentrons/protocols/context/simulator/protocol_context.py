@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from opentrons import types
 from opentrons.protocols.context.instrument import AbstractInstrument
@@ -14,6 +15,30 @@ logger = logging.getLogger(__name__)
 
 
 class ProtocolContextSimulation(ProtocolContextImplementation):
+    """A protocol context implementation for analysis.
+
+    Pipettes only track their own state and check motion plans, and actions
+    that would only wait on or home the hardware simulator are skipped.
+    """
+
+    _rail_lights_on: bool = False
+
+    def delay(self, seconds: float, msg: Optional[str]) -> None:
+        """Skip the delay; there is nothing to wait for in analysis."""
+        pass
+
+    def home(self) -> None:
+        """Forget the last location without homing the hardware simulator."""
+        self.set_last_location(None)
+
+    def set_rail_lights(self, on: bool) -> None:
+        """Set the simulated rail light state."""
+        self._rail_lights_on = on
+
+    def get_rail_lights_on(self) -> bool:
+        """Get the simulated rail light state."""
+        return self._rail_lights_on
+
     def load_instrument(
         self, instrument_name: str, mount: types.Mount, replace: bool
     ) -> AbstractInstrument:
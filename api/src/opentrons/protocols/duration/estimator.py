@@ -2,7 +2,6 @@ import logging
 from typing import Optional, List
 from typing_extensions import Final
 
-import math
 import functools
 
 from dataclasses import dataclass
@@ -11,25 +10,23 @@ from opentrons.protocols.geometry.deck import Deck
 from opentrons.commands import types
 from opentrons.protocols.api_support.labware_like import LabwareLike
 from opentrons.protocols.duration.errors import DurationEstimatorException
+from opentrons.protocols.duration.timing import (
+    BLOW_OUT_TIME,
+    DROP_TIP_TIME,
+    PICK_UP_TIP_TIME,
+    START_MODULE_TEMPERATURE,
+    THERMOCYCLER_DEACTIVATE_LID_TIME,
+    THERMOCYCLER_LID_MOVE_TIME,
+    THERMOCYCLER_SET_LID_TEMP_TIME,
+    TOUCH_TIP_TIME,
+    get_deck_travel_time,
+    get_temperature_module_ramp_time,
+    get_thermocycler_ramp_time,
+    get_z_travel_time,
+)
 from opentrons.types import Location
 
 
-# We refer to page 3 of the GEN2 Temperature Module White-Paper
-# https://blog.opentrons.com/opentrons-technical-documentation/
-# Through the data we notice that there are different
-# rates of Celsius/second depending on temperature range.
-# These were all tested to be ~95% consistent with the data
-TEMP_MOD_RATE_HIGH_AND_ABOVE: Final = 0.3611111111
-TEMP_MOD_RATE_LOW_TO_HIGH: Final = 0.2
-TEMP_MOD_RATE_ZERO_TO_LOW: Final = 0.0875
-TEMP_MOD_LOW_THRESH: Final = 25.0
-TEMP_MOD_HIGH_THRESH: Final = 37.0
-
-THERMO_LOW_THRESH: Final = 23.0
-THERMO_HIGH_THRESH: Final = 70.0
-
-START_MODULE_TEMPERATURE: Final = 25.0
-
 STARTING_SLOT: Final[str] = "12"
 
 
@@ -186,8 +183,7 @@ class DurationEstimator:
             self._deck, curr_slot, prev_slot, gantry_speed
         )
 
-        # The time to pick up tip is 4 seconds. Determined by testing on hardware.
-        duration = deck_travel_time + 4
+        duration = deck_travel_time + PICK_UP_TIP_TIME
 
         logger.info(
             f"{instrument.name} picked up tip from slot "
@@ -209,8 +205,7 @@ class DurationEstimator:
         )
         # TODO (al, 2021-09-08): Should we be checking for drop tip home_after = False?
 
-        # The time to drop up tip is 10 seconds. Determined by testing on hardware.
-        duration = deck_travel_time + 10
+        duration = deck_travel_time + DROP_TIP_TIME
 
         # let's only log the message after the pick up tip is done.
         logger.info(f"{instrument.name}, drop tip duration is {duration}")
@@ -290,7 +285,7 @@ class DurationEstimator:
         # In theory, we could use instrument.flow_rate.blow_out, but we don't
         # know how much is in the tip left to blow out
         # So we are defaulting to 0.5 seconds
-        duration = 0.5
+        duration = BLOW_OUT_TIME
         logger.info(f"blowing_out_for {duration} seconds, in slot {curr_slot}")
         return duration
 
@@ -302,7 +297,7 @@ class DurationEstimator:
         # Then use the speed of the touch tip
         # ( plate = protocol.load_labware('corning_96_wellplate_360ul_flat', '1')
         # depth = plate['A1'].diameter
-        duration = 0.5
+        duration = TOUCH_TIP_TIME
         logger.info(f"touch_tip for {duration} seconds")
         return duration
 
@@ -383,28 +378,28 @@ class DurationEstimator:
 
     def on_thermocycler_set_lid_temp(self, payload) -> float:
         # Hardware said ~1 minute
-        duration = 60
+        duration = THERMOCYCLER_SET_LID_TEMP_TIME
         thermoaction = "set lid temperature"
         logger.info(f"thermocation =  {thermoaction}")
         return duration
 
     def on_thermocycler_lid_close(self, payload) -> float:
         # Hardware said ~24 seconds
-        duration = 24
+        duration = THERMOCYCLER_LID_MOVE_TIME
         thermoaction = "closing"
         logger.info(f"thermocation =  {thermoaction}")
         return duration
 
     def on_thermocycler_lid_open(self, payload) -> float:
         # Hardware said ~24 seconds
-        duration = 24
+        duration = THERMOCYCLER_LID_MOVE_TIME
         thermoaction = "opening"
         logger.info(f"thermocation =  {thermoaction}")
         return duration
 
     def on_thermocycler_deactivate_lid(self, payload) -> float:
         # Hardware said ~23 seconds
-        duration = 23
+        duration = THERMOCYCLER_DEACTIVATE_LID_TIME
         thermoaction = "Deactivating"
         logger.info(f"thermocation =  {thermoaction}")
         return duration
@@ -419,41 +414,10 @@ class DurationEstimator:
         return duration
 
     def thermocycler_handler(self, temp0: float, temp1: float) -> float:
-        total = 0.0
-        if temp1 - temp0 > 0:
-            # heating up!
-            if temp1 > THERMO_HIGH_THRESH:
-                # the temp1 part that's over 70 is
-                total = abs(temp1 - THERMO_HIGH_THRESH) / 2
-                # the temp1 part that's under 70 is:
-                total += abs(THERMO_HIGH_THRESH - temp0) / 4
-            else:
-                total = abs(temp1 - temp0) / 4
-        # This is where the error is. if it's 10 and 94 this would not
-        # @Matt please look into this
-        elif temp1 - temp0 < 0:
-            if temp1 >= THERMO_HIGH_THRESH:
-                total = abs(temp1 - temp0) / 2
-            elif temp1 >= THERMO_LOW_THRESH:
-                total = abs(temp1 - temp0) / 1
-            else:
-                # 70 to 23 2 C/s
-                total = abs(temp0 - THERMO_LOW_THRESH) / 0.5
-                # 23 to temp1 0.1 C/s
-                total += abs(temp1 - THERMO_LOW_THRESH) / 0.1
-
-        return total
+        return get_thermocycler_ramp_time(temp0, temp1)
 
     def temperature_module(self, temp0: float, temp1: float) -> float:
-        duration = 0.0
-        if temp1 != temp0:
-            if temp1 > TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_high(temp0, temp1)
-            elif TEMP_MOD_LOW_THRESH <= temp1 <= TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_mid(temp0, temp1)
-            elif temp1 < TEMP_MOD_LOW_THRESH:
-                duration = self.rate_low(temp0, temp1)
-        return duration
+        return get_temperature_module_ramp_time(temp0, temp1)
 
     def on_tempdeck_deactivate(self, payload) -> float:
         # TODO (al, 2021-09-08: Find an answer for this value.
@@ -495,108 +459,13 @@ class DurationEstimator:
             )
         current_deck_center = deck.position_for(current_slot)
 
-        x_difference = abs(current_deck_center.point.x - previous_deck_center.point.x)
-        y_difference = abs(current_deck_center.point.y - previous_deck_center.point.y)
-
-        if x_difference == 0 and y_difference == 0:
-            # Inter slot movement defaults to half a second.
-            deck_movement_time = 0.5
-        else:
-            deck_distance = math.sqrt((x_difference**2) + (y_difference**2))
-            deck_movement_time = deck_distance / gantry_speed
-        return deck_movement_time
+        return get_deck_travel_time(
+            (previous_deck_center.point.x, previous_deck_center.point.y),
+            (current_deck_center.point.x, current_deck_center.point.y),
+            gantry_speed,
+        )
 
     @staticmethod
     def z_time(is_module: bool, gantry_speed: float) -> float:
         # TODO (al, 2021-09-08): Use definitions from protocol context objects.
-        z_default_labware_height = 177.8
-        z_default_module_height = 95.25
-        # 177.8 - 82.55 Where did we get 177.8 from?
-        # Would it be better to just use
-        # protocol_api.labware.Well.top
-        # labware.top() ?
-
-        if is_module:
-            z_time = z_default_module_height / gantry_speed
-        else:
-            z_time = z_default_labware_height / gantry_speed
-
-        return z_time
-
-    @staticmethod
-    def rate_high(temp0: float, temp1: float) -> float:
-        """
-        Calculate temp deck temperature change to a high temperature.
-
-        Args:
-            temp0: Current
-            temp1: Target
-
-        Returns:
-            Duration in seconds.
-        """
-        val = 0.0
-        if temp0 >= TEMP_MOD_HIGH_THRESH:
-            val = abs(temp1 - temp0) / TEMP_MOD_RATE_HIGH_AND_ABOVE
-        elif TEMP_MOD_LOW_THRESH < temp0 < TEMP_MOD_HIGH_THRESH:
-            val = abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
-            val += abs(temp1 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_HIGH_AND_ABOVE
-        elif temp0 <= TEMP_MOD_LOW_THRESH:
-            # the temp1 part that's under TEMP_MOD_HIGH_THRESH is:
-            val = abs(TEMP_MOD_LOW_THRESH - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
-            val += abs(TEMP_MOD_LOW_THRESH - temp1) / TEMP_MOD_RATE_HIGH_AND_ABOVE
-
-        return val
-
-    @staticmethod
-    def rate_mid(temp0: float, temp1: float) -> float:
-        """
-        Calculate temp deck temperature change to a medium temperature.
-
-        Args:
-            temp0: Current
-            temp1: Target
-
-        Returns:
-            Duration in seconds.
-        """
-        val = 0.0
-        if TEMP_MOD_LOW_THRESH <= temp0 <= TEMP_MOD_HIGH_THRESH:
-            val = abs(temp1 - temp0) / TEMP_MOD_RATE_LOW_TO_HIGH
-        elif temp0 < TEMP_MOD_LOW_THRESH:
-            # the temp1 part that's over TEMP_MOD_HIGH_THRESH is
-            val = abs(temp1 - TEMP_MOD_LOW_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
-            # the temp0 part that's under TEMP_MOD_HIGH_THRESH is:
-            val += abs(TEMP_MOD_LOW_THRESH - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
-        elif temp0 > TEMP_MOD_HIGH_THRESH:
-            val = abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_HIGH_AND_ABOVE
-            # the temp1 part that's under TEMP_MOD_HIGH_THRESH is:
-            val += abs(TEMP_MOD_HIGH_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
-        return val
-
-    # How to handle temperatures where one of them is low temp
-    @staticmethod
-    def rate_low(temp0: float, temp1: float) -> float:
-        """
-        Calculate temp deck temperature change to a low temperature.
-
-        Args:
-            temp0: Current
-            temp1: Target
-
-        Returns:
-            Duration in seconds.
-        """
-        val = 0.0
-        if temp0 <= TEMP_MOD_LOW_THRESH:
-            val = abs(temp1 - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
-        elif TEMP_MOD_LOW_THRESH < temp0 < TEMP_MOD_HIGH_THRESH:
-            # the temp0 part that's over TEMP_MOD_HIGH_THRESH is
-            val = abs(temp0 - TEMP_MOD_LOW_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
-            # the temp1 part that's under TEMP_MOD_HIGH_THRESH is:
-            val += abs(TEMP_MOD_LOW_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
-        elif temp0 >= TEMP_MOD_HIGH_THRESH:
-            val = abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
-            # the temp1 part that's under TEMP_MOD_HIGH_THRESH is:
-            val += abs(TEMP_MOD_HIGH_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
-        return val
+        return get_z_travel_time(is_module, gantry_speed)
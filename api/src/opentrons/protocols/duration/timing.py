@@ -0,0 +1,131 @@
+"""Hardware timings shared by the protocol duration estimators.
+
+Both the legacy `DurationEstimator` and the Protocol Engine's duration
+store estimate commands from these, so they agree on how long things take.
+"""
+import math
+from typing import Tuple
+
+from typing_extensions import Final
+
+
+# Time, in seconds, to move between wells in the same slot.
+SAME_SLOT_TRAVEL_TIME: Final = 0.5
+
+# Time, in seconds, to pick up or drop a tip, excluding travel.
+# Determined by testing on hardware.
+PICK_UP_TIP_TIME: Final = 4.0
+DROP_TIP_TIME: Final = 10.0
+
+# Heights, in mm, that the pipette moves down to reach a well
+# in labware on the deck or on a module.
+LABWARE_Z_TRAVEL: Final = 177.8
+MODULE_Z_TRAVEL: Final = 95.25
+
+# Commands without enough information to estimate from,
+# but with a consistent duration on hardware.
+BLOW_OUT_TIME: Final = 0.5
+TOUCH_TIP_TIME: Final = 0.5
+THERMOCYCLER_LID_MOVE_TIME: Final = 24.0
+THERMOCYCLER_SET_LID_TEMP_TIME: Final = 60.0
+THERMOCYCLER_DEACTIVATE_LID_TIME: Final = 23.0
+
+# We refer to page 3 of the GEN2 Temperature Module White-Paper
+# https://blog.opentrons.com/opentrons-technical-documentation/
+# Through the data we notice that there are different
+# rates of Celsius/second depending on temperature range.
+# These were all tested to be ~95% consistent with the data
+TEMP_MOD_RATE_HIGH_AND_ABOVE: Final = 0.3611111111
+TEMP_MOD_RATE_LOW_TO_HIGH: Final = 0.2
+TEMP_MOD_RATE_ZERO_TO_LOW: Final = 0.0875
+TEMP_MOD_LOW_THRESH: Final = 25.0
+TEMP_MOD_HIGH_THRESH: Final = 37.0
+
+THERMO_LOW_THRESH: Final = 23.0
+THERMO_HIGH_THRESH: Final = 70.0
+
+START_MODULE_TEMPERATURE: Final = 25.0
+
+
+def get_deck_travel_time(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    gantry_speed: float,
+) -> float:
+    """Get the time to travel between two slot centers at a gantry speed."""
+    if start == end:
+        return SAME_SLOT_TRAVEL_TIME
+
+    return math.hypot(end[0] - start[0], end[1] - start[1]) / gantry_speed
+
+
+def get_z_travel_time(is_on_module: bool, gantry_speed: float) -> float:
+    """Get the time to move down to a well in labware at a gantry speed."""
+    z_travel = MODULE_Z_TRAVEL if is_on_module else LABWARE_Z_TRAVEL
+    return z_travel / gantry_speed
+
+
+def get_temperature_module_ramp_time(temp0: float, temp1: float) -> float:  # noqa: C901
+    """Get the time for a Temperature Module to go from one temperature to another."""
+    if temp1 == temp0:
+        return 0.0
+
+    if temp1 > TEMP_MOD_HIGH_THRESH:
+        if temp0 >= TEMP_MOD_HIGH_THRESH:
+            return abs(temp1 - temp0) / TEMP_MOD_RATE_HIGH_AND_ABOVE
+        if temp0 > TEMP_MOD_LOW_THRESH:
+            return (
+                abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
+                + abs(temp1 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_HIGH_AND_ABOVE
+            )
+        return (
+            abs(TEMP_MOD_LOW_THRESH - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
+            + abs(TEMP_MOD_LOW_THRESH - temp1) / TEMP_MOD_RATE_HIGH_AND_ABOVE
+        )
+
+    if temp1 >= TEMP_MOD_LOW_THRESH:
+        if TEMP_MOD_LOW_THRESH <= temp0 <= TEMP_MOD_HIGH_THRESH:
+            return abs(temp1 - temp0) / TEMP_MOD_RATE_LOW_TO_HIGH
+        if temp0 < TEMP_MOD_LOW_THRESH:
+            return (
+                abs(temp1 - TEMP_MOD_LOW_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
+                + abs(TEMP_MOD_LOW_THRESH - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
+            )
+        return (
+            abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_HIGH_AND_ABOVE
+            + abs(TEMP_MOD_HIGH_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
+        )
+
+    if temp0 <= TEMP_MOD_LOW_THRESH:
+        return abs(temp1 - temp0) / TEMP_MOD_RATE_ZERO_TO_LOW
+    if temp0 < TEMP_MOD_HIGH_THRESH:
+        return (
+            abs(temp0 - TEMP_MOD_LOW_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
+            + abs(TEMP_MOD_LOW_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
+        )
+    return (
+        abs(temp0 - TEMP_MOD_HIGH_THRESH) / TEMP_MOD_RATE_LOW_TO_HIGH
+        + abs(TEMP_MOD_HIGH_THRESH - temp1) / TEMP_MOD_RATE_ZERO_TO_LOW
+    )
+
+
+def get_thermocycler_ramp_time(temp0: float, temp1: float) -> float:
+    """Get the time for a Thermocycler block to go from one temperature to another."""
+    if temp1 > temp0:
+        if temp1 > THERMO_HIGH_THRESH:
+            return (
+                abs(temp1 - THERMO_HIGH_THRESH) / 2
+                + abs(THERMO_HIGH_THRESH - temp0) / 4
+            )
+        return abs(temp1 - temp0) / 4
+
+    if temp1 < temp0:
+        if temp1 >= THERMO_HIGH_THRESH:
+            return abs(temp1 - temp0) / 2
+        if temp1 >= THERMO_LOW_THRESH:
+            return abs(temp1 - temp0) / 1
+        return (
+            abs(temp0 - THERMO_LOW_THRESH) / 0.5 + abs(temp1 - THERMO_LOW_THRESH) / 0.1
+        )
+
+    return 0.0
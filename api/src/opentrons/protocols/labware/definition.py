@@ -1,11 +1,15 @@
+import hashlib
 import logging
 import json
 import os
 import shutil
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
 
 from pathlib import Path
-from typing import Any, AnyStr, List, Dict, Union
+from typing import Any, AnyStr, List, Dict, Optional, Union
 
 import jsonschema  # type: ignore
 
@@ -23,6 +27,8 @@ from opentrons.protocols.api_support.constants import (
 )
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
+from .registry import LabwareDefinitionRegistry
+
 
 MODULE_LOG = logging.getLogger(__name__)
 
@@ -131,6 +137,8 @@ def save_definition(
     with open(def_path, "w") as f:
         json.dump(labware_def, f)
 
+    _get_registry().invalidate()
+
 
 def verify_definition(
     contents: Union[AnyStr, LabwareDefinition, Dict[str, Any]]
@@ -144,14 +152,28 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+
+    digest = _get_definition_digest(to_return)
+    validator = _get_schema_validator()
+
+    with _schema_validator_lock:
+        if digest is not None and digest in _verified_digests:
+            _verified_digests.move_to_end(digest)
+            error = None
+        else:
+            # Equivalent to jsonschema.validate(), minus re-checking the schema.
+            error = jsonschema.exceptions.best_match(validator.iter_errors(to_return))
+            if error is None and digest is not None:
+                _verified_digests[digest] = None
+                while len(_verified_digests) > _VERIFIED_DIGESTS_SIZE:
+                    _verified_digests.popitem(last=False)
+
+    if error is not None:
+        raise error
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -162,6 +184,8 @@ def delete_all_custom_labware() -> None:
     if USER_DEFS_PATH.is_dir():
         shutil.rmtree(USER_DEFS_PATH)
 
+    _get_registry().invalidate()
+
 
 def save_calibration(labware: AbstractLabware, delta: Point) -> None:
     """Save a calibration"""
@@ -242,26 +266,24 @@ def _get_standard_labware_definition(
         uploading your protocol.
         """
 
+    registry = _get_registry()
+
     if namespace is None:
         for fallback_namespace in [OPENTRONS_NAMESPACE, CUSTOM_NAMESPACE]:
-            try:
-                return _get_standard_labware_definition(
-                    load_name, fallback_namespace, checked_version
-                )
-            except FileNotFoundError:
-                pass
+            labware_def = registry.get(
+                fallback_namespace, load_name, int(checked_version)
+            )
+            if labware_def is not None:
+                return labware_def
 
         raise FileNotFoundError(
             error_msg_string.format(load_name, checked_version, OPENTRONS_NAMESPACE)
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
+    labware_def = registry.get(namespace, load_name, int(checked_version))
 
-    try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
-    except FileNotFoundError:
+    if labware_def is None:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
@@ -270,6 +292,41 @@ def _get_standard_labware_definition(
     return labware_def
 
 
+@lru_cache(maxsize=None)
+def _get_registry() -> LabwareDefinitionRegistry:
+    return LabwareDefinitionRegistry(
+        standard_defs_dir=STANDARD_DEFS_PATH,
+        user_defs_dir=USER_DEFS_PATH,
+    )
+
+
+# Validators aren't thread-safe, since they track their position in the schema
+# while resolving references, so validations that share one take turns.
+_schema_validator_lock = Lock()
+
+# Validating a definition takes much longer than hashing it, and the same few
+# definitions (e.g. tip racks during calibration) tend to be verified over and
+# over, so remember the digests of recent definitions that passed validation.
+_VERIFIED_DIGESTS_SIZE = 128
+_verified_digests: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _get_definition_digest(definition: object) -> Optional[str]:
+    try:
+        serialized = json.dumps(definition, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _get_schema_validator() -> Any:
+    labware_schema_v2 = json.loads(load_shared_data("labware/schemas/2.json"))
+    validator_cls = jsonschema.validators.validator_for(labware_schema_v2)
+    validator_cls.check_schema(labware_schema_v2)
+    return validator_cls(labware_schema_v2)
+
+
 def _get_parent_identifier(labware: AbstractLabware) -> str:
     """
     Helper function to return whether a labware is on top of a
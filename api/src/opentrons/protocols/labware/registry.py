@@ -0,0 +1,195 @@
+"""An in-memory index and cache of labware definition files."""
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Dict, Optional, Tuple
+
+from opentrons_shared_data import list_shared_data, load_shared_data
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
+
+# (namespace, load_name, version)
+DefinitionKey = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class _CachedDefinition:
+    # The definition, pickled, so that every lookup can cheaply return a copy.
+    pickled: bytes
+    # The (mtime, size) of a user definition file when it was read,
+    # or None for standard definitions, which never change.
+    file_stamp: Optional[Tuple[int, int]]
+
+
+class LabwareDefinitionRegistry:
+    """Find and load labware definitions by namespace, load name, and version.
+
+    The first lookup indexes every definition file in the standard and user
+    definition directories, so later lookups don't need to search the
+    filesystem to find a definition, or to find out that there isn't one.
+    Recently loaded definitions are kept parsed in a bounded LRU cache.
+    Standard definitions are read through `opentrons_shared_data`, so they
+    come from its compiled bundle when there is one.
+
+    Standard definitions ship with the software and never change. User
+    definitions can be added at any time, so a lookup that misses the index
+    checks the user definition directory before giving up, and a cached user
+    definition is read again if its file has changed since it was cached.
+
+    Each lookup returns a new copy of its definition, which callers may modify.
+    This is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        standard_defs_dir: PurePath,
+        user_defs_dir: Path,
+        cache_size: int = 64,
+    ) -> None:
+        """Initialize the registry.
+
+        Arguments:
+            standard_defs_dir: The shared data directory of Opentrons standard
+                definitions, laid out as `<load_name>/<version>.json`, relative
+                to the shared data root.
+            user_defs_dir: The directory of user definitions,
+                laid out as `<namespace>/<load_name>/<version>.json`.
+            cache_size: How many parsed definitions to keep in memory.
+        """
+        self._standard_defs_dir = standard_defs_dir
+        self._user_defs_dir = user_defs_dir
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[DefinitionKey, PurePath]] = None
+        self._cache: "OrderedDict[PurePath, _CachedDefinition]" = OrderedDict()
+
+    def get(
+        self, namespace: str, load_name: str, version: int
+    ) -> Optional[LabwareDefinition]:
+        """Get a copy of a definition, or None if it doesn't exist."""
+        key = (namespace, load_name, version)
+        path = self._get_path(key)
+
+        if path is None:
+            return None
+
+        try:
+            file_stamp = _get_file_stamp(namespace, path)
+
+            with self._lock:
+                cached = self._cache.get(path)
+                if cached is not None and cached.file_stamp == file_stamp:
+                    self._cache.move_to_end(path)
+                    return pickle.loads(cached.pickled)
+
+            contents = _read_definition_file(namespace, path)
+        except FileNotFoundError:
+            self._forget(key, path)
+            return None
+
+        definition: LabwareDefinition = json.loads(contents.decode("utf-8"))
+
+        with self._lock:
+            self._cache[path] = _CachedDefinition(
+                pickled=pickle.dumps(definition, protocol=pickle.HIGHEST_PROTOCOL),
+                file_stamp=file_stamp,
+            )
+            self._cache.move_to_end(path)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return definition
+
+    def invalidate(self) -> None:
+        """Forget every indexed and cached definition.
+
+        Call this after adding or removing user definitions.
+        """
+        with self._lock:
+            self._index = None
+            self._cache.clear()
+
+    def _get_path(self, key: DefinitionKey) -> Optional[PurePath]:
+        """Get the path to a definition, or None if it doesn't exist.
+
+        Standard definition paths are relative to the shared data root,
+        and user definition paths are absolute.
+        """
+        namespace, load_name, version = key
+
+        with self._lock:
+            path = self._get_index().get(key)
+
+        if path is None and namespace != OPENTRONS_NAMESPACE:
+            user_path = self._user_defs_dir / namespace / load_name / f"{version}.json"
+            if user_path.is_file():
+                with self._lock:
+                    self._get_index()[key] = user_path
+                path = user_path
+
+        return path
+
+    def _forget(self, key: DefinitionKey, path: PurePath) -> None:
+        with self._lock:
+            if self._index is not None and self._index.get(key) == path:
+                del self._index[key]
+            self._cache.pop(path, None)
+
+    def _get_index(self) -> Dict[DefinitionKey, PurePath]:
+        if self._index is None:
+            self._index = _build_index(self._standard_defs_dir, self._user_defs_dir)
+        return self._index
+
+
+def _get_file_stamp(namespace: str, path: PurePath) -> Optional[Tuple[int, int]]:
+    if namespace == OPENTRONS_NAMESPACE:
+        return None
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_definition_file(namespace: str, path: PurePath) -> bytes:
+    if namespace == OPENTRONS_NAMESPACE:
+        return load_shared_data(path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _build_index(
+    standard_defs_dir: PurePath, user_defs_dir: Path
+) -> Dict[DefinitionKey, PurePath]:
+    index: Dict[DefinitionKey, PurePath] = {}
+
+    for path in list_shared_data(standard_defs_dir):
+        parsed = _parse_definition_path(path.relative_to(standard_defs_dir))
+        if parsed is not None:
+            load_name, version = parsed
+            index[(OPENTRONS_NAMESPACE, load_name, version)] = path
+
+    if user_defs_dir.is_dir():
+        with os.scandir(user_defs_dir) as namespaces:
+            for namespace in namespaces:
+                # Definitions in the Opentrons namespace always come from
+                # the standard definitions, never the user's.
+                if namespace.is_dir() and namespace.name != OPENTRONS_NAMESPACE:
+                    for path in Path(namespace.path).glob("*/*.json"):
+                        parsed = _parse_definition_path(
+                            path.relative_to(namespace.path)
+                        )
+                        if parsed is not None and path.is_file():
+                            load_name, version = parsed
+                            index[(namespace.name, load_name, version)] = path
+
+    return index
+
+
+def _parse_definition_path(path: PurePath) -> Optional[Tuple[str, int]]:
+    """Get the load name and version from a `<load_name>/<version>.json` path."""
+    if len(path.parts) != 2 or path.suffix != ".json" or not path.stem.isdigit():
+        return None
+    return path.parts[0], int(path.stem)
@@ -102,16 +102,7 @@ def _parse_python(
     else:
         ast_filename = filename_checked
 
-    parsed = ast.parse(protocol_contents, filename=ast_filename)
-
-    metadata = extract_metadata(parsed)
-    protocol = compile(parsed, filename=ast_filename, mode="exec")
-    version = get_version(metadata, parsed)
-
-    if version >= APIVersion(2, 0):
-        _validate_v2_ast(parsed)
-    else:
-        raise ApiDeprecationError(version)
+    protocol, metadata, version = compile_python(protocol_contents, ast_filename)
 
     result = PythonProtocol(
         text=protocol_contents,
@@ -128,6 +119,33 @@ def _parse_python(
     return result
 
 
+def compile_python(
+    protocol_contents: str, filename: str
+) -> Tuple[Any, Metadata, APIVersion]:
+    """Parse, validate, and compile the source of a Python protocol.
+
+    :param protocol_contents: The protocol's source.
+    :param filename: The file name to compile the protocol with.
+    :return: The compiled code object, the protocol's metadata, and the
+             protocol's API version.
+    :raises ApiDeprecationError: If the protocol uses Protocol API v1.
+    :raises MalformedProtocolError: If the protocol is not a valid Protocol
+                                    API v2 protocol.
+    """
+    parsed = ast.parse(protocol_contents, filename=filename)
+
+    metadata = extract_metadata(parsed)
+    protocol = compile(parsed, filename=filename, mode="exec")
+    version = get_version(metadata, parsed)
+
+    if version >= APIVersion(2, 0):
+        _validate_v2_ast(parsed)
+    else:
+        raise ApiDeprecationError(version)
+
+    return protocol, metadata, version
+
+
 def _parse_bundle(bundle: ZipFile, filename: str = None) -> PythonProtocol:
     """Parse a bundled Python protocol"""
     contents = extract_bundle(bundle)
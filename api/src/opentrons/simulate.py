@@ -38,6 +38,9 @@ from opentrons.commands import types as command_types
 from opentrons.protocols.context.protocol_api.protocol_context import (
     ProtocolContextImplementation,
 )
+from opentrons.protocols.context.simulator.protocol_context import (
+    ProtocolContextSimulation,
+)
 from opentrons.protocols import parse, bundle
 from opentrons.protocols.types import PythonProtocol, BundleContents
 from opentrons.protocols.api_support.types import APIVersion
@@ -137,6 +140,7 @@ def get_protocol_api(
     bundled_data: Optional[Dict[str, bytes]] = None,
     extra_labware: Optional[Dict[str, LabwareDefinition]] = None,
     hardware_simulator: Optional[SyncHardwareAPI] = None,
+    analysis_only: bool = False,
 ) -> protocol_api.ProtocolContext:
     """
     Build and return a ``protocol_api.ProtocolContext``
@@ -178,6 +182,11 @@ def get_protocol_api(
                           subdirectory of the Jupyter data directory for
                           custom labware.
     :param hardware_simulator: If specified, a hardware simulator instance.
+    :param analysis_only: If ``True``, pipettes only track their own state and
+                          check their motion plans instead of moving the
+                          hardware simulator, and delays and homing are
+                          skipped. The run log is the same, but the positions
+                          reported by the hardware simulator are not updated.
     :return: The protocol context.
     """
     if isinstance(version, str):
@@ -203,6 +212,7 @@ def get_protocol_api(
         bundled_labware=bundled_labware,
         bundled_data=bundled_data,
         extra_labware=extra_labware,
+        analysis_only=analysis_only,
     )
 
 
@@ -212,12 +222,16 @@ def _build_protocol_context(
     bundled_labware: Optional[Dict[str, LabwareDefinition]],
     bundled_data: Optional[Dict[str, bytes]],
     extra_labware: Optional[Dict[str, LabwareDefinition]],
+    analysis_only: bool = False,
 ) -> protocol_api.ProtocolContext:
     """Internal version of :py:meth:`get_protocol_api` that allows deferring
     version specification for use with
     :py:meth:`.protocol_api.execute.run_protocol`
     """
-    ctx_impl = ProtocolContextImplementation(
+    context_type = (
+        ProtocolContextSimulation if analysis_only else ProtocolContextImplementation
+    )
+    ctx_impl = context_type(
         bundled_labware=bundled_labware,
         bundled_data=bundled_data,
         api_version=version,
@@ -263,6 +277,7 @@ def simulate(
     hardware_simulator_file_path: Optional[str] = None,
     duration_estimator: Optional[DurationEstimator] = None,
     log_level: str = "warning",
+    analysis_only: bool = False,
 ) -> Tuple[List[Mapping[str, Any]], Optional[BundleContents]]:
     """
     Simulate the protocol itself.
@@ -323,6 +338,11 @@ def simulate(
     :param log_level: The level of logs to capture in the runlog:
                       ``"debug"``, ``"info"``, ``"warning"``, or ``"error"``.
                       Defaults to ``"warning"``.
+    :param analysis_only: Whether to simulate without moving the hardware
+                          simulator. The run log is the same, and errors in
+                          the protocol are still raised, but pipette motion
+                          is only planned, not executed, and delays and
+                          homing are skipped. Default: ``False``
     :returns: A tuple of a run log for user output, and possibly the required
               data to write to a bundle to bundle this protocol. The bundle is
               only emitted if bundling is allowed
@@ -365,6 +385,7 @@ def simulate(
         bundled_data=getattr(protocol, "bundled_data", None),
         hardware_simulator=hardware_simulator,
         extra_labware=gpa_extras,
+        analysis_only=analysis_only,
     )
     broker = context.broker
     scraper = CommandScraper(stack_logger, log_level, broker)
@@ -527,6 +548,15 @@ def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         " This is an experimental feature.",
     )
 
+    parser.add_argument(
+        "-a",
+        "--analysis-only",
+        action="store_true",
+        help="Simulate without moving the hardware simulator. The run log is "
+        "the same, but pipette motion is only planned, and delays and homing "
+        "are skipped, so simulation is faster.",
+    )
+
     parser.add_argument(
         "protocol",
         metavar="PROTOCOL",
@@ -595,6 +625,7 @@ def main() -> int:
         duration_estimator=duration_estimator,
         hardware_simulator_file_path=getattr(args, "custom_hardware_simulator_file"),
         log_level=args.log_level,
+        analysis_only=args.analysis_only,
     )
 
     if maybe_bundle:
@@ -0,0 +1,153 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from opentrons.calibration_storage import (
+    delete,
+    file_operators as io,
+    get,
+    labware_offset_store,
+)
+from opentrons.util.helpers import utc_now
+
+CAL_ID = "fakeid1"
+URI = "opentrons/opentrons_96_tiprack_10ul/1"
+
+LEGACY_INDEX: Dict[str, Any] = {
+    "version": 1,
+    "data": {
+        "fakeid1": {"uri": URI, "slot": "fakeid1", "module": {}},
+        "fakeid2temperatureModuleV2": {
+            "uri": "opentrons/opentrons_96_aluminumblock_pcr_strip_200ul/1",
+            "slot": "fakeid2temperatureModuleV2",
+            "module": {
+                "parent": "temperatureModuleV2",
+                "fullParent": "1-temperatureModuleV2",
+            },
+        },
+        "fakeid3": {
+            "uri": "opentrons/corning_96_wellplate_360ul_flat/1",
+            "slot": "fakeid3",
+            "module": {},
+        },
+    },
+}
+
+
+@pytest.fixture
+def legacy_offsets(labware_offset_tempdir: Path) -> Dict[str, Any]:
+    offsets = {
+        "fakeid1": {"default": {"offset": [1, 2, 3], "lastModified": utc_now()}},
+        "fakeid2temperatureModuleV2": {
+            "default": {"offset": [4, 5, 6], "lastModified": utc_now()}
+        },
+    }
+    io.save_to_file(labware_offset_tempdir / "index.json", LEGACY_INDEX)
+    for calibration_id, data in offsets.items():
+        io.save_to_file(labware_offset_tempdir / f"{calibration_id}.json", data)
+    return offsets
+
+
+def test_migrate_legacy_files(
+    labware_offset_tempdir: Path, legacy_offsets: Dict[str, Any]
+) -> None:
+    all_offsets = labware_offset_store.get_all()
+
+    for calibration_id, index_data in LEGACY_INDEX["data"].items():
+        expected = {**index_data, **legacy_offsets.get(calibration_id, {})}
+        assert all_offsets[calibration_id] == expected
+
+    # The legacy files are kept for software that doesn't know the store.
+    assert sorted(os.listdir(labware_offset_tempdir)) == sorted(
+        [labware_offset_store.STORE_FILE_NAME, "index.json"]
+        + [f"{calibration_id}.json" for calibration_id in legacy_offsets]
+    )
+
+
+def test_migrate_skips_corrupt_file(
+    labware_offset_tempdir: Path, legacy_offsets: Dict[str, Any]
+) -> None:
+    (labware_offset_tempdir / "fakeid1.json").write_text("{")
+
+    all_offsets = labware_offset_store.get_all()
+
+    assert "default" not in all_offsets["fakeid1"]
+    assert (labware_offset_tempdir / "fakeid1.json").exists()
+    assert [cal.labware_id for cal in get.get_all_calibrations()] == [
+        "fakeid2temperatureModuleV2"
+    ]
+
+
+def test_corrupt_store_moved_aside(labware_offset_tempdir: Path) -> None:
+    store_path = labware_offset_tempdir / labware_offset_store.STORE_FILE_NAME
+    store_path.write_text("{")
+
+    assert labware_offset_store.get_all() == {}
+    labware_offset_store.put(CAL_ID, {"uri": URI, "slot": CAL_ID, "module": {}})  # type: ignore[typeddict-item]  # noqa: E501
+
+    corrupt_path = labware_offset_tempdir / labware_offset_store.CORRUPT_STORE_FILE_NAME
+    assert corrupt_path.read_text() == "{"
+    assert labware_offset_store.get(CAL_ID) is not None
+
+
+def test_put_and_remove(labware_offset_tempdir: Path) -> None:
+    assert labware_offset_store.get(CAL_ID) is None
+
+    labware_offset_store.put(CAL_ID, {"uri": URI, "slot": CAL_ID, "module": {}})  # type: ignore[typeddict-item]  # noqa: E501
+    assert labware_offset_store.get(CAL_ID) == {
+        "uri": URI,
+        "slot": CAL_ID,
+        "module": {},
+    }
+
+    labware_offset_store.remove(CAL_ID)
+    assert labware_offset_store.get(CAL_ID) is None
+
+    with pytest.raises(KeyError):
+        delete.delete_offset_file(CAL_ID)  # type: ignore[arg-type]
+
+
+def test_reads_are_cached(
+    labware_offset_tempdir: Path,
+    legacy_offsets: Dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    labware_offset_store.get_all()
+    read_count = 0
+    read_cal_file = io.read_cal_file
+
+    def _counting_read_cal_file(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        nonlocal read_count
+        read_count += 1
+        return read_cal_file(*args, **kwargs)
+
+    monkeypatch.setattr(io, "read_cal_file", _counting_read_cal_file)
+
+    get.get_all_calibrations()
+    get.get_all_calibrations()
+    assert read_count == 0
+
+    # Another process replacing the store should invalidate the cache.
+    store_path = labware_offset_tempdir / labware_offset_store.STORE_FILE_NAME
+    blob = json.loads(store_path.read_text())
+    del blob["data"][CAL_ID]
+    temp_path = labware_offset_tempdir / "replacement"
+    temp_path.write_text(json.dumps(blob))
+    os.replace(temp_path, store_path)
+
+    assert CAL_ID not in [cal.labware_id for cal in get.get_all_calibrations()]
+    assert read_count == 1
+
+
+def test_clear_calibrations(
+    labware_offset_tempdir: Path, legacy_offsets: Dict[str, Any]
+) -> None:
+    assert len(get.get_all_calibrations()) == 2
+
+    delete.clear_calibrations()
+
+    assert get.get_all_calibrations() == []
+    assert os.listdir(labware_offset_tempdir) == []
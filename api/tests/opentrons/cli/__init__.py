@@ -0,0 +1 @@
+"""Tests for opentrons.cli."""
@@ -0,0 +1,63 @@
+"""Tests for the `opentrons analyze` CLI command."""
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from click.testing import CliRunner
+
+from opentrons.cli import main
+
+
+def test_analyze_batch(tmp_path: Path) -> None:
+    """It should stream one line of JSON per protocol in batch mode."""
+    good_protocol_dir = tmp_path / "good"
+    good_protocol_dir.mkdir()
+    (good_protocol_dir / "protocol.py").write_text(
+        dedent(
+            """
+            metadata = {"apiLevel": "2.12"}
+
+            def run(ctx):
+                ctx.comment("hello, world")
+            """
+        )
+    )
+
+    bad_protocol_dir = tmp_path / "bad"
+    bad_protocol_dir.mkdir()
+    (bad_protocol_dir / "notes.txt").write_text("not a protocol")
+
+    output_path = tmp_path / "output.ndjson"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "analyze",
+            "--batch",
+            "--workers",
+            "1",
+            "--json-output",
+            str(output_path),
+            str(good_protocol_dir),
+            str(bad_protocol_dir),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+
+    lines = output_path.read_text().splitlines()
+    results_by_path = {
+        entry["path"]: entry for entry in (json.loads(line) for line in lines)
+    }
+
+    assert len(lines) == 2
+
+    good_result = results_by_path[str(good_protocol_dir)]
+    assert good_result["wallTime"] > 0
+    assert good_result["results"]["files"] == [{"name": "protocol.py", "role": "main"}]
+    assert good_result["results"]["errors"] == []
+    assert "error" not in good_result
+
+    bad_result = results_by_path[str(bad_protocol_dir)]
+    assert bad_result["error"].startswith("ProtocolFilesInvalidError")
+    assert "results" not in bad_result
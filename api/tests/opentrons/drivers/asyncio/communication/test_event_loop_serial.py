@@ -0,0 +1,164 @@
+import asyncio
+from typing import AsyncIterator, Tuple
+
+import pytest
+from serial import SerialException  # type: ignore[import]
+
+from opentrons.drivers.asyncio.communication import (
+    EventLoopSerial,
+    SerialConnection,
+)
+
+
+Device = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+@pytest.fixture
+async def device() -> AsyncIterator[Tuple[str, "asyncio.Queue[Device]"]]:
+    """A socket server standing in for a serial device."""
+    connections: "asyncio.Queue[Device]" = asyncio.Queue()
+
+    async def _on_connect(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await connections.put((reader, writer))
+
+    server = await asyncio.start_server(_on_connect, host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+    yield f"socket://127.0.0.1:{port}", connections
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.fixture
+async def subject(
+    device: Tuple[str, "asyncio.Queue[Device]"]
+) -> AsyncIterator[EventLoopSerial]:
+    """The test subject."""
+    url, _ = device
+    subject = await EventLoopSerial.create(port=url, baud_rate=115200, timeout=0.5)
+    yield subject
+    await subject.close()
+
+
+async def test_read_until(
+    subject: EventLoopSerial, device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should return data up to the match and keep the rest for later."""
+    _, connections = device
+    _, writer = await connections.get()
+
+    writer.write(b"first ok\r\nsec")
+    result = await subject.read_until(b"ok\r\n")
+    assert result == b"first ok\r\n"
+
+    # The match arrives in pieces.
+    writer.write(b"ond o")
+    read = asyncio.get_running_loop().create_task(subject.read_until(b"ok\r\n"))
+    await asyncio.sleep(0.05)
+    assert not read.done()
+    writer.write(b"k\r\n")
+    assert await read == b"second ok\r\n"
+
+
+async def test_read_until_timeout(
+    subject: EventLoopSerial, device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should return what it has read if the match doesn't arrive in time."""
+    _, connections = device
+    _, writer = await connections.get()
+
+    writer.write(b"partial")
+    async with subject.timeout_override("timeout", 0.1):
+        result = await subject.read_until(b"ok\r\n")
+
+    assert result == b"partial"
+
+
+async def test_write(
+    subject: EventLoopSerial, device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should write all of the data."""
+    _, connections = device
+    reader, _ = await connections.get()
+    data = b"x" * 1000000
+
+    await subject.write(data)
+
+    assert await reader.readexactly(len(data)) == data
+
+
+async def test_reset_buffer_before_write(
+    device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should discard unread data before writing."""
+    url, connections = device
+    subject = await EventLoopSerial.create(
+        port=url, baud_rate=115200, timeout=0.5, reset_buffer_before_write=True
+    )
+    reader, writer = await connections.get()
+
+    writer.write(b"stale ok\r\n")
+    await asyncio.sleep(0.05)
+    await subject.write(b"hello")
+    assert await reader.readexactly(5) == b"hello"
+    writer.write(b"fresh ok\r\n")
+
+    assert await subject.read_until(b"ok\r\n") == b"fresh ok\r\n"
+    await subject.close()
+
+
+async def test_close_and_open(
+    subject: EventLoopSerial, device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should stop reading when closed and start again when reopened."""
+    _, connections = device
+    await connections.get()
+
+    await subject.close()
+    assert not await subject.is_open()
+    with pytest.raises(SerialException):
+        await subject.read_until(b"ok\r\n")
+
+    await subject.open()
+    _, writer = await connections.get()
+    writer.write(b"again ok\r\n")
+    assert await subject.read_until(b"ok\r\n") == b"again ok\r\n"
+
+
+async def test_device_disconnected(
+    subject: EventLoopSerial, device: Tuple[str, "asyncio.Queue[Device]"]
+) -> None:
+    """It should raise once buffered data is read if the device goes away."""
+    _, connections = device
+    _, writer = await connections.get()
+
+    writer.write(b"last ok\r\n")
+    writer.close()
+
+    assert await subject.read_until(b"ok\r\n") == b"last ok\r\n"
+    with pytest.raises(SerialException):
+        await subject.read_until(b"ok\r\n")
+
+
+async def test_serial_connection(device: Tuple[str, "asyncio.Queue[Device]"]) -> None:
+    """It should be usable behind a SerialConnection."""
+    url, connections = device
+    subject = await SerialConnection.create(
+        port=url,
+        baud_rate=115200,
+        timeout=0.5,
+        ack="ok\r\n",
+        event_loop_io=True,
+    )
+    reader, writer = await connections.get()
+
+    async def _respond() -> None:
+        assert await reader.readuntil(b"\r\n") == b"M105\r\n"
+        writer.write(b"T:25.0 ok\r\n")
+
+    respond = asyncio.get_running_loop().create_task(_respond())
+    assert await subject.send_data("M105\r\n") == "T:25.0"
+    await respond
+    await subject.close()
@@ -464,3 +464,108 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+@pytest.fixture
+def pipelined_smoothie(
+    mock_connection: AsyncMock, sim_gpio
+) -> driver_3_0.SmoothieDriver:
+    """A smoothie driver that pipelines setup commands."""
+    from opentrons.config import robot_configs
+
+    return driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load_ot2(),
+        gpio_chardev=sim_gpio,
+        pipelined=True,
+    )
+
+
+async def test_pipelined_setup_commands(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send setup commands on the same line as the next command."""
+    await pipelined_smoothie.set_speed(1)
+    await pipelined_smoothie.set_axis_max_speed({"A": 22, "B": 322})
+    assert mock_connection.send_command.call_count == 0
+
+    await pipelined_smoothie.disengage_axis("X")
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == ["G0 F60 M203.1 A22 B322 M18 X", "M400"]
+
+
+async def test_pipelined_setup_commands_long_line(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send setup commands on their own if the line would be too long."""
+    for _ in range(20):
+        await pipelined_smoothie.set_speed(1)
+    await pipelined_smoothie.disengage_axis("X")
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        " ".join(["G0 F60"] * 20),
+        "M18 X",
+        "M400",
+    ]
+
+
+async def test_pipelined_plunger_move(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should dwell plunger current on the same line as the move."""
+    pipelined_smoothie.set_active_current({"B": 0.5})
+    pipelined_smoothie.set_dwelling_current({"B": 0.1})
+    await pipelined_smoothie.move({"B": 1})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert len(cmds) == 2
+    move, wait = cmds
+    assert move.startswith("M907 ")
+    assert " G0 B1 M400 M907 " in move
+    assert "B0.1" in move.split("M400")[1]
+    assert wait == "M400"
+    # The move line is only acked once the move is done.
+    assert (
+        mock_connection.send_command.call_args_list[0].kwargs["timeout"]
+        == constants.DEFAULT_EXECUTE_TIMEOUT
+    )
+    assert pipelined_smoothie.current["B"] == 0.1
+
+
+async def test_pipelined_setup_kept_on_failure(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send held back setup commands again if their line failed."""
+    await pipelined_smoothie.set_speed(1)
+    mock_connection.send_command.side_effect = [RuntimeError("no response"), "", ""]
+    with pytest.raises(RuntimeError):
+        await pipelined_smoothie.disengage_axis("X")
+
+    await pipelined_smoothie.disengage_axis("X")
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds[0] == cmds[1] == "G0 F60 M18 X"
+
+
+async def test_unpipelined_plunger_move(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should dwell plunger current with a command of its own by default."""
+    await smoothie.move({"B": 1})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert len(cmds) == 4
+    assert cmds[0].endswith("G0 B1")
+    assert cmds[2].startswith("M907 ")
@@ -52,6 +52,15 @@ async def test_sim_state(subject: modules.AbstractModule):
     assert status["version"] == "dummyVersionTD"
 
 
+async def test_poll_statistics(subject: modules.AbstractModule):
+    await subject.wait_next_poll()
+    stats = subject.poll_statistics
+    assert stats is not None
+    assert stats.name == "tempdeck /dev/ot_module_sim_tempdeck0"
+    assert stats.polls >= 1
+    assert stats.errors == 0
+
+
 async def test_sim_update(subject: modules.AbstractModule):
     await subject.set_temperature(10)
     assert subject.temperature == 10
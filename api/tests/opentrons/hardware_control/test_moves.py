@@ -14,6 +14,7 @@ from opentrons.hardware_control.types import (
     OutOfBoundsMove,
     MotionChecks,
     MustHomeError,
+    PositionReadCounts,
 )
 from opentrons.hardware_control.robot_calibration import RobotCalibration
 from opentrons.hardware_control.types import OT3Axis
@@ -343,6 +344,39 @@ async def test_attitude_deck_cal_applied(monkeypatch):
     assert round(called_with["Z"], 2) == -30.0
 
 
+async def test_update_deck_calibration_keeps_position(hardware_api):
+    await hardware_api.home()
+    await hardware_api.move_to(types.Mount.RIGHT, types.Point(50, 60, 70))
+    machine_position = dict(hardware_api._machine_position)
+    deck_cal = RobotCalibration(
+        deck_calibration=DeckCalibration(
+            attitude=[[1.0047, -0.0046, 0.0], [0.0011, 1.0038, 0.0], [0.0, 0.0, 1.0]],
+            source=SourceType.user,
+            status=CalibrationStatus(),
+        )
+    )
+    await hardware_api.update_deck_calibration(deck_cal)
+    assert hardware_api.robot_calibration == deck_cal
+    assert hardware_api._machine_position == machine_position
+    # The cached position is in the new deck frame, as read back from the
+    # controller would be.
+    cached = await hardware_api.gantry_position(types.Mount.RIGHT)
+    assert cached != types.Point(50, 60, 70)
+    assert cached == await hardware_api.gantry_position(types.Mount.RIGHT, refresh=True)
+
+
+async def test_position_read_counts(hardware_api):
+    await hardware_api.home()
+    await hardware_api.gantry_position(types.Mount.RIGHT)
+    await hardware_api.current_position(types.Mount.LEFT)
+    await hardware_api.gantry_position(types.Mount.RIGHT, refresh=True)
+    assert hardware_api.position_read_counts == PositionReadCounts(
+        controller=1, cached=2
+    )
+    await hardware_api.reset()
+    assert hardware_api.position_read_counts == PositionReadCounts()
+
+
 async def test_other_mount_retracted(hardware_api, is_robot):
     await hardware_api.home()
     await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 0, 0))
@@ -1,9 +1,17 @@
 import asyncio
+import logging
 from typing import Callable
 
 import pytest
 from mock import AsyncMock, MagicMock
-from opentrons.hardware_control.poller import Poller, Listener, Reader, WaitableListener
+from opentrons.hardware_control import poller
+from opentrons.hardware_control.poller import (
+    Poller,
+    PollScheduler,
+    Listener,
+    Reader,
+    WaitableListener,
+)
 
 
 async def test_poll_error() -> None:
@@ -85,3 +93,110 @@ async def test_on_poll_canceled_future(
     # Notify.
     func(listener)
     # There should be no exception
+
+
+class _CountingReader(Reader[int]):
+    """A reader that counts its polls."""
+
+    def __init__(self, idle: bool) -> None:
+        self.count = 0
+        self.idle = idle
+
+    async def read(self) -> int:
+        self.count += 1
+        return self.count
+
+    def is_idle(self, result: int) -> bool:
+        return self.idle
+
+
+async def test_idle_interval() -> None:
+    """It should poll at the idle interval while the reader reports idle."""
+    busy_reader = _CountingReader(idle=False)
+    idle_reader = _CountingReader(idle=True)
+    busy: Poller[int] = Poller(
+        interval_seconds=0.01,
+        idle_interval_seconds=1,
+        reader=busy_reader,
+        listener=MagicMock(spec=Listener),
+    )
+    idle: Poller[int] = Poller(
+        interval_seconds=0.01,
+        idle_interval_seconds=1,
+        reader=idle_reader,
+        listener=MagicMock(spec=Listener),
+    )
+
+    await asyncio.sleep(0.2)
+    await busy.stop_and_wait()
+    await idle.stop_and_wait()
+
+    assert busy_reader.count > 5
+    assert idle_reader.count == 1
+    assert busy.interval == 0.01
+    assert idle.interval == 1
+
+
+async def test_idle_waiter() -> None:
+    """It should poll soon if something waits for a poll while idle."""
+    reader = _CountingReader(idle=True)
+    listener = WaitableListener[int]()
+    p: Poller[int] = Poller(
+        interval_seconds=0.01,
+        idle_interval_seconds=10,
+        reader=reader,
+        listener=listener,
+    )
+
+    assert await asyncio.wait_for(listener.wait_next_poll(), timeout=1) == 1
+    assert await asyncio.wait_for(listener.wait_next_poll(), timeout=1) == 2
+    await p.stop_and_wait()
+
+
+async def test_statistics() -> None:
+    """It should keep statistics of every poller on the loop's scheduler."""
+
+    async def slow_read() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = slow_read
+    reader.is_idle.return_value = False
+    listener = WaitableListener[int]()
+    p: Poller[int] = Poller(
+        interval_seconds=0.01, reader=reader, listener=listener, name="slow"
+    )
+
+    await listener.wait_next_poll()
+    await listener.wait_next_poll()
+    stats = PollScheduler.get().statistics()["slow"]
+    await p.stop_and_wait()
+
+    assert PollScheduler.get().pollers == []
+    assert stats.polls >= 2
+    assert stats.errors == 0
+    assert stats.mean_latency is not None and stats.mean_latency >= 0.01
+    assert stats.max_latency is not None and stats.max_latency >= 0.01
+    assert 0 < stats.utilization <= 1
+
+
+async def test_statistics_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """It should periodically log the statistics of every poller."""
+    monkeypatch.setattr(poller, "_STATISTICS_LOG_INTERVAL", 0.0)
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 1
+    reader.is_idle.return_value = False
+    listener = WaitableListener[int]()
+
+    with caplog.at_level(logging.DEBUG, logger=poller.__name__):
+        p: Poller[int] = Poller(
+            interval_seconds=0.01, reader=reader, listener=listener, name="logged"
+        )
+        await listener.wait_next_poll()
+        await listener.wait_next_poll()
+        await p.stop_and_wait()
+
+    assert "Poller statistics: PollStatistics(name='logged'" in caplog.text
@@ -8,6 +8,7 @@ from opentrons.hardware_control.thread_manager import (
     ThreadManager,
 )
 from opentrons.hardware_control.api import API
+from opentrons.types import Mount
 
 
 def test_build_fail_raises_exception():
@@ -69,3 +70,50 @@ async def test_module_cache_remove_entry():
     future.result()
     mods_after = thread_manager.attached_modules
     assert len(mods_after) == 1
+
+
+async def test_bridged_method_cache():
+    """It should reuse bridged methods, unless they're overridden on the instance."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    try:
+        assert thread_manager.home is thread_manager.home
+        assert thread_manager.get_config is thread_manager.get_config
+
+        async def fake_home(*args, **kwargs):
+            return "fake"
+
+        thread_manager.managed_obj.home = fake_home
+        assert await thread_manager.home() == "fake"
+
+        del thread_manager.managed_obj.home
+        assert await thread_manager.home() is None
+    finally:
+        thread_manager.clean_up()
+
+
+async def test_call_batch():
+    """It should make several calls in the managed thread and return the results."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    try:
+        await thread_manager.home()
+
+        def current_position(hw):
+            return hw.current_position(Mount.LEFT)
+
+        def gantry_position(hw):
+            return hw.gantry_position(Mount.LEFT)
+
+        result = await thread_manager.call_batch(current_position, gantry_position)
+
+        assert result == [
+            await thread_manager.current_position(Mount.LEFT),
+            await thread_manager.gantry_position(Mount.LEFT),
+        ]
+
+        # Calls from the managed thread itself don't hop.
+        future = asyncio.run_coroutine_threadsafe(
+            thread_manager.call_batch(gantry_position), thread_manager._loop
+        )
+        assert await asyncio.wrap_future(future) == result[1:]
+    finally:
+        thread_manager.clean_up()
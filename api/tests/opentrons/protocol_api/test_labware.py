@@ -15,7 +15,13 @@ from opentrons.protocols.labware.definition import _get_parent_identifier
 from opentrons_shared_data import load_shared_data
 from opentrons_shared_data.labware.dev_types import WellDefinition
 
-from opentrons.calibration_storage import helpers, get, delete, file_operators
+from opentrons.calibration_storage import (
+    helpers,
+    get,
+    delete,
+    file_operators,
+    labware_offset_store,
+)
 from opentrons.types import Point, Location
 from opentrons.hardware_control.modules.types import ModuleType, MagneticModuleModel
 from opentrons.protocols.api_support.types import APIVersion
@@ -640,9 +646,9 @@ def test_add_index_file(labware_name, labware_offset_tempdir) -> None:
     full_id = f"{labware_hash}{str_parent}"
     blob = {"uri": f"{lw_uri}", "slot": full_id, "module": mod_dict}
 
-    lw_path = labware_offset_tempdir / "index.json"
-    info = file_operators.read_cal_file(lw_path)
-    assert info["data"][full_id] == blob
+    store_path = labware_offset_tempdir / labware_offset_store.STORE_FILE_NAME
+    info = file_operators.read_cal_file(store_path)
+    assert {k: v for k, v in info["data"][full_id].items() if k != "default"} == blob
 
 
 def test_delete_one_calibration(set_up_index_file) -> None:
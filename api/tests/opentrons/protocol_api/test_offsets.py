@@ -13,6 +13,7 @@ from opentrons.calibration_storage import (
     helpers,
     delete,
     encoder_decoder as ed,
+    labware_offset_store,
     types as cs_types,
 )
 from opentrons.protocol_api import labware
@@ -61,10 +62,8 @@ minimalLabwareDef = {
 }
 
 
-def path(calibration_name):
-    return config.get_opentrons_path(
-        "labware_calibration_offsets_dir_v2"
-    ) / "{}.json".format(calibration_name)
+def path(file_name):
+    return config.get_opentrons_path("labware_calibration_offsets_dir_v2") / file_name
 
 
 def tlc_path(pip_id):
@@ -82,13 +81,13 @@ def mock_hash_labware(labware_def):
 @pytest.fixture
 def clear_calibration(monkeypatch):
     try:
-        os.remove(path({MOCK_HASH}))
-    except FileNotFoundError:
+        delete.delete_offset_file(MOCK_HASH)  # type: ignore[arg-type]
+    except KeyError:
         pass
     yield
     try:
-        os.remove(path(MOCK_HASH))
-    except FileNotFoundError:
+        delete.delete_offset_file(MOCK_HASH)  # type: ignore[arg-type]
+    except KeyError:
         pass
 
 
@@ -120,7 +119,7 @@ def clear_tlc_calibration(monkeypatch):
 
 def test_save_labware_calibration(monkeypatch, clear_calibration):
     # Test the save calibration file
-    assert not os.path.exists(path(MOCK_HASH))
+    assert labware_offset_store.get(MOCK_HASH) is None
 
     impl = LabwareImplementation(minimalLabwareDef, Location(Point(0, 0, 0), "deck"))  # type: ignore[arg-type]  # noqa: E501
     impl.set_calibration = Mock()  # type: ignore[assignment]
@@ -131,7 +130,7 @@ def test_save_labware_calibration(monkeypatch, clear_calibration):
 
     point = Point(1, 1, 1)
     labware.save_calibration(test_labware, point)
-    assert os.path.exists(path(MOCK_HASH))
+    assert labware_offset_store.get(MOCK_HASH) is not None
     impl.set_calibration.assert_called_once_with(delta=point)
 
 
@@ -269,15 +268,12 @@ def test_schema_shape(monkeypatch, clear_calibration):
 
     expected = {"default": {"offset": [1, 1, 1], "lastModified": fake_time}}
 
-    def fake_helper_data(path, delta):
-        return expected
-
-    monkeypatch.setattr(modify, "_helper_offset_data_format", fake_helper_data)
+    monkeypatch.setattr(modify, "utc_now", lambda: fake_time)
 
     labware.save_calibration(test_labware, Point(1, 1, 1))
-    with open(path(MOCK_HASH)) as f:
+    with open(path(labware_offset_store.STORE_FILE_NAME)) as f:
         result = json.load(f, cls=ed.DateTimeDecoder)
-    assert result == expected
+    assert result["data"][MOCK_HASH]["default"] == expected["default"]
 
 
 def test_load_calibration(monkeypatch, clear_calibration):
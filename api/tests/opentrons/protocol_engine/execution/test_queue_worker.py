@@ -2,7 +2,7 @@
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateTopic
 from opentrons.protocol_engine.errors import ProtocolEngineStoppedError
 from opentrons.protocol_engine.execution import CommandExecutor, QueueWorker
 
@@ -38,7 +38,10 @@ def subject(
 async def queue_commands(decoy: Decoy, state_store: StateStore) -> None:
     """Load the command queue with 2 queued commands, then stop."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for(
+            condition=state_store.commands.get_next_queued,
+            topic=StateTopic.COMMANDS,
+        )
     ).then_return("command-id-1", "command-id-2")
 
     decoy.when(state_store.commands.get_stop_requested()).then_return(
@@ -54,7 +57,10 @@ async def test_start_processes_commands(
 ) -> None:
     """It should pull commands off the queue and execute them."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for(
+            condition=state_store.commands.get_next_queued,
+            topic=StateTopic.COMMANDS,
+        )
     ).then_return("command-id-1", "command-id-2")
 
     decoy.when(state_store.commands.get_stop_requested()).then_return(
@@ -131,7 +137,10 @@ async def test_engine_stopped_exception_breaks_loop_gracefully(
 ) -> None:
     """It should `join` gracefully if a ProtocolEngineStoppedError is raised."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for(
+            condition=state_store.commands.get_next_queued,
+            topic=StateTopic.COMMANDS,
+        )
     ).then_raise(ProtocolEngineStoppedError("oh no"))
 
     subject.start()
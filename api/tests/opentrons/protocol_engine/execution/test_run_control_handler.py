@@ -2,7 +2,7 @@
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateTopic
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state import EngineConfigs
@@ -43,7 +43,10 @@ async def test_pause(
     await subject.pause()
     decoy.verify(
         action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
-        await state_store.wait_for(condition=state_store.commands.get_is_running),
+        await state_store.wait_for(
+            condition=state_store.commands.get_is_running,
+            topic=StateTopic.COMMANDS,
+        ),
     )
 
 
@@ -1,7 +1,10 @@
 """Tests for the ChangeNotifier interface."""
 import asyncio
 import pytest
-from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+from opentrons.protocol_engine.state.change_notifier import (
+    ChangeNotifier,
+    StateTopic,
+)
 
 
 async def test_single_subscriber() -> None:
@@ -19,6 +22,33 @@ async def test_single_subscriber() -> None:
     await result
 
 
+async def test_topic_subscriber() -> None:
+    """Test that a topic subscriber only wakes up for changes to its topic."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait(topic=StateTopic.MODULES))
+
+    await asyncio.sleep(0)
+    subject.notify(topics=[StateTopic.LABWARE])
+    await asyncio.sleep(0.1)
+    assert result.done() is False
+
+    subject.notify(topics=[StateTopic.LABWARE, StateTopic.MODULES])
+    await asyncio.wait_for(result, timeout=1.0)
+
+
+async def test_notify_all_topics() -> None:
+    """Test that a notification without topics wakes up all subscribers."""
+    subject = ChangeNotifier()
+    result = asyncio.gather(
+        subject.wait(),
+        *(subject.wait(topic=topic) for topic in StateTopic),
+    )
+
+    await asyncio.sleep(0)
+    subject.notify()
+    await asyncio.wait_for(result, timeout=1.0)
+
+
 @pytest.mark.parametrize("count", range(10))
 async def test_multiple_subscribers(count: int) -> None:
     """Test that multiple subscribers can wait for a notification.
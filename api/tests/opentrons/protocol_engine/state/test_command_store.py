@@ -342,6 +342,47 @@ def test_command_failure_clears_queue() -> None:
     }
 
 
+def test_command_failure_keeps_other_entries() -> None:
+    """It should leave entries that a failure doesn't change as they are."""
+    succeeded = create_succeeded_command(command_id="command-id-1")
+
+    subject = CommandStore()
+    subject.handle_action(UpdateCommandAction(command=succeeded))
+    succeeded_entry = subject.state.commands_by_id["command-id-1"]
+
+    for command_id in ["command-id-2", "command-id-3"]:
+        subject.handle_action(
+            QueueCommandAction(
+                request=commands.PauseCreate(params=commands.PauseParams()),
+                created_at=datetime(year=2021, month=1, day=1),
+                command_id=command_id,
+                command_key=command_id,
+            )
+        )
+
+    # Fail a command that's still queued.
+    subject.handle_action(
+        FailCommandAction(
+            command_id="command-id-2",
+            error_id="error-id",
+            failed_at=datetime(year=2023, month=3, day=3),
+            error=errors.ProtocolEngineError("oh no"),
+        )
+    )
+
+    commands_by_id = subject.state.commands_by_id
+    assert commands_by_id["command-id-1"] is succeeded_entry
+    assert (
+        commands_by_id["command-id-2"].command.status == commands.CommandStatus.FAILED
+    )
+    assert commands_by_id["command-id-2"].command.error is not None
+    assert (
+        commands_by_id["command-id-3"].command.status == commands.CommandStatus.FAILED
+    )
+    assert commands_by_id["command-id-3"].command.error is None
+    assert list(commands_by_id) == ["command-id-1", "command-id-2", "command-id-3"]
+
+
 def test_command_store_preserves_handle_order() -> None:
     """It should store commands in the order they are handled."""
     # Any arbitrary 3 commands that compare non-equal (!=) to each other.
@@ -0,0 +1,486 @@
+"""Run duration estimate state store tests."""
+import pytest
+from datetime import datetime
+from typing import Tuple
+
+from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
+from opentrons_shared_data.pipette import name_config
+
+from opentrons.commands import types as legacy_command_types
+from opentrons.types import DeckSlotName, MountType
+from opentrons.protocol_engine import commands, errors
+from opentrons.protocol_engine.actions import (
+    FailCommandAction,
+    QueueCommandAction,
+    SetExpectedCommandsAction,
+    StopAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.commands import temperature_module, thermocycler
+from opentrons.protocol_engine.types import (
+    DeckSlotLocation,
+    ModuleLocation,
+    ModuleModel,
+    PipetteName,
+)
+from opentrons.protocol_runner.legacy_command_mapper import LegacyCommandParams
+from opentrons.protocol_engine.state.durations import (
+    DurationStore,
+    DurationView,
+    GANTRY_SPEED,
+)
+from opentrons.protocols.duration.timing import (
+    DROP_TIP_TIME,
+    LABWARE_Z_TRAVEL,
+    MODULE_Z_TRAVEL,
+    PICK_UP_TIP_TIME,
+    SAME_SLOT_TRAVEL_TIME,
+    TOUCH_TIP_TIME,
+    get_deck_travel_time,
+    get_temperature_module_ramp_time,
+    get_thermocycler_ramp_time,
+)
+
+
+@pytest.fixture
+def subject(standard_deck_def: DeckDefinitionV2) -> DurationStore:
+    """Get a DurationStore test subject."""
+    return DurationStore(deck_definition=standard_deck_def)
+
+
+def _queue(
+    subject: DurationStore, command_id: str, request: commands.CommandCreate
+) -> None:
+    subject.handle_action(
+        QueueCommandAction(
+            command_id=command_id,
+            command_key=command_id,
+            created_at=datetime(year=2021, month=1, day=1),
+            request=request,
+        )
+    )
+
+
+def _start_legacy(
+    subject: DurationStore, command_id: str, command_type: str, command_text: str
+) -> None:
+    subject.handle_action(
+        UpdateCommandAction(
+            command=commands.Custom(
+                id=command_id,
+                key=command_id,
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=commands.CommandStatus.RUNNING,
+                params=LegacyCommandParams(
+                    legacyCommandType=command_type,
+                    legacyCommandText=command_text,
+                ),
+            )
+        )
+    )
+
+
+def _succeed(subject: DurationStore, command: commands.Command) -> None:
+    subject.handle_action(
+        UpdateCommandAction(
+            command=command.copy(update={"status": commands.CommandStatus.SUCCEEDED})
+        )
+    )
+
+
+def _get_slot_position(deck_def: DeckDefinitionV2, slot: str) -> Tuple[float, float]:
+    slot_def = next(s for s in deck_def["locations"]["orderedSlots"] if s["id"] == slot)
+    return (slot_def["position"][0], slot_def["position"][1])
+
+
+def _queue_setup(subject: DurationStore) -> None:
+    _queue(
+        subject,
+        "load-pipette",
+        commands.LoadPipetteCreate(
+            params=commands.LoadPipetteParams(
+                pipetteId="pipette-id",
+                pipetteName=PipetteName.P300_SINGLE_GEN2,
+                mount=MountType.LEFT,
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "load-tip-rack",
+        commands.LoadLabwareCreate(
+            params=commands.LoadLabwareParams(
+                labwareId="tip-rack-id",
+                loadName="tip-rack",
+                namespace="opentrons",
+                version=1,
+                location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+            )
+        ),
+    )
+
+
+def test_initial_state(subject: DurationStore) -> None:
+    """It should start with nothing to estimate."""
+    view = DurationView(subject.state)
+
+    assert view.get_total() == 0
+    assert view.get_remaining() == 0
+    assert view.get_estimate("command-id") is None
+
+
+def test_queued_commands(
+    subject: DurationStore, standard_deck_def: DeckDefinitionV2
+) -> None:
+    """It should estimate commands in order as they're queued."""
+    _queue_setup(subject)
+    _queue(
+        subject,
+        "pick-up-tip",
+        commands.PickUpTipCreate(
+            params=commands.PickUpTipParams(
+                pipetteId="pipette-id", labwareId="tip-rack-id", wellName="A1"
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "aspirate",
+        commands.AspirateCreate(
+            params=commands.AspirateParams(
+                pipetteId="pipette-id",
+                labwareId="tip-rack-id",
+                wellName="B1",
+                volume=100,
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "drop-tip",
+        commands.DropTipCreate(
+            params=commands.DropTipParams(
+                pipetteId="pipette-id", labwareId="unknown-id", wellName="A1"
+            )
+        ),
+    )
+
+    view = DurationView(subject.state)
+    flow_rate = name_config()["p300_single_gen2"]["defaultAspirateFlowRate"]["value"]
+    travel_time = get_deck_travel_time(
+        _get_slot_position(standard_deck_def, "12"),
+        _get_slot_position(standard_deck_def, "1"),
+        GANTRY_SPEED,
+    )
+
+    assert travel_time != SAME_SLOT_TRAVEL_TIME
+    assert view.get_estimate("load-pipette") == 0
+    assert view.get_estimate("pick-up-tip") == travel_time + PICK_UP_TIP_TIME
+    assert view.get_estimate("aspirate") == pytest.approx(
+        SAME_SLOT_TRAVEL_TIME + LABWARE_Z_TRAVEL / GANTRY_SPEED + 100 / flow_rate
+    )
+    assert view.get_estimate("drop-tip") == SAME_SLOT_TRAVEL_TIME + DROP_TIP_TIME
+    assert view.get_total() == pytest.approx(
+        sum(view.get_estimate(i) or 0 for i in ["pick-up-tip", "aspirate", "drop-tip"])
+    )
+    assert view.get_remaining() == view.get_total()
+
+
+def test_running_totals(subject: DurationStore) -> None:
+    """It should count down the remaining time as commands complete."""
+    _queue_setup(subject)
+    pick_up_tip = commands.PickUpTip(
+        id="pick-up-tip",
+        key="pick-up-tip",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=commands.CommandStatus.QUEUED,
+        params=commands.PickUpTipParams(
+            pipetteId="pipette-id", labwareId="tip-rack-id", wellName="A1"
+        ),
+    )
+    _queue(
+        subject,
+        "pick-up-tip",
+        commands.PickUpTipCreate(params=pick_up_tip.params),
+    )
+    _start_legacy(subject, "touch-tip", legacy_command_types.TOUCH_TIP, "Touching tip")
+
+    view = DurationView(subject.state)
+    total = view.get_total()
+    pick_up_tip_time = view.get_estimate("pick-up-tip")
+    assert pick_up_tip_time is not None
+
+    _succeed(subject, pick_up_tip)
+
+    assert view.get_total() == total
+    assert view.get_remaining() == pytest.approx(total - pick_up_tip_time)
+
+    subject.handle_action(StopAction())
+
+    assert view.get_total() == pytest.approx(pick_up_tip_time)
+    assert view.get_remaining() == 0
+
+
+def test_failed_command(subject: DurationStore) -> None:
+    """It should drop the estimates of commands that a failure cancels."""
+    for command_id in ["delay-1", "delay-2"]:
+        _start_legacy(
+            subject,
+            command_id,
+            legacy_command_types.DELAY,
+            "Delaying for 1 minutes and 2.5 seconds",
+        )
+
+    view = DurationView(subject.state)
+    assert view.get_total() == 2 * 62.5
+
+    subject.handle_action(
+        FailCommandAction(
+            command_id="delay-1",
+            error_id="error-id",
+            failed_at=datetime(year=2021, month=1, day=1),
+            error=errors.ProtocolEngineError("oh no"),
+        )
+    )
+
+    assert view.get_total() == 62.5
+    assert view.get_remaining() == 0
+
+
+def test_commands_added_running(subject: DurationStore) -> None:
+    """It should estimate commands that skip the queue once, when they start."""
+    command = commands.Custom(
+        id="aspirate",
+        key="aspirate",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=commands.CommandStatus.RUNNING,
+        params=LegacyCommandParams(
+            legacyCommandType=legacy_command_types.ASPIRATE,
+            legacyCommandText="Aspirating from A1 of Plate on 1",
+            volume=50,
+            flowRate=25,
+        ),
+    )
+    expected = LABWARE_Z_TRAVEL / GANTRY_SPEED + 2
+
+    subject.handle_action(UpdateCommandAction(command=command))
+    view = DurationView(subject.state)
+
+    assert view.get_estimate("aspirate") == pytest.approx(expected)
+    assert view.get_remaining() == pytest.approx(expected)
+
+    _succeed(subject, command)
+
+    assert view.get_total() == pytest.approx(expected)
+    assert view.get_remaining() == 0
+
+
+def _legacy_delay(
+    command_id: str, seconds: float, status: commands.CommandStatus
+) -> commands.Custom:
+    return commands.Custom(
+        id=command_id,
+        key=command_id,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=status,
+        params=LegacyCommandParams(
+            legacyCommandType=legacy_command_types.DELAY,
+            legacyCommandText="Delaying",
+            delaySeconds=seconds,
+        ),
+    )
+
+
+def test_expected_commands(subject: DurationStore) -> None:
+    """It should count expected commands as remaining until they're added."""
+    expected_commands = [
+        _legacy_delay(f"expected-{i}", seconds, commands.CommandStatus.SUCCEEDED)
+        for i, seconds in enumerate([10, 20, 30])
+    ]
+
+    subject.handle_action(SetExpectedCommandsAction(commands=expected_commands))
+    view = DurationView(subject.state)
+
+    assert view.get_total() == 60
+    assert view.get_remaining() == 60
+    assert view.get_estimate("expected-0") is None
+
+    # The command the protocol actually adds takes the first expected one's place.
+    command = _legacy_delay("delay", 15, commands.CommandStatus.RUNNING)
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    assert view.get_total() == 65
+    assert view.get_remaining() == 65
+
+    _succeed(subject, command)
+
+    assert view.get_total() == 65
+    assert view.get_remaining() == 50
+
+    subject.handle_action(StopAction())
+
+    assert view.get_total() == 15
+    assert view.get_remaining() == 0
+
+
+def test_module_temperatures(subject: DurationStore) -> None:
+    """It should track every module's temperature separately."""
+    for module_id, slot in [
+        ("temp-1", DeckSlotName.SLOT_1),
+        ("temp-2", DeckSlotName.SLOT_3),
+    ]:
+        _queue(
+            subject,
+            f"load-{module_id}",
+            commands.LoadModuleCreate(
+                params=commands.LoadModuleParams(
+                    moduleId=module_id,
+                    model=ModuleModel.TEMPERATURE_MODULE_V2,
+                    location=DeckSlotLocation(slotName=slot),
+                )
+            ),
+        )
+
+    for command_id, module_id, celsius in [
+        ("set-1", "temp-1", 4),
+        ("set-2", "temp-2", 60),
+        ("set-1-again", "temp-1", 37),
+    ]:
+        _queue(
+            subject,
+            command_id,
+            temperature_module.SetTargetTemperatureCreate(
+                commandType="temperatureModule/setTargetTemperature",
+                params=temperature_module.SetTargetTemperatureParams(
+                    moduleId=module_id, celsius=celsius
+                ),
+            ),
+        )
+        _queue(
+            subject,
+            f"wait-{command_id}",
+            temperature_module.WaitForTemperatureCreate(
+                commandType="temperatureModule/waitForTemperature",
+                params=temperature_module.WaitForTemperatureParams(moduleId=module_id),
+            ),
+        )
+
+    view = DurationView(subject.state)
+
+    assert view.get_estimate("set-1") == 0
+    assert view.get_estimate("wait-set-1") == get_temperature_module_ramp_time(25, 4)
+    assert view.get_estimate("wait-set-2") == get_temperature_module_ramp_time(25, 60)
+    assert view.get_estimate("wait-set-1-again") == get_temperature_module_ramp_time(
+        4, 37
+    )
+
+
+def test_labware_on_module(subject: DurationStore) -> None:
+    """It should travel to a module's slot, and less far down into its labware."""
+    _queue_setup(subject)
+    _queue(
+        subject,
+        "load-thermocycler",
+        commands.LoadModuleCreate(
+            params=commands.LoadModuleParams(
+                moduleId="tc-id",
+                model=ModuleModel.THERMOCYCLER_MODULE_V1,
+                location=DeckSlotLocation(slotName=DeckSlotName.SLOT_7),
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "load-plate",
+        commands.LoadLabwareCreate(
+            params=commands.LoadLabwareParams(
+                labwareId="plate-id",
+                loadName="plate",
+                namespace="opentrons",
+                version=1,
+                location=ModuleLocation(moduleId="tc-id"),
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "heat",
+        thermocycler.SetAndWaitForBlockTemperatureCreate(
+            commandType="thermocycler/setAndWaitForBlockTemperature",
+            params=thermocycler.SetAndWaitForBlockTemperatureParams(
+                moduleId="tc-id", celsius=95
+            ),
+        ),
+    )
+    _queue(
+        subject,
+        "move",
+        commands.MoveToWellCreate(
+            params=commands.MoveToWellParams(
+                pipetteId="pipette-id", labwareId="plate-id", wellName="A1"
+            )
+        ),
+    )
+    _queue(
+        subject,
+        "dispense",
+        commands.DispenseCreate(
+            params=commands.DispenseParams(
+                pipetteId="pipette-id",
+                labwareId="plate-id",
+                wellName="A1",
+                volume=50,
+            )
+        ),
+    )
+
+    view = DurationView(subject.state)
+    flow_rate = name_config()["p300_single_gen2"]["defaultDispenseFlowRate"]["value"]
+
+    assert view.get_estimate("heat") == get_thermocycler_ramp_time(25, 95)
+    assert view.get_estimate("move") != SAME_SLOT_TRAVEL_TIME
+    assert view.get_estimate("dispense") == pytest.approx(
+        SAME_SLOT_TRAVEL_TIME + MODULE_Z_TRAVEL / GANTRY_SPEED + 50 / flow_rate
+    )
+
+
+def test_legacy_fixed_times(subject: DurationStore) -> None:
+    """It should use fixed times for legacy commands it can't estimate otherwise."""
+    for command_id, command_type in [
+        ("touch-tip", legacy_command_types.TOUCH_TIP),
+        ("comment", legacy_command_types.COMMENT),
+    ]:
+        _start_legacy(subject, command_id, command_type, "Hello")
+
+    view = DurationView(subject.state)
+
+    assert view.get_estimate("touch-tip") == TOUCH_TIP_TIME
+    assert view.get_estimate("comment") == 0
+
+
+def test_legacy_text_fallback(
+    subject: DurationStore, caplog: pytest.LogCaptureFixture
+) -> None:
+    """It should estimate legacy commands recorded without details from their text."""
+    _start_legacy(
+        subject,
+        "aspirate",
+        legacy_command_types.ASPIRATE,
+        "Aspirating 50.0 uL from A1 of Plate on 1 at 25.0 uL/sec",
+    )
+    _start_legacy(
+        subject,
+        "delay",
+        legacy_command_types.DELAY,
+        "Delaying for 1 minutes and 30.0 seconds",
+    )
+    _start_legacy(subject, "dispense", legacy_command_types.DISPENSE, "Dispensing")
+
+    view = DurationView(subject.state)
+
+    assert view.get_estimate("aspirate") == pytest.approx(
+        LABWARE_Z_TRAVEL / GANTRY_SPEED + 2
+    )
+    assert view.get_estimate("delay") == 90
+    assert view.get_estimate("dispense") == 0
+    assert "'Dispensing'" in caplog.text
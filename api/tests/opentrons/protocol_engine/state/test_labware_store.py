@@ -69,6 +69,7 @@ def test_initial_state(
             )
         },
         labware_offsets_by_id={},
+        latest_labware_offset_ids={},
         definitions_by_uri={expected_trash_uri: fixed_trash_def},
     )
 
@@ -100,6 +101,34 @@ def test_handles_add_labware_offset(
     )
 
     assert subject.state.labware_offsets_by_id == {"offset-id": resolved_offset}
+    assert subject.state.latest_labware_offset_ids == {
+        ("offset-definition-uri", DeckSlotName.SLOT_1, None): "offset-id"
+    }
+
+
+def test_handles_add_overriding_labware_offset(
+    subject: LabwareStore,
+) -> None:
+    """It should index the most recently added offset for a URI and location."""
+    request = LabwareOffsetCreate(
+        definitionUri="offset-definition-uri",
+        location=LabwareOffsetLocation(slotName=DeckSlotName.SLOT_1),
+        vector=LabwareOffsetVector(x=1, y=2, z=3),
+    )
+
+    for offset_id in ["offset-id-1", "offset-id-2"]:
+        subject.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=offset_id,
+                created_at=datetime(year=2021, month=1, day=2),
+                request=request,
+            )
+        )
+
+    assert list(subject.state.labware_offsets_by_id) == ["offset-id-1", "offset-id-2"]
+    assert subject.state.latest_labware_offset_ids == {
+        ("offset-definition-uri", DeckSlotName.SLOT_1, None): "offset-id-2"
+    }
 
 
 def test_handles_load_labware(
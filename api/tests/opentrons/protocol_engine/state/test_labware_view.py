@@ -19,7 +19,11 @@ from opentrons.protocol_engine.types import (
     ModuleModel,
 )
 
-from opentrons.protocol_engine.state.labware import LabwareState, LabwareView
+from opentrons.protocol_engine.state.labware import (
+    LabwareState,
+    LabwareView,
+    get_labware_offset_index_key,
+)
 
 
 plate = LoadedLabware(
@@ -62,9 +66,17 @@ def get_labware_view(
     deck_definition: Optional[DeckDefinitionV2] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    labware_offsets_by_id = labware_offsets_by_id or {}
     state = LabwareState(
         labware_by_id=labware_by_id or {},
-        labware_offsets_by_id=labware_offsets_by_id or {},
+        labware_offsets_by_id=labware_offsets_by_id,
+        latest_labware_offset_ids={
+            get_labware_offset_index_key(
+                definition_uri=offset.definitionUri,
+                location=offset.location,
+            ): offset_id
+            for offset_id, offset in labware_offsets_by_id.items()
+        },
         definitions_by_uri=definitions_by_uri or {},
         deck_definition=deck_definition or cast(DeckDefinitionV2, {"fake": True}),
     )
@@ -1,15 +1,52 @@
 """Tests for the top-level StateStore/StateView."""
+import asyncio
+from datetime import datetime
 from typing import Callable, Optional
 
 import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
-from opentrons.protocol_engine.state import State, StateStore
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.types import DeckSlotName
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.errors import ProtocolEngineError
+from opentrons.protocol_engine.state import State, StateStore, StateTopic
+from opentrons.protocol_engine.types import DeckSlotLocation, EngineStatus
+from opentrons.protocol_engine.actions import (
+    FailCommandAction,
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
+def _queue_pause(subject: StateStore, command_id: str) -> None:
+    subject.handle_action(
+        QueueCommandAction(
+            command_id=command_id,
+            command_key=command_id,
+            created_at=datetime(year=2021, month=1, day=1),
+            request=commands.PauseCreate(params=commands.PauseParams()),
+        )
+    )
+
+
+def _succeed_pause(subject: StateStore, command_id: str) -> None:
+    subject.handle_action(
+        UpdateCommandAction(
+            command=commands.Pause(
+                id=command_id,
+                key=command_id,
+                status=commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2021, month=1, day=1),
+                params=commands.PauseParams(),
+                result=commands.PauseResult(),
+            )
+        )
+    )
+
+
 @pytest.fixture
 def change_notifier(decoy: Decoy) -> ChangeNotifier:
     """Get a mocked out ChangeNotifier."""
@@ -45,15 +82,96 @@ def test_state_is_immutable(subject: StateStore) -> None:
     assert result_1 is not result_2
 
 
+def test_state_version(subject: StateStore) -> None:
+    """It should increment the state version every time state is updated."""
+    assert subject.get_state_version() == 0
+
+    subject.handle_action(PlayAction())
+    assert subject.get_state_version() == 1
+
+    subject.handle_action(PlayAction())
+    assert subject.get_state_version() == 2
+
+
+def test_get_summary_cached_per_version(subject: StateStore) -> None:
+    """It should only rebuild the state summary when the state version changes."""
+    summary_1 = subject.get_summary()
+    summary_2 = subject.get_summary()
+
+    subject.handle_action(PlayAction())
+    summary_3 = subject.get_summary()
+
+    assert summary_1 is summary_2
+    assert summary_1.status == EngineStatus.IDLE
+    assert summary_3.status == EngineStatus.RUNNING
+
+
+def test_get_summary_duration_estimates(subject: StateStore) -> None:
+    """It should include the run's estimated durations in the summary."""
+    subject.handle_action(
+        QueueCommandAction(
+            command_id="command-id",
+            command_key="command-id",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=commands.LoadLabwareCreate(
+                params=commands.LoadLabwareParams(
+                    labwareId="labware-id",
+                    loadName="load-name",
+                    namespace="namespace",
+                    version=1,
+                    location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+                )
+            ),
+        )
+    )
+    subject.handle_action(
+        QueueCommandAction(
+            command_id="command-id-2",
+            command_key="command-id-2",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=commands.PickUpTipCreate(
+                params=commands.PickUpTipParams(
+                    pipetteId="pipette-id", labwareId="labware-id", wellName="A1"
+                )
+            ),
+        )
+    )
+
+    estimate = subject.durations.get_estimate("command-id-2")
+    summary = subject.get_summary()
+
+    assert estimate is not None and estimate > 0
+    assert summary.estimatedDuration == estimate
+    assert summary.estimatedRemainingDuration == estimate
+
+
 def test_notify_on_state_change(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify(topics=frozenset(StateTopic)), times=0)
     subject.handle_action(PlayAction())
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(
+        change_notifier.notify(topics=frozenset([StateTopic.COMMANDS])),
+        times=1,
+    )
+
+
+def test_notify_command_update_all_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should notify every topic when a command is updated.
+
+    A command's result may change labware, pipette, or module state.
+    """
+    _queue_pause(subject, "command-id")
+    _succeed_pause(subject, "command-id")
+
+    decoy.verify(change_notifier.notify(topics=frozenset(StateTopic)), times=1)
 
 
 async def test_wait_for_state(
@@ -73,7 +191,25 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(topic=None), times=2)
+    assert subject.get_spurious_wakeup_count() == 1
+
+
+async def test_wait_for_state_topic(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only re-check the condition on changes to the given topic."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition()).then_return(None, "hello world")
+
+    result = await subject.wait_for(check_condition, topic=StateTopic.LABWARE)
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait(topic=StateTopic.LABWARE), times=1)
+    assert subject.get_spurious_wakeup_count() == 0
 
 
 async def test_wait_for_state_short_circuit(
@@ -89,7 +225,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(topic=None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -107,3 +243,50 @@ async def test_wait_for_raises(decoy: Decoy, subject: StateStore) -> None:
 
     with pytest.raises(ValueError, match="oh no"):
         await subject.wait_for(check_condition)
+
+
+async def test_wait_for_command_completion(subject: StateStore) -> None:
+    """It should resolve when the command completes."""
+    _queue_pause(subject, "command-id")
+
+    task = asyncio.create_task(subject.wait_for_command_completion("command-id"))
+    await asyncio.sleep(0)
+    assert task.done() is False
+
+    _succeed_pause(subject, "command-id")
+    await asyncio.wait_for(task, timeout=1.0)
+
+
+async def test_wait_for_command_completion_already_complete(
+    subject: StateStore,
+) -> None:
+    """It should resolve immediately if the command is already complete."""
+    _queue_pause(subject, "command-id")
+    _succeed_pause(subject, "command-id")
+
+    await asyncio.wait_for(
+        subject.wait_for_command_completion("command-id"),
+        timeout=1.0,
+    )
+
+
+async def test_wait_for_command_completion_failed_queue(
+    subject: StateStore,
+) -> None:
+    """It should resolve waiters on queued commands failed by an earlier failure."""
+    _queue_pause(subject, "command-id-1")
+    _queue_pause(subject, "command-id-2")
+
+    task = asyncio.create_task(subject.wait_for_command_completion("command-id-2"))
+    await asyncio.sleep(0)
+
+    subject.handle_action(
+        FailCommandAction(
+            command_id="command-id-1",
+            error_id="error-id",
+            failed_at=datetime(year=2021, month=1, day=1),
+            error=ProtocolEngineError("oh no"),
+        )
+    )
+
+    await asyncio.wait_for(task, timeout=1.0)
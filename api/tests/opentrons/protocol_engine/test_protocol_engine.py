@@ -2,7 +2,7 @@
 import pytest
 
 from datetime import datetime
-from decoy import Decoy
+from decoy import Decoy, matchers
 from typing import Any
 
 from opentrons.types import DeckSlotName
@@ -26,7 +26,7 @@ from opentrons.protocol_engine.execution import (
     HardwareEventForwarder,
 )
 from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateTopic
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 
 from opentrons.protocol_engine.actions import (
@@ -41,6 +41,7 @@ from opentrons.protocol_engine.actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    SetExpectedCommandsAction,
     HardwareStoppedAction,
 )
 
@@ -210,9 +211,8 @@ async def test_add_and_execute_command(
     def _stub_queued(*_a: object, **_k: object) -> None:
         decoy.when(state_store.commands.get("command-id")).then_return(queued)
 
-    def _stub_completed(*_a: object, **_k: object) -> bool:
+    def _stub_completed(*_a: object, **_k: object) -> None:
         decoy.when(state_store.commands.get("command-id")).then_return(completed)
-        return True
 
     decoy.when(
         action_dispatcher.dispatch(
@@ -226,10 +226,7 @@ async def test_add_and_execute_command(
     ).then_do(_stub_queued)
 
     decoy.when(
-        await state_store.wait_for(
-            condition=state_store.commands.get_is_complete,
-            command_id="command-id",
-        ),
+        await state_store.wait_for_command_completion("command-id"),
     ).then_do(_stub_completed)
 
     result = await subject.add_and_execute_command(request)
@@ -378,6 +375,32 @@ async def test_finish_stops_hardware_if_queue_worker_join_fails(
     )
 
 
+async def test_wait_for_state_change(
+    decoy: Decoy,
+    state_store: StateStore,
+    subject: ProtocolEngine,
+) -> None:
+    """It should wait for the state version to move past the given version."""
+    condition_captor = matchers.Captor()
+
+    await subject.wait_for_state_change(41, topic=StateTopic.COMMANDS)
+
+    decoy.verify(
+        await state_store.wait_for(
+            condition_captor,
+            state_store,
+            41,
+            topic=StateTopic.COMMANDS,
+        )
+    )
+
+    condition = condition_captor.value
+    decoy.when(state_store.get_state_version()).then_return(41)
+    assert condition(state_store, 41) is False
+    decoy.when(state_store.get_state_version()).then_return(42)
+    assert condition(state_store, 41) is True
+
+
 async def test_wait_until_complete(
     decoy: Decoy,
     state_store: StateStore,
@@ -387,7 +410,10 @@ async def test_wait_until_complete(
     await subject.wait_until_complete()
 
     decoy.verify(
-        await state_store.wait_for(condition=state_store.commands.get_all_complete)
+        await state_store.wait_for(
+            condition=state_store.commands.get_all_complete,
+            topic=StateTopic.COMMANDS,
+        )
     )
 
 
@@ -422,6 +448,31 @@ def test_add_plugin(
     decoy.verify(plugin_starter.start(plugin))
 
 
+def test_set_expected_commands(
+    decoy: Decoy,
+    action_dispatcher: ActionDispatcher,
+    subject: ProtocolEngine,
+) -> None:
+    """It should dispatch the expected commands to state."""
+    expected_commands = [
+        commands.Pause(
+            id="command-id",
+            key="command-key",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            params=commands.PauseParams(message="hello world"),
+        )
+    ]
+
+    subject.set_expected_commands(expected_commands)
+
+    decoy.verify(
+        action_dispatcher.dispatch(
+            SetExpectedCommandsAction(commands=expected_commands)
+        )
+    )
+
+
 def test_add_labware_offset(
     decoy: Decoy,
     action_dispatcher: ActionDispatcher,
@@ -0,0 +1,171 @@
+"""Tests for the CompiledProtocolCache interface."""
+import pytest
+from pathlib import Path
+from typing import Any, Dict
+
+from opentrons_shared_data.labware.dev_types import (
+    LabwareDefinition as LegacyLabwareDefinition,
+)
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocol_reader import (
+    CompiledProtocolCache,
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    PythonProtocolConfig,
+)
+from opentrons.protocol_reader.compiled_protocol_cache import CACHE_FILE_NAME
+
+
+PYTHON_PROTOCOL = b"""
+metadata = {"apiLevel": "2.11"}
+
+def run(ctx):
+    ctx.comment("hello world")
+"""
+
+
+def test_compute_key() -> None:
+    """It should compute a key that depends on file names and contents only."""
+    key = CompiledProtocolCache.compute_key(
+        [("protocol.py", b"abc"), ("labware.json", b"{}")]
+    )
+
+    assert key == CompiledProtocolCache.compute_key(
+        [("labware.json", b"{}"), ("protocol.py", b"abc")]
+    )
+    assert key != CompiledProtocolCache.compute_key(
+        [("protocol.py", b"abcd"), ("labware.json", b"{}")]
+    )
+    assert key != CompiledProtocolCache.compute_key(
+        [("protocol2.py", b"abc"), ("labware.json", b"{}")]
+    )
+
+
+def test_save_and_load(
+    tmp_path: Path, minimal_labware_def: LegacyLabwareDefinition
+) -> None:
+    """It should load a saved compiled protocol with a matching key."""
+    compiled = CompiledProtocolCache.build(
+        key="cache-key",
+        main_file_name="protocol.py",
+        main_file_contents=PYTHON_PROTOCOL,
+        labware_file_names=["labware.json"],
+        metadata={"apiLevel": "2.11"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        labware_definitions=[LabwareDefinition.parse_obj(minimal_labware_def)],
+    )
+    CompiledProtocolCache.save(tmp_path, compiled)
+
+    result = CompiledProtocolCache.load(tmp_path, "cache-key")
+
+    assert result == compiled
+    assert result.code is not None
+    assert result.code.co_filename == "protocol.py"
+    assert LabwareDefinition.parse_obj(
+        result.labware_definitions[0]
+    ) == LabwareDefinition.parse_obj(minimal_labware_def)
+
+    protocol_globals: Dict[str, Any] = {}
+    exec(result.code, protocol_globals)
+    assert callable(protocol_globals["run"])
+
+
+def test_save_and_load_json(tmp_path: Path) -> None:
+    """It should save JSON protocols without any code."""
+    compiled = CompiledProtocolCache.build(
+        key="cache-key",
+        main_file_name="protocol.json",
+        main_file_contents=b"{}",
+        labware_file_names=[],
+        metadata={"protocolName": "hello"},
+        config=JsonProtocolConfig(schema_version=6),
+        labware_definitions=[],
+    )
+    CompiledProtocolCache.save(tmp_path, compiled)
+
+    result = CompiledProtocolCache.load(tmp_path, "cache-key")
+
+    assert result == compiled
+    assert result.code is None
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"def run(ctx) pass",
+        b'metadata = {"apiLevel": "2.11"}',
+        b'metadata = {"apiLevel": "2.11"}\nfrom opentrons import robot\n'
+        b"def run(ctx): pass",
+    ],
+)
+def test_build_invalid_python(contents: bytes) -> None:
+    """It should not compile protocols that fail Protocol API v2 validation."""
+    result = CompiledProtocolCache.build(
+        key="cache-key",
+        main_file_name="protocol.py",
+        main_file_contents=contents,
+        labware_file_names=[],
+        metadata={"apiLevel": "2.11"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        labware_definitions=[],
+    )
+
+    assert result.code is None
+
+
+def test_load_mismatch(tmp_path: Path) -> None:
+    """It should ignore missing, stale, and unreadable cache files."""
+    assert CompiledProtocolCache.load(tmp_path, "cache-key") is None
+
+    compiled = CompiledProtocolCache.build(
+        key="cache-key",
+        main_file_name="protocol.py",
+        main_file_contents=PYTHON_PROTOCOL,
+        labware_file_names=[],
+        metadata={"apiLevel": "2.11"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        labware_definitions=[],
+    )
+    CompiledProtocolCache.save(tmp_path, compiled)
+    assert CompiledProtocolCache.load(tmp_path, "other-key") is None
+
+    cache_file = tmp_path / CACHE_FILE_NAME
+    cache_file.write_bytes(cache_file.read_bytes()[:20])
+    assert CompiledProtocolCache.load(tmp_path, "cache-key") is None
+
+
+def test_load_for_source_and_clear(tmp_path: Path) -> None:
+    """It should find and delete the compiled protocol of a protocol source."""
+    main_file = tmp_path / "protocol.py"
+    main_file.write_bytes(PYTHON_PROTOCOL)
+    source = ProtocolSource(
+        directory=tmp_path,
+        main_file=main_file,
+        files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+        metadata={"apiLevel": "2.11"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        labware_definitions=[],
+    )
+    compiled = CompiledProtocolCache.build(
+        key=CompiledProtocolCache.compute_key([("protocol.py", PYTHON_PROTOCOL)]),
+        main_file_name="protocol.py",
+        main_file_contents=PYTHON_PROTOCOL,
+        labware_file_names=[],
+        metadata={"apiLevel": "2.11"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        labware_definitions=[],
+    )
+    CompiledProtocolCache.save(tmp_path, compiled)
+
+    assert CompiledProtocolCache.load_for_source(source) == compiled
+
+    main_file.write_bytes(PYTHON_PROTOCOL + b"\n# changed")
+    assert CompiledProtocolCache.load_for_source(source) is None
+
+    CompiledProtocolCache.clear(tmp_path)
+    CompiledProtocolCache.clear(tmp_path)
+    assert list(tmp_path.iterdir()) == [main_file]
@@ -6,10 +6,16 @@ from decoy import Decoy, matchers
 from pathlib import Path
 from typing import IO, Optional
 
+from opentrons_shared_data.labware.dev_types import (
+    LabwareDefinition as LegacyLabwareDefinition,
+)
+
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.models import LabwareDefinition
 
 from opentrons.protocol_reader import (
+    CompiledProtocol,
+    CompiledProtocolCache,
     ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
@@ -64,17 +70,25 @@ def config_analyzer(decoy: Decoy) -> ConfigAnalyzer:
     return decoy.mock(cls=ConfigAnalyzer)
 
 
+@pytest.fixture
+def compiled_protocol_cache(decoy: Decoy) -> CompiledProtocolCache:
+    """Get a mocked out CompiledProtocolCache."""
+    return decoy.mock(cls=CompiledProtocolCache)
+
+
 @pytest.fixture
 def subject(
     file_reader_writer: FileReaderWriter,
     role_analyzer: RoleAnalyzer,
     config_analyzer: ConfigAnalyzer,
+    compiled_protocol_cache: CompiledProtocolCache,
 ) -> ProtocolReader:
     """Create a ProtocolReader test subject."""
     return ProtocolReader(
         file_reader_writer=file_reader_writer,
         role_analyzer=role_analyzer,
         config_analyzer=config_analyzer,
+        compiled_protocol_cache=compiled_protocol_cache,
     )
 
 
@@ -148,6 +162,71 @@ async def test_read_files(
     )
 
 
+async def test_read_files_saves_compiled_protocol(
+    decoy: Decoy,
+    tmp_path: Path,
+    file_reader_writer: FileReaderWriter,
+    role_analyzer: RoleAnalyzer,
+    config_analyzer: ConfigAnalyzer,
+    compiled_protocol_cache: CompiledProtocolCache,
+    subject: ProtocolReader,
+) -> None:
+    """It should save a compiled protocol alongside the saved files."""
+    input_file = InputFile(
+        filename="protocol.py",
+        file=io.BytesIO(b"# hello world"),
+    )
+    buffered_file = BufferedFile(
+        name="protocol.py",
+        contents=b"# hello world",
+        data=None,
+        path=None,
+    )
+    main_file = MainFile(
+        name="protocol.py",
+        contents=b"# hello world",
+        path=None,
+    )
+    analyzed_roles = RoleAnalysis(
+        main_file=main_file, labware_files=[], labware_definitions=[]
+    )
+    analyzed_config = ConfigAnalysis(
+        metadata={"hey": "there"},
+        config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+    )
+    compiled = CompiledProtocol(
+        key="cache-key",
+        main_file_name="protocol.py",
+        labware_file_names=[],
+        metadata={"hey": "there"},
+        config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+        labware_definitions=[],
+        code=None,
+    )
+
+    decoy.when(await file_reader_writer.read([input_file])).then_return([buffered_file])
+    decoy.when(role_analyzer.analyze([buffered_file])).then_return(analyzed_roles)
+    decoy.when(config_analyzer.analyze(main_file)).then_return(analyzed_config)
+    decoy.when(
+        compiled_protocol_cache.compute_key([("protocol.py", b"# hello world")])
+    ).then_return("cache-key")
+    decoy.when(
+        compiled_protocol_cache.build(
+            key="cache-key",
+            main_file_name="protocol.py",
+            main_file_contents=b"# hello world",
+            labware_file_names=[],
+            metadata={"hey": "there"},
+            config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+            labware_definitions=[],
+        )
+    ).then_return(compiled)
+
+    await subject.read_and_save(files=[input_file], directory=tmp_path)
+
+    decoy.verify(compiled_protocol_cache.save(tmp_path, compiled))
+
+
 async def test_read_error(
     decoy: Decoy,
     tmp_path: Path,
@@ -295,3 +374,58 @@ async def test_read_files_no_copy(
         ),
         times=0,
     )
+
+
+async def test_read_saved_compiled_protocol(
+    decoy: Decoy,
+    tmp_path: Path,
+    minimal_labware_def: LegacyLabwareDefinition,
+    file_reader_writer: FileReaderWriter,
+    compiled_protocol_cache: CompiledProtocolCache,
+    subject: ProtocolReader,
+) -> None:
+    """It should use a matching compiled protocol instead of reading the files."""
+    main_path = tmp_path / "protocol.py"
+    labware_path = tmp_path / "labware.json"
+    cache_path = tmp_path / ".compiled_protocol"
+    main_path.write_bytes(b"# hello world")
+    labware_path.write_bytes(b"{}")
+    labware_data = LabwareDefinition.parse_obj(minimal_labware_def)
+
+    decoy.when(
+        compiled_protocol_cache.compute_key(
+            [("protocol.py", b"# hello world"), ("labware.json", b"{}")]
+        )
+    ).then_return("cache-key")
+    decoy.when(compiled_protocol_cache.load(tmp_path, "cache-key")).then_return(
+        CompiledProtocol(
+            key="cache-key",
+            main_file_name="protocol.py",
+            labware_file_names=["labware.json"],
+            metadata={"hey": "there"},
+            config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+            labware_definitions=[dict(minimal_labware_def)],
+            code=None,
+        )
+    )
+
+    result = await subject.read_saved(
+        files=[main_path, labware_path, cache_path], directory=tmp_path
+    )
+
+    assert result == ProtocolSource(
+        directory=tmp_path,
+        main_file=main_path,
+        files=[
+            ProtocolSourceFile(path=main_path, role=ProtocolFileRole.MAIN),
+            ProtocolSourceFile(path=labware_path, role=ProtocolFileRole.LABWARE),
+        ],
+        metadata={"hey": "there"},
+        config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+        labware_definitions=[labware_data],
+    )
+
+    decoy.verify(
+        await file_reader_writer.read(matchers.Anything()),
+        times=0,
+    )
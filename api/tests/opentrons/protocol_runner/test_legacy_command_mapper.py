@@ -3,8 +3,15 @@ import pytest
 from decoy import matchers, Decoy
 from datetime import datetime
 from typing import cast
-
-from opentrons.commands.types import CommentMessage, PauseMessage, CommandMessage
+from unittest.mock import MagicMock
+
+from opentrons.commands.types import (
+    AspirateMessage,
+    CommentMessage,
+    DelayMessage,
+    PauseMessage,
+    CommandMessage,
+)
 from opentrons.protocol_engine import (
     DeckSlotLocation,
     ModuleLocation,
@@ -24,7 +31,9 @@ from opentrons.protocol_runner.legacy_wrappers import (
     LegacyInstrumentLoadInfo,
     LegacyLabwareLoadInfo,
     LegacyModuleLoadInfo,
+    LegacyPipetteContext,
     LegacyTemperatureModuleModel,
+    LegacyWell,
 )
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
 from opentrons_shared_data.module.dev_types import ModuleDefinitionV2
@@ -142,6 +151,70 @@ def test_map_after_with_error_command() -> None:
     ]
 
 
+def test_map_command_details() -> None:
+    """It should map the details needed to estimate aspirates and delays."""
+    pipette = MagicMock(spec=LegacyPipetteContext)
+    pipette.flow_rate.aspirate = 10.0
+    legacy_aspirate: AspirateMessage = {
+        "$": "before",
+        "id": "aspirate-id",
+        "name": "command.ASPIRATE",
+        "payload": {
+            "text": "Aspirating",
+            "location": MagicMock(spec=LegacyWell),
+            "instrument": pipette,
+            "volume": 50,
+            "rate": 2.0,
+        },
+        "error": None,
+    }
+    legacy_delay: DelayMessage = {
+        "$": "before",
+        "id": "delay-id",
+        "name": "command.DELAY",
+        "payload": {"text": "Delaying", "minutes": 1, "seconds": 30},
+        "error": None,
+    }
+
+    subject = LegacyCommandMapper()
+    aspirate_result = subject.map_command(legacy_aspirate)
+    delay_result = subject.map_command(legacy_delay)
+
+    assert aspirate_result == [
+        pe_actions.UpdateCommandAction(
+            pe_commands.Custom.construct(
+                id="command.ASPIRATE-0",
+                key="command.ASPIRATE-0",
+                status=pe_commands.CommandStatus.RUNNING,
+                createdAt=matchers.IsA(datetime),
+                startedAt=matchers.IsA(datetime),
+                params=LegacyCommandParams(
+                    legacyCommandType="command.ASPIRATE",
+                    legacyCommandText="Aspirating",
+                    volume=50,
+                    flowRate=20,
+                ),
+            )
+        )
+    ]
+    assert delay_result == [
+        pe_actions.UpdateCommandAction(
+            pe_commands.Custom.construct(
+                id="command.DELAY-0",
+                key="command.DELAY-0",
+                status=pe_commands.CommandStatus.RUNNING,
+                createdAt=matchers.IsA(datetime),
+                startedAt=matchers.IsA(datetime),
+                params=LegacyCommandParams(
+                    legacyCommandType="command.DELAY",
+                    legacyCommandText="Delaying",
+                    delaySeconds=90,
+                ),
+            )
+        )
+    ]
+
+
 def test_command_stack() -> None:
     """It should use messages ID and command ordering to create command IDs."""
     legacy_command_1: CommentMessage = {
@@ -1,3 +1,5 @@
+import random
+from itertools import dropwhile, takewhile
 from typing import List
 
 import pytest
@@ -157,3 +159,79 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def test_next_tip_from_starting_tip(wells, tiptracker):
+    well_list = wells
+
+    # Tips before the starting tip, in its column or earlier ones, don't count
+    assert tiptracker.next_tip(starting_tip=well_list[3]) is well_list[3]
+    assert tiptracker.next_tip(5, starting_tip=well_list[3]) is well_list[3]
+    assert tiptracker.next_tip(6, starting_tip=well_list[3]) is well_list[8]
+    assert tiptracker.next_tip(8, starting_tip=well_list[8]) is well_list[8]
+
+    tiptracker.use_tips(well_list[8], num_channels=8)
+    assert tiptracker.next_tip(8, starting_tip=well_list[8]) is well_list[16]
+    assert tiptracker.next_tip(starting_tip=well_list[95]) is well_list[95]
+
+    tiptracker.use_tips(well_list[95])
+    assert tiptracker.next_tip(starting_tip=well_list[95]) is None
+
+    # A well with the same name from another rack finds the starting
+    # column, but none of its tips
+    other_well = WellImplementation(
+        well_geometry=None, display_name="other", has_tip=True, name="A1"
+    )
+    assert tiptracker.next_tip(starting_tip=other_well) is well_list[16]
+
+
+def test_tracks_tips_set_on_wells(wells, tiptracker):
+    for well in wells[:16]:
+        well.set_has_tip(False)
+
+    assert tiptracker.next_tip(8) is wells[16]
+    assert tiptracker.previous_tip(8) is wells[0]
+
+    wells[3].set_has_tip(True)
+    assert tiptracker.next_tip() is wells[3]
+    assert tiptracker.previous_tip(8) is wells[8]
+
+    for well in wells:
+        well.set_has_tip(True)
+    assert tiptracker.next_tip(8) is wells[0]
+    assert tiptracker.previous_tip() is None
+
+
+def test_matches_well_by_well_search(wells, tiptracker):
+    """It should agree with a search over each column's wells."""
+    columns = [wells[i : i + 8] for i in range(0, 96, 8)]
+
+    def first_run(column, has_tip):
+        run = list(
+            takewhile(
+                lambda w: w.has_tip() == has_tip,
+                dropwhile(lambda w: w.has_tip() != has_tip, column),
+            )
+        )
+        return run
+
+    def expected_next_tip(num_tips):
+        runs = [first_run(column, True) for column in columns]
+        return next((run[0] for run in runs if len(run) >= num_tips), None)
+
+    def expected_previous_tip(num_tips):
+        runs = [first_run(column, False) for column in columns]
+        return next((run[0] for run in runs if len(run) >= num_tips), None)
+
+    rng = random.Random(1234)
+    for _ in range(500):
+        well = rng.choice(wells)
+        num_channels = rng.choice([1, 1, 4, 8])
+        if rng.random() < 0.7:
+            tiptracker.use_tips(well, num_channels)
+        else:
+            well.set_has_tip(True)
+
+        for num_tips in (1, 3, 8):
+            assert tiptracker.next_tip(num_tips) is expected_next_tip(num_tips)
+            assert tiptracker.previous_tip(num_tips) is expected_previous_tip(num_tips)
@@ -49,3 +49,22 @@ def test_replacing_instrument_tip_state(
 
     assert pip1.has_tip() is False
     assert pip2.has_tip() is False
+
+
+def test_simulated_rail_lights(
+    simulating_protocol_context: AbstractProtocol,
+) -> None:
+    """It should report the rail light state that was last set."""
+    subject = simulating_protocol_context
+    subject.set_rail_lights(on=True)
+    assert subject.get_rail_lights_on() is True
+
+    subject.set_rail_lights(on=False)
+    assert subject.get_rail_lights_on() is False
+
+
+def test_home_clears_last_location(subject: AbstractProtocol) -> None:
+    """It should forget the last location when homing."""
+    subject.set_last_location(types.Location(types.Point(1, 2, 3), None))
+    subject.home()
+    assert subject.get_last_location() is None
@@ -5,8 +5,8 @@ import pytest
 
 from opentrons.commands import types
 from opentrons.protocol_api import InstrumentContext
-from opentrons.protocols.duration.estimator import (
-    DurationEstimator,
+from opentrons.protocols.duration.estimator import DurationEstimator
+from opentrons.protocols.duration.timing import (
     TEMP_MOD_HIGH_THRESH,
     TEMP_MOD_RATE_HIGH_AND_ABOVE,
     TEMP_MOD_LOW_THRESH,
@@ -0,0 +1,29 @@
+"""Tests for labware definition loading and verification."""
+import json
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons.protocols.labware import get_labware_definition, verify_definition
+
+
+def test_verify_definition() -> None:
+    """It should verify definitions as dicts or JSON, repeatedly."""
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+
+    assert verify_definition(definition) == definition
+    assert verify_definition(definition) == definition
+    assert verify_definition(json.dumps(definition)) == definition
+
+
+def test_verify_invalid_definition() -> None:
+    """It should reject an invalid definition even if a valid one was verified."""
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+    verify_definition(definition)
+
+    invalid_definition = {k: v for k, v in definition.items() if k != "wells"}
+
+    with pytest.raises(jsonschema.ValidationError):
+        verify_definition(invalid_definition)
+    with pytest.raises(jsonschema.ValidationError):
+        verify_definition(invalid_definition)
@@ -0,0 +1,106 @@
+"""Tests for the labware definition registry."""
+import json
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocols.api_support.constants import STANDARD_DEFS_PATH
+from opentrons.protocols.labware.registry import LabwareDefinitionRegistry
+
+
+def _write_definition(user_defs_dir: Path, namespace: str, version: int) -> Path:
+    path = user_defs_dir / namespace / "my_labware" / f"{version}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "namespace": namespace,
+                "version": version,
+                "parameters": {"loadName": "my_labware"},
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def user_defs_dir(tmp_path: Path) -> Path:
+    """Get an empty directory for user definitions."""
+    return tmp_path / "user_defs"
+
+
+@pytest.fixture
+def subject(user_defs_dir: Path) -> LabwareDefinitionRegistry:
+    """Get a registry of the real standard definitions."""
+    return LabwareDefinitionRegistry(
+        standard_defs_dir=STANDARD_DEFS_PATH,
+        user_defs_dir=user_defs_dir,
+        cache_size=2,
+    )
+
+
+def test_get_standard_definition(subject: LabwareDefinitionRegistry) -> None:
+    """It should load standard definitions, returning a new copy each time."""
+    result = subject.get("opentrons", "opentrons_96_tiprack_300ul", 1)
+
+    assert result is not None
+    assert result["parameters"]["loadName"] == "opentrons_96_tiprack_300ul"
+
+    result["ordering"] = []
+    assert subject.get("opentrons", "opentrons_96_tiprack_300ul", 1) != result
+
+    assert subject.get("opentrons", "opentrons_96_tiprack_300ul", 999) is None
+    assert subject.get("opentrons", "not_a_real_labware", 1) is None
+
+
+def test_get_user_definition(
+    subject: LabwareDefinitionRegistry, user_defs_dir: Path
+) -> None:
+    """It should find user definitions added after the index was built."""
+    assert subject.get("custom_beta", "my_labware", 1) is None
+
+    _write_definition(user_defs_dir, "custom_beta", 1)
+
+    result = subject.get("custom_beta", "my_labware", 1)
+    assert result is not None
+    assert result["namespace"] == "custom_beta"
+
+
+def test_user_definition_changes(
+    subject: LabwareDefinitionRegistry, user_defs_dir: Path
+) -> None:
+    """It should notice when a cached user definition is changed or removed."""
+    path = _write_definition(user_defs_dir, "custom_beta", 1)
+    subject.get("custom_beta", "my_labware", 1)
+
+    path.write_text(json.dumps({"namespace": "custom_beta", "changed": True}))
+    result = subject.get("custom_beta", "my_labware", 1)
+    assert result == {"namespace": "custom_beta", "changed": True}
+
+    path.unlink()
+    assert subject.get("custom_beta", "my_labware", 1) is None
+
+
+def test_ignores_user_opentrons_namespace(
+    subject: LabwareDefinitionRegistry, user_defs_dir: Path
+) -> None:
+    """It should only load Opentrons definitions from the standard definitions."""
+    _write_definition(user_defs_dir, "opentrons", 1)
+    subject.invalidate()
+
+    assert subject.get("opentrons", "my_labware", 1) is None
+
+
+def test_cache_is_bounded(subject: LabwareDefinitionRegistry) -> None:
+    """It should still load definitions correctly after evicting them."""
+    load_names = [
+        "opentrons_96_tiprack_300ul",
+        "nest_12_reservoir_15ml",
+        "corning_96_wellplate_360ul_flat",
+    ]
+
+    for _ in range(2):
+        for load_name in load_names:
+            result = subject.get("opentrons", load_name, 1)
+            assert result is not None
+            assert result["parameters"]["loadName"] == load_name
@@ -82,6 +82,36 @@ def test_simulate_function_bundle_apiv2(
     ]
 
 
+@pytest.mark.parametrize("protocol_file", ["test_simulate.py"])
+def test_simulate_function_analysis_only(
+    protocol: Protocol,
+    protocol_file: str,
+) -> None:
+    """It should produce the same run log without moving the hardware."""
+    runlog, _ = simulate.simulate(protocol.filelike, "test_simulate.py")
+    protocol.filelike.seek(0)
+    analysis_runlog, _ = simulate.simulate(
+        protocol.filelike, "test_simulate.py", analysis_only=True
+    )
+    assert [item["payload"]["text"] for item in analysis_runlog] == [
+        item["payload"]["text"] for item in runlog
+    ]
+
+
+def test_simulate_function_json_analysis_only(
+    get_json_protocol_fixture: Callable[[str, str, bool], str]
+) -> None:
+    """It should produce the same run log for a JSON protocol."""
+    jp = get_json_protocol_fixture("3", "simple", False)
+    runlog, _ = simulate.simulate(io.StringIO(jp), "simple.json")
+    analysis_runlog, _ = simulate.simulate(
+        io.StringIO(jp), "simple.json", analysis_only=True
+    )
+    assert [item["payload"]["text"] for item in analysis_runlog] == [
+        item["payload"]["text"] for item in runlog
+    ]
+
+
 @pytest.mark.parametrize("protocol_file", ["testosaur.py"])
 def test_simulate_function_v1(protocol: Protocol, protocol_file: str) -> None:
     with pytest.raises(ApiDeprecationError):
@@ -0,0 +1,146 @@
+"""Benchmark decoding and dispatching received CAN frames in CanMessenger.
+
+Replays a frame stream, like what the host sees while a move group executes
+with capacitive sensor data streaming in, through a CanMessenger with one
+listener per node. Listeners are registered either with filter functions,
+which are called for every frame, or with dispatch ids, which are indexed.
+
+Usage:
+    python benchmarks/bench_can_messenger.py --frames 20000
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, List
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import MessageId, NodeId
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+
+_NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head_l, NodeId.head_r]
+
+
+def _make_frame(message_id: MessageId, node: NodeId, data: bytes) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node,
+            )
+        ),
+        data=data,
+    )
+
+
+def _record_frames(count: int) -> List[CanMessage]:
+    """Build a frame stream of move completions and sensor readings."""
+    frames = []
+    for i in range(count):
+        if i % 4 == 0:
+            frames.append(
+                _make_frame(
+                    MessageId.move_completed,
+                    _NODES[i % len(_NODES)],
+                    bytes([0, i % 256, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]),
+                )
+            )
+        else:
+            frames.append(
+                _make_frame(
+                    MessageId.read_sensor_response,
+                    NodeId.pipette_left,
+                    bytes([1, 0, 0, i % 256, 0]),
+                )
+            )
+    return frames
+
+
+class _ReplayDriver(AbstractCanDriver):
+    """A driver that replays recorded frames, then signals it is done."""
+
+    def __init__(self, frames: List[CanMessage]) -> None:
+        self._frames = iter(frames)
+        self.done = asyncio.Event()
+
+    async def send(self, message: CanMessage) -> None:
+        pass
+
+    async def read(self) -> CanMessage:
+        try:
+            return next(self._frames)
+        except StopIteration:
+            self.done.set()
+            raise StopAsyncIteration()
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _make_filter(node: NodeId) -> Callable[[ArbitrationId], bool]:
+    return lambda arbitration_id: bool(
+        arbitration_id.parts.originating_node_id == node
+        and arbitration_id.parts.message_id == MessageId.move_completed
+    )
+
+
+class _CountingListener:
+    """A listener that counts the messages it receives."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        self.count += 1
+
+
+async def _replay(frames: List[CanMessage], use_filters: bool) -> float:
+    driver = _ReplayDriver(frames)
+    messenger = CanMessenger(driver=driver)
+
+    for node in _NODES:
+        if use_filters:
+            messenger.add_listener(_CountingListener(), _make_filter(node))
+        else:
+            messenger.add_listener(
+                _CountingListener(),
+                message_id=MessageId.move_completed,
+                originating_node_id=node,
+            )
+
+    start = time.perf_counter()
+    messenger.start()
+    await driver.done.wait()
+    elapsed = time.perf_counter() - start
+    await messenger.stop()
+
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    frames = _record_frames(args.frames)
+    loop = asyncio.get_event_loop()
+
+    print(f"{args.frames} frames, {len(_NODES)} listeners")
+    for use_filters in (True, False):
+        elapsed = loop.run_until_complete(_replay(frames, use_filters))
+        mode = "filter functions" if use_filters else "dispatch ids"
+        print(f"  {mode:<18} {elapsed * 1e6 / args.frames:8.2f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
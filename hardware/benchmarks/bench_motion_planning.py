@@ -0,0 +1,115 @@
+"""Benchmark blending long multi-dispense paths with MoveManager.
+
+Plans a path that visits every well of a 96 well plate in turn, dipping the
+pipette into each well and moving the plunger down a little for every
+dispense, with both `MoveManager.plan_motion`, which builds every move one at
+a time, and `MoveManager.plan_motion_vectorized`, which blends all of them at
+once. Both planners must produce the same plan.
+
+Usage:
+    python benchmarks/bench_motion_planning.py --targets 96 --repeats 20
+"""
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+
+_CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=500,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=10,
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=500,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=10,
+    ),
+}
+
+_ORIGIN: Coordinates[str, np.float64] = {
+    "X": np.float64(0),
+    "Y": np.float64(0),
+    "Z": np.float64(100),
+    "A": np.float64(0),
+}
+
+
+def _multi_dispense_path(count: int) -> List[MoveTarget[str]]:
+    """Build a path that dips into wells at a 9 mm pitch, in column order."""
+    targets = []
+    for i in range(count):
+        column, row = divmod(i % 96, 8)
+        targets.append(
+            MoveTarget.build(
+                position={
+                    "X": 14.38 + column * 9,
+                    "Y": 74.24 - row * 9,
+                    "Z": 10 + (i % 2) * 5,
+                    "A": i * 0.5,
+                },
+                max_speed=200 if i % 2 == 0 else 50,
+            )
+        )
+    return targets
+
+
+def _time_planner(
+    planner: Callable[..., Tuple[bool, List[List[Move[str]]]]],
+    targets: List[MoveTarget[str]],
+    repeats: int,
+) -> Tuple[float, Tuple[bool, List[List[Move[str]]]]]:
+    result = planner(origin=_ORIGIN, target_list=targets, iteration_limit=20)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        planner(origin=_ORIGIN, target_list=targets, iteration_limit=20)
+    return (time.perf_counter() - start) / repeats, result
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=96)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    targets = _multi_dispense_path(args.targets)
+    manager = MoveManager(constraints=_CONSTRAINTS)
+
+    looped, looped_plan = _time_planner(manager.plan_motion, targets, args.repeats)
+    vectorized, vectorized_plan = _time_planner(
+        manager.plan_motion_vectorized, targets, args.repeats
+    )
+    assert vectorized_plan == looped_plan, "planners produced different plans"
+
+    converged, blend_log = vectorized_plan
+    print(
+        f"{args.targets} targets, converged: {converged} "
+        f"after {len(blend_log)} iteration(s)"
+    )
+    print(f"  {'plan_motion':<24} {looped * 1e3:8.2f} ms/plan")
+    print(f"  {'plan_motion_vectorized':<24} {vectorized * 1e3:8.2f} ms/plan")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import asyncio
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict
+from typing import Optional, Callable, Tuple, Dict, List, NamedTuple, Type
 import logging
 
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -30,6 +30,22 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+class _Listener(NamedTuple):
+    """A registered listener and the messages it wants to receive."""
+
+    callback: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    message_id: Optional[MessageId]
+    originating_node_id: Optional[NodeId]
+
+    def accepts(self, message_id: int, originating_node_id: int) -> bool:
+        """Whether this listener should be dispatched messages with these ids."""
+        return (self.message_id is None or self.message_id == message_id) and (
+            self.originating_node_id is None
+            or self.originating_node_id == originating_node_id
+        )
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
@@ -45,10 +61,11 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._listeners: Dict[MessageListenerCallback, _Listener] = {}
+        # Listeners to dispatch to, keyed by (message_id, originating_node_id).
+        # Built lazily as messages arrive and cleared when listeners change.
+        self._dispatch_table: Dict[Tuple[int, int], List[_Listener]] = {}
+        self._definitions: Dict[int, Optional[Type[MessageDefinition]]] = {}
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
@@ -64,8 +81,9 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.info(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
         await self._drive.send(
             message=CanMessage(arbitration_id=arbitration_id, data=data)
@@ -104,14 +122,34 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_id: Optional[MessageId] = None,
+        originating_node_id: Optional[NodeId] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: The callback to call with each message.
+            filter: Optional function to accept or reject each message.
+            message_id: Only listen to messages with this message id.
+            originating_node_id: Only listen to messages sent by this node.
+
+        Messages that don't match `message_id` and `originating_node_id` are
+        never dispatched to the listener, so prefer them over `filter`
+        when possible.
+        """
+        self._listeners[listener] = _Listener(
+            callback=listener,
+            filter=filter,
+            message_id=message_id,
+            originating_node_id=originating_node_id,
+        )
+        self._dispatch_table.clear()
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
             del self._listeners[listener]
+            self._dispatch_table.clear()
 
     async def _read_task_shield(self) -> None:
         try:
@@ -125,24 +163,58 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
-                    log.info(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]  # noqa: E501
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+            self._handle_message(message)
+
+    def _handle_message(self, message: CanMessage) -> None:
+        """Decode a received message and dispatch it to listeners."""
+        parts = message.arbitration_id.parts
+        message_id = parts.message_id
+        message_definition = self._get_definition(message_id)
+        if message_definition:
+            try:
+                build = message_definition.payload_type.build(memoryview(message.data))
+                log.info(
+                    "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                    message.arbitration_id,
+                    build,
+                )
+                listeners = self._get_listeners(message_id, parts.originating_node_id)
+                for listener in listeners:
+                    if listener.filter and not listener.filter(message.arbitration_id):
+                        continue
+                    listener.callback(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]  # noqa: E501
+            except BinarySerializableException:
+                log.exception("Failed to build from %s", message)
+        else:
+            log.error("Message %s is not recognized.", message)
+
+    def _get_definition(self, message_id: int) -> Optional[Type[MessageDefinition]]:
+        """Get the message definition of a raw message id."""
+        try:
+            return self._definitions[message_id]
+        except KeyError:
+            try:
+                definition = get_definition(MessageId(message_id))
+            except ValueError:
+                definition = None
+            self._definitions[message_id] = definition
+            return definition
+
+    def _get_listeners(
+        self, message_id: int, originating_node_id: int
+    ) -> List[_Listener]:
+        """Get the listeners that messages with these ids should be dispatched to."""
+        key = (message_id, originating_node_id)
+        try:
+            return self._dispatch_table[key]
+        except KeyError:
+            listeners = [
+                listener
+                for listener in self._listeners.values()
+                if listener.accepts(message_id, originating_node_id)
+            ]
+            self._dispatch_table[key] = listeners
+            return listeners
 
 
 class WaitableCallback:
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 
 class BinarySerializableException(BaseException):
@@ -156,15 +167,34 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = _get_codec(type(self))
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*codec.get_values(self))
         except struct.error as e:
             raise SerializationException(str(e))
 
+    def serialize_into(self, buffer: Union[bytearray, memoryview], offset: int) -> int:
+        """Serialize into a preallocated, writable buffer.
+
+        This lets many serializables be packed back-to-back into one buffer
+        without allocating intermediate byte strings.
+
+        Args:
+            buffer: The buffer to write into.
+            offset: The position in `buffer` to start writing at.
+
+        Returns:
+            The number of bytes written.
+        """
+        codec = _get_codec(type(self))
+        try:
+            codec.struct.pack_into(buffer, offset, *codec.get_values(self))
+        except struct.error as e:
+            raise SerializationException(str(e))
+        return codec.struct.size
+
     @classmethod
-    def build(cls, data: bytes) -> BinarySerializable:
+    def build(cls, data: Union[bytes, memoryview]) -> BinarySerializable:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
@@ -175,21 +205,22 @@ class BinarySerializable:
             from a stream of bytes.
 
         Args:
-            data: Byte buffer
+            data: Byte buffer. A memoryview may be passed to avoid copying.
 
         Returns:
             cls
         """
+        codec = _get_codec(cls)
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
-            # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            values = codec.struct.unpack_from(data)
         except struct.error as e:
             raise InvalidFieldException(str(e))
+        args = {
+            name: field_type.build(value)
+            for name, field_type, value in zip(codec.names, codec.types, values)
+        }
+        # Mypy is not liking constructing the derived types.
+        return cls(**args)  # type: ignore[call-arg]
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -211,7 +242,42 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return _get_codec(cls).struct.size
+
+
+class _BinaryCodec:
+    """The precompiled packing and unpacking logic of a BinarySerializable class."""
+
+    def __init__(self, cls: Type[BinarySerializable]) -> None:
+        dataclass_fields = fields(cls)
+        self.struct = struct.Struct(cls._get_format_string())
+        self.names = tuple(f.name for f in dataclass_fields)
+        self.types: Tuple[Type[BinaryFieldBase[Any]], ...] = tuple(
+            f.type for f in dataclass_fields
+        )
+        self._get_fields: Optional[Callable[[BinarySerializable], Any]] = (
+            attrgetter(*self.names) if self.names else None
+        )
+
+    def get_values(self, obj: BinarySerializable) -> Tuple[Any, ...]:
+        """Get the raw value of every field of a serializable, in order."""
+        if self._get_fields is None:
+            return ()
+        if len(self.names) == 1:
+            return (self._get_fields(obj).value,)
+        return tuple(f.value for f in self._get_fields(obj))
+
+
+_codecs: Dict[type, _BinaryCodec] = {}
+
+
+def _get_codec(cls: Type[BinarySerializable]) -> _BinaryCodec:
+    """Get the codec of a BinarySerializable class, compiling it on first use."""
+    try:
+        return _codecs[cls]
+    except KeyError:
+        codec = _codecs[cls] = _BinaryCodec(cls)
+        return codec
 
 
 class LittleEndianMixIn:
@@ -0,0 +1,523 @@
+"""Array-based blending for a whole list of moves at once.
+
+Each function here matches one of the per-move functions in `move_utils`, but
+operates on every move of a plan at once, with one row per move and one column
+per axis. Axes are still visited one at a time and in the same order as
+`move_utils`, because the per-axis speed limits are applied in sequence.
+"""
+import dataclasses
+import logging
+from typing import Generic, List, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstraintArrays:
+    """Axis constraints, with one element per axis."""
+
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+    ) -> "ConstraintArrays":
+        """Build ConstraintArrays for the given axes, in order."""
+        return cls(
+            max_acceleration=np.array(
+                [constraints[axis].max_acceleration for axis in axes], dtype=np.float64
+            ),
+            max_speed_discont=np.array(
+                [constraints[axis].max_speed_discont for axis in axes], dtype=np.float64
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[axis].max_direction_change_speed_discont for axis in axes],
+                dtype=np.float64,
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class BlockArrays:
+    """The three blocks of every move, with one row per move.
+
+    `built_distance` is the distance each block was built with. When
+    `move_utils.build_blocks` has to trim a move's top speed, it only updates
+    the distances of blocks it has already built, so their speeds and times
+    still come from `built_distance`.
+    """
+
+    distance: "NDArray[np.float64]"
+    built_distance: "NDArray[np.float64]"
+    initial_speed: "NDArray[np.float64]"
+    acceleration: "NDArray[np.float64]"
+    final_speed: "NDArray[np.float64]"
+
+
+@dataclasses.dataclass(frozen=True)
+class MoveArrays(Generic[AxisKey]):
+    """Every move of a plan, with one row per move."""
+
+    axes: List[AxisKey]
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    initial_speeds: "NDArray[np.float64]"
+    final_speeds: "NDArray[np.float64]"
+    blocks: "BlockArrays"
+
+    def to_moves(self) -> List[Move[AxisKey]]:
+        """Create a Move for every row."""
+        blocks = self.blocks
+        return [
+            Move(
+                unit_vector=dict(zip(self.axes, unit_vector)),
+                distance=distance,
+                max_speed=max_speed,
+                blocks=(
+                    _build_block(blocks, i, 0),
+                    _build_block(blocks, i, 1),
+                    _build_block(blocks, i, 2),
+                ),
+            )
+            for i, (unit_vector, distance, max_speed) in enumerate(
+                zip(self.unit_vectors, self.distances, self.max_speeds)
+            )
+        ]
+
+    @property
+    def nonzero_blocks(self) -> int:
+        """Get the number of blocks that take any time to run."""
+        blocks = self.blocks
+        with np.errstate(divide="ignore", invalid="ignore"):
+            time = np.where(
+                blocks.acceleration != 0,
+                (blocks.final_speed - blocks.initial_speed) / blocks.acceleration,
+                np.where(
+                    blocks.initial_speed != 0,
+                    blocks.built_distance / blocks.initial_speed,
+                    0.0,
+                ),
+            )
+        return int(np.count_nonzero(time))
+
+
+def _build_block(blocks: BlockArrays, move: int, block: int) -> Block:
+    built = Block(
+        distance=blocks.built_distance[move, block],
+        initial_speed=blocks.initial_speed[move, block],
+        acceleration=blocks.acceleration[move, block],
+    )
+    built.distance = blocks.distance[move, block]
+    return built
+
+
+def _norms(vectors: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the magnitude of every row.
+
+    This takes each row's dot product with itself, the same way that
+    np.linalg.norm does for a single vector, so that the results match
+    move_utils exactly.
+    """
+    return np.sqrt(  # type: ignore[no-any-return]
+        np.matmul(vectors[:, np.newaxis, :], vectors[:, :, np.newaxis])[:, 0, 0]
+    )
+
+
+def _square(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Square every element.
+
+    Squaring an array with `**` multiplies each element by itself, which can
+    round differently from squaring an np.float64 scalar with `**`.
+    """
+    return np.power(values, 2.0)  # type: ignore[no-any-return]
+
+
+def _shift(
+    values: "NDArray[np.float64]", by: int, fill: float = 0.0
+) -> "NDArray[np.float64]":
+    """Shift rows down (by=1) or up (by=-1), filling in the vacated row."""
+    shifted = np.full_like(values, fill)
+    if by > 0:
+        shifted[by:] = values[:-by]
+    else:
+        shifted[:by] = values[-by:]
+    return shifted
+
+
+def targets_to_move_arrays(
+    initial: Coordinates[AxisKey, CoordinateValue], targets: List[MoveTarget[AxisKey]]
+) -> MoveArrays[AxisKey]:
+    """Transform a list of MoveTargets into MoveArrays, like targets_to_moves."""
+    all_axes: Set[AxisKey] = set()
+    for target in targets:
+        all_axes.update(set(target.position.keys()))
+    axes = list(all_axes)
+
+    positions = np.array(
+        [[np.float64(initial.get(k, 0)) for k in axes]]
+        + [[np.float64(target.position.get(k, 0)) for k in axes] for target in targets],
+        dtype=np.float64,
+    )
+    displacements = positions[1:] - positions[:-1]
+    distances = _norms(displacements)
+
+    for i in np.flatnonzero(distances == 0)[:1]:
+        raise ZeroLengthMoveError(
+            dict(zip(axes, positions[i])), dict(zip(axes, positions[i + 1]))
+        )
+
+    unit_vectors = displacements / distances[:, np.newaxis]
+    max_speeds = np.array([target.max_speed for target in targets], dtype=np.float64)
+
+    # every move starts as three constant speed blocks at its max speed
+    third_distances = np.repeat(distances[:, np.newaxis] / 3, 3, axis=1)
+    speeds = np.repeat(max_speeds[:, np.newaxis], 3, axis=1)
+
+    return MoveArrays(
+        axes=axes,
+        unit_vectors=unit_vectors,
+        distances=distances,
+        max_speeds=max_speeds,
+        initial_speeds=max_speeds,
+        final_speeds=max_speeds,
+        blocks=BlockArrays(
+            distance=third_distances,
+            built_distance=third_distances,
+            initial_speed=speeds,
+            acceleration=np.zeros_like(speeds),
+            final_speed=speeds,
+        ),
+    )
+
+
+def find_initial_speeds(
+    constraints: ConstraintArrays, moves: MoveArrays[AxisKey]
+) -> "NDArray[np.float64]":
+    """Get every move's initial speed, like find_initial_speed."""
+    initial_speeds = moves.initial_speeds
+    prev_components = np.where(
+        _shift(moves.distances, 1)[:, np.newaxis] > FLOAT_THRESHOLD,
+        _shift(moves.unit_vectors, 1),
+        0.0,
+    )
+    prev_final_speeds = _shift(moves.final_speeds, 1)
+
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        axis_prev_components = prev_components[:, axis]
+        moving = ~(np.abs(axis_components * initial_speeds) < FLOAT_THRESHOLD)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            axis_constrained_speeds = np.where(
+                (axis_prev_components == 0) | (prev_final_speeds == 0),
+                np.abs(constraints.max_speed_discont[axis] / axis_components),
+                np.where(
+                    axis_prev_components * axis_components > 0,
+                    np.abs(
+                        np.maximum(
+                            np.abs(prev_final_speeds * axis_prev_components),
+                            constraints.max_speed_discont[axis],
+                        )
+                        / axis_components
+                    ),
+                    np.abs(
+                        constraints.max_direction_change_speed_discont[axis]
+                        / axis_components
+                    ),
+                ),
+            )
+
+        initial_speeds = np.where(
+            moving, np.minimum(axis_constrained_speeds, initial_speeds), initial_speeds
+        )
+
+    return initial_speeds
+
+
+def find_final_speeds(
+    constraints: ConstraintArrays, moves: MoveArrays[AxisKey]
+) -> "NDArray[np.float64]":
+    """Get every move's final speed, like find_final_speed."""
+    final_speeds = moves.final_speeds
+    next_components = np.where(
+        _shift(moves.distances, -1)[:, np.newaxis] > FLOAT_THRESHOLD,
+        _shift(moves.unit_vectors, -1),
+        0.0,
+    )
+    next_initial_speeds = _shift(moves.initial_speeds, -1)
+
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        axis_next_components = next_components[:, axis]
+        moving = ~(np.abs(axis_components * final_speeds) < FLOAT_THRESHOLD)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            axis_speed_limits = np.where(
+                (axis_next_components == 0) | (next_initial_speeds == 0),
+                np.abs(constraints.max_speed_discont[axis] / axis_components),
+                np.where(
+                    axis_next_components * axis_components > 0,
+                    np.abs(
+                        np.maximum(
+                            constraints.max_speed_discont[axis],
+                            np.abs(next_initial_speeds * axis_next_components),
+                        )
+                        / axis_components
+                    ),
+                    np.abs(
+                        constraints.max_direction_change_speed_discont[axis]
+                        / axis_components
+                    ),
+                ),
+            )
+
+        final_speeds = np.where(
+            moving, np.minimum(axis_speed_limits, final_speeds), final_speeds
+        )
+
+    return final_speeds
+
+
+def achievable_finals(
+    constraints: ConstraintArrays,
+    moves: MoveArrays[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Limit every move's final speed to what is achievable, like achievable_final."""
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        max_axis_final_velocity_sq = (
+            _square(initial_speeds * axis_components)
+            + 2 * constraints.max_acceleration[axis] * moves.distances
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_axis_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_axis_final_velocity_sq) / axis_components,
+                    final_speeds - initial_speeds,
+                )
+                + initial_speeds
+            )
+
+        final_speeds = np.where(
+            axis_components != 0,
+            np.copysign(
+                np.minimum(np.abs(max_axis_final_velocity), np.abs(final_speeds)),
+                final_speeds,
+            ),
+            final_speeds,
+        )
+
+    return final_speeds
+
+
+def build_block_arrays(
+    constraints: ConstraintArrays,
+    moves: MoveArrays[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> BlockArrays:
+    """Build the blocks of every move, like build_blocks."""
+    distances = moves.distances
+    max_speeds = moves.max_speeds
+    assert np.all(
+        (np.abs(initial_speeds) <= max_speeds)
+        | np.isclose(np.abs(initial_speeds), max_speeds)
+    ), f"initial speeds {initial_speeds} exceed max speeds {max_speeds}"
+    assert np.all(
+        (np.abs(final_speeds) <= max_speeds)
+        | np.isclose(np.abs(final_speeds), max_speeds)
+    ), f"final speeds {final_speeds} exceed max speeds {max_speeds}"
+
+    max_acc = np.where(
+        moves.unit_vectors != 0, constraints.max_acceleration[np.newaxis, :], 0.0
+    )
+    max_acc_magnitude = _norms(max_acc)
+    acc_v = max_acc_magnitude[:, np.newaxis] * moves.unit_vectors
+
+    for axis in range(len(moves.axes)):
+        a_i = acc_v[:, axis]
+        over = np.abs(a_i) > max_acc[:, axis]
+        acc_v[over] *= (max_acc[over, axis] / a_i[over])[:, np.newaxis]
+    max_acceleration = _norms(acc_v)
+
+    initial_speed_sq = _square(initial_speeds)
+    final_speed_sq = _square(final_speeds)
+
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = _square(np.minimum(max_achievable_speed, max_speeds))
+
+    first_distance = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    top_speed = np.sqrt(initial_speed_sq + max_acceleration * first_distance * 2)
+    final_distance = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    end_speed = np.sqrt(_square(top_speed) - max_acceleration * final_distance * 2)
+    built_first_distance = first_distance
+    built_final_distance = final_distance
+
+    # trim down the top speed of moves that went too far; see build_blocks
+    trim = first_distance + final_distance > distances
+    trimmed_max_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distance = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distance,
+    )
+    final_distance = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        final_distance,
+    )
+
+    coast = first_distance + final_distance < distances
+    coast_distance = np.where(coast, distances - first_distance - final_distance, 0.0)
+    coast_speed = np.where(coast, top_speed, 0.0)
+
+    zeros = np.zeros_like(distances)
+    return BlockArrays(
+        distance=np.stack([first_distance, coast_distance, final_distance], axis=1),
+        built_distance=np.stack(
+            [built_first_distance, coast_distance, built_final_distance], axis=1
+        ),
+        initial_speed=np.stack([initial_speeds, coast_speed, top_speed], axis=1),
+        acceleration=np.stack([max_acceleration, zeros, -max_acceleration], axis=1),
+        final_speed=np.stack(
+            [top_speed, np.sqrt(_square(coast_speed)), end_speed], axis=1
+        ),
+    )
+
+
+def _first_nonzero(
+    blocks: BlockArrays, values: "NDArray[np.float64]", reverse: bool
+) -> "NDArray[np.float64]":
+    """Pick each move's value from its first (or last) block that has distance."""
+    result = np.zeros(values.shape[0], dtype=np.float64)
+    order = (0, 1, 2) if reverse else (2, 1, 0)
+    for block in order:
+        result = np.where(blocks.distance[:, block] != 0, values[:, block], result)
+    return result
+
+
+def build_moves(
+    constraints: ConstraintArrays, moves: MoveArrays[AxisKey]
+) -> MoveArrays[AxisKey]:
+    """Run one blending pass over every move, like build_move."""
+    initial_speeds = find_initial_speeds(constraints, moves)
+    final_speeds = find_final_speeds(constraints, moves)
+    final_speeds = achievable_finals(constraints, moves, initial_speeds, final_speeds)
+    blocks = build_block_arrays(constraints, moves, initial_speeds, final_speeds)
+
+    return dataclasses.replace(
+        moves,
+        initial_speeds=_first_nonzero(blocks, blocks.initial_speed, reverse=False),
+        final_speeds=_first_nonzero(blocks, blocks.final_speed, reverse=True),
+        blocks=blocks,
+    )
+
+
+def _less_or_close(
+    constraint: np.float64, values: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    return (np.abs(values) <= constraint) | np.isclose(  # type: ignore[no-any-return]
+        values, constraint
+    )
+
+
+def all_blended(constraints: ConstraintArrays, moves: MoveArrays[AxisKey]) -> bool:
+    """Check if consecutive moves are all blended, like move_utils.all_blended."""
+    if len(moves.distances) < 2:
+        return True
+
+    distance_sums = moves.blocks.distance.sum(axis=1)
+    distance_mismatch = (
+        np.abs(distance_sums - moves.distances) > FLOAT_THRESHOLD
+    ) | ~np.isclose(distance_sums, moves.distances)
+    if np.any(distance_mismatch):
+        log.debug(
+            f"Sum of block distances does not match for moves {distance_mismatch}"
+        )
+        return False
+
+    first_unit_vectors = moves.unit_vectors[:-1]
+    second_unit_vectors = moves.unit_vectors[1:]
+    junction_final_speeds = moves.blocks.final_speed[:-1, -1]
+    junction_initial_speeds = moves.blocks.initial_speed[1:, 0]
+
+    for axis in range(len(moves.axes)):
+        final_speeds = junction_final_speeds * first_unit_vectors[:, axis]
+        initial_speeds = junction_initial_speeds * second_unit_vectors[:, axis]
+        same_direction = first_unit_vectors[:, axis] * second_unit_vectors[:, axis] > 0
+        matching = np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD
+
+        under_discont = np.logical_or(
+            _less_or_close(constraints.max_speed_discont[axis], final_speeds),
+            _less_or_close(constraints.max_speed_discont[axis], initial_speeds),
+        )
+        under_direction_change_discont = np.logical_or(
+            _less_or_close(
+                constraints.max_direction_change_speed_discont[axis], final_speeds
+            ),
+            _less_or_close(
+                constraints.max_direction_change_speed_discont[axis], initial_speeds
+            ),
+        )
+
+        if np.any(
+            np.where(
+                same_direction,
+                np.logical_not(np.logical_or(matching, under_discont)),
+                np.logical_not(under_direction_change_discont),
+            )
+        ):
+            log.debug(f"Junction speeds for {moves.axes[axis]} are not blended")
+            return False
+
+    return True
+
+
+def plan_blends(
+    constraints: SystemConstraints[AxisKey],
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    iteration_limit: int,
+) -> Tuple[bool, List[MoveArrays[AxisKey]]]:
+    """Blend moves from targets, returning the moves after every iteration."""
+    moves = targets_to_move_arrays(origin, target_list)
+    constraint_arrays = ConstraintArrays.build(constraints, moves.axes)
+    blend_log: List[MoveArrays[AxisKey]] = []
+    for i in range(iteration_limit):
+        log.debug(f"Motion blending iteration: {i}")
+        moves = build_moves(constraint_arrays, moves)
+        blend_log.append(moves)
+        if all_blended(constraint_arrays, moves):
+            log.info(
+                f"built {len(moves.distances)} moves with "
+                f"{moves.nonzero_blocks} non-zero blocks after {i+1} iteration(s)"
+            )
+            return True, blend_log
+    return False, blend_log
@@ -1,7 +1,7 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import move_arrays, move_utils
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -93,3 +93,29 @@ class MoveManager(Generic[AxisKey]):
                 to_blend = self._blend_log[-1]
         log.error("Could not converge!")
         return False, self._blend_log
+
+    def plan_motion_vectorized(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int = 10,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+        """Create and blend moves from targets, blending all moves at once.
+
+        This produces the same plan as `plan_motion`, but each iteration is
+        computed with array math over the whole target list, which is much
+        faster for long multi-target paths.
+        """
+        self._clear_blend_log()
+        assert target_list, "Check target list"
+        converged, blend_log = move_arrays.plan_blends(
+            self._constraints, origin, target_list, iteration_limit
+        )
+        self._blend_log = [moves.to_moves() for moves in blend_log]
+        # like plan_motion, keep the dummy moves of every unconverged iteration
+        unconverged = len(blend_log) - 1 if converged else len(blend_log)
+        for i in range(unconverged):
+            self._blend_log[i] = self._add_dummy_start_end_to_moves(self._blend_log[i])
+        if not converged:
+            log.error("Could not converge!")
+        return converged, self._blend_log
@@ -281,4 +281,5 @@ def is_unit_vector(position: Coordinates[AxisKey, np.float64]) -> bool:
     """Check whether a coordinate vector has unit magnitude."""
     vectorized = vectorize(position)
     magnitude = np.linalg.norm(vectorized)  # type: ignore[no-untyped-call]
-    return cast(bool, np.isclose(magnitude, 1.0))
+    # the same check as np.isclose(magnitude, 1.0), without its array overhead
+    return bool(abs(magnitude - 1.0) <= 1e-08 + 1e-05)
@@ -77,6 +77,12 @@ def main() -> None:
         default="last",
         help="output the last list or all of the blend log",
     )
+    parser.add_argument(
+        "--vectorized",
+        "-v",
+        action="store_true",
+        help="plan with array math over the whole target list",
+    )
     args = parser.parse_args()
 
     if args.debug:
@@ -103,7 +109,10 @@ def main() -> None:
     ]
 
     manager = move_manager.MoveManager(constraints=constraints)
-    _, blend_log = manager.plan_motion(
+    plan_motion = (
+        manager.plan_motion_vectorized if args.vectorized else manager.plan_motion
+    )
+    _, blend_log = plan_motion(
         origin=origin,
         target_list=target_list,
         iteration_limit=params["iteration_limit"],
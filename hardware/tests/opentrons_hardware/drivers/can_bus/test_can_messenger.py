@@ -214,3 +214,98 @@ async def test_waitable_callback_context_with_filter() -> None:
     with WaitableCallback(mock_messenger, some_func) as callback:
         mock_messenger.add_listener.assert_called_once_with(callback, some_func)
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _make_get_move_group_request(originating_node_id: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.get_move_group_request,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=b"\1",
+    )
+
+
+@pytest.mark.parametrize(
+    "message_id,originating_node_id,expect_called",
+    [
+        [MessageId.get_move_group_request, None, True],
+        [MessageId.get_move_group_request, NodeId.gantry_x, True],
+        [None, NodeId.gantry_x, True],
+        [MessageId.get_move_group_request, NodeId.gantry_y, False],
+        [MessageId.move_completed, None, False],
+    ],
+)
+def test_dispatch_by_ids(
+    subject: CanMessenger,
+    message_id: MessageId,
+    originating_node_id: NodeId,
+    expect_called: bool,
+) -> None:
+    """It should only dispatch messages matching a listener's ids."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        message_id=message_id,
+        originating_node_id=originating_node_id,
+    )
+
+    subject._handle_message(_make_get_move_group_request(NodeId.gantry_x))
+
+    assert listener.called is expect_called
+
+
+def test_dispatch_after_listener_changes(subject: CanMessenger) -> None:
+    """It should dispatch to the current listeners after listeners change."""
+    listener_1 = Mock(spec=MessageListenerCallback)
+    listener_2 = Mock(spec=MessageListenerCallback)
+
+    subject.add_listener(listener_1, message_id=MessageId.get_move_group_request)
+    subject._handle_message(_make_get_move_group_request(NodeId.gantry_x))
+
+    subject.add_listener(listener_2)
+    subject.remove_listener(listener_1)
+    subject._handle_message(_make_get_move_group_request(NodeId.gantry_x))
+
+    assert listener_1.call_count == 1
+    assert listener_2.call_count == 1
+
+
+def test_listener_removes_itself(subject: CanMessenger) -> None:
+    """It should allow a listener to remove itself while being dispatched to."""
+    listener_2 = Mock(spec=MessageListenerCallback)
+
+    def _listener_1(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+        subject.remove_listener(_listener_1)
+
+    subject.add_listener(_listener_1)
+    subject.add_listener(listener_2)
+    subject._handle_message(_make_get_move_group_request(NodeId.gantry_x))
+
+    listener_2.assert_called_once()
+
+
+def test_unknown_message_id(subject: CanMessenger) -> None:
+    """It should not dispatch messages with unknown message ids."""
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener)
+
+    subject._handle_message(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=0x7FF,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x,
+                )
+            ),
+            data=b"",
+        )
+    )
+
+    listener.assert_not_called()
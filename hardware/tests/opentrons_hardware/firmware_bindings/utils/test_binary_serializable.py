@@ -0,0 +1,104 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int16Field
+    third: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int16Field
+    third: utils.UInt32Field
+
+
+@dataclass
+class _SingleFieldPayload(utils.BinarySerializable):
+    only: utils.UInt16Field
+
+
+@dataclass
+class _EmptyPayload(utils.BinarySerializable):
+    pass
+
+
+_PAYLOAD = _Payload(
+    first=utils.UInt8Field(1),
+    second=utils.Int16Field(-2),
+    third=utils.UInt32Field(3),
+)
+_PAYLOAD_BYTES = b"\x01\xff\xfe\x00\x00\x00\x03"
+
+
+def test_serialize() -> None:
+    """It should serialize fields in order, big endian."""
+    assert _PAYLOAD.serialize() == _PAYLOAD_BYTES
+    assert _Payload.get_size() == len(_PAYLOAD_BYTES)
+
+
+def test_serialize_little_endian() -> None:
+    """It should serialize little endian payloads."""
+    subject = _LittleEndianPayload(
+        first=utils.UInt8Field(1),
+        second=utils.Int16Field(-2),
+        third=utils.UInt32Field(3),
+    )
+    assert subject.serialize() == b"\x01\xfe\xff\x03\x00\x00\x00"
+
+
+@pytest.mark.parametrize(
+    argnames=["subject", "expected"],
+    argvalues=[
+        [_SingleFieldPayload(only=utils.UInt16Field(0x1234)), b"\x12\x34"],
+        [_EmptyPayload(), b""],
+    ],
+)
+def test_serialize_few_fields(
+    subject: utils.BinarySerializable, expected: bytes
+) -> None:
+    """It should serialize payloads with one or zero fields."""
+    assert subject.serialize() == expected
+    assert type(subject).build(expected) == subject
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a value doesn't fit its field."""
+    subject = _SingleFieldPayload(only=utils.UInt16Field(0x10000))
+
+    with pytest.raises(utils.BinarySerializableException):
+        subject.serialize()
+
+
+def test_serialize_into() -> None:
+    """It should pack many payloads back-to-back into one buffer."""
+    size = _Payload.get_size()
+    buffer = bytearray(1 + 2 * size)
+
+    assert _PAYLOAD.serialize_into(buffer, 1) == size
+    assert _PAYLOAD.serialize_into(buffer, 1 + size) == size
+    assert buffer == b"\x00" + _PAYLOAD_BYTES + _PAYLOAD_BYTES
+
+
+def test_build() -> None:
+    """It should build from bytes, ignoring extra bytes."""
+    assert _Payload.build(_PAYLOAD_BYTES + b"\x00\x00") == _PAYLOAD
+
+
+def test_build_memoryview() -> None:
+    """It should build from a slice of a memoryview without copying."""
+    data = memoryview(b"\x00" + _PAYLOAD_BYTES)
+    assert _Payload.build(data[1:]) == _PAYLOAD
+
+
+def test_build_too_short() -> None:
+    """It should raise if there are not enough bytes."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.build(_PAYLOAD_BYTES[:-1])
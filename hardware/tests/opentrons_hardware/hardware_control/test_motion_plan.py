@@ -1,5 +1,6 @@
 """Tests for motion planning."""
 import numpy as np
+import pytest
 from hypothesis import given, assume, strategies as st
 from hypothesis.extra import numpy as hynp
 from typing import Iterator, List
@@ -10,6 +11,7 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     MoveTarget,
     SystemConstraints,
+    ZeroLengthMoveError,
     vectorize,
 )
 
@@ -187,3 +189,66 @@ def test_close_move_plan(
     )
 
     assert converged
+
+
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    targets=generate_target_list(),
+)
+def test_vectorized_move_plan(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> None:
+    """The vectorized planner should make the same plan as plan_motion."""
+    assume(reject_close_coordinates(origin, targets[0].position))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    expected = manager.plan_motion(
+        origin=origin,
+        target_list=targets,
+        iteration_limit=20,
+    )
+    result = manager.plan_motion_vectorized(
+        origin=origin,
+        target_list=targets,
+        iteration_limit=20,
+    )
+
+    assert result == expected
+
+
+def test_vectorized_move_plan_zero_length() -> None:
+    """The vectorized planner should reject moves to where it already is."""
+    origin = {"X": np.float64(0), "Y": np.float64(0)}
+    targets = [
+        MoveTarget.build({"X": 10, "Y": 0}, 10),
+        MoveTarget.build({"X": 10, "Y": 0}, 10),
+    ]
+    manager = move_manager.MoveManager(
+        constraints={
+            "X": AxisConstraints.build(1000, 10, 5),
+            "Y": AxisConstraints.build(1000, 10, 5),
+        }
+    )
+
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion_vectorized(origin=origin, target_list=targets)
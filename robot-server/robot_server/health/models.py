@@ -29,6 +29,20 @@ class HealthLinks(BaseModel):
     )
 
 
+class HealthAnalysisCache(BaseModel):
+    """How often protocol analyses have been reused since the server started."""
+
+    hits: int = Field(
+        ...,
+        description="Analyses reused from an earlier analysis of an identical"
+        " protocol, without simulating the protocol again",
+    )
+    misses: int = Field(
+        ...,
+        description="Analyses that had to simulate their protocol",
+    )
+
+
 class Health(BaseModel):
     """Information about the server and system."""
 
@@ -77,6 +91,10 @@ class Health(BaseModel):
         min_items=2,
         max_items=2,
     )
+    analysis_cache: HealthAnalysisCache = Field(
+        ...,
+        description="How often protocol analyses have been reused",
+    )
     links: HealthLinks
 
     class Config:
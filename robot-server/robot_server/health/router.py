@@ -6,8 +6,10 @@ from opentrons.hardware_control import HardwareControlAPI
 from opentrons.config.feature_flags import enable_ot3_hardware_controller
 
 from robot_server.hardware import get_hardware
+from robot_server.protocols.analysis_cache import AnalysisCacheStats
+from robot_server.protocols.dependencies import get_analysis_cache_stats
 from robot_server.service.legacy.models import V1BasicResponse
-from .models import Health, HealthLinks
+from .models import Health, HealthAnalysisCache, HealthLinks
 
 
 LOG_PATHS = ["/logs/serial.log", "/logs/api.log", "/logs/server.log"]
@@ -28,7 +30,10 @@ health_router = APIRouter()
         }
     },
 )
-async def get_health(hardware: HardwareControlAPI = Depends(get_hardware)) -> Health:
+async def get_health(
+    hardware: HardwareControlAPI = Depends(get_hardware),
+    analysis_cache_stats: AnalysisCacheStats = Depends(get_analysis_cache_stats),
+) -> Health:
     """Get information about the health of the robot server.
 
     Use the health endpoint to check that the robot server is running
@@ -47,6 +52,10 @@ async def get_health(hardware: HardwareControlAPI = Depends(get_hardware)) -> He
         robot_model="OT-3 Standard"
         if enable_ot3_hardware_controller()
         else "OT-2 Standard",
+        analysis_cache=HealthAnalysisCache(
+            hits=analysis_cache_stats.hits,
+            misses=analysis_cache_stats.misses,
+        ),
         links=HealthLinks(
             apiLog="/logs/api.log",
             serialLog="/logs/serial.log",
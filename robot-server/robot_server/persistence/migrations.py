@@ -23,6 +23,11 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - Commands moved out of `run_table.commands` into `run_command_table`
+- Version 3
+    - `analysis_table.cache_key` column added
 """
 import logging
 from datetime import datetime, timezone
@@ -31,9 +36,9 @@ from typing_extensions import Final
 
 import sqlalchemy
 
-from .tables import migration_table, run_table
+from .tables import migration_table, run_table, run_command_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 3
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +58,10 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +139,52 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    This migration moves each run's pickled list of commands
+    out of `run_table.commands` and into one `run_command_table` row
+    per command. The `run_command` table itself will have already been
+    created by SQLAlchemy.
+    """
+    select_run_commands = sqlalchemy.select(
+        run_table.c.id,
+        run_table.c.commands,
+    ).where(run_table.c.commands.is_not(None))
+
+    for run_row in transaction.execute(select_run_commands).all():
+        command_rows = [
+            {
+                "run_id": run_row.id,
+                "index_in_run": index,
+                "command_id": command["id"],
+                "command": command,
+            }
+            for index, command in enumerate(run_row.commands)
+        ]
+
+        if len(command_rows) > 0:
+            transaction.execute(sqlalchemy.insert(run_command_table), command_rows)
+
+    transaction.execute(sqlalchemy.update(run_table).values(commands=None))
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration adds the following nullable, indexed column to the analysis table:
+
+    - Column("cache_key", sqlalchemy.String, index=True, nullable=True)
+
+    Analyses stored before this migration have no cache key,
+    so they're never reused for new protocols.
+    """
+    add_cache_key_column = sqlalchemy.text("ALTER TABLE analysis ADD cache_key VARCHAR")
+    add_cache_key_index = sqlalchemy.text(
+        "CREATE INDEX ix_analysis_cache_key ON analysis (cache_key)"
+    )
+
+    transaction.execute(add_cache_key_column)
+    transaction.execute(add_cache_key_index)
@@ -60,6 +60,15 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v3
+    # A hash of everything that went into the analysis,
+    # so it can be reused for identical protocols.
+    sqlalchemy.Column(
+        "cache_key",
+        sqlalchemy.String,
+        index=True,
+        nullable=True,
+    ),
 )
 
 
@@ -86,6 +95,8 @@ run_table = sqlalchemy.Table(
     # column added in schema v1
     sqlalchemy.Column("state_summary", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
+    # NOTE: As of schema v2, commands are stored in `run_command_table`.
+    # This column is left in place, but is always NULL.
     sqlalchemy.Column("commands", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
     sqlalchemy.Column("engine_status", sqlalchemy.String, nullable=True),
@@ -116,6 +127,33 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        primary_key=True,
+    ),
+    # The command's position in the run's list of commands.
+    sqlalchemy.Column(
+        "index_in_run",
+        sqlalchemy.Integer,
+        primary_key=True,
+        autoincrement=False,
+    ),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("command", sqlalchemy.PickleType, nullable=False),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_command_id",
+        "run_id",
+        "command_id",
+        unique=True,
+    ),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
@@ -1,6 +1,8 @@
 """Protocol file upload and management."""
 from .router import protocols_router, ProtocolNotFound
-from .dependencies import get_protocol_store
+from .dependencies import get_protocol_store, get_analysis_store
+from .analysis_store import AnalysisStore
+from .analysis_models import CompletedAnalysis
 from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
 
 __all__ = [
@@ -13,4 +15,8 @@ __all__ = [
     "ProtocolStore",
     "ProtocolResource",
     "ProtocolNotFoundError",
+    # analysis state management
+    "get_analysis_store",
+    "AnalysisStore",
+    "CompletedAnalysis",
 ]
@@ -0,0 +1,81 @@
+"""Cache keys for reusing protocol analyses."""
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from opentrons import __version__ as opentrons_version
+from opentrons.config import CONFIG, feature_flags
+from opentrons.protocol_reader import ProtocolSource
+
+
+@dataclass(frozen=True)
+class AnalysisCacheStats:
+    """How often analyses have been reused instead of simulated.
+
+    Attributes:
+        hits: Analyses copied from an earlier analysis with the same cache key.
+        misses: Analyses that had to be simulated.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+def compute_cache_key(source: ProtocolSource) -> str:
+    """Compute a key that's equal for any two protocols that analyze identically.
+
+    The key is a hash of everything on the robot that an analysis depends on:
+
+    * The protocol's files, by name, role, and contents.
+    * The installed `opentrons` version, which covers the built-in labware and
+      pipette definitions, and the simulator itself.
+    * The feature flags that change how analyses are simulated.
+    * The robot settings, custom labware definitions, and pipette config
+      overrides stored on the robot.
+
+    This reads files from disk, so avoid calling it from the event loop.
+    """
+    key = hashlib.sha256()
+
+    def _update(*parts: object) -> None:
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode()
+            # Length-prefix every part so that adjacent parts can't run together.
+            key.update(len(data).to_bytes(8, "big"))
+            key.update(data)
+
+    _update("opentrons", opentrons_version)
+    _update(
+        "feature_flags",
+        feature_flags.enable_ot3_hardware_controller(),
+        feature_flags.disable_fast_protocol_upload(),
+    )
+
+    for protocol_file in sorted(source.files, key=lambda f: f.path.name):
+        _update("protocol_file", protocol_file.path.name, protocol_file.role.value)
+        _update(protocol_file.path.read_bytes())
+
+    for name, path in _robot_config_files():
+        _update("robot_config_file", name)
+        _update(path.read_bytes())
+
+    return key.hexdigest()
+
+
+def _robot_config_files() -> Iterator[Tuple[str, Path]]:
+    """Yield the name and path of every robot config file that affects analysis."""
+    robot_settings_file = Path(CONFIG["robot_settings_file"])
+
+    if robot_settings_file.is_file():
+        yield "robot_settings", robot_settings_file
+
+    for config_name in (
+        "labware_user_definitions_dir_v2",
+        "pipette_config_overrides_dir",
+    ):
+        config_dir = Path(CONFIG[config_name])
+
+        if config_dir.is_dir():
+            for path in sorted(p for p in config_dir.rglob("*") if p.is_file()):
+                yield f"{config_name}/{path.relative_to(config_dir)}", path
@@ -2,7 +2,7 @@
 # TODO(mc, 2021-08-25): add modules to simulation result
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Union
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import (
@@ -20,6 +20,18 @@ class AnalysisStatus(str, Enum):
     COMPLETED = "completed"
 
 
+class AnalysisQueueStatus(str, Enum):
+    """Where a pending analysis is in the analysis queue.
+
+    Properties:
+        QUEUED: The analysis is waiting for a free analysis worker.
+        RUNNING: The analysis is running in an analysis worker.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+
+
 class AnalysisResult(str, Enum):
     """Result of a completed protocol analysis.
 
@@ -40,6 +52,25 @@ class AnalysisSummary(BaseModel):
 
     id: str = Field(..., description="Unique identifier of this analysis resource")
     status: AnalysisStatus = Field(..., description="Status of the analysis")
+    queueStatus: Optional[AnalysisQueueStatus] = Field(
+        None,
+        description="If the analysis is pending, where it is in the analysis queue",
+    )
+    queuePosition: Optional[int] = Field(
+        None,
+        description=(
+            "If the analysis is queued, how many analyses are ahead of it"
+            " in the analysis queue"
+        ),
+    )
+    result: Optional[AnalysisResult] = Field(
+        None,
+        description="If the analysis is completed, whether it found any problems",
+    )
+    errors: Optional[List[ErrorOccurrence]] = Field(
+        None,
+        description="If the analysis is completed, the errors it found",
+    )
 
 
 class PendingAnalysis(BaseModel):
@@ -50,6 +81,17 @@ class PendingAnalysis(BaseModel):
         AnalysisStatus.PENDING,
         description="Status marking the analysis as pending",
     )
+    queueStatus: Optional[AnalysisQueueStatus] = Field(
+        None,
+        description="Where the analysis is in the analysis queue",
+    )
+    queuePosition: Optional[int] = Field(
+        None,
+        description=(
+            "If the analysis is queued, how many analyses are ahead of it"
+            " in the queue"
+        ),
+    )
 
 
 class CompletedAnalysis(BaseModel):
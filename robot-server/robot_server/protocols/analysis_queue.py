@@ -0,0 +1,184 @@
+"""A first-in, first-out queue of protocol analyses."""
+import asyncio
+from collections import OrderedDict
+from functools import partial
+from logging import getLogger
+from typing import Dict, NamedTuple, Optional
+
+from .analysis_models import AnalysisQueueStatus, AnalysisStatus, AnalysisSummary
+from .analysis_store import AnalysisStore
+from .protocol_analyzer import ProtocolAnalyzer
+from .protocol_store import ProtocolResource
+
+
+_log = getLogger(__name__)
+
+
+class _QueuedAnalysis(NamedTuple):
+    protocol_resource: ProtocolResource
+    analysis_id: str
+    cache_key: Optional[str]
+
+
+class _RunningAnalysis(NamedTuple):
+    analysis_id: str
+    task: "asyncio.Task[None]"
+
+
+class AnalysisQueue:
+    """Run protocol analyses in the order they were added, a few at a time.
+
+    Every analysis in the queue is pending in the `AnalysisStore`, which is
+    kept up to date with where each analysis is in the queue. A protocol has
+    at most one pending analysis, so analyses are tracked by protocol ID.
+    """
+
+    def __init__(
+        self,
+        protocol_analyzer: ProtocolAnalyzer,
+        analysis_store: AnalysisStore,
+        max_running: int,
+    ) -> None:
+        """Initialize the queue and its dependencies.
+
+        Args:
+            protocol_analyzer: The analyzer to run analyses with.
+            analysis_store: The store to keep pending analyses in.
+            max_running: How many analyses to run at once.
+        """
+        self._protocol_analyzer = protocol_analyzer
+        self._analysis_store = analysis_store
+        self._max_running = max_running
+        self._queued: "OrderedDict[str, _QueuedAnalysis]" = OrderedDict()
+        self._running: Dict[str, _RunningAnalysis] = {}
+        self._closed = False
+
+    async def add(
+        self,
+        protocol_resource: ProtocolResource,
+        analysis_id: str,
+    ) -> AnalysisSummary:
+        """Add a new pending analysis of a protocol to the back of the queue.
+
+        If an identical protocol has already been analyzed, its analysis is
+        reused right away instead, without waiting behind queued simulations.
+
+        Args:
+            protocol_resource: The protocol to analyze.
+                Must not already have a pending analysis.
+            analysis_id: The ID of the new analysis.
+
+        Returns:
+            A summary of the just-added analysis.
+        """
+        protocol_id = protocol_resource.protocol_id
+
+        self._analysis_store.add_pending(
+            protocol_id=protocol_id,
+            analysis_id=analysis_id,
+        )
+
+        cache_key: Optional[str] = None
+        try:
+            cache_key = await self._protocol_analyzer.get_cache_key(protocol_resource)
+            if await self._protocol_analyzer.analyze_from_cache(
+                analysis_id=analysis_id, cache_key=cache_key
+            ):
+                return AnalysisSummary(id=analysis_id, status=AnalysisStatus.COMPLETED)
+        except Exception as e:
+            # The analysis can still be run the usual way.
+            _log.warning(
+                f'Unable to reuse a cached analysis for "{analysis_id}".', exc_info=e
+            )
+
+        self._queued[protocol_id] = _QueuedAnalysis(
+            protocol_resource=protocol_resource,
+            analysis_id=analysis_id,
+            cache_key=cache_key,
+        )
+
+        return self._advance()[analysis_id]
+
+    def cancel(self, protocol_id: str) -> None:
+        """Cancel the pending analysis of a protocol, if it has one.
+
+        The cancelled analysis is removed from the `AnalysisStore`.
+        """
+        queued = self._queued.pop(protocol_id, None)
+        running = self._running.get(protocol_id)
+
+        if queued is not None:
+            self._analysis_store.remove_pending(analysis_id=queued.analysis_id)
+            self._advance()
+            _log.info(f'Cancelled queued analysis "{queued.analysis_id}".')
+
+        elif running is not None and running.task.cancel():
+            self._analysis_store.remove_pending(analysis_id=running.analysis_id)
+            _log.info(f'Cancelled running analysis "{running.analysis_id}".')
+
+    async def close(self) -> None:
+        """Cancel every queued and running analysis, and wait for them to stop.
+
+        Intended to be called just once, when the server shuts down.
+        """
+        self._closed = True
+        self._queued.clear()
+
+        tasks = [running.task for running in self._running.values()]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _advance(self) -> Dict[str, AnalysisSummary]:
+        """Start queued analyses while there's room, and update queue positions.
+
+        Returns:
+            Summaries of every updated analysis, by analysis ID.
+        """
+        summaries: Dict[str, AnalysisSummary] = {}
+
+        while self._queued and len(self._running) < self._max_running:
+            protocol_id, queued = self._queued.popitem(last=False)
+            task = asyncio.get_running_loop().create_task(self._analyze(queued))
+            task.add_done_callback(partial(self._finish, protocol_id))
+            self._running[protocol_id] = _RunningAnalysis(
+                analysis_id=queued.analysis_id,
+                task=task,
+            )
+            summaries[queued.analysis_id] = self._analysis_store.update_pending(
+                analysis_id=queued.analysis_id,
+                queue_status=AnalysisQueueStatus.RUNNING,
+                queue_position=None,
+            )
+
+        for position, queued in enumerate(self._queued.values()):
+            summaries[queued.analysis_id] = self._analysis_store.update_pending(
+                analysis_id=queued.analysis_id,
+                queue_status=AnalysisQueueStatus.QUEUED,
+                queue_position=position,
+            )
+
+        return summaries
+
+    async def _analyze(self, queued: _QueuedAnalysis) -> None:
+        analysis_id = queued.analysis_id
+
+        try:
+            await self._protocol_analyzer.analyze(
+                protocol_resource=queued.protocol_resource,
+                analysis_id=analysis_id,
+                cache_key=queued.cache_key,
+            )
+        except asyncio.CancelledError:
+            # On Python 3.7, CancelledError is an Exception; let it through
+            # rather than logging the cancellation as a failure.
+            raise
+        except Exception as e:
+            _log.warning(f'Analysis "{analysis_id}" failed.', exc_info=e)
+
+    def _finish(self, protocol_id: str, task: "asyncio.Task[None]") -> None:
+        del self._running[protocol_id]
+
+        if not self._closed:
+            self._advance()
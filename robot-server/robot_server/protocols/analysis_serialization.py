@@ -0,0 +1,176 @@
+"""Serialization of completed protocol analyses for storage in the database.
+
+Completed analyses are stored in a small binary container with a stable layout:
+
+    +------------------+----------------+---------------------+-------------+
+    | magic (4 bytes)  | format version | header length       | header JSON |
+    | b"OTAN"          | (uint16, BE)   | (uint32, big-endian)| (UTF-8)     |
+    +------------------+----------------+---------------------+-------------+
+    | section payloads, each one zlib-compressed JSON, back-to-back        |
+    +-----------------------------------------------------------------------+
+
+The header holds the analysis's ID and result, plus the byte offset and length
+of each section (`labware`, `pipettes`, `errors`, `commands`) within the payloads.
+This lets a reader decode the small sections, like errors, without paying to
+decompress and parse the potentially huge command list.
+
+Analyses stored before this format existed are plain pickles of
+`CompletedAnalysis.dict()`; those are still readable.
+"""
+from __future__ import annotations
+
+import json
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from pydantic import parse_obj_as
+from pydantic.json import pydantic_encoder
+from typing_extensions import Final
+
+from opentrons.protocol_engine import (
+    Command,
+    ErrorOccurrence,
+    LoadedLabware,
+    LoadedPipette,
+)
+
+from .analysis_models import AnalysisResult, CompletedAnalysis
+
+_MAGIC: Final = b"OTAN"
+_FORMAT_VERSION: Final = 1
+_PREAMBLE: Final = struct.Struct(">4sHI")
+
+_SECTIONS: Final = ("labware", "pipettes", "errors", "commands")
+
+
+class AnalysisFormatError(ValueError):
+    """Error raised when stored analysis bytes cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class CompletedAnalysisSummary:
+    """The result and errors of a completed analysis, without its commands."""
+
+    id: str
+    result: AnalysisResult
+    errors: List[ErrorOccurrence]
+
+
+def serialize_completed_analysis(completed_analysis: CompletedAnalysis) -> bytes:
+    """Encode a completed analysis into the current storage format."""
+    payloads = [
+        zlib.compress(
+            json.dumps(
+                getattr(completed_analysis, section),
+                default=pydantic_encoder,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        for section in _SECTIONS
+    ]
+
+    section_positions: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for section, payload in zip(_SECTIONS, payloads):
+        section_positions[section] = (offset, len(payload))
+        offset += len(payload)
+
+    header = json.dumps(
+        {
+            "id": completed_analysis.id,
+            "result": completed_analysis.result.value,
+            "sections": section_positions,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return b"".join(
+        [_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)), header, *payloads]
+    )
+
+
+def deserialize_completed_analysis(data: bytes) -> CompletedAnalysis:
+    """Decode a completed analysis, including its full command list."""
+    if not _is_current_format(data):
+        return CompletedAnalysis.parse_obj(pickle.loads(data))
+
+    header, payload_start = _read_header(data)
+    sections = header["sections"]
+
+    return CompletedAnalysis.construct(
+        id=header["id"],
+        result=AnalysisResult(header["result"]),
+        labware=parse_obj_as(
+            List[LoadedLabware], _read_section(data, payload_start, sections, "labware")
+        ),
+        pipettes=parse_obj_as(
+            List[LoadedPipette],
+            _read_section(data, payload_start, sections, "pipettes"),
+        ),
+        errors=parse_obj_as(
+            List[ErrorOccurrence],
+            _read_section(data, payload_start, sections, "errors"),
+        ),
+        commands=parse_obj_as(
+            List[Command], _read_section(data, payload_start, sections, "commands")
+        ),
+    )
+
+
+def deserialize_completed_analysis_summary(data: bytes) -> CompletedAnalysisSummary:
+    """Decode a completed analysis's result and errors.
+
+    Only the header and the errors section are decoded; the command list
+    is never decompressed. Analyses in the legacy pickle format have to be
+    decoded in full.
+    """
+    if not _is_current_format(data):
+        legacy = deserialize_completed_analysis(data)
+        return CompletedAnalysisSummary(
+            id=legacy.id, result=legacy.result, errors=legacy.errors
+        )
+
+    header, payload_start = _read_header(data)
+
+    return CompletedAnalysisSummary(
+        id=header["id"],
+        result=AnalysisResult(header["result"]),
+        errors=parse_obj_as(
+            List[ErrorOccurrence],
+            _read_section(data, payload_start, header["sections"], "errors"),
+        ),
+    )
+
+
+def _is_current_format(data: bytes) -> bool:
+    return data[: len(_MAGIC)] == _MAGIC
+
+
+def _read_header(data: bytes) -> Tuple[Dict[str, Any], int]:
+    _, version, header_length = _PREAMBLE.unpack_from(data)
+
+    if version != _FORMAT_VERSION:
+        raise AnalysisFormatError(
+            f"Stored analysis has format version {version},"
+            f" but only version {_FORMAT_VERSION} is supported."
+        )
+
+    header_start = _PREAMBLE.size
+    payload_start = header_start + header_length
+    header = json.loads(data[header_start:payload_start].decode("utf-8"))
+
+    return header, payload_start
+
+
+def _read_section(
+    data: bytes,
+    payload_start: int,
+    sections: Dict[str, List[int]],
+    name: str,
+) -> Any:
+    offset, length = sections[name]
+    start = payload_start + offset
+    return json.loads(zlib.decompress(memoryview(data)[start : start + length]))
@@ -1,13 +1,14 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
-import pickle
+from collections import OrderedDict
 from dataclasses import dataclass
 from logging import getLogger
 from typing import Dict, List, Optional
 
 import anyio
 import sqlalchemy
+from typing_extensions import Final
 
 from opentrons.protocol_engine import (
     Command,
@@ -25,6 +26,13 @@ from .analysis_models import (
     CompletedAnalysis,
     AnalysisResult,
     AnalysisStatus,
+    AnalysisQueueStatus,
+)
+from .analysis_serialization import (
+    CompletedAnalysisSummary,
+    serialize_completed_analysis,
+    deserialize_completed_analysis,
+    deserialize_completed_analysis_summary,
 )
 
 
@@ -54,6 +62,9 @@ _log = getLogger(__name__)
 # robot software version.
 _CURRENT_ANALYZER_VERSION = "initial"
 
+# How many decoded completed analyses to keep in memory.
+_COMPLETED_ANALYSIS_CACHE_SIZE: Final = 32
+
 
 class AnalysisNotFoundError(ValueError):
     """Exception raised if a given analysis is not found."""
@@ -95,6 +106,39 @@ class AnalysisStore:
         )
         return _summarize_pending(pending_analysis=new_pending_analysis)
 
+    def update_pending(
+        self,
+        analysis_id: str,
+        queue_status: AnalysisQueueStatus,
+        queue_position: Optional[int],
+    ) -> AnalysisSummary:
+        """Update where a pending analysis is in the analysis queue.
+
+        Args:
+            analysis_id: The ID of the analysis to update.
+                Must point to a valid pending analysis.
+            queue_status: See `PendingAnalysis.queueStatus`.
+            queue_position: See `PendingAnalysis.queuePosition`.
+
+        Returns:
+            A summary of the just-updated analysis.
+        """
+        updated_pending_analysis = self._pending_store.update(
+            analysis_id=analysis_id,
+            queue_status=queue_status,
+            queue_position=queue_position,
+        )
+        return _summarize_pending(pending_analysis=updated_pending_analysis)
+
+    def remove_pending(self, analysis_id: str) -> None:
+        """Remove a pending analysis that will never complete.
+
+        Args:
+            analysis_id: The ID of the analysis to remove.
+                Must point to a valid pending analysis.
+        """
+        self._pending_store.remove(analysis_id=analysis_id)
+
     async def update(
         self,
         analysis_id: str,
@@ -102,6 +146,7 @@ class AnalysisStore:
         labware: List[LoadedLabware],
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -113,6 +158,9 @@ class AnalysisStore:
             pipettes: See `CompletedAnalysis.pipettes`.
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
+            cache_key: A hash of everything that went into the analysis.
+                If given, later protocols with the same cache key can reuse
+                this analysis. See `get_by_cache_key()`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -139,6 +187,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
+            cache_key=cache_key,
         )
         await self._completed_store.add(
             completed_analysis_resource=completed_analysis_resource
@@ -164,17 +213,61 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
-    def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
-        """Get summaries of all analyses for a protocol, in order from oldest first.
+    async def get_by_cache_key(self, cache_key: str) -> Optional[CompletedAnalysis]:
+        """Get the most recent completed analysis with the given cache key, if any.
 
-        If `protocol_id` doesn't point to a valid protocol, returns an empty list.
+        Only analyses stored by the current analyzer version are returned,
+        since older ones may not reflect how a protocol would run now.
         """
+        completed_analysis_resource = await self._completed_store.get_by_cache_key(
+            cache_key=cache_key
+        )
+
+        if completed_analysis_resource is None:
+            return None
+        else:
+            return completed_analysis_resource.completed_analysis
+
+    async def get_latest_completed(
+        self, protocol_id: str
+    ) -> Optional[CompletedAnalysis]:
+        """Get a protocol's most recent completed analysis, if it has any."""
         completed_analysis_ids = self._completed_store.get_ids_by_protocol(
             protocol_id=protocol_id
         )
+
+        if len(completed_analysis_ids) == 0:
+            return None
+
+        completed_analysis_resource = await self._completed_store.get_by_id(
+            analysis_id=completed_analysis_ids[-1]
+        )
+
+        if completed_analysis_resource is None:
+            return None
+        else:
+            return completed_analysis_resource.completed_analysis
+
+    async def get_summaries_by_protocol(
+        self, protocol_id: str
+    ) -> List[AnalysisSummary]:
+        """Get summaries of all analyses for a protocol, in order from oldest first.
+
+        Completed analyses are summarized with their result and errors,
+        without decoding their commands.
+
+        If `protocol_id` doesn't point to a valid protocol, returns an empty list.
+        """
         completed_analysis_summaries = [
-            AnalysisSummary.construct(id=analysis_id, status=AnalysisStatus.COMPLETED)
-            for analysis_id in completed_analysis_ids
+            AnalysisSummary.construct(
+                id=summary.id,
+                status=AnalysisStatus.COMPLETED,
+                result=summary.result,
+                errors=summary.errors,
+            )
+            for summary in await self._completed_store.get_summaries_by_protocol(
+                protocol_id=protocol_id
+            )
         ]
 
         pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
@@ -232,6 +325,22 @@ class _PendingAnalysisStore:
 
         return new_pending_analysis
 
+    def update(
+        self,
+        analysis_id: str,
+        queue_status: AnalysisQueueStatus,
+        queue_position: Optional[int],
+    ) -> PendingAnalysis:
+        """Replace the queue status of the pending analysis with the given ID.
+
+        The given analysis must exist.
+        """
+        updated_pending_analysis = self._analyses_by_id[analysis_id].copy(
+            update={"queueStatus": queue_status, "queuePosition": queue_position}
+        )
+        self._analyses_by_id[analysis_id] = updated_pending_analysis
+        return updated_pending_analysis
+
     def remove(self, analysis_id: str) -> None:
         """Remove the pending analysis with the given ID.
 
@@ -270,6 +379,7 @@ class _CompletedAnalysisResource:
     protocol_id: str
     analyzer_version: str
     completed_analysis: CompletedAnalysis
+    cache_key: Optional[str] = None
 
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
@@ -281,12 +391,9 @@ class _CompletedAnalysisResource:
 
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
-
-        def serialize_completed_analysis() -> bytes:
-            return pickle.dumps(self.completed_analysis.dict())
-
         serialized_completed_analysis = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
+            self.completed_analysis,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
             cancellable=True,
@@ -297,6 +404,7 @@ class _CompletedAnalysisResource:
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
             "completed_analysis": serialized_completed_analysis,
+            "cache_key": self.cache_key,
         }
 
     @classmethod
@@ -324,11 +432,12 @@ class _CompletedAnalysisResource:
         protocol_id = sql_row.protocol_id
         assert isinstance(protocol_id, str)
 
-        def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(pickle.loads(sql_row.completed_analysis))
+        cache_key = sql_row.cache_key
+        assert cache_key is None or isinstance(cache_key, str)
 
         completed_analysis = await anyio.to_thread.run_sync(
-            parse_completed_analysis,
+            deserialize_completed_analysis,
+            sql_row.completed_analysis,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
             cancellable=True,
@@ -339,26 +448,50 @@ class _CompletedAnalysisResource:
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
             completed_analysis=completed_analysis,
+            cache_key=cache_key,
         )
 
 
 class _CompletedAnalysisStore:
-    """A SQL-backed persistent store of protocol analyses that are completed."""
+    """A SQL-backed persistent store of protocol analyses that are completed.
+
+    Completed analyses never change once stored, so recently used ones
+    are kept decoded in an in-memory LRU cache. Analysis IDs are still
+    checked against the database on every read, so analyses deleted
+    behind this store's back (e.g. along with their protocol) are not returned.
+    """
 
     def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
         self._sql_engine = sql_engine
+        self._memory_cache: OrderedDict[str, _CompletedAnalysisResource] = OrderedDict()
 
     async def get_by_id(self, analysis_id: str) -> Optional[_CompletedAnalysisResource]:
         """Return the analysis with the given ID, if it exists."""
-        statement = sqlalchemy.select(analysis_table).where(
-            analysis_table.c.id == analysis_id
-        )
+        cached_resource = self._memory_cache.get(analysis_id)
+
+        if cached_resource is not None:
+            statement = sqlalchemy.select(analysis_table.c.id).where(
+                analysis_table.c.id == analysis_id
+            )
+        else:
+            statement = sqlalchemy.select(analysis_table).where(
+                analysis_table.c.id == analysis_id
+            )
+
         with self._sql_engine.begin() as transaction:
             try:
                 result = transaction.execute(statement).one()
             except sqlalchemy.exc.NoResultFound:
+                self._memory_cache.pop(analysis_id, None)
                 return None
-        return await _CompletedAnalysisResource.from_sql_row(result)
+
+        if cached_resource is not None:
+            self._memory_cache.move_to_end(analysis_id)
+            return cached_resource
+
+        resource = await _CompletedAnalysisResource.from_sql_row(result)
+        self._add_to_memory_cache(resource)
+        return resource
 
     async def get_by_protocol(
         self, protocol_id: str
@@ -368,14 +501,101 @@ class _CompletedAnalysisStore:
         If protocol_id doesn't point to a valid protocol, returns an empty list;
         doesn't raise an error.
         """
+        analysis_ids = self.get_ids_by_protocol(protocol_id=protocol_id)
+        uncached_ids = [i for i in analysis_ids if i not in self._memory_cache]
+        resources_by_id: Dict[str, _CompletedAnalysisResource] = {}
+
+        if len(uncached_ids) > 0:
+            statement = sqlalchemy.select(analysis_table).where(
+                analysis_table.c.id.in_(uncached_ids)
+            )
+            with self._sql_engine.begin() as transaction:
+                results = transaction.execute(statement).all()
+
+            for r in results:
+                resource = await _CompletedAnalysisResource.from_sql_row(r)
+                resources_by_id[resource.id] = resource
+
+        for analysis_id in analysis_ids:
+            if analysis_id in resources_by_id:
+                self._add_to_memory_cache(resources_by_id[analysis_id])
+            elif analysis_id in self._memory_cache:
+                resources_by_id[analysis_id] = self._memory_cache[analysis_id]
+                self._memory_cache.move_to_end(analysis_id)
+
+        return [
+            resources_by_id[analysis_id]
+            for analysis_id in analysis_ids
+            if analysis_id in resources_by_id
+        ]
+
+    async def get_summaries_by_protocol(
+        self, protocol_id: str
+    ) -> List[CompletedAnalysisSummary]:
+        """Like `get_by_protocol()`, but return only each analysis's result and errors.
+
+        Analyses that aren't already in memory are decoded without their commands.
+        """
+        analysis_ids = self.get_ids_by_protocol(protocol_id=protocol_id)
+        summaries_by_id: Dict[str, CompletedAnalysisSummary] = {}
+
+        for analysis_id in analysis_ids:
+            cached_resource = self._memory_cache.get(analysis_id)
+            if cached_resource is not None:
+                completed_analysis = cached_resource.completed_analysis
+                summaries_by_id[analysis_id] = CompletedAnalysisSummary(
+                    id=completed_analysis.id,
+                    result=completed_analysis.result,
+                    errors=completed_analysis.errors,
+                )
+
+        uncached_ids = [i for i in analysis_ids if i not in summaries_by_id]
+
+        if len(uncached_ids) > 0:
+            statement = sqlalchemy.select(
+                analysis_table.c.id, analysis_table.c.completed_analysis
+            ).where(analysis_table.c.id.in_(uncached_ids))
+            with self._sql_engine.begin() as transaction:
+                results = transaction.execute(statement).all()
+
+            uncached_summaries = await anyio.to_thread.run_sync(
+                _deserialize_summaries,
+                [r.completed_analysis for r in results],
+                # Cancellation may orphan the worker thread,
+                # but that should be harmless in this case.
+                cancellable=True,
+            )
+            for summary in uncached_summaries:
+                summaries_by_id[summary.id] = summary
+
+        return [
+            summaries_by_id[analysis_id]
+            for analysis_id in analysis_ids
+            if analysis_id in summaries_by_id
+        ]
+
+    async def get_by_cache_key(
+        self, cache_key: str
+    ) -> Optional[_CompletedAnalysisResource]:
+        """Return the most recently added current-version analysis with a cache key.
+
+        If no analysis matches, returns None; doesn't raise an error.
+        """
         statement = (
-            sqlalchemy.select(analysis_table)
-            .where(analysis_table.c.protocol_id == protocol_id)
-            .order_by(sqlite_rowid)
+            sqlalchemy.select(analysis_table.c.id)
+            .where(analysis_table.c.cache_key == cache_key)
+            .where(analysis_table.c.analyzer_version == _CURRENT_ANALYZER_VERSION)
+            .order_by(sqlite_rowid.desc())
+            .limit(1)
         )
         with self._sql_engine.begin() as transaction:
-            results = transaction.execute(statement).all()
-        return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
+            analysis_id = transaction.execute(statement).scalar()
+
+        if analysis_id is None:
+            return None
+
+        assert isinstance(analysis_id, str)
+        return await self.get_by_id(analysis_id=analysis_id)
 
     def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
@@ -403,6 +623,28 @@ class _CompletedAnalysisStore:
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
 
+        self._add_to_memory_cache(completed_analysis_resource)
+
+    def _add_to_memory_cache(self, resource: _CompletedAnalysisResource) -> None:
+        self._memory_cache[resource.id] = resource
+        self._memory_cache.move_to_end(resource.id)
+
+        while len(self._memory_cache) > _COMPLETED_ANALYSIS_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+
+def _deserialize_summaries(
+    serialized_analyses: List[bytes],
+) -> List[CompletedAnalysisSummary]:
+    return [
+        deserialize_completed_analysis_summary(data) for data in serialized_analyses
+    ]
+
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
-    return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
+    return AnalysisSummary(
+        id=pending_analysis.id,
+        status=pending_analysis.status,
+        queueStatus=pending_analysis.queueStatus,
+        queuePosition=pending_analysis.queuePosition,
+    )
@@ -0,0 +1,160 @@
+"""Worker processes to run protocol analyses in."""
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from logging import getLogger
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext
+from typing import List, Set, Tuple, Union
+
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunResult, create_simulating_runner
+
+
+_log = getLogger(__name__)
+
+_Outcome = Tuple[bool, Union[ProtocolRunResult, BaseException]]
+
+
+def _run_analysis(source: ProtocolSource) -> ProtocolRunResult:
+    """Analyze a protocol. Runs inside a worker process."""
+
+    async def _run() -> ProtocolRunResult:
+        protocol_runner = await create_simulating_runner()
+        return await protocol_runner.run(source)
+
+    return asyncio.run(_run())
+
+
+def _serve(conn: Connection) -> None:
+    """Analyze each protocol sent over `conn`, sending back the outcome.
+
+    Runs inside a worker process, until the server closes its end of `conn`.
+    """
+    while True:
+        try:
+            source = conn.recv()
+        except EOFError:
+            return
+
+        outcome: _Outcome
+        try:
+            outcome = (True, _run_analysis(source))
+        except Exception as e:
+            outcome = (False, e)
+
+        try:
+            conn.send(outcome)
+        except Exception as e:
+            # The exception couldn't be pickled.
+            conn.send((False, RuntimeError(repr(e))))
+
+
+class _Worker:
+    """A worker process that analyzes one protocol at a time."""
+
+    def __init__(self, context: SpawnContext) -> None:
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+        # Sending and receiving block, so they're done on a thread of the
+        # worker's own, which lets stop() wait for them to finish before
+        # closing the pipe.
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+
+    async def run(self, source: ProtocolSource) -> _Outcome:
+        """Send a protocol to the worker process and wait for its outcome.
+
+        Raises:
+            BrokenProcessPool: The worker process died.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._io_executor, self._conn.send, source)
+            outcome: _Outcome = await loop.run_in_executor(
+                self._io_executor, self._conn.recv
+            )
+        except (EOFError, OSError) as e:
+            raise BrokenProcessPool("Analysis worker process died.") from e
+        return outcome
+
+    async def stop(self) -> None:
+        """Stop the worker process, even in the middle of an analysis."""
+        self._process.terminate()
+
+        def _wait_stopped() -> None:
+            self._process.join()
+            # Once the process is gone, any send or receive it was in the
+            # middle of fails right away.
+            self._io_executor.shutdown(wait=True)
+            self._conn.close()
+
+        await asyncio.get_running_loop().run_in_executor(None, _wait_stopped)
+
+
+class AnalysisWorkerPool:
+    """A pool of worker processes that analyze protocols.
+
+    An analysis runs the full simulating `ProtocolRunner`, including any
+    Python protocol code, which can take a lot of CPU time. Running it in
+    a separate process keeps it from holding up HTTP requests and hardware
+    control in the server's event loop.
+
+    Worker processes are started the first time they're needed, and are
+    reused for later analyses. A worker whose analysis is cancelled is
+    stopped, so it never keeps running an analysis nobody is waiting for.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: The maximum number of worker processes to start.
+        """
+        # Workers are spawned, rather than forked, so that they don't inherit
+        # the server's event loop, threads, or hardware connections.
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._idle: List[_Worker] = []
+        self._busy: Set[_Worker] = set()
+
+    async def run(self, source: ProtocolSource) -> ProtocolRunResult:
+        """Analyze a protocol in a worker process.
+
+        If this is cancelled, the worker process is stopped before the
+        cancellation propagates, so the slot it frees up is really free.
+        """
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else _Worker(self._context)
+            self._busy.add(worker)
+            try:
+                succeeded, value = await worker.run(source)
+            except BrokenProcessPool:
+                _log.warning("Analysis worker process died, restarting it.")
+                await worker.stop()
+                raise
+            except BaseException:
+                await worker.stop()
+                raise
+            finally:
+                self._busy.discard(worker)
+
+            self._idle.append(worker)
+
+        if not succeeded:
+            assert isinstance(value, BaseException)
+            raise value
+        assert isinstance(value, ProtocolRunResult)
+        return value
+
+    async def shutdown(self) -> None:
+        """Stop every worker process, interrupting any analyses they're running.
+
+        Intended to be called just once, when the server shuts down.
+        """
+        workers = [*self._idle, *self._busy]
+        self._idle.clear()
+        self._busy.clear()
+        await asyncio.gather(*(worker.stop() for worker in workers))
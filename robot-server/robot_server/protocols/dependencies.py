@@ -10,18 +10,21 @@ from pathlib import Path
 from anyio import Path as AsyncPath
 
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence import get_sql_engine, get_persistence_directory
+from robot_server.settings import get_settings
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
     ProtocolStore,
 )
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_cache import AnalysisCacheStats
+from .analysis_queue import AnalysisQueue
 from .analysis_store import AnalysisStore
+from .analysis_worker_pool import AnalysisWorkerPool
 
 
 _PROTOCOL_FILES_SUBDIRECTORY: Final = "protocols"
@@ -31,6 +34,11 @@ _log = logging.getLogger(__name__)
 _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_analysis_worker_pool_accessor = AppStateAccessor[AnalysisWorkerPool](
+    "analysis_worker_pool"
+)
+_analysis_queue_accessor = AppStateAccessor[AnalysisQueue]("analysis_queue")
+_protocol_analyzer_accessor = AppStateAccessor[ProtocolAnalyzer]("protocol_analyzer")
 
 
 def get_protocol_reader() -> ProtocolReader:
@@ -87,23 +95,68 @@ def get_analysis_store(
     return analysis_store
 
 
-async def get_protocol_analyzer(
+def get_analysis_queue(
+    app_state: AppState = Depends(get_app_state),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> ProtocolAnalyzer:
-    """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
+) -> AnalysisQueue:
+    """Get a singleton AnalysisQueue to run protocol analyses in worker processes."""
+    analysis_queue = _analysis_queue_accessor.get_from(app_state)
+
+    if analysis_queue is None:
+        worker_count = get_settings().analysis_worker_count
+        worker_pool = AnalysisWorkerPool(max_workers=worker_count)
+        protocol_analyzer = ProtocolAnalyzer(
+            worker_pool=worker_pool,
+            analysis_store=analysis_store,
+        )
+        analysis_queue = AnalysisQueue(
+            protocol_analyzer=protocol_analyzer,
+            analysis_store=analysis_store,
+            max_running=worker_count,
+        )
+        _analysis_worker_pool_accessor.set_on(app_state, worker_pool)
+        _protocol_analyzer_accessor.set_on(app_state, protocol_analyzer)
+        _analysis_queue_accessor.set_on(app_state, analysis_queue)
 
-    return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
-        analysis_store=analysis_store,
-    )
+    return analysis_queue
+
+
+def get_analysis_cache_stats(
+    app_state: AppState = Depends(get_app_state),
+) -> AnalysisCacheStats:
+    """Get how often protocol analyses have been reused since the server started.
+
+    Unlike the other analysis dependencies, this doesn't create anything, so
+    it's cheap enough for the health endpoint.
+    """
+    protocol_analyzer = _protocol_analyzer_accessor.get_from(app_state)
+    if protocol_analyzer is None:
+        return AnalysisCacheStats()
+    return protocol_analyzer.cache_stats
+
+
+async def clean_up_analysis_queue(app_state: AppState) -> None:
+    """Clean up the `AnalysisQueue` and its worker processes, if they were created.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    analysis_queue = _analysis_queue_accessor.get_from(app_state)
+    worker_pool = _analysis_worker_pool_accessor.get_from(app_state)
+
+    if analysis_queue is not None:
+        await analysis_queue.close()
+
+    if worker_pool is not None:
+        await worker_pool.shutdown()
 
 
 async def get_protocol_auto_deleter(
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_queue: AnalysisQueue = Depends(get_analysis_queue),
 ) -> ProtocolAutoDeleter:
     """Get a `ProtocolAutoDeleter` to delete old protocols."""
     return ProtocolAutoDeleter(
         protocol_store=protocol_store,
+        analysis_queue=analysis_queue,
         deletion_planner=ProtocolDeletionPlanner(),
     )
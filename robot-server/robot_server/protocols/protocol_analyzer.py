@@ -1,36 +1,107 @@
 """Protocol analysis module."""
 import logging
+from typing import Optional
 
-from opentrons.protocol_runner import ProtocolRunner
+import anyio
 
 from .protocol_store import ProtocolResource
+from .analysis_cache import AnalysisCacheStats, compute_cache_key
 from .analysis_store import AnalysisStore
+from .analysis_worker_pool import AnalysisWorkerPool
 
 
 log = logging.getLogger(__name__)
 
 
 class ProtocolAnalyzer:
-    """A collaborator to perform an analysis of a protocol and store the result."""
+    """A collaborator to perform an analysis of a protocol and store the result.
+
+    Completed analyses are stored with a cache key, and a protocol whose
+    cache key matches an already-stored analysis reuses that analysis
+    instead of being simulated again. See `compute_cache_key()`.
+    """
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        worker_pool: AnalysisWorkerPool,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._worker_pool = worker_pool
         self._analysis_store = analysis_store
+        self._cache_stats = AnalysisCacheStats()
+
+    @property
+    def cache_stats(self) -> AnalysisCacheStats:
+        """How often analyses have been reused since the analyzer was created."""
+        return self._cache_stats
+
+    async def get_cache_key(self, protocol_resource: ProtocolResource) -> str:
+        """Compute the cache key of a protocol, off of the event loop."""
+        return await anyio.to_thread.run_sync(
+            compute_cache_key, protocol_resource.source
+        )
+
+    async def analyze_from_cache(self, analysis_id: str, cache_key: str) -> bool:
+        """Complete an analysis by reusing a stored analysis with the same cache key.
+
+        Returns:
+            Whether there was a stored analysis to reuse. If not, the analysis
+            is left as it was.
+        """
+        cached_analysis = await self._analysis_store.get_by_cache_key(
+            cache_key=cache_key
+        )
+
+        if cached_analysis is None:
+            return False
+
+        self._cache_stats = AnalysisCacheStats(
+            hits=self._cache_stats.hits + 1,
+            misses=self._cache_stats.misses,
+        )
+        log.info(
+            f'Reusing analysis "{cached_analysis.id}" for analysis "{analysis_id}".'
+            f" Analysis cache: {self._cache_stats}."
+        )
+
+        await self._analysis_store.update(
+            analysis_id=analysis_id,
+            commands=cached_analysis.commands,
+            labware=cached_analysis.labware,
+            pipettes=cached_analysis.pipettes,
+            errors=cached_analysis.errors,
+            cache_key=cache_key,
+        )
+        return True
 
     async def analyze(
         self,
         protocol_resource: ProtocolResource,
         analysis_id: str,
+        cache_key: Optional[str] = None,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        """Analyze a given protocol, storing the analysis when complete.
 
-        log.info(f'Completed analysis "{analysis_id}".')
+        An identical protocol may have been analyzed while this one waited
+        in the analysis queue, so the cache is checked again first.
+        """
+        if cache_key is None:
+            cache_key = await self.get_cache_key(protocol_resource)
+
+        if await self.analyze_from_cache(analysis_id=analysis_id, cache_key=cache_key):
+            return
+
+        result = await self._worker_pool.run(protocol_resource.source)
+
+        self._cache_stats = AnalysisCacheStats(
+            hits=self._cache_stats.hits,
+            misses=self._cache_stats.misses + 1,
+        )
+        log.info(
+            f'Completed analysis "{analysis_id}".'
+            f" Analysis cache: {self._cache_stats}."
+        )
 
         await self._analysis_store.update(
             analysis_id=analysis_id,
@@ -38,4 +109,5 @@ class ProtocolAnalyzer:
             labware=result.state_summary.labware,
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
+            cache_key=cache_key,
         )
@@ -4,6 +4,7 @@
 from logging import getLogger
 
 from robot_server.deletion_planner import ProtocolDeletionPlanner
+from .analysis_queue import AnalysisQueue
 from .protocol_store import ProtocolStore
 
 
@@ -14,9 +15,11 @@ class ProtocolAutoDeleter:  # noqa: D101
     def __init__(
         self,
         protocol_store: ProtocolStore,
+        analysis_queue: AnalysisQueue,
         deletion_planner: ProtocolDeletionPlanner,
     ) -> None:
         self._protocol_store = protocol_store
+        self._analysis_queue = analysis_queue
         self._deletion_planner = deletion_planner
 
     def make_room_for_new_protocol(self) -> None:  # noqa: D102
@@ -33,3 +36,4 @@ class ProtocolAutoDeleter:  # noqa: D101
             )
         for protocol_id in protocol_ids_to_delete:
             self._protocol_store.remove(protocol_id=protocol_id)
+            self._analysis_queue.cancel(protocol_id=protocol_id)
@@ -10,7 +10,11 @@ from typing import Dict, List, Optional, Set
 from anyio import Path as AsyncPath, create_task_group
 import sqlalchemy
 
-from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_reader import (
+    CompiledProtocolCache,
+    ProtocolReader,
+    ProtocolSource,
+)
 from robot_server.persistence import (
     analysis_table,
     protocol_table,
@@ -217,6 +221,7 @@ class ProtocolStore:
         for source_file in deleted_source.files:
             source_file.path.unlink()
         if protocol_dir:
+            CompiledProtocolCache.clear(protocol_dir)
             protocol_dir.rmdir()
 
         return ProtocolResource(
@@ -309,15 +314,9 @@ class ProtocolStore:
             except sqlalchemy.exc.NoResultFound as e:
                 raise ProtocolNotFoundError(protocol_id=protocol_id) from e
 
-            # TODO(mm, 2022-04-28): Deleting analyses from the table is enough to
-            # avoid a SQL foreign key conflict. But, if this protocol had any *pending*
-            # analyses, they'll be left behind in the AnalysisStore, orphaned,
-            # since they're stored independently of this SQL table.
-            #
-            # To fix this, we'll need to either:
-            #
-            # * Merge the Store classes or otherwise give them access to each other.
-            # * Switch from SQLAlchemy Core to ORM and use cascade deletes.
+            # This only deletes completed analyses. Pending ones aren't stored in
+            # SQL; callers cancel them with AnalysisQueue.cancel(), which also
+            # removes them from the AnalysisStore, after this succeeds.
             transaction.execute(delete_analyses_statement)
 
             transaction.execute(delete_protocol_statement)
@@ -11,7 +11,6 @@ from typing_extensions import Literal
 from opentrons.protocol_reader import ProtocolReader, ProtocolFilesInvalidError
 
 from robot_server.errors import ErrorDetails, ErrorBody
-from robot_server.service.task_runner import TaskRunner, get_task_runner
 from robot_server.service.dependencies import get_unique_id, get_current_time
 from robot_server.service.json_api import (
     SimpleBody,
@@ -23,7 +22,7 @@ from robot_server.service.json_api import (
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
-from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_queue import AnalysisQueue
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
 from .analysis_models import ProtocolAnalysis
 from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
@@ -32,7 +31,7 @@ from .dependencies import (
     get_protocol_reader,
     get_protocol_store,
     get_analysis_store,
-    get_protocol_analyzer,
+    get_analysis_queue,
     get_protocol_directory,
 )
 
@@ -74,6 +73,12 @@ protocols_router = APIRouter()
         - A single Python protocol file and 0 or more custom labware JSON files
         - A single JSON protocol file (any additional labware files will be ignored)
 
+        The protocol is analyzed in the background. Analyses run a few at a time,
+        in the order their protocols were uploaded. While an analysis is pending,
+        its `queueStatus` and `queuePosition` show where it is in line.
+        If an identical protocol has already been analyzed, its analysis is reused
+        and the new protocol's analysis is completed right away.
+
         When too many protocols already exist, old ones will be automatically deleted
         to make room for the new one.
         A protocol will never be automatically deleted if there's a run
@@ -95,10 +100,8 @@ async def create_protocol(
     key: Optional[str] = Form(None),
     protocol_directory: Path = Depends(get_protocol_directory),
     protocol_store: ProtocolStore = Depends(get_protocol_store),
-    analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_queue: AnalysisQueue = Depends(get_analysis_queue),
     protocol_reader: ProtocolReader = Depends(get_protocol_reader),
-    protocol_analyzer: ProtocolAnalyzer = Depends(get_protocol_analyzer),
-    task_runner: TaskRunner = Depends(get_task_runner),
     protocol_auto_deleter: ProtocolAutoDeleter = Depends(get_protocol_auto_deleter),
     protocol_id: str = Depends(get_unique_id, use_cache=False),
     analysis_id: str = Depends(get_unique_id, use_cache=False),
@@ -111,10 +114,8 @@ async def create_protocol(
         key: Optional key for client-side tracking
         protocol_directory: Location to store uploaded files.
         protocol_store: In-memory database of protocol resources.
-        analysis_store: In-memory database of protocol analyses.
+        analysis_queue: Queue of protocol analyses to run in worker processes.
         protocol_reader: Protocol file reading interface.
-        protocol_analyzer: Protocol analysis interface.
-        task_runner: Background task runner.
         protocol_auto_deleter: An interface to delete old resources to make room for
             the new protocol.
         protocol_id: Unique identifier to attach to the protocol resource.
@@ -141,27 +142,22 @@ async def create_protocol(
     protocol_auto_deleter.make_room_for_new_protocol()
     protocol_store.insert(protocol_resource)
 
-    task_runner.run(
-        protocol_analyzer.analyze,
+    analysis_summary = await analysis_queue.add(
         protocol_resource=protocol_resource,
         analysis_id=analysis_id,
     )
-    pending_analysis = analysis_store.add_pending(
-        protocol_id=protocol_id,
-        analysis_id=analysis_id,
-    )
 
     data = Protocol(
         id=protocol_id,
         createdAt=created_at,
         protocolType=source.config.protocol_type,
         metadata=Metadata.parse_obj(source.metadata),
-        analysisSummaries=[pending_analysis],
+        analysisSummaries=[analysis_summary],
         key=key,
         files=[ProtocolFile(name=f.path.name, role=f.role) for f in source.files],
     )
 
-    log.info(f'Created protocol "{protocol_id}" and started analysis "{analysis_id}".')
+    log.info(f'Created protocol "{protocol_id}" with analysis "{analysis_id}".')
 
     return await PydanticResponse.create(
         content=SimpleBody.construct(data=data),
@@ -191,7 +187,9 @@ async def get_protocols(
             createdAt=r.created_at,
             protocolType=r.source.config.protocol_type,
             metadata=Metadata.parse_obj(r.source.metadata),
-            analysisSummaries=analysis_store.get_summaries_by_protocol(r.protocol_id),
+            analysisSummaries=await analysis_store.get_summaries_by_protocol(
+                r.protocol_id
+            ),
             key=r.protocol_key,
             files=[ProtocolFile(name=f.path.name, role=f.role) for f in r.source.files],
         )
@@ -230,7 +228,7 @@ async def get_protocol_by_id(
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
-    analyses = analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
+    analyses = await analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
 
     data = Protocol.construct(
         id=protocolId,
@@ -261,15 +259,18 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_queue: AnalysisQueue = Depends(get_analysis_queue),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_queue: Queue of protocol analyses, to cancel any pending analysis.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
+        analysis_queue.cancel(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,128 @@
+"""Write-behind persistence of a run's commands while the run is in progress."""
+import asyncio
+import logging
+from typing import List, Optional
+
+import anyio
+from typing_extensions import Final
+
+from opentrons.protocol_engine import AbstractPlugin, Command, actions as pe_actions
+from opentrons.protocol_engine.commands import CommandStatus
+
+from .run_store import RunStore
+
+_DEFAULT_BATCH_SIZE: Final = 50
+
+_COMPLETED_STATUSES: Final = {CommandStatus.SUCCEEDED, CommandStatus.FAILED}
+
+_log = logging.getLogger(__name__)
+
+
+class RunCommandPersister(AbstractPlugin):
+    """A ProtocolEngine plugin to flush completed commands to the RunStore.
+
+    Once a command has succeeded or failed, it will never change again,
+    so it can safely be written to the database before the run is over.
+    This plugin watches the engine's command state and writes completed
+    commands in batches, in the background, so that:
+
+    1. The final `RunStore.update_run_state` call at the end of the run
+       only needs to write the last few commands.
+    2. A server that crashes and restarts mid-run can still show the
+       commands that ran before the crash.
+
+    Commands are always persisted as a contiguous prefix of the run's command
+    list. Persistence stops at the first command that has not yet completed.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        run_store: RunStore,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the plugin with its dependencies.
+
+        Args:
+            run_id: The run whose commands to persist.
+            run_store: The store to write commands to.
+            batch_size: How many completed commands to wait for
+                before writing them to the store.
+        """
+        self._run_id = run_id
+        self._run_store = run_store
+        self._batch_size = batch_size
+        self._persisted_count = 0
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Kick off a background flush if enough commands have completed.
+
+        Plugins see actions before the StateStore does, so commands
+        completed by `action` itself will be picked up by a later flush.
+        """
+        if not isinstance(
+            action, (pe_actions.UpdateCommandAction, pe_actions.FailCommandAction)
+        ):
+            return
+
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+
+        completed_commands = self._get_unpersisted_completed_commands()
+
+        if len(completed_commands) >= self._batch_size:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush(completed_commands)
+            )
+
+    async def teardown(self) -> None:
+        """Wait for any in-progress flush, then flush remaining completed commands."""
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+
+        completed_commands = self._get_unpersisted_completed_commands()
+
+        if len(completed_commands) > 0:
+            await self._flush(completed_commands)
+
+    async def _flush(self, commands: List[Command]) -> None:
+        start_index = self._persisted_count
+
+        try:
+            await anyio.to_thread.run_sync(
+                self._run_store.insert_commands,
+                self._run_id,
+                start_index,
+                commands,
+            )
+        except Exception:
+            _log.exception(
+                f"Unable to persist commands {start_index} through"
+                f" {start_index + len(commands) - 1} of run {self._run_id}."
+            )
+        else:
+            self._persisted_count = start_index + len(commands)
+
+    def _get_unpersisted_completed_commands(self) -> List[Command]:
+        completed_commands: List[Command] = []
+        cursor = self._persisted_count
+
+        while True:
+            command_slice = self.state.commands.get_slice(
+                cursor=cursor,
+                length=self._batch_size,
+            )
+
+            # get_slice clamps the cursor to the last command in the list,
+            # so a mismatched cursor means there are no commands left
+            if command_slice.cursor != cursor or len(command_slice.commands) == 0:
+                return completed_commands
+
+            for command in command_slice.commands:
+                if command.status not in _COMPLETED_STATUSES:
+                    return completed_commands
+                completed_commands.append(command)
+
+            cursor += len(command_slice.commands)
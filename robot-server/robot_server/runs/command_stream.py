@@ -0,0 +1,211 @@
+"""Follow a run's commands and status as they change."""
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from anyio import move_on_after
+from pydantic import BaseModel
+from typing_extensions import Final
+
+from opentrons.protocol_engine import (
+    Command,
+    CommandStatus,
+    EngineStatus as RunStatus,
+    ProtocolEngine,
+    StateTopic,
+)
+
+from .run_models import (
+    RunCommandSummary,
+    RunCommandUpdate,
+    RunEstimateUpdate,
+    RunStatusUpdate,
+)
+
+_DEFAULT_PAGE_LENGTH: Final = 50
+_DEFAULT_KEEPALIVE_INTERVAL: Final = 15.0
+
+_COMPLETED_STATUSES: Final = {CommandStatus.SUCCEEDED, CommandStatus.FAILED}
+_TERMINAL_RUN_STATUSES: Final = {
+    RunStatus.STOPPED,
+    RunStatus.FAILED,
+    RunStatus.SUCCEEDED,
+}
+
+
+@dataclass(frozen=True)
+class RunStreamEvent:
+    """An event emitted by a RunCommandStream.
+
+    Attributes:
+        event: The kind of event; "command", "estimate", "status",
+            or "keepalive".
+        cursor: A command index to resume the stream from without missing
+            any changes, if the client disconnects after this event.
+        data: The event's payload, if any.
+    """
+
+    event: str
+    cursor: int
+    data: Optional[BaseModel] = None
+
+
+class RunCommandStream:
+    """Follow a run's commands, emitting only what changed.
+
+    Every time the engine's command state changes, the stream re-checks the
+    commands that it has not yet seen complete, and emits each command that
+    was added or replaced since the last check. Once a command has succeeded
+    or failed, it will never change again, so it is no longer checked.
+    After the changed commands, it emits the run's estimated durations,
+    if they changed, and then the run's status, if it changed.
+
+    Queued commands only leave the queue in order, or all at once when the
+    run fails, so scanning stops at the first queued command that is unchanged,
+    and picks back up at the first command that hasn't been emitted yet.
+    """
+
+    def __init__(
+        self,
+        protocol_engine: ProtocolEngine,
+        cursor: int = 0,
+        page_length: int = _DEFAULT_PAGE_LENGTH,
+        keepalive_interval: float = _DEFAULT_KEEPALIVE_INTERVAL,
+    ) -> None:
+        """Initialize the stream.
+
+        Arguments:
+            protocol_engine: The engine of the run to follow.
+            cursor: The index of the first command to emit.
+            page_length: How many commands to read from state at a time.
+            keepalive_interval: How long to wait, in seconds, for a change
+                before emitting a "keepalive" event.
+        """
+        self._engine = protocol_engine
+        self._settled_cursor = max(cursor, 0)
+        self._page_length = page_length
+        self._keepalive_interval = keepalive_interval
+        self._sent_commands: Dict[int, Command] = {}
+        self._sent_status: Optional[RunStatus] = None
+        self._sent_estimate: Optional[Tuple[float, float]] = None
+
+    async def events(self) -> AsyncIterator[RunStreamEvent]:
+        """Emit events for every change, until the run reaches a terminal status."""
+        state_view = self._engine.state_view
+
+        while True:
+            state_version = state_view.get_state_version()
+
+            for event in self._get_changes():
+                yield event
+
+            if self._sent_status in _TERMINAL_RUN_STATUSES:
+                return
+
+            with move_on_after(self._keepalive_interval) as scope:
+                await self._engine.wait_for_state_change(
+                    state_version,
+                    topic=StateTopic.COMMANDS,
+                )
+
+            if scope.cancel_called:
+                yield RunStreamEvent(event="keepalive", cursor=self._settled_cursor)
+
+    def _get_changes(self) -> List[RunStreamEvent]:
+        cursor = self._settled_cursor
+        events = [
+            RunStreamEvent(
+                event="command",
+                cursor=cursor,
+                data=RunCommandUpdate.construct(
+                    index=index,
+                    command=_summarize(command),
+                ),
+            )
+            for index, command in self._get_changed_commands()
+        ]
+
+        durations_view = self._engine.state_view.durations
+        total = durations_view.get_total()
+        remaining = durations_view.get_remaining()
+
+        if (total, remaining) != self._sent_estimate:
+            self._sent_estimate = (total, remaining)
+            events.append(
+                RunStreamEvent(
+                    event="estimate",
+                    cursor=cursor,
+                    data=RunEstimateUpdate.construct(
+                        estimatedDuration=total,
+                        estimatedRemainingDuration=remaining,
+                    ),
+                )
+            )
+
+        status = self._engine.state_view.commands.get_status()
+
+        if status != self._sent_status:
+            self._sent_status = status
+            events.append(
+                RunStreamEvent(
+                    event="status",
+                    cursor=cursor,
+                    data=RunStatusUpdate.construct(status=status),
+                )
+            )
+
+        self._advance_settled_cursor()
+        return events
+
+    def _get_changed_commands(self) -> List[Tuple[int, Command]]:
+        commands_view = self._engine.state_view.commands
+        sent = self._sent_commands
+        changed: List[Tuple[int, Command]] = []
+        index = self._settled_cursor
+
+        while True:
+            command_slice = commands_view.get_slice(
+                cursor=index,
+                length=self._page_length,
+            )
+
+            # get_slice clamps the cursor to the last command in the list,
+            # so a mismatched cursor means there are no commands left
+            if command_slice.cursor != index or len(command_slice.commands) == 0:
+                return changed
+
+            for command in command_slice.commands:
+                prev_command = sent.get(index)
+
+                if command is not prev_command:
+                    sent[index] = command
+                    changed.append((index, command))
+                    index += 1
+                elif command.status == CommandStatus.QUEUED:
+                    index = self._settled_cursor + len(sent)
+                    break
+                else:
+                    index += 1
+
+    def _advance_settled_cursor(self) -> None:
+        sent = self._sent_commands
+
+        while (
+            self._settled_cursor in sent
+            and sent[self._settled_cursor].status in _COMPLETED_STATUSES
+        ):
+            del sent[self._settled_cursor]
+            self._settled_cursor += 1
+
+
+def _summarize(command: Command) -> RunCommandSummary:
+    return RunCommandSummary.construct(
+        id=command.id,
+        key=command.key,
+        commandType=command.commandType,
+        status=command.status,
+        createdAt=command.createdAt,
+        startedAt=command.startedAt,
+        completedAt=command.completedAt,
+        params=command.params,
+        error=command.error,
+    )
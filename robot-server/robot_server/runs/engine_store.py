@@ -2,6 +2,7 @@
 from typing import List, NamedTuple, Optional
 
 from opentrons.hardware_control import HardwareControlAPI
+from opentrons.protocol_reader import PythonProtocolConfig
 from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
 from opentrons.protocol_engine import (
     ProtocolEngine,
@@ -11,7 +12,7 @@ from opentrons.protocol_engine import (
 )
 
 
-from robot_server.protocols import ProtocolResource
+from robot_server.protocols import CompletedAnalysis, ProtocolResource
 
 
 class EngineConflictError(RuntimeError):
@@ -90,6 +91,7 @@ class EngineStore:
         run_id: str,
         labware_offsets: List[LabwareOffsetCreate],
         protocol: Optional[ProtocolResource],
+        protocol_analysis: Optional[CompletedAnalysis] = None,
     ) -> StateSummary:
         """Create and store a ProtocolRunner and ProtocolEngine for a given Run.
 
@@ -97,6 +99,8 @@ class EngineStore:
             run_id: The run resource the engine is assigned to.
             labware_offsets: Labware offsets to create the engine with.
             protocol: The protocol to load the runner with, if any.
+            protocol_analysis: An analysis of the protocol, if any,
+                to estimate the run's duration from.
 
         Returns:
             The initial equipment and status summary of the engine.
@@ -114,6 +118,14 @@ class EngineStore:
         if protocol is not None:
             runner.load(protocol.source)
 
+            # JSON protocols queue all of their commands when they're loaded,
+            # but Python protocols only add each command as they run it,
+            # so the engine needs their analysis to know what's left to run.
+            if protocol_analysis is not None and isinstance(
+                protocol.source.config, PythonProtocolConfig
+            ):
+                engine.set_expected_commands(protocol_analysis.commands)
+
         for offset in labware_offsets:
             engine.add_labware_offset(offset)
 
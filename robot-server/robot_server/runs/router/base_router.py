@@ -25,9 +25,11 @@ from robot_server.service.json_api import (
 )
 
 from robot_server.protocols import (
+    AnalysisStore,
     ProtocolStore,
     ProtocolNotFound,
     ProtocolNotFoundError,
+    get_analysis_store,
     get_protocol_store,
 )
 
@@ -124,6 +126,7 @@ async def create_run(
     request_body: Optional[RequestModel[RunCreate]] = None,
     run_data_manager: RunDataManager = Depends(get_run_data_manager),
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
     run_id: str = Depends(get_unique_id),
     created_at: datetime = Depends(get_current_time),
     run_auto_deleter: RunAutoDeleter = Depends(get_run_auto_deleter),
@@ -134,6 +137,8 @@ async def create_run(
         request_body: Optional request body with run creation data.
         run_data_manager: Current and historical run data management.
         protocol_store: Protocol resource storage.
+        analysis_store: Protocol analysis storage, used to estimate
+            how long the run will take.
         run_id: Generated ID to assign to the run.
         created_at: Timestamp to attach to created run.
         run_auto_deleter: An interface to delete old resources to make room for
@@ -142,6 +147,7 @@ async def create_run(
     protocol_id = request_body.data.protocolId if request_body is not None else None
     offsets = request_body.data.labwareOffsets if request_body is not None else []
     protocol_resource = None
+    protocol_analysis = None
 
     # TODO (tz, 5-16-22): same error raised twice.
     #  Check if we can consolidate to one place.
@@ -151,6 +157,10 @@ async def create_run(
         except ProtocolNotFoundError as e:
             raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
+        protocol_analysis = await analysis_store.get_latest_completed(
+            protocol_id=protocol_id
+        )
+
     # TODO(mc, 2022-05-13): move inside `RunDataManager` or return data
     # to pass to `RunDataManager.create`. Right now, runs may be deleted
     # even if a new create is unable to succeed due to a conflict
@@ -162,6 +172,7 @@ async def create_run(
             created_at=created_at,
             labware_offsets=offsets,
             protocol=protocol_resource,
+            protocol_analysis=protocol_analysis,
         )
     except EngineConflictError as e:
         raise RunAlreadyActive(detail=str(e)).as_error(status.HTTP_409_CONFLICT) from e
@@ -1,11 +1,12 @@
 """Router for /runs commands endpoints."""
 from anyio import move_on_after
 from datetime import datetime
-from typing import Optional, Union
+from typing import AsyncIterator, Callable, Optional, Union
 from typing_extensions import Final, Literal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from pydantic import BaseModel, Field
+from starlette.responses import StreamingResponse
 
 from opentrons.protocol_engine import ProtocolEngine, commands as pe_commands
 
@@ -19,6 +20,7 @@ from robot_server.service.json_api import (
 )
 
 from ..run_models import RunCommandSummary
+from ..command_stream import RunCommandStream, RunStreamEvent
 from ..run_data_manager import RunDataManager
 from ..engine_store import EngineStore
 from ..run_store import RunStore, RunNotFoundError, CommandNotFoundError
@@ -257,6 +259,91 @@ async def get_run_commands(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/commands/stream",
+    summary="Stream changes to the run's commands",
+    description=(
+        "Follow the current run's commands as a stream of server-sent events"
+        " instead of polling `GET /runs/{runId}/commands`."
+        "\n\n"
+        "A `command` event is sent whenever a command is added or changes,"
+        " with the command's index and summary as its data."
+        " An `estimate` event is sent whenever the run's estimated duration"
+        " or estimated remaining duration changes."
+        " A `status` event is sent whenever the run's status changes."
+        " The stream ends once the run reaches a terminal status."
+        "\n\n"
+        "Every event's `id` is a cursor. To resume a dropped stream without"
+        " missing changes, reconnect with that cursor, either in the `cursor`"
+        " query parameter or the `Last-Event-ID` header."
+        " Some commands may be sent again after resuming."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_409_CONFLICT: {"model": ErrorBody[RunStopped]},
+    },
+)
+async def stream_run_commands(
+    runId: str,
+    cursor: int = Query(
+        0,
+        ge=0,
+        description="The index of the first command to send.",
+    ),
+    lastEventId: Optional[int] = Header(
+        None,
+        alias="Last-Event-ID",
+        description=(
+            "The `id` of the last event received before the stream dropped."
+            " Takes precedence over the `cursor` query parameter."
+        ),
+    ),
+    protocol_engine: ProtocolEngine = Depends(get_current_run_engine_from_url),
+    engine_store: EngineStore = Depends(get_engine_store),
+) -> StreamingResponse:
+    """Stream changes to the current run's commands.
+
+    Arguments:
+        runId: Run ID to follow, from the URL.
+        cursor: Index of the first command to send, from the URL.
+        lastEventId: Cursor to resume a previous stream from, from the headers.
+        protocol_engine: The current run's `ProtocolEngine`.
+        engine_store: Used to end the stream if the run stops being current.
+    """
+    command_stream = RunCommandStream(
+        protocol_engine=protocol_engine,
+        cursor=lastEventId if lastEventId is not None else cursor,
+    )
+
+    return StreamingResponse(
+        content=_format_server_sent_events(
+            events=command_stream.events(),
+            is_current=lambda: engine_store.current_run_id == runId,
+        ),
+        media_type="text/event-stream",
+    )
+
+
+async def _format_server_sent_events(
+    events: AsyncIterator[RunStreamEvent],
+    is_current: Callable[[], bool],
+) -> AsyncIterator[str]:
+    async for event in events:
+        if event.data is None:
+            # an idle run that is no longer current will never change again
+            if not is_current():
+                return
+            yield f": {event.event}\n\n"
+        else:
+            yield (
+                f"id: {event.cursor}\n"
+                f"event: {event.event}\n"
+                f"data: {event.data.json()}\n\n"
+            )
+
+
 @commands_router.get(
     path="/runs/{runId}/commands/{commandId}",
     summary="Get full details about a specific command in the run",
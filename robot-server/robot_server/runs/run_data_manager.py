@@ -11,9 +11,10 @@ from opentrons.protocol_engine import (
     Command,
 )
 
-from robot_server.protocols import ProtocolResource
+from robot_server.protocols import CompletedAnalysis, ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 
+from .command_persister import RunCommandPersister
 from .engine_store import EngineStore
 from .run_store import RunResource, RunStore
 from .run_models import Run
@@ -44,6 +45,8 @@ def _build_run(
         labware=state_summary.labware,
         labwareOffsets=state_summary.labwareOffsets,
         pipettes=state_summary.pipettes,
+        estimatedDuration=state_summary.estimatedDuration,
+        estimatedRemainingDuration=state_summary.estimatedRemainingDuration,
         current=current,
     )
 
@@ -81,6 +84,7 @@ class RunDataManager:
         created_at: datetime,
         labware_offsets: List[LabwareOffsetCreate],
         protocol: Optional[ProtocolResource],
+        protocol_analysis: Optional[CompletedAnalysis] = None,
     ) -> Run:
         """Create a new, current run.
 
@@ -88,6 +92,9 @@ class RunDataManager:
             run_id: Identifier to assign the new run.
             created_at: Creation datetime.
             labware_offsets: Labware offsets to initialize the engine with.
+            protocol: The protocol to load the runner with, if any.
+            protocol_analysis: The protocol's most recent analysis, if any,
+                to estimate the run's duration from.
 
         Returns:
             The run resource.
@@ -109,12 +116,16 @@ class RunDataManager:
             run_id=run_id,
             labware_offsets=labware_offsets,
             protocol=protocol,
+            protocol_analysis=protocol_analysis,
         )
         run_resource = self._run_store.insert(
             run_id=run_id,
             created_at=created_at,
             protocol_id=protocol.protocol_id if protocol is not None else None,
         )
+        self._engine_store.engine.add_plugin(
+            RunCommandPersister(run_id=run_id, run_store=self._run_store)
+        )
 
         return _build_run(
             run_resource=run_resource,
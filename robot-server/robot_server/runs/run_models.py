@@ -50,6 +50,36 @@ class RunCommandSummary(ResourceModel):
     params: CommandParams = Field(..., description="Command execution parameters.")
 
 
+class RunCommandUpdate(BaseModel):
+    """A command that was added to or changed in a run, sent by the run stream."""
+
+    index: int = Field(..., description="Index of the command in the overall list.")
+    command: RunCommandSummary = Field(..., description="The command's new state.")
+
+
+class RunStatusUpdate(BaseModel):
+    """A change to a run's status, sent by the run stream."""
+
+    status: RunStatus = Field(..., description="The run's new status.")
+
+
+class RunEstimateUpdate(BaseModel):
+    """A change to a run's estimated duration, sent by the run stream."""
+
+    estimatedDuration: float = Field(
+        ...,
+        description="The run's new estimated duration, in seconds.",
+    )
+    estimatedRemainingDuration: float = Field(
+        ...,
+        description=(
+            "The new estimated duration, in seconds, of the run's commands"
+            " that are still queued or running, and of the commands that"
+            " the protocol's analysis says it has yet to add."
+        ),
+    )
+
+
 class Run(ResourceModel):
     """Run resource model."""
 
@@ -90,6 +120,25 @@ class Run(ResourceModel):
             " still be used to execute protocol commands over HTTP."
         ),
     )
+    estimatedDuration: Optional[float] = Field(
+        None,
+        description=(
+            "Estimated duration of the run, in seconds. This includes the"
+            " commands that have run and the commands that are queued or"
+            " running. For a Python protocol with a completed analysis,"
+            " it also includes the commands that the analysis says the"
+            " protocol has yet to add."
+        ),
+    )
+    estimatedRemainingDuration: Optional[float] = Field(
+        None,
+        description=(
+            "Estimated duration, in seconds, of the run's commands"
+            " that are queued or running. For a Python protocol with"
+            " a completed analysis, it also includes the commands that"
+            " the analysis says the protocol has yet to add."
+        ),
+    )
 
 
 class RunCreate(BaseModel):
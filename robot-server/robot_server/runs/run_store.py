@@ -2,7 +2,7 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import sqlalchemy
 from pydantic import parse_obj_as
@@ -11,7 +11,12 @@ from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table, ensure_utc_datetime
+from robot_server.persistence import (
+    run_table,
+    run_command_table,
+    action_table,
+    ensure_utc_datetime,
+)
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -62,6 +67,10 @@ class RunStore:
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        Commands that have already been written by `insert_commands`
+        are left in place, so only the unpersisted tail of `commands`
+        is written to the database.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
@@ -78,13 +87,18 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
             )
         )
+        select_commands_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            run_command_table.c.run_id == run_id
+        )
+        delete_extra_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.index_in_run >= len(commands),
+        )
         select_run_resource = sqlalchemy.select(
             run_table.c.id,
             run_table.c.protocol_id,
@@ -103,6 +117,15 @@ class RunStore:
             except sqlalchemy.exc.NoResultFound:
                 raise RunNotFoundError(run_id=run_id)
 
+            persisted_count = transaction.execute(select_commands_count).scalar_one()
+            transaction.execute(delete_extra_commands)
+            _insert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                start_index=persisted_count,
+                commands=commands[persisted_count:],
+            )
+
             action_rows = transaction.execute(select_actions).all()
 
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
@@ -127,6 +150,34 @@ class RunStore:
             except sqlalchemy.exc.IntegrityError:
                 raise RunNotFoundError(run_id=run_id)
 
+    def insert_commands(
+        self,
+        run_id: str,
+        start_index: int,
+        commands: Sequence[Command],
+    ) -> None:
+        """Persist some of a run's commands, ahead of its final state update.
+
+        Args:
+            run_id: The run the commands belong to.
+            start_index: The index of `commands[0]` in the run's full command list.
+            commands: Commands to store. Any command already stored
+                at the same index will be replaced.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found in the store.
+        """
+        with self._sql_engine.begin() as transaction:
+            try:
+                _insert_commands(
+                    transaction=transaction,
+                    run_id=run_id,
+                    start_index=start_index,
+                    commands=commands,
+                )
+            except sqlalchemy.exc.IntegrityError:
+                raise RunNotFoundError(run_id=run_id)
+
     def insert(
         self,
         run_id: str,
@@ -270,27 +321,37 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            run_command_table.c.run_id == run_id
         )
 
         with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
+            if not _has_run(transaction=transaction, run_id=run_id):
                 raise RunNotFoundError(run_id=run_id)
 
-        command_source_dicts = row.commands if row.commands is not None else []
-        commands_length = len(command_source_dicts)
-        if cursor is None:
-            cursor = commands_length - length
+            commands_length = transaction.execute(select_count).scalar_one()
+
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            command_rows = transaction.execute(select_slice).all()
 
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
         sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_source_dicts[actual_cursor:stop]
+            parse_obj_as(Command, row.command)  # type: ignore[arg-type]
+            for row in command_rows
         ]
 
         return CommandSlice(
@@ -313,20 +374,21 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
         )
+
         with self._sql_engine.begin() as transaction:
+            if not _has_run(transaction=transaction, run_id=run_id):
+                raise RunNotFoundError(run_id=run_id)
+
             try:
-                row = transaction.execute(select_run_commands).one()
+                row = transaction.execute(select_command).one()
             except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
-            try:
-                command = next(c for c in row.commands if c["id"] == command_id)
-            except StopIteration as e:
                 raise CommandNotFoundError(command_id=command_id) from e
 
-            return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        return parse_obj_as(Command, row.command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -341,14 +403,43 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
             if result.rowcount < 1:
                 raise RunNotFoundError(run_id)
 
 
+def _insert_commands(
+    transaction: sqlalchemy.engine.Connection,
+    run_id: str,
+    start_index: int,
+    commands: Sequence[Command],
+) -> None:
+    if len(commands) > 0:
+        transaction.execute(
+            sqlalchemy.insert(run_command_table).prefix_with("OR REPLACE"),
+            [
+                _convert_command_to_sql_values(
+                    run_id=run_id,
+                    index=start_index + offset,
+                    command=command,
+                )
+                for offset, command in enumerate(commands)
+            ],
+        )
+
+
+def _has_run(transaction: sqlalchemy.engine.Connection, run_id: str) -> bool:
+    select_run_id = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+    return transaction.execute(select_run_id).first() is not None
+
+
 def _convert_row_to_run(
     row: sqlalchemy.engine.Row,
     action_rows: List[sqlalchemy.engine.Row],
@@ -395,14 +486,24 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_command_to_sql_values(
+    run_id: str,
+    index: int,
+    command: Command,
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index,
+        "command_id": command.id,
+        "command": command.dict(),
+    }
@@ -75,5 +75,15 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    analysis_worker_count: int = Field(
+        1,
+        ge=1,
+        description=(
+            "How many protocol analyses to run at once."
+            " Each one runs in its own worker process."
+            " Further analyses wait in a queue."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
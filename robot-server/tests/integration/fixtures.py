@@ -29,7 +29,11 @@ def check_health_response(response: Response) -> None:
         },
     }
 
-    assert response.json() == expected
+    health = response.json()
+    # Depends on which protocols other tests have uploaded.
+    analysis_cache = health.pop("analysis_cache")
+    assert set(analysis_cache) == {"hits", "misses"}
+    assert health == expected
 
 
 def delete_all_runs(response: Response, host: str, port: str) -> None:
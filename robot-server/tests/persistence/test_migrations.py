@@ -1,4 +1,5 @@
 """Test SQL database migrations."""
+from datetime import datetime
 from pathlib import Path
 from typing import Generator
 
@@ -10,13 +11,32 @@ from robot_server.persistence.database import create_sql_engine
 from robot_server.persistence.tables import (
     migration_table,
     run_table,
+    run_command_table,
     action_table,
     protocol_table,
     analysis_table,
 )
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, run_command_table, action_table, protocol_table, analysis_table]
+
+
+def _drop_analysis_cache_key(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Recreate the analysis table as it was before schema version 3."""
+    sql_engine.execute("DROP TABLE analysis")
+    sql_engine.execute(
+        """
+        CREATE TABLE analysis (
+            id VARCHAR NOT NULL,
+            protocol_id VARCHAR NOT NULL,
+            analyzer_version VARCHAR NOT NULL,
+            completed_analysis BLOB NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES protocol (id)
+        )
+        """
+    )
+    sql_engine.execute("CREATE INDEX ix_analysis_protocol_id ON analysis (protocol_id)")
 
 
 @pytest.fixture
@@ -24,6 +44,7 @@ def database_v0(tmp_path: Path) -> Path:
     """Create a database matching schema version 0."""
     db_path = tmp_path / "migration-test-v0.db"
     sql_engine = create_sql_engine(db_path)
+    _drop_analysis_cache_key(sql_engine)
     sql_engine.execute("DROP TABLE migration")
     sql_engine.execute("DROP TABLE run")
     sql_engine.execute(
@@ -46,6 +67,45 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    _drop_analysis_cache_key(sql_engine)
+    sql_engine.execute("DROP TABLE migration")
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute(
+        """
+        CREATE TABLE migration (
+            id INTEGER NOT NULL,
+            created_at DATETIME NOT NULL,
+            version INTEGER NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    sql_engine.execute(
+        """
+        INSERT INTO migration (id, created_at, version)
+        VALUES (1, '2022-05-01 00:00:00', 1)
+        """
+    )
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    _drop_analysis_cache_key(sql_engine)
+    sql_engine.execute("UPDATE migration SET version = 2")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -68,15 +128,45 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
     [
         lazy_fixture("database_v0"),
         lazy_fixture("database_v1"),
+        lazy_fixture("database_v2"),
+        lazy_fixture("database_v3"),
     ],
 )
 def test_migration(subject: sqlalchemy.engine.Engine) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations][-1] == 3
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_1_to_2_moves_commands(database_v1: Path) -> None:
+    """It should move pickled run commands into the run_command table."""
+    # open without migrating, to insert v1-style data
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v1}")
+    sql_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2022, month=5, day=1),
+            commands=[{"id": "command-1"}, {"id": "command-2"}],
+        )
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    command_rows = subject.execute(
+        sqlalchemy.select(run_command_table).order_by(run_command_table.c.index_in_run)
+    ).all()
+    run_row = subject.execute(sqlalchemy.select(run_table)).one()
+    subject.dispose()
+
+    assert [(r.run_id, r.index_in_run, r.command_id) for r in command_rows] == [
+        ("run-id", 0, "command-1"),
+        ("run-id", 1, "command-2"),
+    ]
+    assert command_rows[1].command == {"id": "command-2"}
+    assert run_row.commands is None
@@ -0,0 +1,61 @@
+"""Tests for analysis cache keys."""
+from pathlib import Path
+
+import pytest
+
+from opentrons.config import CONFIG
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+)
+
+from robot_server.protocols.analysis_cache import compute_cache_key
+
+
+def _make_source(directory: Path, contents: str) -> ProtocolSource:
+    directory.mkdir()
+    main_file = directory / "protocol.json"
+    main_file.write_text(contents)
+
+    return ProtocolSource(
+        directory=directory,
+        main_file=main_file,
+        config=JsonProtocolConfig(schema_version=6),
+        files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+        metadata={},
+        labware_definitions=[],
+    )
+
+
+def test_same_files_same_key(tmp_path: Path) -> None:
+    """It should give identical files in different directories the same key."""
+    source_1 = _make_source(tmp_path / "upload-1", '{"hello": "world"}')
+    source_2 = _make_source(tmp_path / "upload-2", '{"hello": "world"}')
+
+    assert compute_cache_key(source_1) == compute_cache_key(source_2)
+
+
+def test_different_files_different_key(tmp_path: Path) -> None:
+    """It should give files with different contents different keys."""
+    source_1 = _make_source(tmp_path / "upload-1", '{"hello": "world"}')
+    source_2 = _make_source(tmp_path / "upload-2", '{"hello": "there"}')
+
+    assert compute_cache_key(source_1) != compute_cache_key(source_2)
+
+
+def test_robot_config_changes_key(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should change the key when the robot's pipette config changes."""
+    source = _make_source(tmp_path / "upload", '{"hello": "world"}')
+    overrides_dir = tmp_path / "pipette-overrides"
+    overrides_dir.mkdir()
+    monkeypatch.setitem(CONFIG, "pipette_config_overrides_dir", overrides_dir)
+
+    key_before = compute_cache_key(source)
+    (overrides_dir / "pipette-id.json").write_text('{"maxVolume": 10}')
+    key_after = compute_cache_key(source)
+
+    assert key_before != key_after
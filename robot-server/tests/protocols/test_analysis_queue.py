@@ -0,0 +1,374 @@
+"""Tests for the AnalysisQueue."""
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, cast
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+
+from robot_server.protocols.analysis_models import (
+    AnalysisQueueStatus,
+    AnalysisStatus,
+    AnalysisSummary,
+)
+from robot_server.protocols.analysis_queue import AnalysisQueue
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.protocol_store import ProtocolResource
+
+
+class _FakeProtocolAnalyzer:
+    """A ProtocolAnalyzer whose analyses only finish when a test says so."""
+
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.cancelled: List[str] = []
+        self.cached_protocol_ids: Set[str] = set()
+        self._finished: Dict[str, asyncio.Event] = {}
+
+    async def get_cache_key(self, protocol_resource: ProtocolResource) -> str:
+        return f"key-{protocol_resource.protocol_id}"
+
+    async def analyze_from_cache(self, analysis_id: str, cache_key: str) -> bool:
+        return cache_key[len("key-") :] in self.cached_protocol_ids
+
+    async def analyze(
+        self,
+        protocol_resource: ProtocolResource,
+        analysis_id: str,
+        cache_key: Optional[str] = None,
+    ) -> None:
+        self.started.append(analysis_id)
+        finished = self._finished.setdefault(analysis_id, asyncio.Event())
+        try:
+            await finished.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(analysis_id)
+            raise
+
+    def finish(self, analysis_id: str) -> None:
+        self._finished.setdefault(analysis_id, asyncio.Event()).set()
+
+
+def _make_protocol(protocol_id: str) -> ProtocolResource:
+    return ProtocolResource(
+        protocol_id=protocol_id,
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            labware_definitions=[],
+        ),
+        protocol_key=None,
+    )
+
+
+def _summary(
+    analysis_id: str,
+    queue_status: AnalysisQueueStatus,
+    queue_position: Optional[int] = None,
+) -> AnalysisSummary:
+    return AnalysisSummary(
+        id=analysis_id,
+        status=AnalysisStatus.PENDING,
+        queueStatus=queue_status,
+        queuePosition=queue_position,
+    )
+
+
+async def _settle() -> None:
+    """Let started and finished analysis tasks run."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def protocol_analyzer() -> _FakeProtocolAnalyzer:
+    """Get a fake ProtocolAnalyzer."""
+    return _FakeProtocolAnalyzer()
+
+
+@pytest.fixture
+def analysis_store(decoy: Decoy) -> AnalysisStore:
+    """Get a mocked out AnalysisStore."""
+    return decoy.mock(cls=AnalysisStore)
+
+
+@pytest.fixture
+def subject(
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+) -> AnalysisQueue:
+    """Get an AnalysisQueue test subject that runs two analyses at once."""
+    return AnalysisQueue(
+        protocol_analyzer=cast(ProtocolAnalyzer, protocol_analyzer),
+        analysis_store=analysis_store,
+        max_running=2,
+    )
+
+
+async def test_add_runs_in_order(
+    decoy: Decoy,
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should start analyses in the order they were added, up to its limit."""
+    for i in range(1, 3):
+        decoy.when(
+            analysis_store.update_pending(
+                analysis_id=f"analysis-{i}",
+                queue_status=AnalysisQueueStatus.RUNNING,
+                queue_position=None,
+            )
+        ).then_return(_summary(f"analysis-{i}", AnalysisQueueStatus.RUNNING))
+
+    decoy.when(
+        analysis_store.update_pending(
+            analysis_id="analysis-3",
+            queue_status=AnalysisQueueStatus.QUEUED,
+            queue_position=0,
+        )
+    ).then_return(_summary("analysis-3", AnalysisQueueStatus.QUEUED, 0))
+
+    result_1 = await subject.add(_make_protocol("protocol-1"), analysis_id="analysis-1")
+    result_2 = await subject.add(_make_protocol("protocol-2"), analysis_id="analysis-2")
+    result_3 = await subject.add(_make_protocol("protocol-3"), analysis_id="analysis-3")
+    await _settle()
+
+    assert result_1 == _summary("analysis-1", AnalysisQueueStatus.RUNNING)
+    assert result_2 == _summary("analysis-2", AnalysisQueueStatus.RUNNING)
+    assert result_3 == _summary("analysis-3", AnalysisQueueStatus.QUEUED, 0)
+    assert protocol_analyzer.started == ["analysis-1", "analysis-2"]
+    decoy.verify(
+        analysis_store.add_pending(protocol_id="protocol-1", analysis_id="analysis-1"),
+        analysis_store.add_pending(protocol_id="protocol-2", analysis_id="analysis-2"),
+        analysis_store.add_pending(protocol_id="protocol-3", analysis_id="analysis-3"),
+    )
+
+    protocol_analyzer.finish("analysis-2")
+    await _settle()
+
+    assert protocol_analyzer.started == ["analysis-1", "analysis-2", "analysis-3"]
+    decoy.verify(
+        analysis_store.update_pending(
+            analysis_id="analysis-3",
+            queue_status=AnalysisQueueStatus.RUNNING,
+            queue_position=None,
+        )
+    )
+
+    await subject.close()
+
+
+async def test_add_updates_queue_positions(
+    decoy: Decoy,
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should keep the positions of queued analyses up to date."""
+    for i in range(1, 5):
+        await subject.add(_make_protocol(f"protocol-{i}"), analysis_id=f"analysis-{i}")
+    await _settle()
+
+    decoy.verify(
+        analysis_store.update_pending(
+            analysis_id="analysis-4",
+            queue_status=AnalysisQueueStatus.QUEUED,
+            queue_position=1,
+        )
+    )
+
+    protocol_analyzer.finish("analysis-1")
+    await _settle()
+
+    decoy.verify(
+        analysis_store.update_pending(
+            analysis_id="analysis-3",
+            queue_status=AnalysisQueueStatus.RUNNING,
+            queue_position=None,
+        ),
+        analysis_store.update_pending(
+            analysis_id="analysis-4",
+            queue_status=AnalysisQueueStatus.QUEUED,
+            queue_position=0,
+        ),
+    )
+
+    await subject.close()
+
+
+async def test_analysis_failure_advances_queue(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should move on to the next analysis if one raises."""
+    protocol_analyzer = decoy.mock(cls=ProtocolAnalyzer)
+    protocol_1 = _make_protocol("protocol-1")
+    protocol_2 = _make_protocol("protocol-2")
+    subject = AnalysisQueue(
+        protocol_analyzer=protocol_analyzer,
+        analysis_store=analysis_store,
+        max_running=1,
+    )
+
+    decoy.when(
+        await protocol_analyzer.analyze(
+            protocol_resource=protocol_1,
+            analysis_id="analysis-1",
+            cache_key="key-1",
+        )
+    ).then_raise(RuntimeError("oh no"))
+
+    decoy.when(await protocol_analyzer.get_cache_key(protocol_1)).then_return("key-1")
+    decoy.when(await protocol_analyzer.get_cache_key(protocol_2)).then_return("key-2")
+    decoy.when(
+        await protocol_analyzer.analyze_from_cache(
+            analysis_id="analysis-1", cache_key="key-1"
+        )
+    ).then_return(False)
+    decoy.when(
+        await protocol_analyzer.analyze_from_cache(
+            analysis_id="analysis-2", cache_key="key-2"
+        )
+    ).then_return(False)
+
+    await subject.add(protocol_1, analysis_id="analysis-1")
+    await subject.add(protocol_2, analysis_id="analysis-2")
+    await _settle()
+
+    decoy.verify(
+        await protocol_analyzer.analyze(
+            protocol_resource=protocol_2,
+            analysis_id="analysis-2",
+            cache_key="key-2",
+        )
+    )
+
+    await subject.close()
+
+
+async def test_add_cached(
+    decoy: Decoy,
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should complete an analysis from the cache without queueing it."""
+    protocol_analyzer.cached_protocol_ids.add("protocol-2")
+
+    await subject.add(_make_protocol("protocol-1"), analysis_id="analysis-1")
+    result = await subject.add(_make_protocol("protocol-2"), analysis_id="analysis-2")
+    await _settle()
+
+    assert result == AnalysisSummary(id="analysis-2", status=AnalysisStatus.COMPLETED)
+    assert protocol_analyzer.started == ["analysis-1"]
+    decoy.verify(
+        analysis_store.update_pending(
+            analysis_id="analysis-2",
+            queue_status=matchers.Anything(),
+            queue_position=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+    # The cached analysis is no longer pending, so there's nothing to cancel.
+    subject.cancel(protocol_id="protocol-2")
+    decoy.verify(
+        analysis_store.remove_pending(analysis_id="analysis-2"),
+        times=0,
+    )
+
+    await subject.close()
+
+
+async def test_cancel_queued(
+    decoy: Decoy,
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should remove a queued analysis without ever starting it."""
+    for i in range(1, 5):
+        await subject.add(_make_protocol(f"protocol-{i}"), analysis_id=f"analysis-{i}")
+    await _settle()
+
+    subject.cancel(protocol_id="protocol-3")
+
+    decoy.verify(
+        analysis_store.remove_pending(analysis_id="analysis-3"),
+        analysis_store.update_pending(
+            analysis_id="analysis-4",
+            queue_status=AnalysisQueueStatus.QUEUED,
+            queue_position=0,
+        ),
+    )
+
+    protocol_analyzer.finish("analysis-1")
+    protocol_analyzer.finish("analysis-2")
+    await _settle()
+
+    assert protocol_analyzer.started == ["analysis-1", "analysis-2", "analysis-4"]
+
+    await subject.close()
+
+
+async def test_cancel_running(
+    decoy: Decoy,
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should cancel a running analysis and start the next one."""
+    for i in range(1, 4):
+        await subject.add(_make_protocol(f"protocol-{i}"), analysis_id=f"analysis-{i}")
+    await _settle()
+
+    subject.cancel(protocol_id="protocol-1")
+    await _settle()
+
+    assert protocol_analyzer.cancelled == ["analysis-1"]
+    assert protocol_analyzer.started == ["analysis-1", "analysis-2", "analysis-3"]
+    decoy.verify(analysis_store.remove_pending(analysis_id="analysis-1"))
+
+    await subject.close()
+
+
+async def test_cancel_unknown(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    subject: AnalysisQueue,
+) -> None:
+    """It should do nothing if the protocol has no pending analysis."""
+    subject.cancel(protocol_id="protocol-id")
+
+    decoy.verify(
+        analysis_store.remove_pending(analysis_id=matchers.Anything()),
+        times=0,
+    )
+
+
+async def test_close(
+    protocol_analyzer: _FakeProtocolAnalyzer,
+    subject: AnalysisQueue,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """It should cancel running analyses and drop queued ones on close."""
+    for i in range(1, 4):
+        await subject.add(_make_protocol(f"protocol-{i}"), analysis_id=f"analysis-{i}")
+    await _settle()
+
+    await subject.close()
+
+    # Cancelled analyses aren't failed ones.
+    assert "failed" not in caplog.text
+
+    assert protocol_analyzer.cancelled == ["analysis-1", "analysis-2"]
+    assert protocol_analyzer.started == ["analysis-1", "analysis-2"]
@@ -0,0 +1,127 @@
+"""Tests for the stored format of completed analyses."""
+import json
+import pickle
+import struct
+import zlib
+from datetime import datetime
+
+import pytest
+
+from opentrons.types import MountType, DeckSlotName
+from opentrons.protocol_engine import (
+    commands as pe_commands,
+    errors as pe_errors,
+    types as pe_types,
+)
+
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
+from robot_server.protocols.analysis_serialization import (
+    AnalysisFormatError,
+    CompletedAnalysisSummary,
+    serialize_completed_analysis,
+    deserialize_completed_analysis,
+    deserialize_completed_analysis_summary,
+)
+
+
+@pytest.fixture
+def completed_analysis() -> CompletedAnalysis:
+    """Get a CompletedAnalysis with one of everything in it."""
+    return CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.NOT_OK,
+        labware=[
+            pe_types.LoadedLabware(
+                id="labware-id",
+                loadName="load-name",
+                definitionUri="namespace/load-name/42",
+                location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+                offsetId=None,
+            )
+        ],
+        pipettes=[
+            pe_types.LoadedPipette(
+                id="pipette-id",
+                pipetteName=pe_types.PipetteName.P300_SINGLE,
+                mount=MountType.LEFT,
+            )
+        ],
+        commands=[
+            pe_commands.Pause(
+                id="pause-1",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2021, month=1, day=1),
+                params=pe_commands.PauseParams(message="hello world"),
+                result=pe_commands.PauseResult(),
+            )
+        ],
+        errors=[
+            pe_errors.ErrorOccurrence(
+                id="error-id",
+                createdAt=datetime(year=2021, month=1, day=1),
+                errorType="BadError",
+                detail="oh no",
+            )
+        ],
+    )
+
+
+def test_round_trip(completed_analysis: CompletedAnalysis) -> None:
+    """It should decode an analysis to what was encoded."""
+    data = serialize_completed_analysis(completed_analysis)
+    assert deserialize_completed_analysis(data) == completed_analysis
+
+
+def test_deserialize_summary_skips_commands(
+    completed_analysis: CompletedAnalysis,
+) -> None:
+    """It should decode the result and errors without touching the commands."""
+    data = serialize_completed_analysis(completed_analysis)
+
+    # The commands section is the last payload; replace it with garbage.
+    header_length = struct.unpack_from(">I", data, 6)[0]
+    header = json.loads(data[10 : 10 + header_length])
+    commands_offset, commands_length = header["sections"]["commands"]
+    commands_start = 10 + header_length + commands_offset
+    corrupted = data[:commands_start] + b"\xff" * commands_length
+
+    with pytest.raises(zlib.error):
+        deserialize_completed_analysis(corrupted)
+
+    assert deserialize_completed_analysis_summary(
+        corrupted
+    ) == CompletedAnalysisSummary(
+        id="analysis-id",
+        result=AnalysisResult.NOT_OK,
+        errors=completed_analysis.errors,
+    )
+
+
+def test_deserialize_legacy_pickle_summary(
+    completed_analysis: CompletedAnalysis,
+) -> None:
+    """It should summarize analyses stored as plain pickles."""
+    data = pickle.dumps(completed_analysis.dict())
+
+    assert deserialize_completed_analysis_summary(data) == CompletedAnalysisSummary(
+        id="analysis-id",
+        result=AnalysisResult.NOT_OK,
+        errors=completed_analysis.errors,
+    )
+
+
+def test_deserialize_legacy_pickle(completed_analysis: CompletedAnalysis) -> None:
+    """It should decode analyses stored as pickles by older software."""
+    data = pickle.dumps(completed_analysis.dict())
+
+    assert deserialize_completed_analysis(data) == completed_analysis
+
+
+def test_deserialize_unknown_version(completed_analysis: CompletedAnalysis) -> None:
+    """It should raise if the stored format version is not supported."""
+    data = bytearray(serialize_completed_analysis(completed_analysis))
+    data[4:6] = (999).to_bytes(2, "big")
+
+    with pytest.raises(AnalysisFormatError, match="999"):
+        deserialize_completed_analysis(bytes(data))
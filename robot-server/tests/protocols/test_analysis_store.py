@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, NamedTuple
 
+import sqlalchemy
 from sqlalchemy.engine import Engine as SQLEngine
 
 from opentrons.types import MountType, DeckSlotName
@@ -18,7 +19,9 @@ from opentrons.protocol_reader import (
     JsonProtocolConfig,
 )
 
+from robot_server.persistence import analysis_table
 from robot_server.protocols.analysis_models import (
+    AnalysisQueueStatus,
     AnalysisResult,
     AnalysisStatus,
     AnalysisSummary,
@@ -78,7 +81,7 @@ async def test_get_empty(subject: AnalysisStore, protocol_store: ProtocolStore)
     protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
 
     full_result = await subject.get_by_protocol("protocol-id")
-    summaries_result = subject.get_summaries_by_protocol("protocol-id")
+    summaries_result = await subject.get_summaries_by_protocol("protocol-id")
 
     assert full_result == []
     assert summaries_result == []
@@ -104,7 +107,55 @@ async def test_add_pending(
     assert result == expected_summary
     assert await subject.get("analysis-id") == expected_analysis
     assert await subject.get_by_protocol("protocol-id") == [expected_analysis]
-    assert subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+    assert await subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+
+
+async def test_update_pending(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should update where a pending analysis is in the analysis queue."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    expected_analysis = PendingAnalysis(
+        id="analysis-id",
+        queueStatus=AnalysisQueueStatus.QUEUED,
+        queuePosition=2,
+    )
+    expected_summary = AnalysisSummary(
+        id="analysis-id",
+        status=AnalysisStatus.PENDING,
+        queueStatus=AnalysisQueueStatus.QUEUED,
+        queuePosition=2,
+    )
+
+    result = subject.update_pending(
+        analysis_id="analysis-id",
+        queue_status=AnalysisQueueStatus.QUEUED,
+        queue_position=2,
+    )
+
+    assert result == expected_summary
+    assert await subject.get("analysis-id") == expected_analysis
+    assert await subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+
+
+async def test_remove_pending(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should remove a pending analysis that will never complete."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    subject.remove_pending(analysis_id="analysis-id")
+
+    assert await subject.get_summaries_by_protocol("protocol-id") == []
+
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
+        await subject.get("analysis-id")
+
+    # The protocol can get a new pending analysis.
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
 
 
 async def test_returned_in_order_added(
@@ -150,7 +201,7 @@ async def test_returned_in_order_added(
         "analysis-id-3",
         "analysis-id-4",
     ]
-    summaries = subject.get_summaries_by_protocol(protocol_id="protocol-id")
+    summaries = await subject.get_summaries_by_protocol(protocol_id="protocol-id")
     full_analyses = await subject.get_by_protocol(protocol_id="protocol-id")
     assert [s.id for s in summaries] == expected_order
     assert [a.id for a in full_analyses] == expected_order
@@ -257,3 +308,129 @@ async def test_update_infers_status_from_errors(
     analysis = (await subject.get_by_protocol("protocol-id"))[0]
     assert isinstance(analysis, CompletedAnalysis)
     assert analysis.result == expected_result
+
+
+async def test_get_from_new_store_instance(
+    subject: AnalysisStore, protocol_store: ProtocolStore, sql_engine: SQLEngine
+) -> None:
+    """It should read back analyses that another store instance wrote."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    await subject.update(
+        analysis_id="analysis-id",
+        commands=analysis_result_specs[0].commands,
+        errors=analysis_result_specs[1].errors,
+        labware=[],
+        pipettes=[],
+    )
+    expected = await subject.get("analysis-id")
+
+    expected_summary = AnalysisSummary(
+        id="analysis-id",
+        status=AnalysisStatus.COMPLETED,
+        result=AnalysisResult.NOT_OK,
+        errors=analysis_result_specs[1].errors,
+    )
+    assert await subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+
+    fresh_subject = AnalysisStore(sql_engine=sql_engine)
+
+    # Summarized from the database, without the analysis in memory.
+    assert await fresh_subject.get_summaries_by_protocol("protocol-id") == [
+        expected_summary
+    ]
+    assert await fresh_subject.get("analysis-id") == expected
+    assert await fresh_subject.get_by_protocol("protocol-id") == [expected]
+
+
+async def test_get_removed_analysis(
+    subject: AnalysisStore, protocol_store: ProtocolStore, sql_engine: SQLEngine
+) -> None:
+    """It should not return a cached analysis that was removed from the database."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    await subject.update(
+        analysis_id="analysis-id",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+    )
+    await subject.get("analysis-id")
+
+    sql_engine.execute(sqlalchemy.delete(analysis_table))
+
+    assert await subject.get_by_protocol("protocol-id") == []
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
+        await subject.get("analysis-id")
+
+
+async def test_get_by_cache_key(
+    subject: AnalysisStore, protocol_store: ProtocolStore, sql_engine: SQLEngine
+) -> None:
+    """It should return the latest current-version analysis with a cache key."""
+    for i in range(1, 4):
+        protocol_store.insert(make_dummy_protocol_resource(protocol_id=f"protocol-{i}"))
+        subject.add_pending(protocol_id=f"protocol-{i}", analysis_id=f"analysis-{i}")
+
+    await subject.update(
+        analysis_id="analysis-1",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+        cache_key="cache-key",
+    )
+    await subject.update(
+        analysis_id="analysis-2",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+        cache_key="cache-key",
+    )
+    await subject.update(
+        analysis_id="analysis-3",
+        commands=[],
+        errors=[],
+        labware=[],
+        pipettes=[],
+        cache_key="other-cache-key",
+    )
+
+    result = await subject.get_by_cache_key("cache-key")
+    assert result is not None
+    assert result.id == "analysis-2"
+
+    assert await subject.get_by_cache_key("missing-cache-key") is None
+
+    sql_engine.execute(
+        sqlalchemy.update(analysis_table).values(analyzer_version="old-version")
+    )
+    assert await subject.get_by_cache_key("cache-key") is None
+
+
+async def test_get_latest_completed(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return a protocol's most recent completed analysis."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    assert await subject.get_latest_completed(protocol_id="protocol-id") is None
+
+    for i in range(1, 3):
+        subject.add_pending(protocol_id="protocol-id", analysis_id=f"analysis-{i}")
+        await subject.update(
+            analysis_id=f"analysis-{i}",
+            commands=[],
+            errors=[],
+            labware=[],
+            pipettes=[],
+        )
+
+    # Pending analyses aren't completed yet.
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-3")
+
+    result = await subject.get_latest_completed(protocol_id="protocol-id")
+    assert result is not None
+    assert result.id == "analysis-2"
@@ -0,0 +1,89 @@
+"""Tests for the AnalysisWorkerPool."""
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data import get_shared_data_root
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_worker_pool import AnalysisWorkerPool
+
+
+@pytest.fixture
+async def json_protocol_source() -> ProtocolSource:
+    """Get a JSON protocol that analyzes quickly."""
+    simple_protocol = (
+        get_shared_data_root() / "protocol" / "fixtures" / "6" / "simpleV6.json"
+    )
+    return await ProtocolReader().read_saved(files=[simple_protocol], directory=None)
+
+
+@pytest.fixture
+async def slow_protocol_source(tmp_path: Path) -> ProtocolSource:
+    """Get a Python protocol whose analysis doesn't finish on its own."""
+    protocol = tmp_path / "slow.py"
+    protocol.write_text(
+        "import time\n"
+        "metadata = {'apiLevel': '2.11'}\n"
+        "def run(ctx):\n"
+        "    time.sleep(600)\n"
+    )
+    return await ProtocolReader().read_saved(files=[protocol], directory=None)
+
+
+async def test_run(json_protocol_source: ProtocolSource) -> None:
+    """It should analyze protocols in a worker process it reuses."""
+    subject = AnalysisWorkerPool(max_workers=1)
+
+    try:
+        first = await subject.run(json_protocol_source)
+        second = await subject.run(json_protocol_source)
+    finally:
+        await subject.shutdown()
+
+    assert len(first.commands) > 0
+    assert [c.commandType for c in first.commands] == [
+        c.commandType for c in second.commands
+    ]
+
+
+async def test_cancel_stops_worker(
+    json_protocol_source: ProtocolSource, slow_protocol_source: ProtocolSource
+) -> None:
+    """It should stop a worker whose analysis is cancelled, freeing its slot."""
+    subject = AnalysisWorkerPool(max_workers=1)
+
+    try:
+        task = asyncio.get_running_loop().create_task(subject.run(slow_protocol_source))
+        while not subject._busy:
+            await asyncio.sleep(0.01)
+        (worker,) = subject._busy
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not worker._process.is_alive()
+        result = await asyncio.wait_for(subject.run(json_protocol_source), timeout=60)
+        assert len(result.commands) > 0
+    finally:
+        await subject.shutdown()
+
+
+async def test_shutdown_interrupts_analyses(
+    slow_protocol_source: ProtocolSource,
+) -> None:
+    """It should not wait for running analyses to finish when shutting down."""
+    subject = AnalysisWorkerPool(max_workers=1)
+    task = asyncio.get_running_loop().create_task(subject.run(slow_protocol_source))
+    while not subject._busy:
+        await asyncio.sleep(0.01)
+    (worker,) = subject._busy
+
+    await asyncio.wait_for(subject.shutdown(), timeout=10)
+
+    assert not worker._process.is_alive()
+    with pytest.raises(BrokenProcessPool):
+        await task
@@ -1,6 +1,6 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -11,18 +11,26 @@ from opentrons.protocol_engine import (
     types as pe_types,
 )
 from opentrons.protocol_engine import StateSummary, EngineStatus
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
-from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+from opentrons.protocol_runner import ProtocolRunResult
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+)
 
+from robot_server.protocols.analysis_cache import AnalysisCacheStats
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker_pool import AnalysisWorkerPool
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def worker_pool(decoy: Decoy) -> AnalysisWorkerPool:
+    """Get a mocked out AnalysisWorkerPool."""
+    return decoy.mock(cls=AnalysisWorkerPool)
 
 
 @pytest.fixture
@@ -31,39 +39,47 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
     return decoy.mock(cls=AnalysisStore)
 
 
+@pytest.fixture
+def protocol_resource(tmp_path: Path) -> ProtocolResource:
+    """Get a protocol resource backed by a real file."""
+    main_file = tmp_path / "abc.json"
+    main_file.write_text("{}")
+
+    return ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=main_file,
+            config=JsonProtocolConfig(schema_version=123),
+            files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+            metadata={},
+            labware_definitions=[],
+        ),
+        protocol_key="dummy-data-111",
+    )
+
+
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    worker_pool: AnalysisWorkerPool,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        worker_pool=worker_pool,
         analysis_store=analysis_store,
     )
 
 
 async def test_analyze(
     decoy: Decoy,
-    protocol_runner: ProtocolRunner,
+    worker_pool: AnalysisWorkerPool,
     analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
     subject: ProtocolAnalyzer,
 ) -> None:
     """It should be able to analyze a protocol."""
-    protocol_resource = ProtocolResource(
-        protocol_id="protocol-id",
-        created_at=datetime(year=2021, month=1, day=1),
-        source=ProtocolSource(
-            directory=Path("/dev/null"),
-            main_file=Path("/dev/null/abc.json"),
-            config=JsonProtocolConfig(schema_version=123),
-            files=[],
-            metadata={},
-            labware_definitions=[],
-        ),
-        protocol_key="dummy-data-111",
-    )
-
     analysis_command = pe_commands.Pause(
         id="command-id",
         key="command-key",
@@ -93,7 +109,10 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+    decoy.when(
+        await analysis_store.get_by_cache_key(cache_key=matchers.IsA(str))
+    ).then_return(None)
+    decoy.when(await worker_pool.run(protocol_resource.source)).then_return(
         ProtocolRunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -120,5 +139,83 @@ async def test_analyze(
             labware=[analysis_labware],
             pipettes=[analysis_pipette],
             errors=[analysis_error],
+            cache_key=matchers.IsA(str),
+        ),
+    )
+    assert subject.cache_stats == AnalysisCacheStats(hits=0, misses=1)
+
+
+async def test_analyze_cache_hit(
+    decoy: Decoy,
+    worker_pool: AnalysisWorkerPool,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should reuse a stored analysis with a matching cache key."""
+    cached_command = pe_commands.Pause(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+    cached_analysis = CompletedAnalysis(
+        id="cached-analysis-id",
+        result=AnalysisResult.OK,
+        commands=[cached_command],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+    decoy.when(
+        await analysis_store.get_by_cache_key(cache_key=matchers.IsA(str))
+    ).then_return(cached_analysis)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[cached_command],
+            labware=[],
+            pipettes=[],
+            errors=[],
+            cache_key=matchers.IsA(str),
+        ),
+    )
+    decoy.verify(await worker_pool.run(matchers.Anything()), times=0)
+    assert subject.cache_stats == AnalysisCacheStats(hits=1, misses=0)
+
+
+async def test_analyze_from_cache_miss(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should leave the analysis alone if nothing matches its cache key."""
+    decoy.when(
+        await analysis_store.get_by_cache_key(cache_key="cache-key")
+    ).then_return(None)
+
+    result = await subject.analyze_from_cache(
+        analysis_id="analysis-id", cache_key="cache-key"
+    )
+
+    assert result is False
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+            cache_key=matchers.Anything(),
         ),
+        times=0,
     )
+    assert subject.cache_stats == AnalysisCacheStats(hits=0, misses=0)
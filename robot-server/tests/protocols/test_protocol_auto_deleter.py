@@ -7,6 +7,7 @@ import pytest
 from decoy import Decoy
 
 from robot_server.deletion_planner import ProtocolDeletionPlanner
+from robot_server.protocols.analysis_queue import AnalysisQueue
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
@@ -19,10 +20,12 @@ def test_make_room_for_new_protocol(
 ) -> None:
     """It should get a deletion plan and enact it on the store."""
     mock_protocol_store = decoy.mock(cls=ProtocolStore)
+    mock_analysis_queue = decoy.mock(cls=AnalysisQueue)
     mock_deletion_planner = decoy.mock(cls=ProtocolDeletionPlanner)
 
     subject = ProtocolAutoDeleter(
         protocol_store=mock_protocol_store,
+        analysis_queue=mock_analysis_queue,
         deletion_planner=mock_deletion_planner,
     )
 
@@ -43,8 +46,14 @@ def test_make_room_for_new_protocol(
     with caplog.at_level(logging.INFO):
         subject.make_room_for_new_protocol()
 
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-4"))
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-5"))
+    decoy.verify(
+        mock_protocol_store.remove(protocol_id="protocol-id-4"),
+        mock_analysis_queue.cancel(protocol_id="protocol-id-4"),
+    )
+    decoy.verify(
+        mock_protocol_store.remove(protocol_id="protocol-id-5"),
+        mock_analysis_queue.cancel(protocol_id="protocol-id-5"),
+    )
 
     # It should log the protocols that it deleted.
     assert "protocol-id-4" in caplog.text
@@ -19,11 +19,11 @@ from opentrons.protocol_reader import (
 
 from robot_server.errors import ApiError
 from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
-from robot_server.service.task_runner import TaskRunner
+from robot_server.protocols.analysis_queue import AnalysisQueue
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
-from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
+    AnalysisQueueStatus,
     AnalysisStatus,
     AnalysisSummary,
     CompletedAnalysis,
@@ -72,15 +72,9 @@ def protocol_reader(decoy: Decoy) -> ProtocolReader:
 
 
 @pytest.fixture
-def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
-    """Get a mocked out ProtocolAnalyzer."""
-    return decoy.mock(cls=ProtocolAnalyzer)
-
-
-@pytest.fixture
-def task_runner(decoy: Decoy) -> TaskRunner:
-    """Get a mocked out TaskRunner."""
-    return decoy.mock(cls=TaskRunner)
+def analysis_queue(decoy: Decoy) -> AnalysisQueue:
+    """Get a mocked out AnalysisQueue."""
+    return decoy.mock(cls=AnalysisQueue)
 
 
 @pytest.fixture
@@ -162,10 +156,10 @@ async def test_get_protocols(
     )
 
     decoy.when(protocol_store.get_all()).then_return([resource_1, resource_2])
-    decoy.when(analysis_store.get_summaries_by_protocol("abc")).then_return(
+    decoy.when(await analysis_store.get_summaries_by_protocol("abc")).then_return(
         [analysis_1]
     )
-    decoy.when(analysis_store.get_summaries_by_protocol("123")).then_return(
+    decoy.when(await analysis_store.get_summaries_by_protocol("123")).then_return(
         [analysis_2]
     )
 
@@ -206,7 +200,7 @@ async def test_get_protocol_by_id(
 
     decoy.when(protocol_store.get(protocol_id="protocol-id")).then_return(resource)
     decoy.when(
-        analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
     ).then_return([analysis_summary])
 
     result = await get_protocol_by_id(
@@ -250,10 +244,8 @@ async def test_get_protocol_not_found(
 async def test_create_protocol(
     decoy: Decoy,
     protocol_store: ProtocolStore,
-    analysis_store: AnalysisStore,
+    analysis_queue: AnalysisQueue,
     protocol_reader: ProtocolReader,
-    protocol_analyzer: ProtocolAnalyzer,
-    task_runner: TaskRunner,
     protocol_auto_deleter: ProtocolAutoDeleter,
 ) -> None:
     """It should store an uploaded protocol file."""
@@ -285,6 +277,8 @@ async def test_create_protocol(
     pending_analysis = AnalysisSummary(
         id="analysis-id",
         status=AnalysisStatus.PENDING,
+        queueStatus=AnalysisQueueStatus.QUEUED,
+        queuePosition=0,
     )
 
     decoy.when(
@@ -295,7 +289,10 @@ async def test_create_protocol(
     ).then_return(protocol_source)
 
     decoy.when(
-        analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+        await analysis_queue.add(
+            protocol_resource=protocol_resource,
+            analysis_id="analysis-id",
+        )
     ).then_return(pending_analysis)
 
     result = await create_protocol(
@@ -303,10 +300,8 @@ async def test_create_protocol(
         key="dummy-key-111",
         protocol_directory=protocol_directory,
         protocol_store=protocol_store,
-        analysis_store=analysis_store,
+        analysis_queue=analysis_queue,
         protocol_reader=protocol_reader,
-        protocol_analyzer=protocol_analyzer,
-        task_runner=task_runner,
         protocol_auto_deleter=protocol_auto_deleter,
         protocol_id="protocol-id",
         analysis_id="analysis-id",
@@ -327,11 +322,6 @@ async def test_create_protocol(
     decoy.verify(
         protocol_auto_deleter.make_room_for_new_protocol(),
         protocol_store.insert(protocol_resource),
-        task_runner.run(
-            protocol_analyzer.analyze,
-            analysis_id="analysis-id",
-            protocol_resource=protocol_resource,
-        ),
     )
 
 
@@ -362,11 +352,19 @@ async def test_create_protocol_not_readable(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_queue: AnalysisQueue,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should cancel the protocol's pending analysis and remove the protocol."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_queue=analysis_queue,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_queue.cancel(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -375,6 +373,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_queue: AnalysisQueue,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -384,9 +383,14 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_queue=analysis_queue,
+        )
 
     assert exc_info.value.status_code == 404
+    decoy.verify(analysis_queue.cancel(protocol_id="protocol-id"), times=0)
 
 
 async def test_get_protocol_analyses(
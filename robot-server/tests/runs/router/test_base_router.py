@@ -18,10 +18,13 @@ from robot_server.service.json_api import (
 )
 
 from robot_server.protocols import (
+    AnalysisStore,
+    CompletedAnalysis,
     ProtocolStore,
     ProtocolResource,
     ProtocolNotFoundError,
 )
+from robot_server.protocols.analysis_models import AnalysisResult
 
 from robot_server.runs.run_auto_deleter import RunAutoDeleter
 
@@ -79,6 +82,7 @@ async def test_create_run(
             created_at=run_created_at,
             labware_offsets=[labware_offset_create],
             protocol=None,
+            protocol_analysis=None,
         )
     ).then_return(expected_response)
 
@@ -101,6 +105,7 @@ async def test_create_run(
 async def test_create_protocol_run(
     decoy: Decoy,
     mock_protocol_store: ProtocolStore,
+    mock_analysis_store: AnalysisStore,
     mock_run_data_manager: RunDataManager,
     mock_run_auto_deleter: RunAutoDeleter,
 ) -> None:
@@ -136,7 +141,19 @@ async def test_create_protocol_run(
         status=pe_types.EngineStatus.IDLE,
     )
 
+    protocol_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+    )
+
     decoy.when(mock_protocol_store.get(protocol_id)).then_return(protocol_resource)
+    decoy.when(
+        await mock_analysis_store.get_latest_completed(protocol_id=protocol_id)
+    ).then_return(protocol_analysis)
 
     decoy.when(
         await mock_run_data_manager.create(
@@ -144,12 +161,14 @@ async def test_create_protocol_run(
             created_at=run_created_at,
             labware_offsets=[],
             protocol=protocol_resource,
+            protocol_analysis=protocol_analysis,
         )
     ).then_return(expected_response)
 
     result = await create_run(
         request_body=RequestModel(data=RunCreate(protocolId="protocol-id")),
         protocol_store=mock_protocol_store,
+        analysis_store=mock_analysis_store,
         run_data_manager=mock_run_data_manager,
         run_id=run_id,
         created_at=run_created_at,
@@ -195,6 +214,7 @@ async def test_create_run_conflict(
             created_at=created_at,
             labware_offsets=[],
             protocol=None,
+            protocol_analysis=None,
         )
     ).then_raise(EngineConflictError("oh no"))
 
@@ -7,6 +7,7 @@ from decoy import Decoy, matchers
 from opentrons.protocol_engine import (
     CommandSlice,
     CurrentCommand,
+    EngineStatus,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
@@ -30,6 +31,7 @@ from robot_server.runs.router.commands_router import (
     get_run_command,
     get_run_commands,
     get_current_run_engine_from_url,
+    stream_run_commands,
 )
 
 
@@ -360,3 +362,49 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def test_stream_run_commands(
+    decoy: Decoy,
+    mock_protocol_engine: ProtocolEngine,
+    mock_engine_store: EngineStore,
+) -> None:
+    """It should stream command changes as server-sent events."""
+    command = pe_commands.Pause(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+    commands_view = mock_protocol_engine.state_view.commands
+    durations_view = mock_protocol_engine.state_view.durations
+
+    decoy.when(commands_view.get_status()).then_return(EngineStatus.SUCCEEDED)
+    decoy.when(durations_view.get_total()).then_return(12.5)
+    decoy.when(durations_view.get_remaining()).then_return(0.0)
+    decoy.when(commands_view.get_slice(cursor=3, length=50)).then_return(
+        CommandSlice(commands=[command], cursor=3, total_length=4)
+    )
+    decoy.when(commands_view.get_slice(cursor=4, length=50)).then_return(
+        CommandSlice(commands=[command], cursor=3, total_length=4)
+    )
+
+    result = await stream_run_commands(
+        runId="run-id",
+        cursor=0,
+        lastEventId=3,
+        protocol_engine=mock_protocol_engine,
+        engine_store=mock_engine_store,
+    )
+    body = [chunk async for chunk in result.body_iterator]
+
+    assert result.media_type == "text/event-stream"
+    assert body[0].startswith("id: 3\nevent: command\ndata: ")
+    assert '"index": 3' in body[0]
+    assert '"id": "command-id"' in body[0]
+    assert body[1] == (
+        "id: 3\nevent: estimate\n"
+        'data: {"estimatedDuration": 12.5, "estimatedRemainingDuration": 0.0}\n\n'
+    )
+    assert body[2] == 'id: 3\nevent: status\ndata: {"status": "succeeded"}\n\n'
@@ -0,0 +1,155 @@
+"""Tests for robot_server.runs.command_persister."""
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_engine import (
+    CommandSlice,
+    StateView,
+    actions as pe_actions,
+    commands as pe_commands,
+)
+
+from robot_server.runs.command_persister import RunCommandPersister
+from robot_server.runs.run_store import RunStore
+
+
+def _make_command(
+    command_id: str,
+    status: pe_commands.CommandStatus,
+) -> pe_commands.Command:
+    return pe_commands.Pause(
+        id=command_id,
+        key="command-key",
+        status=status,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+
+
+@pytest.fixture
+def state_view(decoy: Decoy) -> StateView:
+    """Get a mock StateView."""
+    return decoy.mock(cls=StateView)
+
+
+@pytest.fixture
+def run_store(decoy: Decoy) -> RunStore:
+    """Get a mock RunStore."""
+    return decoy.mock(cls=RunStore)
+
+
+@pytest.fixture
+def commands() -> List[pe_commands.Command]:
+    """Get a list of commands, the last of which is still running."""
+    return [
+        _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED),
+        _make_command("command-2", pe_commands.CommandStatus.FAILED),
+        _make_command("command-3", pe_commands.CommandStatus.RUNNING),
+    ]
+
+
+@pytest.fixture
+def subject(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+) -> RunCommandPersister:
+    """Get a configured RunCommandPersister with its dependencies mocked out."""
+    plugin = RunCommandPersister(run_id="run-id", run_store=run_store, batch_size=2)
+    plugin._configure(
+        state=state_view,
+        action_dispatcher=decoy.mock(cls=pe_actions.ActionDispatcher),
+    )
+    return plugin
+
+
+async def test_flush_completed_batch(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+    commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should write a full batch of completed commands in the background."""
+    decoy.when(state_view.commands.get_slice(cursor=0, length=2)).then_return(
+        CommandSlice(commands=commands[0:2], cursor=0, total_length=3)
+    )
+    decoy.when(state_view.commands.get_slice(cursor=2, length=2)).then_return(
+        CommandSlice(commands=commands[2:3], cursor=2, total_length=3)
+    )
+
+    subject.handle_action(pe_actions.UpdateCommandAction(command=commands[2]))
+    await subject.teardown()
+
+    decoy.verify(
+        run_store.insert_commands("run-id", 0, commands[0:2]),
+        times=1,
+    )
+
+
+async def test_no_flush_for_incomplete_batch(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+    commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should wait for a full batch of completed commands."""
+    decoy.when(state_view.commands.get_slice(cursor=0, length=2)).then_return(
+        CommandSlice(commands=commands[0:1], cursor=0, total_length=1)
+    )
+    decoy.when(state_view.commands.get_slice(cursor=1, length=2)).then_return(
+        CommandSlice(commands=commands[0:1], cursor=0, total_length=1)
+    )
+
+    subject.handle_action(pe_actions.UpdateCommandAction(command=commands[0]))
+    await asyncio.sleep(0)
+
+    decoy.verify(
+        run_store.insert_commands(
+            matchers.Anything(), matchers.Anything(), matchers.Anything()
+        ),
+        times=0,
+    )
+
+
+async def test_ignore_other_actions(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+    subject: RunCommandPersister,
+) -> None:
+    """It should only check for completed commands on command updates."""
+    subject.handle_action(pe_actions.PlayAction())
+    await asyncio.sleep(0)
+
+    decoy.verify(
+        state_view.commands.get_slice(
+            cursor=matchers.Anything(), length=matchers.Anything()
+        ),
+        times=0,
+    )
+
+
+async def test_teardown_flushes_remaining(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+    commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should write any remaining completed commands on teardown."""
+    decoy.when(state_view.commands.get_slice(cursor=0, length=2)).then_return(
+        CommandSlice(commands=commands[0:1], cursor=0, total_length=1)
+    )
+    decoy.when(state_view.commands.get_slice(cursor=1, length=2)).then_return(
+        CommandSlice(commands=commands[0:1], cursor=0, total_length=1)
+    )
+
+    await subject.teardown()
+
+    decoy.verify(run_store.insert_commands("run-id", 0, commands[0:1]), times=1)
@@ -0,0 +1,183 @@
+"""Tests for robot_server.runs.command_stream."""
+from datetime import datetime
+
+import pytest
+from decoy import Decoy
+
+from opentrons.protocol_engine import (
+    CommandSlice,
+    EngineStatus,
+    ProtocolEngine,
+    StateTopic,
+    commands as pe_commands,
+)
+
+from robot_server.runs.command_stream import RunCommandStream, RunStreamEvent
+from robot_server.runs.run_models import (
+    RunCommandSummary,
+    RunCommandUpdate,
+    RunEstimateUpdate,
+    RunStatusUpdate,
+)
+
+
+def _make_command(
+    command_id: str,
+    status: pe_commands.CommandStatus,
+) -> pe_commands.Command:
+    return pe_commands.Pause(
+        id=command_id,
+        key="command-key",
+        status=status,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+
+
+def _make_command_event(
+    cursor: int,
+    index: int,
+    command: pe_commands.Command,
+) -> RunStreamEvent:
+    return RunStreamEvent(
+        event="command",
+        cursor=cursor,
+        data=RunCommandUpdate.construct(
+            index=index,
+            command=RunCommandSummary.construct(
+                id=command.id,
+                key=command.key,
+                commandType=command.commandType,
+                status=command.status,
+                createdAt=command.createdAt,
+                startedAt=command.startedAt,
+                completedAt=command.completedAt,
+                params=command.params,
+                error=command.error,
+            ),
+        ),
+    )
+
+
+def _make_status_event(cursor: int, status: EngineStatus) -> RunStreamEvent:
+    return RunStreamEvent(
+        event="status",
+        cursor=cursor,
+        data=RunStatusUpdate.construct(status=status),
+    )
+
+
+def _make_estimate_event(cursor: int, total: float, remaining: float) -> RunStreamEvent:
+    return RunStreamEvent(
+        event="estimate",
+        cursor=cursor,
+        data=RunEstimateUpdate.construct(
+            estimatedDuration=total,
+            estimatedRemainingDuration=remaining,
+        ),
+    )
+
+
+@pytest.fixture
+def protocol_engine(decoy: Decoy) -> ProtocolEngine:
+    """Get a mock ProtocolEngine."""
+    return decoy.mock(cls=ProtocolEngine)
+
+
+@pytest.fixture
+def subject(protocol_engine: ProtocolEngine) -> RunCommandStream:
+    """Get a RunCommandStream test subject."""
+    return RunCommandStream(protocol_engine=protocol_engine, cursor=0, page_length=50)
+
+
+async def test_stream_changes(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+    subject: RunCommandStream,
+) -> None:
+    """It should only emit commands, estimates, and statuses that changed.
+
+    It should stop once the run ends.
+    """
+    command_1_running = _make_command("command-1", pe_commands.CommandStatus.RUNNING)
+    command_1_done = _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED)
+    command_2_queued = _make_command("command-2", pe_commands.CommandStatus.QUEUED)
+    command_2_done = _make_command("command-2", pe_commands.CommandStatus.SUCCEEDED)
+
+    commands_view = protocol_engine.state_view.commands
+    durations_view = protocol_engine.state_view.durations
+
+    decoy.when(protocol_engine.state_view.get_state_version()).then_return(1, 2, 3)
+    decoy.when(durations_view.get_total()).then_return(10.0)
+    decoy.when(durations_view.get_remaining()).then_return(10.0, 4.0, 0.0)
+    decoy.when(commands_view.get_status()).then_return(
+        EngineStatus.RUNNING,
+        EngineStatus.RUNNING,
+        EngineStatus.SUCCEEDED,
+    )
+    decoy.when(commands_view.get_slice(cursor=0, length=50)).then_return(
+        CommandSlice(
+            commands=[command_1_running, command_2_queued],
+            cursor=0,
+            total_length=2,
+        ),
+        CommandSlice(
+            commands=[command_1_done, command_2_queued],
+            cursor=0,
+            total_length=2,
+        ),
+    )
+    decoy.when(commands_view.get_slice(cursor=1, length=50)).then_return(
+        CommandSlice(commands=[command_2_done], cursor=1, total_length=2),
+    )
+    decoy.when(commands_view.get_slice(cursor=2, length=50)).then_return(
+        CommandSlice(commands=[command_2_done], cursor=1, total_length=2),
+    )
+
+    result = [event async for event in subject.events()]
+
+    assert result == [
+        _make_command_event(cursor=0, index=0, command=command_1_running),
+        _make_command_event(cursor=0, index=1, command=command_2_queued),
+        _make_estimate_event(cursor=0, total=10.0, remaining=10.0),
+        _make_status_event(cursor=0, status=EngineStatus.RUNNING),
+        _make_command_event(cursor=0, index=0, command=command_1_done),
+        _make_estimate_event(cursor=0, total=10.0, remaining=4.0),
+        _make_command_event(cursor=1, index=1, command=command_2_done),
+        _make_estimate_event(cursor=1, total=10.0, remaining=0.0),
+        _make_status_event(cursor=1, status=EngineStatus.SUCCEEDED),
+    ]
+
+    decoy.verify(
+        await protocol_engine.wait_for_state_change(1, topic=StateTopic.COMMANDS),
+        await protocol_engine.wait_for_state_change(2, topic=StateTopic.COMMANDS),
+    )
+
+
+async def test_stream_from_cursor(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+) -> None:
+    """It should start from the given cursor."""
+    command = _make_command("command-2", pe_commands.CommandStatus.FAILED)
+    commands_view = protocol_engine.state_view.commands
+    durations_view = protocol_engine.state_view.durations
+    subject = RunCommandStream(protocol_engine=protocol_engine, cursor=1)
+
+    decoy.when(durations_view.get_total()).then_return(5.0)
+    decoy.when(durations_view.get_remaining()).then_return(0.0)
+    decoy.when(commands_view.get_status()).then_return(EngineStatus.FAILED)
+    decoy.when(commands_view.get_slice(cursor=1, length=50)).then_return(
+        CommandSlice(commands=[command], cursor=1, total_length=2),
+    )
+    decoy.when(commands_view.get_slice(cursor=2, length=50)).then_return(
+        CommandSlice(commands=[command], cursor=1, total_length=2),
+    )
+
+    result = [event async for event in subject.events()]
+
+    assert result == [
+        _make_command_event(cursor=1, index=1, command=command),
+        _make_estimate_event(cursor=1, total=5.0, remaining=0.0),
+        _make_status_event(cursor=1, status=EngineStatus.FAILED),
+    ]
@@ -9,11 +9,20 @@ from opentrons_shared_data import get_shared_data_root
 
 from opentrons.types import DeckSlotName
 from opentrons.hardware_control import HardwareControlAPI
-from opentrons.protocol_engine import ProtocolEngine, StateSummary, types as pe_types
+from opentrons.commands import types as legacy_command_types
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    StateSummary,
+    commands as pe_commands,
+    types as pe_types,
+)
 from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 
-from robot_server.protocols import ProtocolResource
+from opentrons.protocol_runner.legacy_command_mapper import LegacyCommandParams
+
+from robot_server.protocols import CompletedAnalysis, ProtocolResource
+from robot_server.protocols.analysis_models import AnalysisResult
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 
 
@@ -93,6 +102,54 @@ async def test_create_engine_with_protocol(
     )
 
 
+async def test_create_engine_with_python_protocol_analysis(
+    subject: EngineStore,
+    tmp_path: Path,
+) -> None:
+    """It should estimate a Python protocol's duration from its analysis."""
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        "metadata = {'apiLevel': '2.11'}\n"
+        "def run(ctx):\n"
+        "    ctx.delay(seconds=30)\n"
+    )
+    protocol = ProtocolResource(
+        protocol_id="my cool protocol",
+        protocol_key=None,
+        created_at=datetime(year=2021, month=1, day=1),
+        source=await ProtocolReader().read_saved(files=[protocol_file], directory=None),
+    )
+    protocol_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        labware=[],
+        pipettes=[],
+        errors=[],
+        commands=[
+            pe_commands.Custom(
+                id="command-id",
+                key="command-key",
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                params=LegacyCommandParams(
+                    legacyCommandType=legacy_command_types.DELAY,
+                    legacyCommandText="Delaying for 0 minutes and 30.0 seconds",
+                ),
+            )
+        ],
+    )
+
+    result = await subject.create(
+        run_id="run-id",
+        labware_offsets=[],
+        protocol=protocol,
+        protocol_analysis=protocol_analysis,
+    )
+
+    assert result.estimatedDuration == 30
+    assert result.estimatedRemainingDuration == 30
+
+
 async def test_archives_state_if_engine_already_exists(subject: EngineStore) -> None:
     """It should not create more than one engine / runner pair."""
     await subject.create(run_id="run-id-1", labware_offsets=[], protocol=None)
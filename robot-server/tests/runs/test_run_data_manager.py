@@ -16,7 +16,9 @@ from opentrons.protocol_engine import (
     CurrentCommand,
 )
 
-from robot_server.protocols import ProtocolResource
+from robot_server.protocols import CompletedAnalysis, ProtocolResource
+from robot_server.protocols.analysis_models import AnalysisResult
+from robot_server.runs.command_persister import RunCommandPersister
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 from robot_server.runs.run_data_manager import RunDataManager, RunNotCurrentError
 from robot_server.runs.run_models import Run
@@ -59,6 +61,8 @@ def engine_state_summary() -> StateSummary:
         labwareOffsets=[],
         pipettes=[],
         modules=[],
+        estimatedDuration=42.0,
+        estimatedRemainingDuration=12.0,
     )
 
 
@@ -112,7 +116,9 @@ async def test_create(
     created_at = datetime(year=2021, month=1, day=1)
 
     decoy.when(
-        await mock_engine_store.create(run_id=run_id, labware_offsets=[], protocol=None)
+        await mock_engine_store.create(
+            run_id=run_id, labware_offsets=[], protocol=None, protocol_analysis=None
+        )
     ).then_return(engine_state_summary)
     decoy.when(
         mock_run_store.insert(
@@ -140,7 +146,10 @@ async def test_create(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
+    decoy.verify(mock_engine_store.engine.add_plugin(matchers.IsA(RunCommandPersister)))
 
 
 async def test_create_with_options(
@@ -168,11 +177,21 @@ async def test_create_with_options(
         vector=pe_types.LabwareOffsetVector(x=1, y=2, z=3),
     )
 
+    protocol_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+    )
+
     decoy.when(
         await mock_engine_store.create(
             run_id=run_id,
             labware_offsets=[labware_offset],
             protocol=protocol,
+            protocol_analysis=protocol_analysis,
         )
     ).then_return(engine_state_summary)
 
@@ -189,6 +208,7 @@ async def test_create_with_options(
         created_at=created_at,
         labware_offsets=[labware_offset],
         protocol=protocol,
+        protocol_analysis=protocol_analysis,
     )
 
     assert result == Run(
@@ -202,6 +222,8 @@ async def test_create_with_options(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
 
 
@@ -216,7 +238,9 @@ async def test_create_engine_error(
     created_at = datetime(year=2021, month=1, day=1)
 
     decoy.when(
-        await mock_engine_store.create(run_id, labware_offsets=[], protocol=None)
+        await mock_engine_store.create(
+            run_id, labware_offsets=[], protocol=None, protocol_analysis=None
+        )
     ).then_raise(EngineConflictError("oh no"))
 
     with pytest.raises(EngineConflictError):
@@ -267,6 +291,8 @@ async def test_get_current_run(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
     assert subject.current_run_id == run_id
 
@@ -301,6 +327,8 @@ async def test_get_historical_run(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
 
 
@@ -483,6 +511,8 @@ async def test_update_current(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
 
 
@@ -528,6 +558,8 @@ async def test_update_current_noop(
         labware=engine_state_summary.labware,
         labwareOffsets=engine_state_summary.labwareOffsets,
         pipettes=engine_state_summary.pipettes,
+        estimatedDuration=engine_state_summary.estimatedDuration,
+        estimatedRemainingDuration=engine_state_summary.estimatedRemainingDuration,
     )
 
 
@@ -571,6 +603,7 @@ async def test_create_archives_existing(
             run_id=run_id_new,
             labware_offsets=[],
             protocol=None,
+            protocol_analysis=None,
         )
     ).then_return(engine_state_summary)
 
@@ -139,6 +139,114 @@ def test_update_run_state(
     assert commands_result.commands == protocol_commands
 
 
+def test_update_run_state_after_insert_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should store the commands not already inserted."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        start_index=0,
+        commands=protocol_commands[0:2],
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=3,
+        commands=protocol_commands,
+    )
+
+
+def test_update_run_state_removes_extra_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should remove stored commands past the end of the commands list."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[0:2],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=2,
+        commands=protocol_commands[0:2],
+    )
+
+
+def test_insert_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should insert and replace commands at the given indices."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        start_index=0,
+        commands=protocol_commands[0:2],
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        start_index=1,
+        commands=protocol_commands[1:3],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=3,
+        commands=protocol_commands,
+    )
+    assert subject.get_command(run_id="run-id", command_id="pause-3") == (
+        protocol_commands[2]
+    )
+
+
+def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.insert_commands(
+            run_id="run-not-found",
+            start_index=0,
+            commands=protocol_commands,
+        )
+
+
 def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
@@ -272,7 +380,11 @@ def test_get_all_runs(subject: RunStore) -> None:
     ]
 
 
-def test_remove_run(subject: RunStore) -> None:
+def test_remove_run(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
     """It can remove a previously stored run entry."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -286,6 +398,11 @@ def test_remove_run(subject: RunStore) -> None:
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
     subject.insert_action(run_id="run-id", action=action)
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
     subject.remove(run_id="run-id")
 
     assert subject.get_all() == []
@@ -1,20 +1,16 @@
 import pytest
 
-from opentrons.calibration_storage import file_operators
-from opentrons import config
+from opentrons.calibration_storage import get
 
 
 @pytest.fixture
 def grab_id(set_up_index_file_temporary_directory):
     labware_to_access = "opentrons_96_tiprack_10ul"
     uri_to_check = f"opentrons/{labware_to_access}/1"
-    offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
-    index_file = file_operators.read_cal_file(str(index_path))
     calibration_id = ""
-    for key, data in index_file["data"].items():
-        if data["uri"] == uri_to_check:
-            calibration_id = key
+    for calibration in get.get_all_calibrations():
+        if calibration.uri == uri_to_check:
+            calibration_id = calibration.labware_id
     return calibration_id
 
 
@@ -0,0 +1,108 @@
+"""A single-file, indexed bundle of shared data.
+
+Reading hundreds of small JSON files is slow on the robot's SD card, so
+packaged builds of this library also compile every definition and schema
+into one bundle file. `load_shared_data` reads from the bundle when it's
+present, and falls back to the individual files when it isn't (e.g. when
+running from a source checkout) or when a file isn't in it.
+
+Bundle layout:
+
+    magic (8 bytes) | index length (4 bytes, big-endian) | index | data
+
+where the index is a JSON object mapping each file's path, relative to the
+shared data root, to the `[offset, length]` of its contents in the data
+section. The bundle is memory-mapped, and each file's contents are only
+copied out of the map when they're read.
+
+This module must not import anything outside the standard library,
+because setup.py uses it to build the bundle.
+"""
+import json
+import mmap
+import struct
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+BUNDLE_FILE_NAME = "shared-data.bundle"
+
+_MAGIC = b"OTSDB\x00\x00\x01"
+_HEADER = struct.Struct(">8sI")
+
+
+class SharedDataBundle:
+    """A read-only, memory-mapped shared data bundle."""
+
+    def __init__(self, path: Path) -> None:
+        """Open and map a bundle file.
+
+        :raises OSError: If the file can't be opened or mapped.
+        :raises ValueError: If the file isn't a valid bundle.
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, index_length = _HEADER.unpack_from(self._map, 0)
+        except struct.error as e:
+            raise ValueError(f"{path} is too short to be a shared data bundle") from e
+
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a shared data bundle")
+
+        index_start = _HEADER.size
+        self._data_start = index_start + index_length
+        index = json.loads(self._map[index_start : self._data_start])
+        self._index: Dict[str, Tuple[int, int]] = {
+            name: (offset, length) for name, (offset, length) in index.items()
+        }
+
+    def read(self, path: Union[str, PurePath]) -> Optional[bytes]:
+        """Get the contents of a file in the bundle, or None if it's not there.
+
+        :param path: The file's path relative to the shared data root.
+        """
+        entry = self._index.get(PurePath(path).as_posix())
+
+        if entry is None:
+            return None
+
+        offset, length = entry
+        start = self._data_start + offset
+        return self._map[start : start + length]
+
+    def names(self) -> List[str]:
+        """Get the path of every file in the bundle, relative to the data root."""
+        return list(self._index)
+
+
+def build_bundle(data_root: Path, files: Iterable[Path], target: Path) -> None:
+    """Compile JSON data files into a bundle.
+
+    Every file is re-serialized with minimal whitespace.
+
+    :param data_root: The shared data root that the files are relative to.
+    :param files: The JSON files to include.
+    :param target: Where to write the bundle.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    chunks: List[bytes] = []
+    offset = 0
+
+    for data_file in sorted(files):
+        name = data_file.relative_to(data_root).as_posix()
+        contents = json.dumps(
+            json.loads(data_file.read_bytes()), separators=(",", ":")
+        ).encode("utf-8")
+        index[name] = (offset, len(contents))
+        chunks.append(contents)
+        offset += len(contents)
+
+    encoded_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(encoded_index)))
+        f.write(encoded_index)
+        for contents in chunks:
+            f.write(contents)
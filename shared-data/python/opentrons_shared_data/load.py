@@ -1,9 +1,11 @@
 import typing
 import logging
 import os
-from pathlib import Path
+from pathlib import Path, PurePath
 from functools import lru_cache
 
+from .bundle import BUNDLE_FILE_NAME, SharedDataBundle
+
 log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
@@ -47,11 +49,60 @@ def get_shared_data_root() -> Path:
     raise SharedDataMissingError()
 
 
-def load_shared_data(path: typing.Union[str, Path]) -> bytes:
+@lru_cache(maxsize=1)
+def get_shared_data_bundle() -> typing.Optional[SharedDataBundle]:
+    """
+    Get the compiled bundle of all shared data, if there is one.
+
+    Packaged builds include a bundle in the shared data root. Source
+    checkouts don't, so that edits to the JSON files take effect immediately.
+    """
+    bundle_path = get_shared_data_root() / BUNDLE_FILE_NAME
+
+    if not bundle_path.is_file():
+        return None
+
+    try:
+        return SharedDataBundle(bundle_path)
+    except (OSError, ValueError):
+        log.exception(f"Could not open {bundle_path}, using individual files")
+        return None
+
+
+def load_shared_data(path: typing.Union[str, PurePath]) -> bytes:
     """
     Load file from shared data directory.
 
     path is relative to the root of all shared data (ie. no "shared-data")
     """
+    bundle = get_shared_data_bundle()
+    if bundle is not None:
+        contents = bundle.read(path)
+        if contents is not None:
+            return contents
+
     with open(get_shared_data_root() / path, "rb") as f:
         return f.read()
+
+
+def list_shared_data(directory: typing.Union[str, PurePath]) -> typing.List[PurePath]:
+    """
+    List every file in a shared data directory and its subdirectories.
+
+    directory and the returned paths are relative to the root of all
+    shared data, like the path given to load_shared_data.
+    """
+    prefix = PurePath(directory).as_posix() + "/"
+    bundle = get_shared_data_bundle()
+
+    if bundle is not None:
+        bundled = [PurePath(n) for n in bundle.names() if n.startswith(prefix)]
+        if len(bundled) > 0:
+            return bundled
+
+    root = get_shared_data_root()
+    return [
+        PurePath(p.relative_to(root).as_posix())
+        for p in (root / directory).glob("**/*")
+        if p.is_file()
+    ]
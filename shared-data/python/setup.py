@@ -12,6 +12,10 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(os.path.join(HERE, "..", "..", "scripts"))
 
 from python_build_utils import normalize_version  # noqa: E402
+from opentrons_shared_data.bundle import (  # noqa: E402
+    BUNDLE_FILE_NAME,
+    build_bundle,
+)
 
 # make stdout blocking since Travis sets it to nonblocking
 if os.name == "posix":
@@ -43,6 +47,14 @@ def _minimize_and_write_json(data_file: Path, target_file: Path) -> None:
     target_file.write_text(contents)
 
 
+def _build_shared_data_bundle(target_file: Path) -> None:
+    build_bundle(
+        data_root=Path(DATA_ROOT),
+        files=get_shared_data_files(),
+        target=target_file,
+    )
+
+
 class SDistWithData(sdist.sdist):
     description = sdist.sdist.description + " Also, include data files."
 
@@ -60,6 +72,15 @@ class SDistWithData(sdist.sdist):
                 msg=f"copying and minimizing {data_file} -> {target_file}",
             )
 
+        bundle_file = (
+            Path(base_dir) / "opentrons_shared_data" / DEST_BASE_PATH / BUNDLE_FILE_NAME
+        )
+        self.execute(
+            _build_shared_data_bundle,
+            args=(bundle_file,),
+            msg=f"compiling shared data bundle -> {bundle_file}",
+        )
+
         # also grab our package.json
         self.copy_file(
             os.path.join(HERE, "..", "package.json"),
@@ -71,6 +92,24 @@ class SDistWithData(sdist.sdist):
 class BuildWithData(build_py.build_py):
     description = build_py.build_py.description + " Also, include opentrons data files"
 
+    def run(self) -> None:
+        super().run()
+
+        # Data files copied out of an sdist are already in the package,
+        # along with the sdist's bundle, so there's nothing to compile.
+        if get_shared_data_files():
+            bundle_file = (
+                Path(self.build_lib)
+                / "opentrons_shared_data"
+                / DEST_BASE_PATH
+                / BUNDLE_FILE_NAME
+            )
+            self.execute(
+                _build_shared_data_bundle,
+                args=(bundle_file,),
+                msg=f"compiling shared data bundle -> {bundle_file}",
+            )
+
     def _get_data_files(self):
         """
         Override of build_py.get_data_files that includes out of tree configs.
@@ -0,0 +1,62 @@
+"""Tests for opentrons_shared_data.bundle."""
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+from opentrons_shared_data.bundle import SharedDataBundle, build_bundle
+
+
+def _get_definition_files() -> List[Path]:
+    root = get_shared_data_root()
+    return [
+        p
+        for subdir in ["deck", "labware", "module", "pipette"]
+        for p in (root / subdir / "definitions").glob("**/*.json")
+    ]
+
+
+def test_build_and_read(tmp_path: Path) -> None:
+    """It should read back every bundled file's parsed contents."""
+    root = get_shared_data_root()
+    files = _get_definition_files()
+    bundle_path = tmp_path / "shared-data.bundle"
+
+    build_bundle(data_root=root, files=files, target=bundle_path)
+    subject = SharedDataBundle(bundle_path)
+
+    assert sorted(subject.names()) == sorted(
+        p.relative_to(root).as_posix() for p in files
+    )
+
+    for data_file in files:
+        name = data_file.relative_to(root)
+        contents = subject.read(name)
+        assert contents is not None
+        assert json.loads(contents) == json.loads(load_shared_data(name))
+
+
+def test_read_missing(tmp_path: Path) -> None:
+    """It should return None for files that aren't in the bundle."""
+    data_file = tmp_path / "data" / "labware" / "definitions" / "2" / "a" / "1.json"
+    data_file.parent.mkdir(parents=True)
+    data_file.write_text('{"hello": "world"}')
+    bundle_path = tmp_path / "shared-data.bundle"
+
+    build_bundle(data_root=tmp_path / "data", files=[data_file], target=bundle_path)
+    subject = SharedDataBundle(bundle_path)
+
+    assert subject.read("labware/definitions/2/a/1.json") == b'{"hello":"world"}'
+    assert subject.read("labware/definitions/2/b/1.json") is None
+
+
+@pytest.mark.parametrize("contents", [b"", b"OTSDB", b"not a bundle at all"])
+def test_invalid_bundle(tmp_path: Path, contents: bytes) -> None:
+    """It should raise if the file isn't a bundle."""
+    bundle_path = tmp_path / "shared-data.bundle"
+    bundle_path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        SharedDataBundle(bundle_path)